@@ -0,0 +1,33 @@
+"""add embedding_hash columns
+
+Stores a content hash next to each embedding so the embedding pipeline can
+skip records whose text has not changed since they were last embedded.
+
+Revision ID: 9c3e7a1f5d20
+Revises: 0613d4b1b215
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e7a1f5d20'
+down_revision: Union[str, None] = '0613d4b1b215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('properties', 'property_recaps', 'dossiers', 'evidence')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column('embedding_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_column(table, 'embedding_hash')
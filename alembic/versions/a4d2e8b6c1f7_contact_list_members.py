@@ -0,0 +1,96 @@
+"""materialize contact list membership
+
+Members move from the contact_lists.contact_ids JSON array into a
+contact_list_members join table. Manual lists are backfilled from the JSON
+(which is then cleared); smart lists are marked stale so the worker rebuilds
+them on its next pass.
+
+Revision ID: a4d2e8b6c1f7
+Revises: f3a8c6e1d4b9
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d2e8b6c1f7'
+down_revision: Union[str, None] = 'f3a8c6e1d4b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_lists = sa.table(
+    'contact_lists',
+    sa.column('id', sa.Integer),
+    sa.column('list_type', sa.String),
+    sa.column('contact_ids', sa.JSON),
+    sa.column('total_contacts', sa.Integer),
+    sa.column('last_refreshed_at', sa.DateTime),
+)
+_contacts = sa.table('contacts', sa.column('id', sa.Integer), sa.column('created_at', sa.DateTime))
+_members = sa.table(
+    'contact_list_members',
+    sa.column('list_id', sa.Integer),
+    sa.column('contact_id', sa.Integer),
+    sa.column('contact_created_at', sa.DateTime),
+    sa.column('added_at', sa.DateTime),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'contact_list_members',
+        sa.Column('list_id', sa.Integer(), sa.ForeignKey('contact_lists.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('contact_id', sa.Integer(), sa.ForeignKey('contacts.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('contact_created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('added_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_contact_list_members_contact_id', 'contact_list_members', ['contact_id'])
+    op.create_index(
+        'ix_contact_list_members_list_created', 'contact_list_members', ['list_id', 'contact_created_at']
+    )
+
+    conn = op.get_bind()
+    now = datetime.utcnow()
+    rows = conn.execute(
+        sa.select(_lists.c.id, _lists.c.contact_ids).where(_lists.c.list_type != 'smart')
+    ).all()
+    for list_id, contact_ids in rows:
+        ids = list(dict.fromkeys(contact_ids or []))
+        members = []
+        for start in range(0, len(ids), 500):
+            members.extend(
+                {'list_id': list_id, 'contact_id': cid, 'contact_created_at': created_at, 'added_at': now}
+                for cid, created_at in conn.execute(
+                    sa.select(_contacts.c.id, _contacts.c.created_at).where(_contacts.c.id.in_(ids[start:start + 500]))
+                )
+            )
+        if members:
+            conn.execute(_members.insert(), members)
+        conn.execute(
+            _lists.update().where(_lists.c.id == list_id).values(contact_ids=None, total_contacts=len(members))
+        )
+    conn.execute(_lists.update().where(_lists.c.list_type == 'smart').values(last_refreshed_at=None))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.select(_members.c.list_id, _members.c.contact_id)
+        .select_from(_members.join(_lists, _lists.c.id == _members.c.list_id))
+        .where(_lists.c.list_type != 'smart')
+        .order_by(_members.c.list_id, _members.c.contact_id)
+    ).all()
+    by_list: dict[int, list[int]] = {}
+    for list_id, contact_id in rows:
+        by_list.setdefault(list_id, []).append(contact_id)
+    for list_id, contact_ids in by_list.items():
+        conn.execute(_lists.update().where(_lists.c.id == list_id).values(contact_ids=contact_ids))
+
+    op.drop_index('ix_contact_list_members_list_created', table_name='contact_list_members')
+    op.drop_index('ix_contact_list_members_contact_id', table_name='contact_list_members')
+    op.drop_table('contact_list_members')
@@ -0,0 +1,45 @@
+"""add per-source indexes for the activity timeline
+
+Each timeline source is read newest-first, optionally for one property, so
+every source table gets a ``(property_id, <timestamp>)`` index; sources that
+had no plain timestamp index get one for portfolio-wide timelines.
+
+Revision ID: b5e1c9d3f7a2
+Revises: a4d2e8b6c1f7
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1c9d3f7a2'
+down_revision: Union[str, None] = 'a4d2e8b6c1f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = [
+    ('ix_conversation_history_property_created', 'conversation_history', ['property_id', 'created_at']),
+    ('ix_notifications_property_created', 'notifications', ['property_id', 'created_at']),
+    ('ix_property_notes_property_created', 'property_notes', ['property_id', 'created_at']),
+    ('ix_scheduled_tasks_created_at', 'scheduled_tasks', ['created_at']),
+    ('ix_scheduled_tasks_property_created', 'scheduled_tasks', ['property_id', 'created_at']),
+    ('ix_contracts_property_created', 'contracts', ['property_id', 'created_at']),
+    ('ix_contracts_property_sent', 'contracts', ['property_id', 'sent_at']),
+    ('ix_contracts_property_completed', 'contracts', ['property_id', 'completed_at']),
+    ('ix_zillow_enrichments_created_at', 'zillow_enrichments', ['created_at']),
+    ('ix_zillow_enrichments_property_created', 'zillow_enrichments', ['property_id', 'created_at']),
+    ('ix_skip_traces_property_created', 'skip_traces', ['property_id', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
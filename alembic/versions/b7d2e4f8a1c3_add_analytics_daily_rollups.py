@@ -0,0 +1,48 @@
+"""add analytics_daily_rollups
+
+Per-agent, per-UTC-day, per-event-type counts and value sums so dashboard
+KPIs are served from the rollup instead of scanning analytics_events.
+Backfilled from existing events.
+
+Revision ID: b7d2e4f8a1c3
+Revises: 9c3e7a1f5d20
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f8a1c3'
+down_revision: Union[str, None] = '9c3e7a1f5d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'analytics_daily_rollups',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('agent_id', sa.Integer(), sa.ForeignKey('agents.id'), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('event_type', sa.String(length=100), nullable=False),
+        sa.Column('event_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('value_sum', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.UniqueConstraint('agent_id', 'day', 'event_type', name='uq_analytics_rollup_agent_day_type'),
+    )
+    op.execute(
+        """
+        INSERT INTO analytics_daily_rollups (agent_id, day, event_type, event_count, value_sum)
+        SELECT agent_id, (created_at AT TIME ZONE 'UTC')::date, event_type, COUNT(*), COALESCE(SUM(value), 0)
+        FROM analytics_events
+        WHERE agent_id IS NOT NULL AND created_at IS NOT NULL
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('analytics_daily_rollups')
@@ -0,0 +1,35 @@
+"""add scheduled task lease columns
+
+Lets several task runners (API replicas, arq worker) claim due scheduled
+tasks without running them twice, and recover tasks whose runner crashed.
+
+Revision ID: c4a8f1e6d9b2
+Revises: b7d2e4f8a1c3
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a8f1e6d9b2'
+down_revision: Union[str, None] = 'b7d2e4f8a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('scheduled_tasks', sa.Column('lease_owner', sa.String(length=64), nullable=True))
+    op.add_column('scheduled_tasks', sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('scheduled_tasks', sa.Column('lease_version', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('scheduled_tasks', sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'))
+    op.create_index('ix_scheduled_tasks_lease_expires_at', 'scheduled_tasks', ['lease_expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scheduled_tasks_lease_expires_at', table_name='scheduled_tasks')
+    for column in ('attempts', 'lease_version', 'lease_expires_at', 'lease_owner'):
+        op.drop_column('scheduled_tasks', column)
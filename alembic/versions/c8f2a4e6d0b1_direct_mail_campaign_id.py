@@ -0,0 +1,35 @@
+"""add direct_mail.campaign_id
+
+Campaign runs materialize one piece per recipient and resume by selecting a
+campaign's pieces that are still drafts, so pieces need to know their campaign.
+
+Revision ID: c8f2a4e6d0b1
+Revises: b5e1c9d3f7a2
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f2a4e6d0b1'
+down_revision: Union[str, None] = 'b5e1c9d3f7a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('direct_mail', sa.Column('campaign_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_direct_mail_campaign_id', 'direct_mail', 'direct_mail_campaigns', ['campaign_id'], ['id']
+    )
+    op.create_index('ix_direct_mail_campaign_id', 'direct_mail', ['campaign_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_direct_mail_campaign_id', table_name='direct_mail')
+    op.drop_constraint('fk_direct_mail_campaign_id', 'direct_mail', type_='foreignkey')
+    op.drop_column('direct_mail', 'campaign_id')
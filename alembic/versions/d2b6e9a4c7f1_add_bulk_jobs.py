@@ -0,0 +1,51 @@
+"""add bulk_jobs
+
+Persists bulk operation runs (target properties, per-property results and
+counts) so a job interrupted by a worker restart resumes where it stopped.
+
+Revision ID: d2b6e9a4c7f1
+Revises: c4a8f1e6d9b2
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b6e9a4c7f1'
+down_revision: Union[str, None] = 'c4a8f1e6d9b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'bulk_jobs',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('operation', sa.String(length=64), nullable=False),
+        sa.Column('params', sa.JSON(), nullable=True),
+        sa.Column('status', sa.String(length=32), nullable=False, server_default='pending'),
+        sa.Column('property_ids', sa.JSON(), nullable=False),
+        sa.Column('results', sa.JSON(), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('succeeded', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('failed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('skipped', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('voice_summary', sa.Text(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index('ix_bulk_jobs_id', 'bulk_jobs', ['id'])
+    op.create_index('ix_bulk_jobs_status', 'bulk_jobs', ['status'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bulk_jobs_status', table_name='bulk_jobs')
+    op.drop_index('ix_bulk_jobs_id', table_name='bulk_jobs')
+    op.drop_table('bulk_jobs')
@@ -0,0 +1,85 @@
+"""backfill property coordinates from zillow enrichments
+
+Properties created before coordinates were stored have NULL geo_lat/geohash
+and are invisible to radius comp searches. Fill them from the coordinates in
+the stored Zillow response (``propertyDetails.latitude/longitude``).
+
+Revision ID: d9b3f5a7c2e4
+Revises: c8f2a4e6d0b1
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.geo import encode_geohash
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b3f5a7c2e4'
+down_revision: Union[str, None] = 'c8f2a4e6d0b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BATCH_SIZE = 1000
+
+properties = sa.table(
+    'properties',
+    sa.column('id', sa.Integer),
+    sa.column('geo_lat', sa.Float),
+    sa.column('geo_lng', sa.Float),
+    sa.column('geohash', sa.String),
+)
+zillow_enrichments = sa.table(
+    'zillow_enrichments',
+    sa.column('property_id', sa.Integer),
+    sa.column('raw_response', sa.JSON),
+)
+
+
+def _coordinates(raw_response):
+    details = (raw_response or {}).get('propertyDetails') or {}
+    try:
+        lat, lng = float(details['latitude']), float(details['longitude'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0):
+        return None
+    return lat, lng
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    update = (
+        properties.update()
+        .where(properties.c.id == sa.bindparam('property_id'))
+        .values(geo_lat=sa.bindparam('lat'), geo_lng=sa.bindparam('lng'), geohash=sa.bindparam('hash'))
+    )
+    after = 0
+    while True:
+        rows = bind.execute(
+            sa.select(properties.c.id, zillow_enrichments.c.raw_response)
+            .join(zillow_enrichments, zillow_enrichments.c.property_id == properties.c.id)
+            .where(properties.c.geo_lat.is_(None), properties.c.id > after)
+            .order_by(properties.c.id)
+            .limit(_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        after = rows[-1].id
+        updates = []
+        for row in rows:
+            coords = _coordinates(row.raw_response)
+            if coords is not None:
+                updates.append({
+                    'property_id': row.id, 'lat': coords[0], 'lng': coords[1], 'hash': encode_geohash(*coords),
+                })
+        if updates:
+            bind.execute(update, updates)
+
+
+def downgrade() -> None:
+    # Backfilled coordinates are indistinguishable from geocoded ones; keep them.
+    pass
@@ -0,0 +1,30 @@
+"""add voice_campaign_targets.claimed_at
+
+The dialer claims due targets (queued -> in_progress) before calling them and
+stamps the claim, so concurrent ticks never dial the same target and the
+batched outcome write only applies to the claim it belongs to.
+
+Revision ID: e2a6c8d4f1b3
+Revises: d9b3f5a7c2e4
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a6c8d4f1b3'
+down_revision: Union[str, None] = 'd9b3f5a7c2e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('voice_campaign_targets', sa.Column('claimed_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('voice_campaign_targets', 'claimed_at')
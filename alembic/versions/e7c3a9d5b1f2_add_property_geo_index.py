@@ -0,0 +1,44 @@
+"""add coordinates and geohash index to properties and comps
+
+Properties get geo_lat/geo_lng plus an indexed geohash used for radius
+searches of comparable properties; sales and rental comps keep the
+coordinates of the property they came from.
+
+Revision ID: e7c3a9d5b1f2
+Revises: d2b6e9a4c7f1
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c3a9d5b1f2'
+down_revision: Union[str, None] = 'd2b6e9a4c7f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('properties', sa.Column('geo_lat', sa.Float(), nullable=True))
+    op.add_column('properties', sa.Column('geo_lng', sa.Float(), nullable=True))
+    op.add_column('properties', sa.Column('geohash', sa.String(length=12), nullable=True))
+    op.create_index('ix_properties_geohash', 'properties', ['geohash'])
+
+    for table in ('comps_sales', 'comps_rentals'):
+        op.add_column(table, sa.Column('geo_lat', sa.Float(), nullable=True))
+        op.add_column(table, sa.Column('geo_lng', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    for table in ('comps_rentals', 'comps_sales'):
+        op.drop_column(table, 'geo_lng')
+        op.drop_column(table, 'geo_lat')
+
+    op.drop_index('ix_properties_geohash', table_name='properties')
+    op.drop_column('properties', 'geohash')
+    op.drop_column('properties', 'geo_lng')
+    op.drop_column('properties', 'geo_lat')
@@ -0,0 +1,47 @@
+"""move portal cache pages to the content-addressed blob store
+
+Cached pages are now kept compressed in the page blob store; the
+portal_cache table only keeps their content hashes, sizes and expiry.
+raw_html stays (nullable) so rows cached before this change keep serving
+until they expire.
+
+Revision ID: f3a8c6e1d4b9
+Revises: e7c3a9d5b1f2
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8c6e1d4b9'
+down_revision: Union[str, None] = 'e7c3a9d5b1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('portal_cache', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('portal_cache', sa.Column('text_hash', sa.String(length=64), nullable=True))
+    op.add_column('portal_cache', sa.Column('html_bytes', sa.Integer(), nullable=True))
+    op.add_column('portal_cache', sa.Column('stored_bytes', sa.Integer(), nullable=True))
+    op.alter_column('portal_cache', 'raw_html', existing_type=sa.Text(), nullable=True)
+    op.create_index('ix_portal_cache_content_hash', 'portal_cache', ['content_hash'])
+    op.create_index('ix_portal_cache_text_hash', 'portal_cache', ['text_hash'])
+    op.create_index('ix_portal_cache_expires_at', 'portal_cache', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_portal_cache_expires_at', table_name='portal_cache')
+    op.drop_index('ix_portal_cache_text_hash', table_name='portal_cache')
+    op.drop_index('ix_portal_cache_content_hash', table_name='portal_cache')
+    # Blob-backed rows have no inline copy to fall back to.
+    op.execute("DELETE FROM portal_cache WHERE raw_html IS NULL")
+    op.alter_column('portal_cache', 'raw_html', existing_type=sa.Text(), nullable=False)
+    op.drop_column('portal_cache', 'stored_bytes')
+    op.drop_column('portal_cache', 'html_bytes')
+    op.drop_column('portal_cache', 'text_hash')
+    op.drop_column('portal_cache', 'content_hash')
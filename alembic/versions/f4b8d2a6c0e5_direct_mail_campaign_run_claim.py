@@ -0,0 +1,38 @@
+"""claim direct mail campaign runs and key campaign pieces by recipient
+
+A run claims its campaign (status 'sending' plus a lease) before it touches
+it, so two runs never send the same campaign at once, and a unique
+(campaign_id, recipient_key) keeps materialization from inserting a
+recipient's piece twice. Pieces materialized before this revision keep a
+NULL recipient_key.
+
+Revision ID: f4b8d2a6c0e5
+Revises: e2a6c8d4f1b3
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b8d2a6c0e5'
+down_revision: Union[str, None] = 'e2a6c8d4f1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('direct_mail_campaigns', sa.Column('run_lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('direct_mail', sa.Column('recipient_key', sa.String(length=64), nullable=True))
+    op.create_unique_constraint(
+        'uq_direct_mail_campaign_recipient', 'direct_mail', ['campaign_id', 'recipient_key']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_direct_mail_campaign_recipient', 'direct_mail', type_='unique')
+    op.drop_column('direct_mail', 'recipient_key')
+    op.drop_column('direct_mail_campaigns', 'run_lease_expires_at')
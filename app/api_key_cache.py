@@ -1,34 +1,241 @@
-"""In-memory API key verification cache with TTL."""
+"""In-memory API key verification cache with TTL.
+
+Verified key hashes map to an agent id in a bounded LRU. Rejected hashes are
+remembered for a short time, so a burst of bad keys costs one database
+lookup instead of one per request. Concurrent misses for the same hash share
+a single lookup, which runs in a worker thread.
+
+Lookups run on the event loop, but ``invalidate_api_key_cache`` is also
+called from sync endpoints in the threadpool, so the LRU is guarded by a
+lock. Every invalidation bumps a generation counter; a lookup that was in
+flight across an invalidation returns its result without caching it, so it
+can't put back an entry that was just dropped. ``invalidate_api_key_cache``
+also publishes on a Redis channel so every worker process drops the entry,
+not only this one.
+"""
 
 import asyncio
+import json
+import logging
+import os
+import threading
 import time
-from typing import Dict, Tuple
+import uuid
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
-# Cache stores (agent_id, cached_at_timestamp)
-_api_key_cache: Dict[str, Tuple[int, float]] = {}
-_cache_lock = asyncio.Lock()
 CACHE_TTL_SECONDS = 300  # 5 minutes — permission changes take effect within this window
+NEGATIVE_CACHE_TTL_SECONDS = int(os.getenv("API_KEY_NEGATIVE_CACHE_TTL", "30"))
+CACHE_MAX_ENTRIES = int(os.getenv("API_KEY_CACHE_MAX_ENTRIES", "10000"))
+INVALIDATION_CHANNEL = "rc:api_key_cache:invalidate"
 
+# Value stored for rejected hashes
+_REJECTED = 0
 
-async def get_cached_agent_id(api_key_hash: str) -> int | None:
-    async with _cache_lock:
+# key hash -> (agent_id or _REJECTED, expires_at)
+_api_key_cache: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+_lock = threading.Lock()
+# Bumped by every invalidation
+_generation = 0
+_inflight: Dict[str, "asyncio.Future[Optional[int]]"] = {}
+_stats = {"hits": 0, "negative_hits": 0, "misses": 0, "lookups": 0, "coalesced": 0}
+
+# Identifies this process so it can skip its own invalidation messages
+_instance_id = uuid.uuid4().hex
+_listener_task: Optional[asyncio.Task] = None
+_listener_loop: Optional[asyncio.AbstractEventLoop] = None
+_publish_tasks: set = set()
+
+
+def _get(api_key_hash: str) -> Optional[int]:
+    with _lock:
         entry = _api_key_cache.get(api_key_hash)
         if entry is None:
             return None
-        agent_id, cached_at = entry
-        if time.time() - cached_at > CACHE_TTL_SECONDS:
-            del _api_key_cache[api_key_hash]
+        value, expires_at = entry
+        if time.monotonic() > expires_at:
+            _api_key_cache.pop(api_key_hash, None)
             return None
-        return agent_id
+        _api_key_cache.move_to_end(api_key_hash)
+        return value
+
+
+def _put(api_key_hash: str, value: int, ttl: float, generation: Optional[int] = None) -> None:
+    """Cache a value; skipped if ``generation`` is given and an invalidation happened since."""
+    with _lock:
+        if generation is not None and generation != _generation:
+            return
+        _api_key_cache[api_key_hash] = (value, time.monotonic() + ttl)
+        _api_key_cache.move_to_end(api_key_hash)
+        while len(_api_key_cache) > CACHE_MAX_ENTRIES:
+            _api_key_cache.popitem(last=False)
+
+
+async def get_cached_agent_id(api_key_hash: str) -> int | None:
+    """Agent id for a verified key hash, or None (unknown or rejected)."""
+    value = _get(api_key_hash)
+    return value or None
 
 
 async def cache_agent_id(api_key_hash: str, agent_id: int) -> None:
-    async with _cache_lock:
-        _api_key_cache[api_key_hash] = (agent_id, time.time())
+    _put(api_key_hash, agent_id, CACHE_TTL_SECONDS)
+
+
+def cache_rejected_key(api_key_hash: str) -> None:
+    _put(api_key_hash, _REJECTED, NEGATIVE_CACHE_TTL_SECONDS)
+
+
+async def resolve_agent_id(api_key_hash: str, lookup: Callable[[], Optional[int]]) -> int | None:
+    """Return the agent id for a key hash, calling ``lookup`` at most once.
+
+    ``lookup`` is a blocking function (a database query) and runs in a worker
+    thread. Both outcomes are cached: verified keys for CACHE_TTL_SECONDS,
+    rejected keys for NEGATIVE_CACHE_TTL_SECONDS.
+    """
+    value = _get(api_key_hash)
+    if value is not None:
+        if value == _REJECTED:
+            _stats["negative_hits"] += 1
+            return None
+        _stats["hits"] += 1
+        return value
+
+    _stats["misses"] += 1
+    inflight = _inflight.get(api_key_hash)
+    if inflight is not None:
+        _stats["coalesced"] += 1
+        return await asyncio.shield(inflight)
+
+    future: "asyncio.Future[Optional[int]]" = asyncio.get_running_loop().create_future()
+    _inflight[api_key_hash] = future
+    try:
+        _stats["lookups"] += 1
+        generation = _generation
+        agent_id = await asyncio.to_thread(lookup)
+        if agent_id:
+            _put(api_key_hash, agent_id, CACHE_TTL_SECONDS, generation)
+        else:
+            _put(api_key_hash, _REJECTED, NEGATIVE_CACHE_TTL_SECONDS, generation)
+        future.set_result(agent_id or None)
+        return agent_id or None
+    except BaseException as e:
+        if isinstance(e, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(e)
+            future.exception()
+        raise
+    finally:
+        _inflight.pop(api_key_hash, None)
+
+
+def _invalidate_local(api_key_hash: str | None) -> None:
+    global _generation
+    with _lock:
+        _generation += 1
+        if api_key_hash:
+            _api_key_cache.pop(api_key_hash, None)
+        else:
+            _api_key_cache.clear()
 
 
 def invalidate_api_key_cache(api_key_hash: str | None = None) -> None:
-    if api_key_hash:
-        _api_key_cache.pop(api_key_hash, None)
+    """Drop one key hash (or everything) here and on every other worker."""
+    _invalidate_local(api_key_hash)
+    _publish_invalidation(api_key_hash)
+
+
+def api_key_cache_stats() -> dict:
+    with _lock:
+        positive = sum(1 for value, _ in _api_key_cache.values() if value != _REJECTED)
+        total = len(_api_key_cache)
+    return {
+        **_stats,
+        "entries": positive,
+        "rejected_entries": total - positive,
+        "max_entries": CACHE_MAX_ENTRIES,
+        "listening": _listener_task is not None and not _listener_task.done(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Cross-worker invalidation (Redis pub/sub)
+# ---------------------------------------------------------------------------
+
+async def _publish(api_key_hash: str | None) -> None:
+    from app.services.redis_cache import get_async_redis
+    r = await get_async_redis()
+    if r is None:
+        return
+    try:
+        await r.publish(INVALIDATION_CHANNEL, json.dumps({"origin": _instance_id, "hash": api_key_hash}))
+    except Exception as e:
+        logger.warning("API key cache invalidation publish failed: %s", e)
+
+
+def _publish_invalidation(api_key_hash: str | None) -> None:
+    loop = _listener_loop
+    if loop is None or loop.is_closed():
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        task = loop.create_task(_publish(api_key_hash))
+        _publish_tasks.add(task)
+        task.add_done_callback(_publish_tasks.discard)
     else:
-        _api_key_cache.clear()
+        # Called from a sync endpoint running in the threadpool
+        asyncio.run_coroutine_threadsafe(_publish(api_key_hash), loop)
+
+
+async def _listen() -> None:
+    from app.services.redis_cache import get_async_redis
+    r = await get_async_redis()
+    if r is None:
+        return
+    pubsub = r.pubsub()
+    try:
+        await pubsub.subscribe(INVALIDATION_CHANNEL)
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=5.0)
+            if message is None:
+                continue
+            try:
+                payload = json.loads(message["data"])
+            except (TypeError, ValueError):
+                continue
+            if payload.get("origin") != _instance_id:
+                _invalidate_local(payload.get("hash"))
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning("API key cache invalidation listener stopped: %s", e)
+    finally:
+        try:
+            await pubsub.aclose()
+        except Exception:
+            pass
+
+
+def start_invalidation_listener() -> None:
+    """Subscribe to cross-worker invalidations (call on application startup)."""
+    global _listener_task, _listener_loop
+    _listener_loop = asyncio.get_running_loop()
+    if _listener_task is None or _listener_task.done():
+        _listener_task = asyncio.create_task(_listen())
+
+
+async def stop_invalidation_listener() -> None:
+    global _listener_task, _listener_loop
+    task, _listener_task = _listener_task, None
+    _listener_loop = None
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
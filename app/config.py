@@ -24,12 +24,25 @@ class Settings(BaseSettings):
     exa_base_url: str = "https://api.exa.ai"
     exa_search_type: str = "auto"
     exa_timeout_seconds: int = 20
+    # Portal page cache blobs: "local" (portal_cache_dir) or "s3"
+    portal_cache_backend: str = "local"
+    portal_cache_dir: str = "data/portal_cache"
+    portal_cache_s3_bucket: str = ""
+    portal_cache_s3_prefix: str = "portal-cache/"
+    portal_cache_s3_endpoint_url: str = ""
     vapi_api_key: str = ""
     vapi_phone_number_id: str = ""
     vapi_webhook_secret: str = ""
+    vapi_base_url: str = "https://api.vapi.ai"
     campaign_worker_enabled: bool = True
     campaign_worker_interval_seconds: int = 15
     campaign_worker_max_calls_per_tick: int = 5
+    campaign_dialer_max_concurrency: int = 20
+    # Event bus: per-subscriber queue size, and the Redis Stream outbox for durable subscribers
+    event_bus_queue_size: int = 1000
+    event_outbox_enabled: bool = False
+    event_outbox_stream: str = "events:outbox"
+    event_outbox_maxlen: int = 100_000
     daily_digest_enabled: bool = True
     daily_digest_hour: int = 8
 
@@ -49,6 +62,9 @@ class Settings(BaseSettings):
     lob_api_key: str = ""
     lob_webhook_secret: str = ""
     lob_test_mode: bool = False
+    lob_base_url: str = "https://api.lob.com/v1"
+    lob_rate_limit_per_minute: int = 1800  # Lob allows 150 requests per 5 seconds
+    lob_max_concurrency: int = 10
 
     # Coolify Auto-Provisioning
     coolify_api_base: str = "https://api.coolify.com/v1"
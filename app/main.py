@@ -21,8 +21,8 @@ from app.rate_limit import limiter, RateLimitToggleMiddleware, RATE_LIMIT_ENABLE
 from app.auth import verify_api_key
 from app.middleware.api_key import ApiKeyMiddleware
 from app.middleware.request_id import RequestIdMiddleware
-from app.websocket import manager
-from app.api_key_cache import invalidate_api_key_cache
+from app.websocket import DISPLAY_TOPIC, manager
+from app.api_key_cache import invalidate_api_key_cache, api_key_cache_stats, start_invalidation_listener, stop_invalidation_listener
 from app.routers.registry import register_routers
 from app.middleware.error_handler import register_error_handlers
 from app.middleware.metrics import MetricsMiddleware, metrics_endpoint, PROMETHEUS_AVAILABLE
@@ -127,7 +127,11 @@ app.mount("/uploads", StaticFiles(directory=_uploads_dir), name="uploads")
 # ---------------------------------------------------------------------------
 
 @app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket, api_key: str = Query(default=None)):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    api_key: str = Query(default=None),
+    topics: str = Query(default=None, description="Comma-separated topics; defaults to broadcast, display and activity"),
+):
     if not api_key:
         await websocket.close(code=4001, reason="Missing api_key query parameter")
         return
@@ -140,18 +144,22 @@ async def websocket_endpoint(websocket: WebSocket, api_key: str = Query(default=
     finally:
         db.close()
 
-    await manager.connect(websocket)
+    requested = [t for t in topics.split(",") if t.strip()] if topics else None
+    await manager.connect(websocket, agent_id=agent.id, topics=requested)
     try:
         while True:
             data = await websocket.receive_text()
-            logger.debug("WS message from agent %s: %s", agent.id, data)
+            if not manager.handle_client_message(websocket, data):
+                logger.debug("WS message from agent %s: %s", agent.id, data)
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
 
 
 @app.post("/display/command")
 async def send_display_command(command: dict):
-    await manager.broadcast(command)
+    await manager.publish(DISPLAY_TOPIC, command)
     return {"status": "command_sent", "command": command}
 
 # ---------------------------------------------------------------------------
@@ -195,6 +203,12 @@ def health_check():
         response["circuit_breakers"] = circuit_breakers.status()
     except Exception:
         pass
+    # Add outbound HTTP pool status
+    try:
+        from app.utils.http_clients import http_clients
+        response["http_clients"] = http_clients.status()
+    except Exception:
+        pass
 
     if db_status != "healthy":
         return JSONResponse(status_code=503, content=response)
@@ -215,24 +229,33 @@ def rate_limit_status():
 
 @app.get("/cache/stats")
 async def cache_stats():
-    from app.services.cache import google_places_cache, zillow_cache, docuseal_cache
+    from app.services.cache import all_caches
     from app.services.redis_cache import cache_stats as redis_cache_stats
-    return {
-        "google_places": google_places_cache.stats(),
-        "zillow": zillow_cache.stats(),
-        "docuseal": docuseal_cache.stats(),
-        "redis": await redis_cache_stats(),
-    }
+    from app.services.tiered_cache import all_tiered_caches
+    stats = {name: cache.stats(count_expired=True) for name, cache in all_caches().items()}
+    stats["tiered"] = {name: cache.stats() for name, cache in all_tiered_caches().items()}
+    stats["api_keys"] = api_key_cache_stats()
+    stats["redis"] = await redis_cache_stats()
+    return stats
 
 
 @app.post("/cache/clear")
 def cache_clear():
-    from app.services.cache import google_places_cache, zillow_cache, docuseal_cache
-    google_places_cache.clear()
-    zillow_cache.clear()
-    docuseal_cache.clear()
+    from app.services.cache import all_caches
+    for cache in all_caches().values():
+        cache.clear()
     return {"message": "All caches cleared"}
 
+
+@app.post("/cache/invalidate/{namespace}")
+async def cache_invalidate_namespace(namespace: str):
+    from app.services.tiered_cache import all_tiered_caches
+    cache = all_tiered_caches().get(namespace)
+    if cache is None:
+        return JSONResponse(status_code=404, content={"detail": f"Unknown cache namespace '{namespace}'"})
+    removed = await cache.invalidate_namespace()
+    return {"message": f"Cache namespace '{namespace}' invalidated", "redis_keys_removed": removed}
+
 # ---------------------------------------------------------------------------
 # Background task management (legacy — kept for in-process fallback)
 # ---------------------------------------------------------------------------
@@ -264,10 +287,9 @@ _bg_started = False
 async def _periodic_cache_cleanup():
     while True:
         await asyncio.sleep(3600)
-        from app.services.cache import google_places_cache, zillow_cache, docuseal_cache
-        google_places_cache.cleanup_expired()
-        zillow_cache.cleanup_expired()
-        docuseal_cache.cleanup_expired()
+        from app.services.cache import all_caches
+        for cache in all_caches().values():
+            cache.cleanup_expired()
 
 
 @app.on_event("startup")
@@ -294,6 +316,23 @@ async def startup_event():
 
         _bg_started = True
 
+    # Write-behind flushers for activity events and website page views (stopped and flushed on shutdown)
+    from app.middleware.activity_logger import activity_writer
+    from app.services.website_render_cache import website_view_writer
+    activity_writer.start()
+    website_view_writer.start()
+
+    # Durable event subscribers (their events go through the outbox when it is enabled)
+    from app.services.event_subscribers import register_durable_subscribers
+    from app.services.observer import event_bus
+    register_durable_subscribers(event_bus)
+
+    # Drop API key cache entries invalidated by other workers
+    start_invalidation_listener()
+
+    # Deliver WebSocket messages published by other workers
+    manager.start_listener()
+
     logger.info("RealtorClaw Platform ready")
 
 
@@ -301,6 +340,20 @@ async def startup_event():
 async def shutdown_event():
     from app.services.cron_scheduler import cron_scheduler
     from app.services.hybrid_search import hybrid_search
+    from app.services.redis_cache import close_redis
+    from app.utils.http_clients import http_clients
+    from app.middleware.activity_logger import activity_writer
+    from app.services.task_runner import task_runner
+    from app.services.observer import event_bus
+    from app.services.website_render_cache import website_view_writer
     cron_scheduler.stop()
+    task_runner.stop()
+    await event_bus.stop()
+    await activity_writer.stop()
+    await website_view_writer.stop()
+    await stop_invalidation_listener()
+    await manager.close()
     hybrid_search.close()
+    await close_redis()
+    await http_clients.aclose_all()
     logger.info("RealtorClaw Platform shutdown complete")
@@ -1,28 +1,255 @@
 """
 Activity logging middleware to capture all API requests and MCP tool calls
+
+Events are written behind the request path: they are appended to a bounded
+in-memory buffer and a background task bulk-inserts them in batches (when
+``batch_size`` events are waiting or every ``flush_interval_ms``). When the
+buffer runs hot, successful events are sampled; when it is full, new events
+are dropped and counted. Pending events are flushed on shutdown.
 """
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
+import asyncio
+import random
+import threading
 import time
 import json
 import logging
-from typing import Callable
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
 from app.database import SessionLocal
+from app.middleware import metrics
 from app.models.activity_event import ActivityEvent, ActivityEventType, ActivityEventStatus
 
 
+class ActivityEventWriter:
+    """Bounded write-behind buffer that bulk-inserts ActivityEvent rows.
+
+    ``table`` points the writer at another append-only table (e.g. website
+    view analytics); Prometheus activity metrics are only recorded for the
+    default activity_events table.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 10_000,
+        batch_size: int = 500,
+        flush_interval_ms: int = 500,
+        sample_high_water: float = 0.8,
+        sample_rate: float = 0.1,
+        session_factory: Callable[[], Session] = SessionLocal,
+        table=None,
+    ):
+        self.table = table if table is not None else ActivityEvent.__table__
+        self.record_metrics = table is None
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.sample_high_water = int(max_queue * sample_high_water)
+        self.sample_rate = sample_rate
+        self.session_factory = session_factory
+        self._buffer: deque = deque()
+        self._lock = threading.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self.enqueued = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.written = 0
+        self.failed = 0
+        self.last_flush_ms = 0.0
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    @property
+    def depth(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def enqueue(self, row: dict) -> bool:
+        """Queue one activity_events row. Returns False if it was dropped."""
+        if not self.running:
+            # No flusher (scripts, workers without a loop) — write through.
+            self._write_batch([row])
+            return True
+
+        with self._lock:
+            depth = len(self._buffer)
+            if depth >= self.max_queue:
+                self.dropped += 1
+                if self.record_metrics:
+                    _record_drop("queue_full")
+                return False
+            if (
+                depth >= self.sample_high_water
+                and row.get("status") == ActivityEventStatus.SUCCESS
+                and random.random() >= self.sample_rate
+            ):
+                self.sampled_out += 1
+                if self.record_metrics:
+                    _record_drop("sampled")
+                return False
+            self._buffer.append(row)
+            self.enqueued += 1
+            depth += 1
+
+        if depth >= self.batch_size:
+            self._wake()
+        return True
+
+    def _wake(self) -> None:
+        if self._loop is None or self._wakeup is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and write everything still buffered."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def _drain(self) -> list:
+        with self._lock:
+            count = min(len(self._buffer), self.batch_size)
+            return [self._buffer.popleft() for _ in range(count)]
+
+    async def flush(self) -> int:
+        """Write all buffered events in batches off the event loop."""
+        total = 0
+        while True:
+            batch = self._drain()
+            if not batch:
+                break
+            await asyncio.to_thread(self._write_batch, batch)
+            total += len(batch)
+        if self.record_metrics:
+            _record_depth(self.depth)
+        return total
+
+    def _write_batch(self, rows: list) -> None:
+        start = time.perf_counter()
+        db = self.session_factory()
+        try:
+            db.execute(insert(self.table), rows)
+            db.commit()
+            self.written += len(rows)
+        except Exception as e:
+            db.rollback()
+            self.failed += len(rows)
+            logger.error("Error writing %d %s rows: %s", len(rows), self.table.name, e)
+        finally:
+            db.close()
+        self.last_flush_ms = (time.perf_counter() - start) * 1000
+        if self.record_metrics:
+            _record_flush(self.last_flush_ms / 1000, len(rows))
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "queue_depth": self.depth,
+            "max_queue": self.max_queue,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+        }
+
+
+def _record_depth(depth: int) -> None:
+    if metrics.PROMETHEUS_AVAILABLE:
+        metrics.ACTIVITY_QUEUE_DEPTH.set(depth)
+
+
+def _record_flush(seconds: float, rows: int) -> None:
+    if metrics.PROMETHEUS_AVAILABLE:
+        metrics.ACTIVITY_FLUSH_LATENCY.observe(seconds)
+        metrics.ACTIVITY_EVENTS_WRITTEN.inc(rows)
+
+
+def _record_drop(reason: str) -> None:
+    if metrics.PROMETHEUS_AVAILABLE:
+        metrics.ACTIVITY_EVENTS_DROPPED.labels(reason=reason).inc()
+
+
+activity_writer = ActivityEventWriter()
+
+
+def _event_row(
+    tool_name: str,
+    user_source: Optional[str],
+    status: ActivityEventStatus,
+    duration_ms: Optional[int] = None,
+    data: Optional[str] = None,
+    error_message: Optional[str] = None,
+) -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).replace(tzinfo=None),
+        "tool_name": tool_name,
+        "user_source": user_source,
+        "event_type": ActivityEventType.TOOL_CALL,
+        "status": status,
+        "duration_ms": duration_ms,
+        "data": data,
+        "error_message": error_message,
+    }
+
+
 class ActivityLoggerMiddleware(BaseHTTPMiddleware):
     """
     Middleware to log all API requests as activity events
     """
 
-    def __init__(self, app: ASGIApp):
+    def __init__(self, app: ASGIApp, writer: ActivityEventWriter = None):
         super().__init__(app)
+        self.writer = writer or activity_writer
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Skip logging for health checks, static files, and WebSocket connections
@@ -52,13 +279,13 @@ class ActivityLoggerMiddleware(BaseHTTPMiddleware):
         else:
             status = ActivityEventStatus.ERROR
 
-        # Create activity event in database
+        # Queue the activity event; the writer persists it in the background
         try:
-            db = SessionLocal()
-            activity_event = ActivityEvent(
+            if not self.writer.running:
+                self.writer.start()
+            self.writer.enqueue(_event_row(
                 tool_name=tool_name,
                 user_source=user_source,
-                event_type=ActivityEventType.TOOL_CALL,
                 status=status,
                 duration_ms=duration_ms,
                 data=json.dumps({
@@ -66,11 +293,8 @@ class ActivityLoggerMiddleware(BaseHTTPMiddleware):
                     "path": path,
                     "status_code": response.status_code,
                     "query_params": dict(request.query_params)
-                })
-            )
-            db.add(activity_event)
-            db.commit()
-            db.close()
+                }),
+            ))
         except Exception as e:
             logger.error("Error logging activity: %s", e)
 
@@ -86,35 +310,38 @@ def log_mcp_tool_call(
     """
     Helper function to log MCP tool calls
 
+    Without ``db`` the event goes through the write-behind writer and the
+    returned ActivityEvent is transient (its ``id`` is not assigned). Pass a
+    session when the caller needs the persisted row, e.g. to call
+    ``update_mcp_tool_result`` later.
+
     Args:
         tool_name: Name of the MCP tool being called
         user_source: Source of the call (e.g., "Claude Desktop")
         metadata: Additional metadata about the tool call
-        db: Database session (optional, will create new if not provided)
+        db: Database session (optional; writes synchronously when provided)
 
     Returns:
         The created ActivityEvent
     """
-    should_close_db = False
+    data = json.dumps(metadata) if metadata else None
+
     if db is None:
-        db = SessionLocal()
-        should_close_db = True
+        row = _event_row(tool_name, user_source, ActivityEventStatus.PENDING, data=data)
+        activity_writer.enqueue(row)
+        return ActivityEvent(**row)
 
-    try:
-        activity_event = ActivityEvent(
-            tool_name=tool_name,
-            user_source=user_source,
-            event_type=ActivityEventType.TOOL_CALL,
-            status=ActivityEventStatus.PENDING,
-            data=json.dumps(metadata) if metadata else None
-        )
-        db.add(activity_event)
-        db.commit()
-        db.refresh(activity_event)
-        return activity_event
-    finally:
-        if should_close_db:
-            db.close()
+    activity_event = ActivityEvent(
+        tool_name=tool_name,
+        user_source=user_source,
+        event_type=ActivityEventType.TOOL_CALL,
+        status=ActivityEventStatus.PENDING,
+        data=data
+    )
+    db.add(activity_event)
+    db.commit()
+    db.refresh(activity_event)
+    return activity_event
 
 
 def update_mcp_tool_result(
@@ -3,11 +3,11 @@
 import logging
 import os
 
-from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.api_key_cache import get_cached_agent_id, cache_agent_id
+from app.api_key_cache import resolve_agent_id
 from app.auth import verify_api_key, hash_api_key
 from app.database import SessionLocal
 
@@ -17,45 +17,60 @@ logger = logging.getLogger(__name__)
 PUBLIC_PATHS = frozenset(("/", "/docs", "/redoc", "/openapi.json", "/health", "/setup", "/rate-limit", "/metrics"))
 PUBLIC_PREFIXES = ("/webhooks/", "/ws", "/cache/", "/agents/register", "/api/setup", "/portal/")
 
+_LOCAL_HOSTS = ("127.0.0.1", "::1", "localhost")
 
-class ApiKeyMiddleware(BaseHTTPMiddleware):
-    """Validate X-API-Key header on all non-public requests with caching."""
 
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
+def is_public_path(path: str) -> bool:
+    return path in PUBLIC_PATHS or path.startswith(PUBLIC_PREFIXES)
 
-        # Skip auth for public paths
-        if path in PUBLIC_PATHS or any(path.startswith(p) for p in PUBLIC_PREFIXES):
-            return await call_next(request)
+
+def _lookup_agent_id(api_key: str) -> int | None:
+    db = SessionLocal()
+    try:
+        agent = verify_api_key(db, api_key)
+        return agent.id if agent else None
+    finally:
+        db.close()
+
+
+class ApiKeyMiddleware:
+    """Validate X-API-Key header on all non-public requests with caching.
+
+    Implemented as a plain ASGI middleware so authenticated requests are
+    handed straight to the app without BaseHTTPMiddleware's extra task and
+    response buffering. Non-HTTP scopes (WebSocket, lifespan) pass through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or is_public_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
 
         # Skip auth for localhost requests only in test mode
         if os.getenv("TESTING") == "1":
-            client_host = request.client.host if request.client else None
-            if client_host in ("127.0.0.1", "::1", "localhost"):
-                request.state.agent_id = 1
-                return await call_next(request)
+            client = scope.get("client")
+            if client and client[0] in _LOCAL_HOSTS:
+                state["agent_id"] = 1
+                await self.app(scope, receive, send)
+                return
 
-        api_key = request.headers.get("x-api-key")
+        api_key = Headers(scope=scope).get("x-api-key")
         if not api_key:
-            return JSONResponse(status_code=401, content={"error": "unauthorized", "message": "Missing API key"})
-
-        # Check cache first
-        key_hash = hash_api_key(api_key)
-        cached_agent_id = await get_cached_agent_id(key_hash)
-
-        if cached_agent_id:
-            request.state.agent_id = cached_agent_id
-            return await call_next(request)
-
-        # Cache miss - query database
-        db = SessionLocal()
-        try:
-            agent = verify_api_key(db, api_key)
-            if not agent:
-                return JSONResponse(status_code=401, content={"error": "unauthorized", "message": "Invalid API key"})
-            await cache_agent_id(key_hash, agent.id)
-            request.state.agent_id = agent.id
-        finally:
-            db.close()
-
-        return await call_next(request)
+            response = JSONResponse(status_code=401, content={"error": "unauthorized", "message": "Missing API key"})
+            await response(scope, receive, send)
+            return
+
+        # Cached verdict, or one database lookup off the event loop
+        agent_id = await resolve_agent_id(hash_api_key(api_key), lambda: _lookup_agent_id(api_key))
+        if not agent_id:
+            response = JSONResponse(status_code=401, content={"error": "unauthorized", "message": "Invalid API key"})
+            await response(scope, receive, send)
+            return
+
+        state["agent_id"] = agent_id
+        await self.app(scope, receive, send)
@@ -1,11 +1,10 @@
 """Prometheus metrics middleware for request monitoring."""
 import time
 import logging
-from typing import Callable
-
-from starlette.middleware.base import BaseHTTPMiddleware
+import threading
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -46,29 +45,100 @@ if PROMETHEUS_AVAILABLE:
         "Total HTTP errors by type",
         ["error_type"],
     )
+    ACTIVITY_QUEUE_DEPTH = Gauge(
+        "activity_events_queue_depth",
+        "Activity events waiting in the write-behind buffer",
+    )
+    ACTIVITY_FLUSH_LATENCY = Histogram(
+        "activity_events_flush_seconds",
+        "Time to bulk-insert one batch of activity events",
+        buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+    )
+    ACTIVITY_EVENTS_WRITTEN = Counter(
+        "activity_events_written_total",
+        "Activity events persisted by the write-behind writer",
+    )
+    ACTIVITY_EVENTS_DROPPED = Counter(
+        "activity_events_dropped_total",
+        "Activity events discarded under backpressure",
+        ["reason"],
+    )
+    HTTP_CLIENT_REQUESTS = Gauge(
+        "http_client_requests",
+        "Cumulative outbound requests per pooled HTTP client",
+        ["client"],
+    )
+    HTTP_CLIENT_ERRORS = Gauge(
+        "http_client_errors",
+        "Cumulative outbound transport errors and 5xx responses per pooled HTTP client",
+        ["client"],
+    )
+    HTTP_CLIENT_IN_FLIGHT = Gauge(
+        "http_client_in_flight",
+        "Outbound requests currently in flight per pooled HTTP client",
+        ["client"],
+    )
+    HTTP_CLIENT_CONNECTIONS = Gauge(
+        "http_client_open_connections",
+        "Open pooled connections per HTTP client",
+        ["client"],
+    )
+    CACHE_ENTRIES = Gauge(
+        "cache_entries",
+        "Entries held by an in-process cache",
+        ["cache"],
+    )
+    CACHE_BYTES = Gauge(
+        "cache_bytes",
+        "Approximate bytes held by an in-process cache",
+        ["cache"],
+    )
+    CACHE_EVENTS = Counter(
+        "cache_events_total",
+        "In-process cache events (hit, miss, eviction, expiration)",
+        ["cache", "event"],
+    )
+
+# Cache event totals already exported, keyed by (cache, event): each scrape
+# adds only what happened since the previous one to CACHE_EVENTS. Scrapes run
+# in the threadpool, hence the lock.
+_cache_events_exported: dict[tuple[str, str], int] = {}
+_cache_events_lock = threading.Lock()
+
 
+class MetricsMiddleware:
+    """Collect request metrics for Prometheus.
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Collect request metrics for Prometheus."""
+    Plain ASGI middleware: the status code is read from the
+    ``http.response.start`` message, so streaming bodies are forwarded
+    untouched.
+    """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        if not PROMETHEUS_AVAILABLE:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Skip metrics for the metrics endpoint itself
-        if request.url.path == "/metrics":
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip metrics for non-HTTP scopes and the metrics endpoint itself
+        if not PROMETHEUS_AVAILABLE or scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
 
-        method = request.method
+        method = scope["method"]
         # Normalize path to avoid cardinality explosion
-        path = self._normalize_path(request.url.path)
+        path = self._normalize_path(scope["path"])
+        status_code = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         ACTIVE_REQUESTS.inc()
         start = time.perf_counter()
         try:
-            response = await call_next(request)
-            REQUEST_COUNT.labels(method=method, endpoint=path, status_code=response.status_code).inc()
-            return response
+            await self.app(scope, receive, send_with_status)
+            REQUEST_COUNT.labels(method=method, endpoint=path, status_code=status_code).inc()
         except Exception as e:
             ERROR_COUNT.labels(error_type=type(e).__name__).inc()
             raise
@@ -104,6 +174,40 @@ def metrics_endpoint(request: Request) -> Response:
     except Exception:
         pass
 
+    # Update activity writer queue depth
+    try:
+        from app.middleware.activity_logger import activity_writer
+        ACTIVITY_QUEUE_DEPTH.set(activity_writer.depth)
+    except Exception:
+        pass
+
+    # Update outbound HTTP pool metrics
+    try:
+        from app.utils.http_clients import http_clients
+        for name, status in http_clients.status().items():
+            HTTP_CLIENT_REQUESTS.labels(client=name).set(status["requests"])
+            HTTP_CLIENT_ERRORS.labels(client=name).set(status["errors"])
+            HTTP_CLIENT_IN_FLIGHT.labels(client=name).set(status["in_flight"])
+            HTTP_CLIENT_CONNECTIONS.labels(client=name).set(status["open_connections"])
+    except Exception:
+        pass
+
+    # Update in-process cache metrics
+    try:
+        from app.services.cache import all_caches
+        for name, cache in all_caches().items():
+            stats = cache.stats()
+            CACHE_ENTRIES.labels(cache=name).set(stats["total_entries"])
+            CACHE_BYTES.labels(cache=name).set(stats["bytes"])
+            with _cache_events_lock:
+                for event in ("hits", "misses", "evictions", "expirations"):
+                    delta = stats[event] - _cache_events_exported.get((name, event), 0)
+                    if delta > 0:
+                        CACHE_EVENTS.labels(cache=name, event=event).inc(delta)
+                    _cache_events_exported[(name, event)] = stats[event]
+    except Exception:
+        pass
+
     return Response(
         content=generate_latest(),
         media_type=CONTENT_TYPE_LATEST,
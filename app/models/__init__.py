@@ -38,6 +38,7 @@ from app.models.property_note import PropertyNote, NoteSource
 from app.models.contact_lists import ContactList
 from app.models.direct_mail import DirectMail, DirectMailTemplate
 from app.models.scheduled_task import ScheduledTask, TaskType, TaskStatus
+from app.models.bulk_job import BulkJob, BulkJobStatus
 from app.models.market_watchlist import MarketWatchlist
 from app.models.deal_outcome import DealOutcome, OutcomeStatus, AgentPerformanceMetrics, PredictionLog
 # Voice and Phone
@@ -89,4 +90,4 @@ from app.models.video_enhancement import (
     VideoThumbnail, ShotstackWebhook, CmaVideo, ListingSlideshow,
 )
 
-__all__ = ["Agent", "Property", "SkipTrace", "Contact", "Todo", "Contract", "ContractTemplate", "AgentPreference", "ContractSubmitter", "ZillowEnrichment", "ActivityEvent", "PropertyRecap", "DealTypeConfig", "Research", "ResearchTemplate", "AgentConversation", "ComplianceRule", "ComplianceCheck", "ComplianceViolation", "ComplianceRuleTemplate", "Notification", "ResearchProperty", "AgenticJob", "AgenticJobStatus", "EvidenceItem", "CompSale", "CompRental", "Underwriting", "RiskScore", "Dossier", "PortalCache", "WorkerRun", "VoiceMemoryNode", "VoiceMemoryEdge", "VoiceCampaign", "VoiceCampaignTarget", "Offer", "OfferStatus", "FinancingType", "ConversationHistory", "PropertyNote", "NoteSource", "ScheduledTask", "TaskType", "TaskStatus", "MarketWatchlist", "DealOutcome", "OutcomeStatus", "AgentPerformanceMetrics", "PredictionLog", "PhoneNumber", "PhoneCall", "Workspace", "WorkspaceAPIKey", "CommandPermission", "API_SCOPES", "Skill", "AgentSkill", "SkillReview", "VideoGenVideo", "VideoGenAvatar", "VideoGenScriptTemplate", "VideoGenSettings", "PostizAccount", "PostizPost", "PostizCalendar", "PostizTemplate", "PostizAnalytics", "PostizCampaign", "RenderJob", "TimelineProject", "PortalUser", "PropertyAccess", "PortalActivity", "AgentBrand", "CalendarConnection", "SyncedCalendarEvent", "CalendarEvent", "PhotoOrder", "PhotoOrderItem", "PhotoOrderDeliverable", "PhotoOrderTemplate", "PhotoProvider", "PhotoOrderStatus", "PhotoServiceType", "PropertyWebsite", "WebsiteAnalytics", "AgentVideoProfile", "PropertyVideo", "VideoTypeEnum", "VideoGenerationStatus", "TalkingHeadVideo", "PropertyVideoJob", "KnowledgeDocument", "KnowledgeChunk", "DocumentType", "WebhookRegistration", "VoiceAgentCall", "TriagedEmail", "FollowUpSequence", "SequenceTouch", "DealJournalEntry", "Transaction", "TransactionMilestone", "TransactionStatus", "MilestoneStatus", "PartyRole"]
+__all__ = ["Agent", "Property", "SkipTrace", "Contact", "Todo", "Contract", "ContractTemplate", "AgentPreference", "ContractSubmitter", "ZillowEnrichment", "ActivityEvent", "PropertyRecap", "DealTypeConfig", "Research", "ResearchTemplate", "AgentConversation", "ComplianceRule", "ComplianceCheck", "ComplianceViolation", "ComplianceRuleTemplate", "Notification", "ResearchProperty", "AgenticJob", "AgenticJobStatus", "EvidenceItem", "CompSale", "CompRental", "Underwriting", "RiskScore", "Dossier", "PortalCache", "WorkerRun", "VoiceMemoryNode", "VoiceMemoryEdge", "VoiceCampaign", "VoiceCampaignTarget", "Offer", "OfferStatus", "FinancingType", "ConversationHistory", "PropertyNote", "NoteSource", "ScheduledTask", "TaskType", "TaskStatus", "BulkJob", "BulkJobStatus", "MarketWatchlist", "DealOutcome", "OutcomeStatus", "AgentPerformanceMetrics", "PredictionLog", "PhoneNumber", "PhoneCall", "Workspace", "WorkspaceAPIKey", "CommandPermission", "API_SCOPES", "Skill", "AgentSkill", "SkillReview", "VideoGenVideo", "VideoGenAvatar", "VideoGenScriptTemplate", "VideoGenSettings", "PostizAccount", "PostizPost", "PostizCalendar", "PostizTemplate", "PostizAnalytics", "PostizCampaign", "RenderJob", "TimelineProject", "PortalUser", "PropertyAccess", "PortalActivity", "AgentBrand", "CalendarConnection", "SyncedCalendarEvent", "CalendarEvent", "PhotoOrder", "PhotoOrderItem", "PhotoOrderDeliverable", "PhotoOrderTemplate", "PhotoProvider", "PhotoOrderStatus", "PhotoServiceType", "PropertyWebsite", "WebsiteAnalytics", "AgentVideoProfile", "PropertyVideo", "VideoTypeEnum", "VideoGenerationStatus", "TalkingHeadVideo", "PropertyVideoJob", "KnowledgeDocument", "KnowledgeChunk", "DocumentType", "WebhookRegistration", "VoiceAgentCall", "TriagedEmail", "FollowUpSequence", "SequenceTouch", "DealJournalEntry", "Transaction", "TransactionMilestone", "TransactionStatus", "MilestoneStatus", "PartyRole"]
@@ -5,7 +5,7 @@ Tracks user interactions, conversions, and custom events
 for analytics and reporting.
 """
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey, Text, Index
+from sqlalchemy import BigInteger, Column, Date, Integer, String, DateTime, JSON, ForeignKey, Text, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -95,3 +95,36 @@ class AnalyticsEvent(Base):
             "currency": self.currency,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
+
+
+class AnalyticsDailyRollup(Base):
+    """
+    Pre-aggregated event counts per agent, UTC day and event type.
+
+    Kept current by ``AnalyticsService.track_event`` (upsert in the same
+    transaction as the event) and rebuilt from ``analytics_events`` by
+    ``analytics_rollup_service.rebuild`` (backfill and nightly repair), so
+    dashboards read a few hundred rows instead of scanning raw events.
+    """
+
+    __tablename__ = "analytics_daily_rollups"
+
+    id = Column(Integer, primary_key=True)
+    agent_id = Column(Integer, ForeignKey("agents.id"), nullable=False)
+    day = Column(Date, nullable=False)
+    event_type = Column(String(100), nullable=False)
+    event_count = Column(Integer, nullable=False, default=0)
+    value_sum = Column(BigInteger, nullable=False, default=0)  # cents
+
+    __table_args__ = (
+        UniqueConstraint("agent_id", "day", "event_type", name="uq_analytics_rollup_agent_day_type"),
+    )
+
+    def to_dict(self):
+        return {
+            "agent_id": self.agent_id,
+            "day": self.day.isoformat() if self.day else None,
+            "event_type": self.event_type,
+            "event_count": self.event_count,
+            "value_sum": self.value_sum,
+        }
@@ -0,0 +1,61 @@
+"""Bulk operation job — a resumable, persisted run of a bulk operation."""
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class BulkJobStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    TERMINAL = (COMPLETED, FAILED)
+
+
+class BulkJob(Base):
+    __tablename__ = "bulk_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    operation = Column(String(64), nullable=False)
+    params = Column(JSON, nullable=True)
+    status = Column(String(32), nullable=False, default=BulkJobStatus.PENDING, index=True)
+
+    # Properties resolved when the job was created; a resumed run skips the
+    # ids already present in ``results``.
+    property_ids = Column(JSON, nullable=False)
+    results = Column(JSON, nullable=False, default=list)
+
+    total = Column(Integer, nullable=False, default=0)
+    succeeded = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    skipped = Column(Integer, nullable=False, default=0)
+
+    voice_summary = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
+
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def to_dict(self, include_results: bool = False) -> dict:
+        data = {
+            "id": self.id,
+            "operation": self.operation,
+            "status": self.status,
+            "total": self.total,
+            "processed": len(self.results or []),
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "voice_summary": self.voice_summary,
+            "error": self.error,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        }
+        if include_results:
+            data["results"] = list(self.results or [])
+        return data
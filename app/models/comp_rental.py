@@ -17,6 +17,8 @@ class CompRental(Base):
 
     address = Column(String, nullable=False)
     distance_mi = Column(Float, nullable=True)
+    geo_lat = Column(Float, nullable=True)
+    geo_lng = Column(Float, nullable=True)
     rent = Column(Float, nullable=True)
     date_listed = Column(Date, nullable=True)
     sqft = Column(Integer, nullable=True)
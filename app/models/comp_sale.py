@@ -17,6 +17,8 @@ class CompSale(Base):
 
     address = Column(String, nullable=False)
     distance_mi = Column(Float, nullable=True)
+    geo_lat = Column(Float, nullable=True)
+    geo_lng = Column(Float, nullable=True)
     sale_date = Column(Date, nullable=True)
     sale_price = Column(Float, nullable=True)
     sqft = Column(Integer, nullable=True)
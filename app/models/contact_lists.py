@@ -1,10 +1,10 @@
 """
 Contact List Models for organizing contacts into smart lists
 """
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON, ForeignKey, Index, Text, event
+from sqlalchemy.orm import Session, relationship
 from sqlalchemy.dialects.postgresql import ENUM
 
 from app.database import Base
@@ -74,7 +74,7 @@ class ContactList(Base):
     filters = Column(JSON, nullable=True)
     # Examples: {"city": "Miami", "state": "FL", "property_type": "condo"}
 
-    # List membership (for manual lists, for smart lists this is auto-calculated)
+    # Legacy manual-list membership; members now live in contact_list_members
     contact_ids = Column(JSON, nullable=True)  # List[int]
 
     # Linked campaign (if list_type=campaign)
@@ -102,93 +102,87 @@ class ContactList(Base):
 
     def get_contacts_query(self, db):
         """
-        Get SQLAlchemy query for contacts in this list
+        Get SQLAlchemy query for contacts in this list, in contact id order
 
-        For smart lists, applies the rule dynamically
-        For manual lists, returns contacts by ID
+        Reads the materialized membership; smart rules are applied by
+        app.services.contact_list_membership as contacts change.
         """
         from app.models.contact import Contact
 
-        if self.list_type == ListType.SMART and self.smart_rule:
-            # Build dynamic query based on smart rule
-            query = db.query(Contact).filter(Contact.agent_id == self.agent_id)
-
-            # Apply time-based rules
-            now = datetime.utcnow()
-            if self.smart_rule == SmartListRule.LAST_24_HOURS:
-                cutoff = now - timedelta(hours=24)
-                query = query.filter(Contact.created_at >= cutoff)
-            elif self.smart_rule == SmartListRule.LAST_2_DAYS:
-                cutoff = now - timedelta(days=2)
-                query = query.filter(Contact.created_at >= cutoff)
-            elif self.smart_rule == SmartListRule.LAST_7_DAYS:
-                cutoff = now - timedelta(days=7)
-                query = query.filter(Contact.created_at >= cutoff)
-            elif self.smart_rule == SmartListRule.THIS_WEEK:
-                # Start of current week (Monday)
-                days_since_monday = now.weekday()
-                start_of_week = now - timedelta(days=days_since_monday)
-                start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
-                query = query.filter(Contact.created_at >= start_of_week)
-            elif self.smart_rule == SmartListRule.THIS_MONTH:
-                # Start of current month
-                start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-                query = query.filter(Contact.created_at >= start_of_month)
-            elif self.smart_rule == SmartListRule.LAST_30_DAYS:
-                cutoff = now - timedelta(days=30)
-                query = query.filter(Contact.created_at >= cutoff)
-            elif self.smart_rule == SmartListRule.LAST_90_DAYS:
-                cutoff = now - timedelta(days=90)
-                query = query.filter(Contact.created_at >= cutoff)
-
-            # Apply property-based rules
-            elif self.smart_rule == SmartListRule.NO_PROPERTY:
-                query = query.filter(Contact.property_id.is_(None))
-            elif self.smart_rule == SmartListRule.HAS_PROPERTY:
-                query = query.filter(Contact.property_id.isnot(None))
-
-            # Apply contact info rules
-            elif self.smart_rule == SmartListRule.NO_PHONE:
-                query = query.filter(Contact.phone.is_(None))
-            elif self.smart_rule == SmartListRule.HAS_EMAIL:
-                query = query.filter(Contact.email.isnot(None))
-
-            # Apply additional filters from JSON
-            if self.filters:
-                if "city" in self.filters:
-                    query = query.filter(Contact.city.ilike(f"%{self.filters['city']}%"))
-                if "state" in self.filters:
-                    query = query.filter(Contact.state == self.filters['state'])
-                if "zip_code" in self.filters:
-                    query = query.filter(Contact.zip_code == self.filters['zip_code'])
-
-            return query
-
-        elif self.list_type in [ListType.MANUAL, ListType.IMPORTED, ListType.CAMPAIGN]:
-            # Return contacts by ID
-            if self.contact_ids:
-                return db.query(Contact).filter(
-                    Contact.id.in_(self.contact_ids),
-                    Contact.agent_id == self.agent_id
-                )
-            else:
-                return db.query(Contact).filter(False)  # Empty result
-
-        return db.query(Contact).filter(False)
+        return (
+            db.query(Contact)
+            .join(ContactListMember, ContactListMember.contact_id == Contact.id)
+            .filter(ContactListMember.list_id == self.id)
+            .order_by(Contact.id)
+        )
 
     def refresh_count(self, db):
-        """Update total_contacts count based on current query"""
-        query = self.get_contacts_query(db)
-        self.total_contacts = query.count()
-        self.last_refreshed_at = datetime.utcnow()
+        """Rebuild membership (smart lists) and recount total_contacts"""
+        from app.services.contact_list_membership import rebuild
 
-        # Update last contact added timestamp
-        latest_contact = query.order_by(Contact.created_at.desc()).first()
-        if latest_contact:
-            self.last_contact_added_at = latest_contact.created_at
+        rebuild(db, self)
 
-        db.commit()
+
+class ContactListMember(Base):
+    """
+    Materialized list membership: one row per (list, contact)
+
+    contact_created_at is copied from the contact so time-window smart lists
+    can expire members with an indexed delete.
+    """
+    __tablename__ = "contact_list_members"
+    __table_args__ = (
+        Index("ix_contact_list_members_contact_id", "contact_id"),
+        Index("ix_contact_list_members_list_created", "list_id", "contact_created_at"),
+    )
+
+    list_id = Column(Integer, ForeignKey("contact_lists.id", ondelete="CASCADE"), primary_key=True)
+    contact_id = Column(Integer, ForeignKey("contacts.id", ondelete="CASCADE"), primary_key=True)
+    contact_created_at = Column(DateTime(timezone=True), nullable=True)
+    added_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+# Keep smart lists current as contacts change. Touched contact ids are
+# collected per flush and applied once, inside the transaction, at commit.
+# Deletes are handled before the flush, while the member rows still exist.
+_PENDING_KEY = "contact_list_sync"
+
+
+@event.listens_for(Session, "before_flush")
+def _drop_deleted_contacts(session, flush_context, instances) -> None:
+    from app.models.contact import Contact
+
+    deleted = {obj.id for obj in session.deleted if isinstance(obj, Contact)}
+    if deleted:
+        from app.services.contact_list_membership import drop_contacts
+
+        drop_contacts(session, deleted)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_contact_changes(session, flush_context) -> None:
+    from app.models.contact import Contact
+    from app.models.direct_mail import DirectMail
+
+    changed = {obj.id for obj in session.new if isinstance(obj, Contact)}
+    # First mail sent to a contact takes it off "uncontacted" lists.
+    changed |= {obj.contact_id for obj in session.new if isinstance(obj, DirectMail) and obj.contact_id}
+    changed |= {obj.id for obj in session.dirty if isinstance(obj, Contact) and session.is_modified(obj)}
+    if changed:
+        session.info.setdefault(_PENDING_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "before_commit")
+def _sync_contact_lists(session) -> None:
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+    changed = session.info.pop(_PENDING_KEY, None)
+    if changed:
+        from app.services.contact_list_membership import sync_contacts
+
+        sync_contacts(session, changed)
 
 
-# Add relationship to Agent model (would need to update agent.py)
-# Add relationship to DirectMailCampaign model (would need to update direct_mail.py)
+@event.listens_for(Session, "after_rollback")
+def _discard_contact_changes(session) -> None:
+    session.info.pop(_PENDING_KEY, None)
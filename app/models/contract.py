@@ -31,6 +31,9 @@ class Contract(Base):
         Index("ix_contracts_status", "status"),
         Index("ix_contracts_property_status", "property_id", "status"),
         Index("ix_contracts_created_at", "created_at"),
+        Index("ix_contracts_property_created", "property_id", "created_at"),
+        Index("ix_contracts_property_sent", "property_id", "sent_at"),
+        Index("ix_contracts_property_completed", "property_id", "completed_at"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
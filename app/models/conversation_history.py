@@ -25,4 +25,5 @@ class ConversationHistory(Base):
 
     __table_args__ = (
         Index("ix_conversation_history_session_created", "session_id", "created_at"),
+        Index("ix_conversation_history_property_created", "property_id", "created_at"),
     )
@@ -1,8 +1,9 @@
 """Direct Mail Models for Lob.com Integration"""
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, JSON, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, JSON, ForeignKey, UniqueConstraint, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from app.database import Base
 import enum
 
@@ -46,6 +47,10 @@ class DirectMail(Base):
     Tracks postcards, letters, and checks sent to contacts/properties
     """
     __tablename__ = "direct_mail"
+    __table_args__ = (
+        # A campaign mails each recipient once, however many runs materialize it
+        UniqueConstraint("campaign_id", "recipient_key", name="uq_direct_mail_campaign_recipient"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -53,6 +58,8 @@ class DirectMail(Base):
     agent_id = Column(Integer, ForeignKey("agents.id"), nullable=False)
     property_id = Column(Integer, ForeignKey("properties.id"), nullable=True)
     contact_id = Column(Integer, ForeignKey("contacts.id"), nullable=True)
+    campaign_id = Column(Integer, ForeignKey("direct_mail_campaigns.id"), nullable=True, index=True)
+    recipient_key = Column(String(64), nullable=True)  # "contact:<id>" or "property:<id>" for campaign pieces
 
     # Mail details
     mail_type = Column(SQLEnum(MailType), nullable=False)
@@ -101,8 +108,8 @@ class DirectMail(Base):
     campaign_metadata = Column(JSON)  # Additional campaign data (renamed from metadata to avoid SQLAlchemy reserved word)
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default="now()", nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate="now()")
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
     agent = relationship("Agent")
@@ -146,8 +153,8 @@ class DirectMailTemplate(Base):
     is_system_template = Column(Boolean, default=False)  # Pre-built templates
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default="now()", nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate="now()")
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationship
     agent = relationship("Agent")
@@ -192,10 +199,11 @@ class DirectMailCampaign(Base):
 
     # Status
     status = Column(String(50), default="draft")  # draft, scheduled, sending, completed, cancelled
+    run_lease_expires_at = Column(DateTime(timezone=True), nullable=True)  # Held by the run currently sending
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default="now()", nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate="now()")
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationship
     agent = relationship("Agent")
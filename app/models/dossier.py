@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Index, Integer, DateTime, Text, JSON, ForeignKey
+from sqlalchemy import Boolean, Column, Index, Integer, DateTime, String, Text, JSON, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -18,6 +18,8 @@ class Dossier(Base):
     markdown = Column(Text, nullable=False)
     citations = Column(JSON, nullable=True)
 
+    embedding_hash = Column(String(64), nullable=True)  # see Property.embedding_hash
+
     is_current = Column(Boolean, nullable=False, server_default="true")
     superseded_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -20,6 +20,8 @@ class EvidenceItem(Base):
     confidence = Column(Float, nullable=True)
     hash = Column(String(64), nullable=False, unique=True, index=True)
 
+    embedding_hash = Column(String(64), nullable=True)  # see Property.embedding_hash
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     research_property = relationship("ResearchProperty", back_populates="evidence_items")
@@ -1,7 +1,7 @@
 """
 Notification model for real-time alerts
 """
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Enum as SQLEnum
+from sqlalchemy import Column, Index, Integer, String, DateTime, Boolean, Text, Enum as SQLEnum
 from sqlalchemy.sql import func
 from app.database import Base
 import enum
@@ -65,3 +65,7 @@ class Notification(Base):
 
     # Auto-dismiss after X seconds (for TV display)
     auto_dismiss_seconds = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        Index("ix_notifications_property_created", "property_id", "created_at"),
+    )
@@ -10,6 +10,12 @@ class PortalCache(Base):
     id = Column(Integer, primary_key=True, index=True)
     url_hash = Column(String(64), nullable=False, unique=True, index=True)
     source_url = Column(String(1000), nullable=False)
-    raw_html = Column(Text, nullable=False)
+    # Legacy inline copy; new entries keep the page in the blob store.
+    raw_html = Column(Text, nullable=True)
+    # Blob store keys (SHA-256 of the HTML and of its extracted text)
+    content_hash = Column(String(64), nullable=True, index=True)
+    text_hash = Column(String(64), nullable=True, index=True)
+    html_bytes = Column(Integer, nullable=True)
+    stored_bytes = Column(Integer, nullable=True)
     captured_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
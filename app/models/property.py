@@ -1,10 +1,11 @@
-from sqlalchemy import Column, Index, Integer, String, Float, DateTime, ForeignKey, Enum, JSON
+from sqlalchemy import Column, Index, event, Integer, String, Float, DateTime, ForeignKey, Enum, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 
 from app.database import Base
 from app.models.analytics_event import AnalyticsEvent  # noqa: F401
+from app.utils.geo import encode_geohash
 
 
 class PropertyStatus(str, enum.Enum):
@@ -44,6 +45,7 @@ class Property(Base):
         Index("ix_properties_agent_status", "agent_id", "status"),
         Index("ix_properties_created_at", "created_at"),
         Index("ix_properties_state_city", "state", "city"),
+        Index("ix_properties_geohash", "geohash"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -59,6 +61,10 @@ class Property(Base):
     square_feet = Column(Integer, nullable=True)
     lot_size = Column(Float, nullable=True)
     year_built = Column(Integer, nullable=True)
+    # Coordinates; geohash is derived from them on flush and backs radius searches
+    geo_lat = Column(Float, nullable=True)
+    geo_lng = Column(Float, nullable=True)
+    geohash = Column(String(12), nullable=True)
     property_type = Column(Enum(PropertyType), default=PropertyType.HOUSE)
     status = Column(Enum(PropertyStatus, values_callable=lambda x: [e.value for e in x]), default=PropertyStatus.NEW_PROPERTY)
     deal_type = Column(Enum(DealType), nullable=True)
@@ -73,6 +79,9 @@ class Property(Base):
     pipeline_started_at = Column(DateTime, nullable=True)
     pipeline_completed_at = Column(DateTime, nullable=True)
 
+    # SHA-256 of the text last embedded (the vector lives in the pgvector-only `embedding` column)
+    embedding_hash = Column(String(64), nullable=True)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -96,3 +105,12 @@ class Property(Base):
     direct_mail_campaigns = relationship("DirectMail", back_populates="property")
     # Analytics events tracking
     analytics_events = relationship("AnalyticsEvent", back_populates="property")
+
+
+@event.listens_for(Property, "before_insert")
+@event.listens_for(Property, "before_update")
+def _sync_geohash(mapper, connection, target: Property) -> None:
+    if target.geo_lat is None or target.geo_lng is None:
+        target.geohash = None
+    else:
+        target.geohash = encode_geohash(target.geo_lat, target.geo_lng)
@@ -20,6 +20,7 @@ class PropertyNote(Base):
     __table_args__ = (
         Index("ix_property_notes_property_id", "property_id"),
         Index("ix_property_notes_created_at", "created_at"),
+        Index("ix_property_notes_property_created", "property_id", "created_at"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -29,6 +29,8 @@ class PropertyRecap(Base):
     version = Column(Integer, default=1)  # Increments on each update
     last_trigger = Column(String(100), nullable=True)  # What caused the update
 
+    embedding_hash = Column(String(64), nullable=True)  # see Property.embedding_hash
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
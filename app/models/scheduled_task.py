@@ -1,6 +1,6 @@
 """Scheduled task model for voice-created reminders and recurring automation."""
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, Boolean
+from sqlalchemy import Column, Index, Integer, String, DateTime, ForeignKey, Text, Enum, Boolean
 from sqlalchemy.types import JSON
 from sqlalchemy.sql import func
 import enum
@@ -47,7 +47,19 @@ class ScheduledTask(Base):
     action = Column(String(100), nullable=True)
     action_params = Column(JSON, nullable=True)
 
+    # Execution lease — set when a runner claims the task; an expired lease
+    # (runner crashed) makes a RUNNING task claimable again
+    lease_owner = Column(String(64), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    lease_version = Column(Integer, nullable=False, default=0, server_default="0")
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+
     # Tracking
     created_by = Column(String(50), default="voice")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_scheduled_tasks_created_at", "created_at"),
+        Index("ix_scheduled_tasks_property_created", "property_id", "created_at"),
+    )
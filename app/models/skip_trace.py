@@ -10,6 +10,7 @@ class SkipTrace(Base):
     __table_args__ = (
         Index("ix_skip_traces_property_id", "property_id"),
         Index("ix_skip_traces_created_at", "created_at"),
+        Index("ix_skip_traces_property_created", "property_id", "created_at"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -58,6 +58,8 @@ class VoiceCampaignTarget(Base):
     attempts_made = Column(Integer, nullable=False, default=0)
     next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     last_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    # Set when a dialer tick claims the target (queued -> in_progress) to call it
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
 
     last_call_id = Column(String(128), nullable=True, index=True)
     last_call_status = Column(String(64), nullable=True)
@@ -13,6 +13,8 @@ class ZillowEnrichment(Base):
     __tablename__ = "zillow_enrichments"
     __table_args__ = (
         Index("ix_zillow_enrichments_property_id", "property_id"),
+        Index("ix_zillow_enrichments_created_at", "created_at"),
+        Index("ix_zillow_enrichments_property_created", "property_id", "created_at"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -16,7 +16,7 @@ from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.auth import verify_api_key
 from app.database import SessionLocal
@@ -134,25 +134,35 @@ def agent_rate_limit(request: Request):
 # Middleware for Toggle Control
 # ============================================================================
 
-class RateLimitToggleMiddleware(BaseHTTPMiddleware):
+class RateLimitToggleMiddleware:
     """
     Middleware to conditionally enable/disable rate limiting.
 
     Allows runtime toggling via RATE_LIMIT_ENABLED environment variable.
+    Plain ASGI: it only annotates request state, so there is no reason to
+    wrap the response the way BaseHTTPMiddleware does.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Add rate limit info to request state for endpoints to check
-        request.state.rate_limit_enabled = RATE_LIMIT_ENABLED
-        request.state.rate_limit_tier = get_agent_tier(request)
-        request.state.rate_limit_config = {
+        state = scope.setdefault("state", {})
+        state["rate_limit_enabled"] = RATE_LIMIT_ENABLED
+        state["rate_limit_tier"] = get_agent_tier(Request(scope))
+        state["rate_limit_config"] = {
             "enabled": RATE_LIMIT_ENABLED,
             "default": RATE_LIMIT_DEFAULT,
             "burst": RATE_LIMIT_BURST,
             "tiers": RATE_LIMIT_TIERS,
         }
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 # ============================================================================
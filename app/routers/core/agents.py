@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.agent import Agent
+from app.api_key_cache import invalidate_api_key_cache
 from app.auth import generate_api_key, hash_api_key
 from app.schemas.agent import AgentCreate, AgentUpdate, AgentResponse, AgentRegister, AgentRegisterResponse
 
@@ -90,6 +91,9 @@ def delete_agent(agent_id: int, db: Session = Depends(get_db)):
     if not db_agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
+    api_key_hash = db_agent.api_key_hash
     db.delete(db_agent)
     db.commit()
+    if api_key_hash:
+        invalidate_api_key_cache(api_key_hash)
     return None
@@ -21,6 +21,7 @@ from app.services.zillow_enrichment import zillow_enrichment_service
 from app.models.zillow_enrichment import ZillowEnrichment
 from app.services.memory_graph import MemoryRef, memory_graph_service
 from app.utils.websocket import get_ws_manager
+from app.websocket import agent_topic, property_topic
 
 router = APIRouter(prefix="/context", tags=["context"])
 
@@ -100,6 +101,8 @@ async def create_property_with_context(
         city=address_details["city"],
         state=address_details["state"],
         zip_code=address_details["zip_code"],
+        geo_lat=address_details.get("lat"),
+        geo_lng=address_details.get("lng"),
         price=request.price,
         bedrooms=request.bedrooms,
         bathrooms=request.bathrooms,
@@ -354,7 +357,7 @@ async def enrich_property_with_zillow(
     # Broadcast enrichment start via WebSocket
     manager = get_ws_manager()
     if manager:
-        await manager.broadcast({
+        await manager.publish([property_topic(property.id), agent_topic(property.agent_id)], {
             "action": "enrichment_start",
             "property_id": property.id,
             "property_address": property.address
@@ -471,7 +474,7 @@ async def enrich_property_with_zillow(
     # Broadcast enrichment complete via WebSocket
     manager = get_ws_manager()
     if manager:
-        await manager.broadcast({
+        await manager.publish([property_topic(property.id), agent_topic(property.agent_id)], {
             "action": "enrichment_complete",
             "property_id": property.id,
             "property_address": property.address
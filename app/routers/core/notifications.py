@@ -89,7 +89,10 @@ async def create_notification(
 
     # Broadcast via WebSocket
     if manager:
-        await manager.broadcast(notification_service.get_websocket_payload(new_notification))
+        await manager.publish(
+            notification_service.get_topics(db, new_notification),
+            notification_service.get_websocket_payload(new_notification),
+        )
 
     return NotificationResponse(
         id=new_notification.id,
@@ -1,9 +1,13 @@
 import asyncio
+import enum
+import json
+from datetime import date, datetime
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session, joinedload
 
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.models.property import Property, PropertyStatus, PropertyType
 from app.models.agent import Agent
 from app.models.phone_call import PhoneCall
@@ -21,6 +25,7 @@ from app.services.contract_auto_attach import contract_auto_attach_service
 from app.services.deal_type_service import apply_deal_type, get_deal_type_summary
 from app.services.scheduled_compliance import schedule_compliance_check
 from app.services.property_pipeline_service import run_auto_enrich_pipeline
+from app.utils.pagination import apply_keyset, encode_cursor
 from app.utils.websocket import get_ws_manager
 
 router = APIRouter(prefix="/properties", tags=["properties"])
@@ -93,6 +98,8 @@ async def create_property_from_voice(
         city=address_details["city"],
         state=address_details["state"],
         zip_code=address_details["zip_code"],
+        geo_lat=address_details.get("lat"),
+        geo_lng=address_details.get("lng"),
         price=property.price,
         bedrooms=property.bedrooms,
         bathrooms=property.bathrooms,
@@ -147,10 +154,38 @@ async def create_property_from_voice(
     )
 
 
+# Scalar columns selectable through ``fields=`` and exported by ``format=ndjson``
+PROPERTY_FIELDS = {c.name: getattr(Property, c.key) for c in Property.__table__.columns}
+NDJSON_CHUNK_SIZE = 1000
+
+
+def _json_value(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _parse_fields(fields: str | None) -> list[str] | None:
+    if not fields:
+        return None
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in names if f not in PROPERTY_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(sorted(PROPERTY_FIELDS))}",
+        )
+    # id and created_at are always selected: they form the cursor
+    return list(dict.fromkeys(["id", *names]))
+
+
 @router.get("/", response_model=list[PropertyResponse])
 def list_properties(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1),
     status: PropertyStatus | None = None,
     property_type: PropertyType | None = None,
     min_price: float | None = None,
@@ -159,15 +194,31 @@ def list_properties(
     bedrooms: int | None = None,
     agent_id: int | None = None,
     include_heartbeat: bool = Query(True, description="Include heartbeat data"),
+    cursor: str | None = Query(None, description="X-Next-Cursor from the previous page (replaces skip)"),
+    fields: str | None = Query(None, description="Comma-separated columns to return, e.g. id,address,city,price"),
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$", description="ndjson streams every matching row"),
     db: Session = Depends(get_db),
 ):
-    query = (
-        db.query(Property)
-        .options(
+    """List properties, newest first.
+
+    Pages are keyset-paginated on ``(created_at, id)``: pass the
+    ``X-Next-Cursor`` response header back as ``cursor`` to fetch the next
+    page. ``fields=`` returns plain objects with only those columns (plus
+    ``id``). ``format=ndjson`` streams all matching rows, one JSON object per
+    line, for exports.
+    """
+    columns = _parse_fields(fields)
+    if output == "ndjson" and columns is None:
+        columns = list(PROPERTY_FIELDS)
+
+    if columns is None:
+        query = db.query(Property).options(
             joinedload(Property.zillow_enrichment),
             joinedload(Property.skip_traces)
         )
-    )
+    else:
+        selected = list(dict.fromkeys([*columns, "created_at"]))
+        query = db.query(*[PROPERTY_FIELDS[name] for name in selected])
 
     if status:
         query = query.filter(Property.status == status)
@@ -184,8 +235,57 @@ def list_properties(
     if agent_id is not None:
         query = query.filter(Property.agent_id == agent_id)
 
-    properties = query.offset(skip).limit(limit).all()
+    try:
+        page_query = apply_keyset(query, Property.created_at, Property.id, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if output == "ndjson":
+        bind = db.get_bind()
+
+        def export():
+            # The body streams after the handler returns and get_db has closed
+            # the request session, so the export reads through its own.
+            export_db = SessionLocal(bind=bind)
+            try:
+                export_query = query.with_session(export_db)
+                after = cursor
+                while True:
+                    rows = (
+                        apply_keyset(export_query, Property.created_at, Property.id, after)
+                        .limit(NDJSON_CHUNK_SIZE)
+                        .all()
+                    )
+                    # One write per chunk: each yield is a threadpool hop
+                    yield "".join(
+                        json.dumps({name: _json_value(getattr(row, name)) for name in columns}) + "\n"
+                        for row in rows
+                    )
+                    if len(rows) < NDJSON_CHUNK_SIZE:
+                        return
+                    after = encode_cursor(rows[-1].created_at, rows[-1].id)
+            finally:
+                export_db.close()
+
+        return StreamingResponse(export(), media_type="application/x-ndjson")
+
+    if not cursor and skip:
+        page_query = page_query.offset(skip)
+    rows = page_query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+
+    if columns is not None:
+        return JSONResponse(
+            content=[{name: _json_value(getattr(row, name)) for name in columns} for row in rows],
+            headers=headers,
+        )
 
+    response.headers.update(headers)
+    properties = rows
     if not include_heartbeat or not properties:
         return properties
 
@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.services.embedding_pipeline import embedding_pipeline
 from app.services.embedding_service import embedding_service
 from app.schemas.search import (
     SemanticSearchRequest,
@@ -130,14 +131,15 @@ def find_similar_properties(
 
 
 @router.post("/backfill", response_model=BackfillResponse)
-def backfill_embeddings(req: BackfillRequest, db: Session = Depends(get_db)):
+async def backfill_embeddings(req: BackfillRequest):
     """
     Backfill embeddings for existing data that doesn't have them yet.
 
     table: "properties" | "property_recaps" | "dossiers" | "evidence" | "all"
+    mode: "missing" (default) | "changed" — also refresh rows whose text changed
     """
     try:
-        result = embedding_service.backfill(db, req.table)
+        result = await embedding_pipeline.run(req.table, only_missing=req.mode == "missing")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
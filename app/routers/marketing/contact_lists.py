@@ -3,18 +3,19 @@ Contact Lists API Router
 
 Organize contacts into smart lists that auto-populate based on rules:
 - Time-based: Last 2 days, This week, This month
-- Property-based: Has property, No property
+- Property-based: Has property
 - Contact info: Has email, No phone
 - Status: Uncontacted
 """
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.database import get_db
-from app.models.contact_lists import ContactList, ListType, SmartListRule
+from app.models.contact_lists import ContactList, ContactListMember, ListType
 from app.models.contact import Contact
+from app.services import contact_list_membership as membership
 from app.schemas.contact_lists import (
     ContactListCreate,
     ContactListUpdate,
@@ -35,6 +36,14 @@ router = APIRouter(
 )
 
 
+def _validate_smart_rule(rule: Optional[str]) -> None:
+    if rule in membership.UNSUPPORTED_RULES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"smart_rule '{rule}' is not supported: every contact is linked to a property"
+        )
+
+
 # ==========================================================================
 # LIST CONTACT LISTS
 # ==========================================================================
@@ -52,7 +61,8 @@ async def list_contact_lists(
     - list_type: Filter by type (smart, manual, imported, campaign)
     - agent_id: Filter by agent ID
 
-    Returns list of contact lists with metadata
+    Returns list of contact lists with metadata. Counts are kept current as
+    contacts change; stale smart lists are rebuilt by the worker.
     """
     query = db.query(ContactList)
 
@@ -62,18 +72,7 @@ async def list_contact_lists(
     if agent_id:
         query = query.filter(ContactList.agent_id == agent_id)
 
-    lists = query.order_by(ContactList.created_at.desc()).limit(100).all()
-
-    # Auto-refresh smart lists if needed
-    for contact_list in lists:
-        if contact_list.list_type == ListType.SMART and contact_list.auto_refresh:
-            # Check if refresh is needed
-            if (not contact_list.last_refreshed_at or
-                (datetime.utcnow() - contact_list.last_refreshed_at).total_seconds() >
-                contact_list.refresh_interval_hours * 3600):
-                contact_list.refresh_count(db)
-
-    return lists
+    return query.order_by(ContactList.created_at.desc()).limit(100).all()
 
 
 @router.get("/presets", response_model=List[SmartListPreset])
@@ -110,7 +109,6 @@ async def create_contact_list(
     - last_2_days: Contacts created in last 48 hours
     - this_week: Contacts created this week (Monday onwards)
     - this_month: Contacts created this month
-    - no_property: Contacts not linked to any property
     - has_property: Contacts linked to a property
     - no_phone: Contacts without phone number
     - has_email: Contacts with email address
@@ -130,6 +128,7 @@ async def create_contact_list(
             status_code=400,
             detail="smart_rule is required when list_type=smart"
         )
+    _validate_smart_rule(data.smart_rule)
 
     # Create contact list
     contact_list = ContactList(
@@ -139,7 +138,6 @@ async def create_contact_list(
         list_type=data.list_type,
         smart_rule=data.smart_rule,
         filters=data.filters,
-        contact_ids=data.contact_ids,
         campaign_id=data.campaign_id,
         auto_refresh=data.auto_refresh,
         refresh_interval_hours=data.refresh_interval_hours,
@@ -151,9 +149,11 @@ async def create_contact_list(
     db.commit()
     db.refresh(contact_list)
 
-    # Initial count refresh for smart lists
+    # Initial membership
     if contact_list.list_type == ListType.SMART:
-        contact_list.refresh_count(db)
+        membership.rebuild(db, contact_list)
+    elif data.contact_ids:
+        membership.add_members(db, contact_list, data.contact_ids)
 
     return contact_list
 
@@ -176,6 +176,7 @@ async def create_smart_list(
     agent = db.query(Agent).filter(Agent.id == agent_id).first()
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
+    _validate_smart_rule(data.smart_rule)
 
     # Create smart list
     contact_list = ContactList(
@@ -195,8 +196,8 @@ async def create_smart_list(
     db.commit()
     db.refresh(contact_list)
 
-    # Initial count refresh
-    contact_list.refresh_count(db)
+    # Initial membership
+    membership.rebuild(db, contact_list)
 
     return contact_list
 
@@ -218,7 +219,6 @@ async def create_quick_smart_list(
     - uncontacted: Never contacted leads
     - no_phone: Missing phone numbers
     - has_email: Has email addresses
-    - no_property: Not linked to any property
 
     Example:
     POST /contact-lists/quick?preset=interested_this_week
@@ -256,8 +256,8 @@ async def create_quick_smart_list(
     db.commit()
     db.refresh(contact_list)
 
-    # Initial count refresh
-    contact_list.refresh_count(db)
+    # Initial membership
+    membership.rebuild(db, contact_list)
 
     return contact_list
 
@@ -272,31 +272,33 @@ async def get_contact_list(
     include_contacts: bool = Query(False, description="Include contacts in response"),
     limit: int = Query(100, description="Max contacts to return"),
     offset: int = Query(0, description="Offset for pagination"),
+    after_id: Optional[int] = Query(None, description="Return contacts after this contact ID (keyset pagination; ignores offset)"),
     db: Session = Depends(get_db)
 ):
     """
     Get contact list details
 
-    Optionally include contacts with pagination
+    Optionally include contacts, in contact ID order. Pass the last ID of a
+    page as after_id to fetch the next one.
     """
     contact_list = db.query(ContactList).filter(ContactList.id == list_id).first()
 
     if not contact_list:
         raise HTTPException(status_code=404, detail="Contact list not found")
 
-    # Refresh smart list if needed
-    if contact_list.list_type == ListType.SMART and contact_list.auto_refresh:
-        if (not contact_list.last_refreshed_at or
-            (datetime.utcnow() - contact_list.last_refreshed_at).total_seconds() >
-            contact_list.refresh_interval_hours * 3600):
-            contact_list.refresh_count(db)
+    # Drop members that aged out of a time-window rule
+    membership.expire_members(db, contact_list)
 
     result = ContactListDetail.from_orm(contact_list)
 
     # Include contacts if requested
     if include_contacts:
-        query = contact_list.get_contacts_query(db)
-        contacts = query.offset(offset).limit(limit).all()
+        query = contact_list.get_contacts_query(db).options(joinedload(Contact.property))
+        if after_id is not None:
+            query = query.filter(Contact.id > after_id)
+        else:
+            query = query.offset(offset)
+        contacts = query.limit(limit).all()
 
         result.contacts = [
             {
@@ -304,9 +306,12 @@ async def get_contact_list(
                 "name": c.name,
                 "email": c.email,
                 "phone": c.phone,
-                "address": f"{c.address}, {c.city}, {c.state} {c.zip_code}",
+                "address": (
+                    f"{c.property.address}, {c.property.city}, {c.property.state} {c.property.zip_code}"
+                    if c.property else None
+                ),
                 "property_id": c.property_id,
-                "created_at": c.created_at.isoformat()
+                "created_at": c.created_at.isoformat() if c.created_at else None
             }
             for c in contacts
         ]
@@ -327,9 +332,7 @@ async def get_contact_list_voice_summary(
     if not contact_list:
         raise HTTPException(status_code=404, detail="Contact list not found")
 
-    # Refresh if needed
-    if contact_list.list_type == ListType.SMART and contact_list.auto_refresh:
-        contact_list.refresh_count(db)
+    membership.expire_members(db, contact_list)
 
     # Build voice summary
     type_voice = {
@@ -383,19 +386,20 @@ async def update_contact_list(
     if data.description is not None:
         contact_list.description = data.description
     if data.smart_rule is not None:
+        _validate_smart_rule(data.smart_rule)
         contact_list.smart_rule = data.smart_rule
     if data.filters is not None:
         contact_list.filters = data.filters
-    if data.contact_ids is not None:
-        contact_list.contact_ids = data.contact_ids
     if data.auto_refresh is not None:
         contact_list.auto_refresh = data.auto_refresh
     if data.refresh_interval_hours is not None:
         contact_list.refresh_interval_hours = data.refresh_interval_hours
 
-    # Refresh smart list if rule or filters changed
+    # Rebuild membership if the rule, filters or members changed
     if contact_list.list_type == ListType.SMART and (data.smart_rule or data.filters):
-        contact_list.refresh_count(db)
+        membership.rebuild(db, contact_list)
+    elif contact_list.list_type != ListType.SMART and data.contact_ids is not None:
+        membership.replace_members(db, contact_list, data.contact_ids)
 
     db.commit()
     db.refresh(contact_list)
@@ -427,8 +431,9 @@ async def refresh_smart_list(
             status_code=400,
             detail="Only smart lists can be refreshed"
         )
+    _validate_smart_rule(contact_list.smart_rule)
 
-    contact_list.refresh_count(db)
+    membership.rebuild(db, contact_list)
     db.refresh(contact_list)
 
     return contact_list
@@ -453,6 +458,7 @@ async def delete_contact_list(
     if not contact_list:
         raise HTTPException(status_code=404, detail="Contact list not found")
 
+    db.query(ContactListMember).filter(ContactListMember.list_id == list_id).delete(synchronize_session=False)
     db.delete(contact_list)
     db.commit()
 
@@ -488,17 +494,8 @@ async def add_contacts_to_list(
             detail="Can only add contacts to manual lists"
         )
 
-    # Add contact IDs
-    if not contact_list.contact_ids:
-        contact_list.contact_ids = []
-
     # Add only new contacts (avoid duplicates)
-    for contact_id in contact_ids:
-        if contact_id not in contact_list.contact_ids:
-            contact_list.contact_ids.append(contact_id)
-
-    contact_list.total_contacts = len(contact_list.contact_ids)
-    db.commit()
+    membership.add_members(db, contact_list, contact_ids)
     db.refresh(contact_list)
 
     return contact_list
@@ -524,14 +521,7 @@ async def remove_contacts_from_list(
             detail="Can only remove contacts from manual lists"
         )
 
-    # Remove contact IDs
-    if contact_list.contact_ids:
-        for contact_id in contact_ids:
-            if contact_id in contact_list.contact_ids:
-                contact_list.contact_ids.remove(contact_id)
-
-    contact_list.total_contacts = len(contact_list.contact_ids) if contact_list.contact_ids else 0
-    db.commit()
+    membership.remove_members(db, contact_list, contact_ids)
     db.refresh(contact_list)
 
     return contact_list
@@ -560,15 +550,13 @@ async def create_campaign_from_list(
     if not contact_list:
         raise HTTPException(status_code=404, detail="Contact list not found")
 
-    # Get contact IDs from list
-    if contact_list.list_type == ListType.SMART:
-        # For smart lists, get IDs dynamically
-        query = contact_list.get_contacts_query(db)
-        contacts = query.all()
-        target_contact_ids = [c.id for c in contacts]
-    else:
-        # For manual lists, use stored IDs
-        target_contact_ids = contact_list.contact_ids or []
+    # Stream member IDs a keyset page at a time
+    membership.expire_members(db, contact_list)
+    target_contact_ids = [
+        contact_id
+        for page in membership.iter_member_ids(db, contact_list.id)
+        for contact_id in page
+    ]
 
     if not target_contact_ids:
         raise HTTPException(
@@ -577,7 +565,7 @@ async def create_campaign_from_list(
         )
 
     # Import here to avoid circular import
-    from app.routers.marketing.direct_mail import execute_campaign
+    from app.services.direct_mail_campaign_runner import execute_campaign
     from app.models.direct_mail import DirectMailCampaign, MailType
 
     # Generate campaign name
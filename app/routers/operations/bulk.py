@@ -1,14 +1,22 @@
 """Bulk Operations router."""
 
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import json
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import SessionLocal, get_db
+from app.job_queue import get_pool
+from app.models.bulk_job import BulkJobStatus
 from app.services.bulk_operations_service import bulk_operations_service
 
 router = APIRouter(prefix="/bulk", tags=["bulk"])
 
+JOB_EVENTS_POLL_SECONDS = 1.0
+
 
 class BulkExecuteRequest(BaseModel):
     operation: str
@@ -17,6 +25,20 @@ class BulkExecuteRequest(BaseModel):
     params: dict | None = None
 
 
+async def _dispatch_job(job_id: int, background_tasks: BackgroundTasks) -> bool:
+    """Queue the job on arq; run it in-process if Redis is down.
+
+    The arq job id is derived from the bulk job id, so a job that is already
+    queued or running is not queued twice.
+    """
+    pool = await get_pool()
+    if pool is None:
+        background_tasks.add_task(bulk_operations_service.run_job, job_id)
+        return False
+    await pool.enqueue_job("run_bulk_job", job_id, _job_id=f"bulk_job:{job_id}")
+    return True
+
+
 @router.post("/execute")
 async def execute_bulk_operation(body: BulkExecuteRequest, db: Session = Depends(get_db)):
     """Execute an operation across multiple properties."""
@@ -36,3 +58,89 @@ async def execute_bulk_operation(body: BulkExecuteRequest, db: Session = Depends
 def list_bulk_operations():
     """List available bulk operations with descriptions."""
     return {"operations": bulk_operations_service.list_operations()}
+
+
+@router.post("/jobs", status_code=202)
+async def create_bulk_job(body: BulkExecuteRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    """Start a bulk operation in the background; follow it via /bulk/jobs/{id}/events."""
+    try:
+        job = bulk_operations_service.create_job(
+            db=db,
+            operation=body.operation,
+            property_ids=body.property_ids,
+            filters=body.filters,
+            params=body.params,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    queued = await _dispatch_job(job.id, background_tasks)
+    return {**job.to_dict(), "queued": queued}
+
+
+@router.get("/jobs/{job_id}")
+def get_bulk_job(job_id: int, db: Session = Depends(get_db)):
+    """Bulk job status with per-property results so far."""
+    job = bulk_operations_service.get_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Bulk job not found")
+    return job.to_dict(include_results=True)
+
+
+@router.post("/jobs/{job_id}/resume", status_code=202)
+async def resume_bulk_job(job_id: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    """Re-queue an unfinished or failed job; properties already processed are skipped.
+
+    Without Redis only a failed job can be resumed: a pending or running one
+    already has an in-process run, and arq's job id dedupe isn't there to
+    stop a second one.
+    """
+    job = bulk_operations_service.get_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Bulk job not found")
+    if job.status == BulkJobStatus.COMPLETED:
+        raise HTTPException(status_code=409, detail="Bulk job already completed")
+    if job.status == BulkJobStatus.FAILED:
+        if not bulk_operations_service.reopen_job(db, job.id):
+            raise HTTPException(status_code=409, detail="Bulk job is already being resumed")
+    elif await get_pool() is None:
+        raise HTTPException(status_code=409, detail=f"Bulk job is already {job.status}")
+    db.refresh(job)
+    queued = await _dispatch_job(job.id, background_tasks)
+    return {**job.to_dict(), "queued": queued}
+
+
+def _job_snapshot(job_id: int) -> dict | None:
+    db = SessionLocal()
+    try:
+        job = bulk_operations_service.get_job(db, job_id)
+        return job.to_dict() if job else None
+    finally:
+        db.close()
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_bulk_job_events(job_id: int):
+    """Server-sent progress events until the job finishes.
+
+    Progress is read from the job row, so this works whether the job runs in
+    this process or on the arq worker.
+    """
+    if await asyncio.to_thread(_job_snapshot, job_id) is None:
+        raise HTTPException(status_code=404, detail="Bulk job not found")
+
+    async def generate():
+        last = None
+        while True:
+            snapshot = await asyncio.to_thread(_job_snapshot, job_id)
+            if snapshot is None:
+                yield f"event: error\ndata: {json.dumps({'error': 'Bulk job not found'})}\n\n"
+                return
+            if snapshot != last:
+                yield f"event: progress\ndata: {json.dumps(snapshot)}\n\n"
+                last = snapshot
+            if snapshot["status"] in BulkJobStatus.TERMINAL:
+                yield f"event: done\ndata: {json.dumps(snapshot)}\n\n"
+                return
+            await asyncio.sleep(JOB_EVENTS_POLL_SECONDS)
+
+    return StreamingResponse(generate(), media_type="text/event-stream")
@@ -32,6 +32,8 @@ async def get_observer_stats():
         "publish_count": event_bus.publish_count,
         "history_size": len(event_bus.event_history),
         "max_history_size": event_bus.max_history_size,
+        "outbox_enabled": event_bus.outbox is not None,
+        "outbox_appended": event_bus.outbox.appended if event_bus.outbox is not None else 0,
         "top_subscribers": stats["top_subscribers"]
     }
 
@@ -103,19 +105,11 @@ async def get_event_types():
 
 @router.get("/subscribers")
 async def get_subscribers():
-    """Get all subscribers with their stats."""
-    stats = event_bus.get_subscriber_stats()
-
+    """Get all subscribers with their queue, latency and error stats."""
     subscribers = []
-    for event_type, subs in event_bus.subscribers.items():
+    for subs in event_bus.subscribers.values():
         for sub in subs:
-            subscribers.append({
-                "name": sub.name,
-                "event_type": event_type.value,
-                "call_count": sub.call_count,
-                "last_called": sub.last_called.isoformat() if sub.last_called else None,
-                "has_filter": sub.filter_func is not None
-            })
+            subscribers.append({**sub.stats(), "has_filter": sub.filter_func is not None})
 
     return {
         "total_subscribers": len(subscribers),
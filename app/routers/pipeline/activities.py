@@ -10,6 +10,7 @@ from app.database import get_db
 from app.models.activity_event import ActivityEvent, ActivityEventType, ActivityEventStatus
 from app.schemas.activity import ActivityEventCreate, ActivityEventUpdate, ActivityEventResponse
 from app.utils.websocket import get_ws_manager
+from app.websocket import ACTIVITY_TOPIC
 
 
 router = APIRouter(prefix="/activities", tags=["activities"])
@@ -51,7 +52,7 @@ async def log_activity_event(
     # Broadcast via WebSocket
     manager = get_ws_manager()
     if manager:
-        await manager.broadcast({
+        await manager.publish(ACTIVITY_TOPIC, {
             "type": "activity_logged",
             "activity": {
                 "id": new_event.id,
@@ -110,7 +111,7 @@ async def update_activity_event(
     manager = get_ws_manager()
     if manager:
         event_type = "tool_completed" if event.status == ActivityEventStatus.SUCCESS else "tool_failed"
-        await manager.broadcast({
+        await manager.publish(ACTIVITY_TOPIC, {
             "type": event_type,
             "activity": {
                 "id": event.id,
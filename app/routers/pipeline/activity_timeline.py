@@ -3,7 +3,7 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -21,6 +21,7 @@ def get_activity_timeline(
     end_date: Optional[str] = Query(None, description="ISO format end date"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (replaces offset)"),
     db: Session = Depends(get_db),
 ):
     """Get unified activity timeline with optional filters."""
@@ -28,10 +29,10 @@ def get_activity_timeline(
     parsed_start = _parse_date(start_date)
     parsed_end = _parse_date(end_date)
 
-    return activity_timeline_service.get_timeline(
+    return _timeline(
         db=db, property_id=property_id, event_types=parsed_types,
         search=search, start_date=parsed_start, end_date=parsed_end,
-        limit=limit, offset=offset,
+        limit=limit, offset=offset, cursor=cursor,
     )
 
 
@@ -42,13 +43,14 @@ def get_property_timeline(
     search: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (replaces offset)"),
     db: Session = Depends(get_db),
 ):
     """Get activity timeline for a specific property."""
     parsed_types = [t.strip() for t in event_types.split(",")] if event_types else None
-    return activity_timeline_service.get_timeline(
+    return _timeline(
         db=db, property_id=property_id, event_types=parsed_types,
-        search=search, limit=limit, offset=offset,
+        search=search, limit=limit, offset=offset, cursor=cursor,
     )
 
 
@@ -65,6 +67,13 @@ def get_recent_activity(
     )
 
 
+def _timeline(**kwargs) -> dict:
+    try:
+        return activity_timeline_service.get_timeline(**kwargs)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 def _parse_date(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
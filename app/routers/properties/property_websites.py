@@ -5,7 +5,7 @@ AI-powered landing page generation for properties
 Voice-activated: "Create a landing page for property 5"
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, Query, Form, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Form, Request, Response
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from datetime import datetime
@@ -20,6 +20,9 @@ from app.models.property import Property
 from app.models.agent import Agent
 from app.models.property_website import PropertyWebsite, WebsiteAnalytics
 from app.services.website_generator import WebsiteGeneratorService
+from app.services.website_render_cache import (
+    content_version, etag_matches, record_view, website_render_cache,
+)
 
 router = APIRouter(prefix="/properties/{property_id}/websites", tags=["Property Websites"])
 
@@ -215,6 +218,7 @@ async def update_website(
 
     db.commit()
     db.refresh(website)
+    website_render_cache.invalidate(website.id)
 
     return {
         "id": website.id,
@@ -295,6 +299,7 @@ async def unpublish_website(
 
     website.is_published = False
     db.commit()
+    website_render_cache.invalidate(website.id)
 
     return {
         "id": website.id,
@@ -331,6 +336,7 @@ async def delete_website(
     website_slug = website.website_slug
     db.delete(website)
     db.commit()
+    website_render_cache.invalidate(website_id)
 
     return {
         "message": f"Website '{website_slug}' deleted successfully"
@@ -415,44 +421,50 @@ async def get_website_analytics(
 @router.get("/view/{website_slug}", include_in_schema=False)
 async def view_published_website(
     website_slug: str,
+    request: Request,
     track_view: bool = True,
     db: Session = Depends(get_db)
 ):
     """
     Public endpoint to view a published website
 
-    Renders the HTML for the AI-generated landing page
+    Serves the pre-rendered, compressed page from the render cache with an
+    ETag; revisits with a matching If-None-Match get a 304.
     """
-    # Find website by slug
-    website = db.query(PropertyWebsite).filter(
+    # Find website by slug (the property's updated_at is part of the content version)
+    row = db.query(PropertyWebsite, Property.updated_at).join(
+        Property, Property.id == PropertyWebsite.property_id
+    ).filter(
         PropertyWebsite.website_slug == website_slug
     ).first()
 
-    if not website:
+    if not row:
         raise HTTPException(status_code=404, detail="Website not found")
+    website, property_updated_at = row
 
     # Check if published
     if not website.is_published or not website.is_active:
         raise HTTPException(status_code=404, detail="Website is not available")
 
-    # Track view if enabled
+    # Track view if enabled (written in batches in the background)
     if track_view:
-        analytics = WebsiteAnalytics(
-            website_id=website.id,
-            event_type="view",
-            event_data={},
-            created_at=datetime.utcnow()
+        record_view(
+            website.id,
+            visitor_ip=request.client.host if request.client else None,
+            user_agent=request.headers.get("user-agent"),
+            referrer=request.headers.get("referer"),
         )
-        db.add(analytics)
-        db.commit()
 
-    # Return HTML content
-    from app.services.website_renderer import WebsiteRenderer
-    renderer = WebsiteRenderer(db)
-    html_content = await renderer.render_website(website)
+    version = content_version(website, property_updated_at)
+    page = await website_render_cache.get_or_render(db, website, version)
+    headers = {"ETag": page.etag, "Cache-Control": "public, no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), page):
+        return Response(status_code=304, headers=headers)
 
-    from fastapi.responses import HTMLResponse
-    return HTMLResponse(content=html_content)
+    body, encoding = page.body(request.headers.get("accept-encoding", ""))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="text/html; charset=utf-8", headers=headers)
 
 
 @router.post("/view/{website_slug}/submit", include_in_schema=False)
@@ -200,11 +200,4 @@ SMART_LIST_PRESETS = [
         "smart_rule": SmartListRule.HAS_EMAIL,
         "suggested_name": "Contacts With Email"
     },
-    {
-        "name": "no_property",
-        "display_name": "No Property Linked",
-        "description": "Contacts not linked to any property",
-        "smart_rule": SmartListRule.NO_PROPERTY,
-        "suggested_name": "No Property Linked"
-    },
 ]
@@ -155,7 +155,7 @@ class ZillowEnrichmentResponse(BaseModel):
 class PropertyResponse(PropertyBase):
     id: int
     agent_id: int
-    created_at: datetime
+    created_at: datetime | None = None
     updated_at: datetime | None = None
     zillow_enrichment: Optional[ZillowEnrichmentResponse] = None
     skip_traces: List[SkipTraceResponse] = []
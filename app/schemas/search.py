@@ -71,6 +71,11 @@ class BackfillRequest(BaseModel):
         pattern=r"^(properties|property_recaps|dossiers|evidence|all)$",
         description="Table to backfill or 'all'"
     )
+    mode: str = Field(
+        "missing",
+        pattern=r"^(missing|changed)$",
+        description="'missing' embeds rows without a vector; 'changed' also re-embeds rows whose text changed"
+    )
 
 
 class BackfillResponse(BaseModel):
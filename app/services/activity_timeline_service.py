@@ -1,11 +1,19 @@
-"""Activity Timeline service — unified chronological event feed."""
+"""Activity Timeline service — unified chronological event feed.
+
+Every source table contributes a lightweight ``(source, id, ts)`` projection
+with its filters (property, date range, text search) applied in SQL; the
+projections are merged with ``UNION ALL`` and ordered and limited by the
+database. Pages are keyset-paginated on ``(ts, source, id)``; only the rows
+on the page are then loaded to build the event dicts.
+"""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from sqlalchemy import or_
+from sqlalchemy import desc, func, literal, or_, select, union_all
 from sqlalchemy.orm import Session
 
 from app.models.conversation_history import ConversationHistory
@@ -15,19 +23,92 @@ from app.models.scheduled_task import ScheduledTask
 from app.models.contract import Contract
 from app.models.zillow_enrichment import ZillowEnrichment
 from app.models.skip_trace import SkipTrace
+from app.utils.pagination import datetime_bounds, decode_source_cursor, encode_source_cursor
 
 ALL_EVENT_TYPES = frozenset(
     ["conversation", "notification", "note", "task", "contract", "enrichment", "skip_trace"]
 )
 
-# Max rows fetched per event type to avoid unbounded table scans.
-# We over-fetch relative to the page size so the merged sort is accurate.
-_PER_TYPE_LIMIT = 200
+
+@dataclass(frozen=True)
+class TimelineSource:
+    """One stream of timeline events: a table and the timestamp it is ordered by."""
+    key: str  # unique per source; the middle part of the keyset cursor
+    event_type: str
+    model: type
+    ts: Any
+    search_columns: tuple = ()
+    format: Callable[..., dict] | None = None
+
+    def select(
+        self,
+        property_id: int | None,
+        search: str | None,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ):
+        stmt = select(literal(self.key).label("source"), self.model.id.label("id"), self.ts.label("ts"))
+        stmt = stmt.where(self.ts.isnot(None))
+        if property_id is not None:
+            stmt = stmt.where(self.model.property_id == property_id)
+        if search:
+            stmt = stmt.where(or_(*(col.icontains(search, autoescape=True) for col in self.search_columns)))
+        if start_date:
+            stmt = stmt.where(self.ts >= start_date)
+        if end_date:
+            stmt = stmt.where(self.ts <= end_date)
+        return stmt
+
+    def after(self, stmt, bounds: tuple, source: str, row_id: int):
+        """Restrict to rows sorting after the cursor ``(ts, source, row_id)`` (descending).
+
+        ``source`` is constant per branch, so the tuple comparison reduces to a
+        timestamp range the ``(property_id, ts)`` index can seek.
+        """
+        low, high = bounds
+        if self.key < source:
+            return stmt.where(self.ts <= high)
+        if self.key > source:
+            return stmt.where(self.ts < low)
+        return stmt.where(self.ts <= high, or_(self.ts < low, self.model.id < row_id))
 
 
 class ActivityTimelineService:
     """Aggregates activity across data sources into a unified timeline."""
 
+    def __init__(self):
+        self.sources = [
+            TimelineSource(
+                "conversation", "conversation", ConversationHistory, ConversationHistory.created_at,
+                (ConversationHistory.tool_name, ConversationHistory.input_summary, ConversationHistory.output_summary),
+                self._conversation_event,
+            ),
+            TimelineSource(
+                "notification", "notification", Notification, Notification.created_at,
+                (Notification.title, Notification.message), self._notification_event,
+            ),
+            TimelineSource("note", "note", PropertyNote, PropertyNote.created_at, (PropertyNote.content,), self._note_event),
+            TimelineSource(
+                "task", "task", ScheduledTask, ScheduledTask.created_at,
+                (ScheduledTask.title, ScheduledTask.description), self._task_event,
+            ),
+            *(
+                TimelineSource(
+                    f"contract_{action}", "contract", Contract, ts, (Contract.name, Contract.description),
+                    getattr(self, f"_contract_{action}_event"),
+                )
+                for action, ts in (
+                    ("created", Contract.created_at),
+                    ("sent", Contract.sent_at),
+                    ("completed", Contract.completed_at),
+                )
+            ),
+            # Enrichments carry no text, so they never match a search
+            TimelineSource("enrichment", "enrichment", ZillowEnrichment, ZillowEnrichment.created_at, (), self._enrichment_event),
+            TimelineSource("skip_trace", "skip_trace", SkipTrace, SkipTrace.created_at, (SkipTrace.owner_name,), self._skip_trace_event),
+        ]
+        self._by_key = {source.key: source for source in self.sources}
+
     def get_timeline(
         self,
         db: Session,
@@ -38,304 +119,195 @@ class ActivityTimelineService:
         end_date: datetime | None = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> dict:
-        types_to_fetch = set(event_types) & ALL_EVENT_TYPES if event_types else ALL_EVENT_TYPES
-        events: list[dict] = []
-
-        fetchers = {
-            "conversation": self._get_conversation_events,
-            "notification": self._get_notification_events,
-            "note": self._get_note_events,
-            "task": self._get_task_events,
-            "contract": self._get_contract_events,
-            "enrichment": self._get_enrichment_events,
-            "skip_trace": self._get_skip_trace_events,
-        }
+        """One page of the timeline, newest first.
 
-        for etype in types_to_fetch:
-            fn = fetchers.get(etype)
-            if fn:
-                events.extend(fn(db, property_id, search, start_date, end_date))
-
-        # Sort by timestamp descending (normalize tz-aware vs naive)
-        from datetime import timezone as _tz
-        def _sort_key(ev: dict) -> datetime:
-            ts = ev["timestamp"]
-            if ts is None:
-                return datetime.min.replace(tzinfo=_tz.utc)
-            if ts.tzinfo is None:
-                return ts.replace(tzinfo=_tz.utc)
-            return ts
-
-        events.sort(key=_sort_key, reverse=True)
-        total_events = len(events)
-        page = events[offset : offset + limit]
-
-        # Serialize timestamps for JSON
-        for ev in page:
-            ts = ev["timestamp"]
-            if isinstance(ts, datetime):
-                ev["timestamp"] = ts.isoformat()
+        Pass ``next_cursor`` from the previous page as ``cursor`` to continue;
+        ``offset`` is only honoured without a cursor. Raises ValueError for a
+        malformed cursor.
+        """
+        types_to_fetch = set(event_types) & ALL_EVENT_TYPES if event_types else ALL_EVENT_TYPES
+        sources = [
+            source for source in self.sources
+            if source.event_type in types_to_fetch and (source.search_columns or not search)
+        ]
+        after = decode_source_cursor(cursor) if cursor else None
+        if after:
+            offset = 0
+
+        if not sources:
+            total_events, page, next_cursor = 0, [], None
+        else:
+            branches = [(source, source.select(property_id, search, start_date, end_date)) for source in sources]
+            total_events = db.execute(
+                select(func.count()).select_from(union_all(*(stmt for _, stmt in branches)).subquery())
+            ).scalar_one()
+            rows = self._page_keys(db, branches, after, limit, offset)
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = encode_source_cursor(rows[-1].ts, rows[-1].source, rows[-1].id)
+            page = self._load_events(db, rows)
 
         return {
             "total_events": total_events,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
             "property_id": property_id,
             "events": page,
             "voice_summary": self._build_voice_summary(page, total_events, property_id),
         }
 
-    # ── Event fetchers ──
+    def _page_keys(self, db: Session, branches, after, limit: int, offset: int) -> list:
+        """``limit + 1`` page keys; each branch is limited too, so every source reads at most a page."""
+        window = offset + limit + 1
+        if after:
+            bounds = datetime_bounds(db, after[0])
+            branches = [(source, source.after(stmt, bounds, after[1], after[2])) for source, stmt in branches]
+        parts = [
+            stmt.order_by(source.ts.desc(), source.model.id.desc()).limit(window).subquery()
+            for source, stmt in branches
+        ]
+        page = (
+            union_all(*(select(*part.c) for part in parts))
+            .order_by(desc("ts"), desc("source"), desc("id"))
+            .limit(limit + 1)
+            .offset(offset)
+        )
+        return db.execute(page).all()
+
+    def _load_events(self, db: Session, rows: list) -> list[dict]:
+        """Load the rows on the page (one query per table) and format them in page order."""
+        ids_by_model: dict[type, set[int]] = {}
+        for row in rows:
+            ids_by_model.setdefault(self._by_key[row.source].model, set()).add(row.id)
+        loaded = {
+            model: {item.id: item for item in db.query(model).filter(model.id.in_(ids))}
+            for model, ids in ids_by_model.items()
+        }
 
-    def _get_conversation_events(
-        self, db: Session, property_id: int | None, search: str | None,
-        start_date: datetime | None, end_date: datetime | None,
-    ) -> list[dict]:
-        query = db.query(ConversationHistory)
-        if property_id is not None:
-            query = query.filter(ConversationHistory.property_id == property_id)
-        if search:
-            query = query.filter(or_(
-                ConversationHistory.tool_name.ilike(f"%{search}%"),
-                ConversationHistory.input_summary.ilike(f"%{search}%"),
-                ConversationHistory.output_summary.ilike(f"%{search}%"),
-            ))
-        if start_date:
-            query = query.filter(ConversationHistory.created_at >= start_date)
-        if end_date:
-            query = query.filter(ConversationHistory.created_at <= end_date)
-
-        results: list[dict] = []
-        for item in query.order_by(ConversationHistory.created_at.desc()).limit(_PER_TYPE_LIMIT).all():
-            results.append({
-                "event_type": "conversation",
-                "timestamp": item.created_at,
-                "property_id": item.property_id,
-                "title": f"Tool: {item.tool_name}",
-                "description": item.output_summary or item.input_summary or "Tool executed",
-                "metadata": {
-                    "tool_name": item.tool_name,
-                    "success": bool(item.success),
-                    "duration_ms": item.duration_ms,
-                    "session_id": item.session_id,
-                },
-            })
-        return results
-
-    def _get_notification_events(
-        self, db: Session, property_id: int | None, search: str | None,
-        start_date: datetime | None, end_date: datetime | None,
-    ) -> list[dict]:
-        query = db.query(Notification)
-        if property_id is not None:
-            query = query.filter(Notification.property_id == property_id)
-        if search:
-            query = query.filter(or_(
-                Notification.title.ilike(f"%{search}%"),
-                Notification.message.ilike(f"%{search}%"),
-            ))
-        if start_date:
-            query = query.filter(Notification.created_at >= start_date)
-        if end_date:
-            query = query.filter(Notification.created_at <= end_date)
-
-        results: list[dict] = []
-        for item in query.order_by(Notification.created_at.desc()).limit(_PER_TYPE_LIMIT).all():
-            results.append({
-                "event_type": "notification",
-                "timestamp": item.created_at,
-                "property_id": item.property_id,
-                "title": item.title,
-                "description": item.message or "",
-                "metadata": {
-                    "notification_type": item.type.value,
-                    "priority": item.priority.value,
-                    "is_read": item.is_read,
-                },
-            })
-        return results
-
-    def _get_note_events(
-        self, db: Session, property_id: int | None, search: str | None,
-        start_date: datetime | None, end_date: datetime | None,
-    ) -> list[dict]:
-        query = db.query(PropertyNote)
-        if property_id is not None:
-            query = query.filter(PropertyNote.property_id == property_id)
-        if search:
-            query = query.filter(PropertyNote.content.ilike(f"%{search}%"))
-        if start_date:
-            query = query.filter(PropertyNote.created_at >= start_date)
-        if end_date:
-            query = query.filter(PropertyNote.created_at <= end_date)
-
-        results: list[dict] = []
-        for item in query.order_by(PropertyNote.created_at.desc()).limit(_PER_TYPE_LIMIT).all():
-            preview = item.content[:120] + "..." if len(item.content) > 120 else item.content
-            results.append({
-                "event_type": "note",
-                "timestamp": item.created_at,
-                "property_id": item.property_id,
-                "title": f"Note ({item.source.value})",
-                "description": preview,
-                "metadata": {"source": item.source.value, "created_by": item.created_by},
-            })
-        return results
-
-    def _get_task_events(
-        self, db: Session, property_id: int | None, search: str | None,
-        start_date: datetime | None, end_date: datetime | None,
-    ) -> list[dict]:
-        query = db.query(ScheduledTask)
-        if property_id is not None:
-            query = query.filter(ScheduledTask.property_id == property_id)
-        if search:
-            query = query.filter(or_(
-                ScheduledTask.title.ilike(f"%{search}%"),
-                ScheduledTask.description.ilike(f"%{search}%"),
-            ))
-        if start_date:
-            query = query.filter(ScheduledTask.created_at >= start_date)
-        if end_date:
-            query = query.filter(ScheduledTask.created_at <= end_date)
-
-        results: list[dict] = []
-        for item in query.order_by(ScheduledTask.created_at.desc()).limit(_PER_TYPE_LIMIT).all():
-            results.append({
-                "event_type": "task",
-                "timestamp": item.created_at,
-                "property_id": item.property_id,
-                "title": f"Task: {item.title}",
-                "description": item.description or f"{item.task_type.value} scheduled",
-                "metadata": {
-                    "task_type": item.task_type.value,
-                    "status": item.status.value,
-                    "scheduled_at": item.scheduled_at.isoformat() if item.scheduled_at else None,
-                },
-            })
-        return results
-
-    def _get_contract_events(
-        self, db: Session, property_id: int | None, search: str | None,
-        start_date: datetime | None, end_date: datetime | None,
-    ) -> list[dict]:
-        query = db.query(Contract)
-        if property_id is not None:
-            query = query.filter(Contract.property_id == property_id)
-        if search:
-            query = query.filter(or_(
-                Contract.name.ilike(f"%{search}%"),
-                Contract.description.ilike(f"%{search}%"),
-            ))
-
-        results: list[dict] = []
-        for c in query.order_by(Contract.created_at.desc()).limit(_PER_TYPE_LIMIT).all():
-            base_meta = {"contract_id": c.id, "contract_name": c.name, "status": c.status.value, "is_required": c.is_required}
-
-            # Created event
-            if c.created_at and self._in_range(c.created_at, start_date, end_date):
-                results.append({
-                    "event_type": "contract",
-                    "timestamp": c.created_at,
-                    "property_id": c.property_id,
-                    "title": f"Contract created: {c.name}",
-                    "description": f"Status: {c.status.value}",
-                    "metadata": {**base_meta, "action": "created"},
-                })
-
-            # Sent event
-            if c.sent_at and self._in_range(c.sent_at, start_date, end_date):
-                results.append({
-                    "event_type": "contract",
-                    "timestamp": c.sent_at,
-                    "property_id": c.property_id,
-                    "title": f"Contract sent: {c.name}",
-                    "description": "Sent for signature",
-                    "metadata": {**base_meta, "action": "sent"},
-                })
-
-            # Completed event
-            if c.completed_at and self._in_range(c.completed_at, start_date, end_date):
-                results.append({
-                    "event_type": "contract",
-                    "timestamp": c.completed_at,
-                    "property_id": c.property_id,
-                    "title": f"Contract completed: {c.name}",
-                    "description": "All parties signed",
-                    "metadata": {**base_meta, "action": "completed"},
-                })
-
-        return results
-
-    def _get_enrichment_events(
-        self, db: Session, property_id: int | None, search: str | None,
-        start_date: datetime | None, end_date: datetime | None,
-    ) -> list[dict]:
-        query = db.query(ZillowEnrichment)
-        if property_id is not None:
-            query = query.filter(ZillowEnrichment.property_id == property_id)
-        if start_date:
-            query = query.filter(ZillowEnrichment.created_at >= start_date)
-        if end_date:
-            query = query.filter(ZillowEnrichment.created_at <= end_date)
-
-        results: list[dict] = []
-        for item in query.order_by(ZillowEnrichment.created_at.desc()).limit(_PER_TYPE_LIMIT).all():
-            z_str = f"${item.zestimate:,.0f}" if item.zestimate else "N/A"
-            results.append({
-                "event_type": "enrichment",
-                "timestamp": item.created_at,
-                "property_id": item.property_id,
-                "title": "Zillow enrichment",
-                "description": f"Zestimate: {z_str}",
-                "metadata": {"zestimate": item.zestimate, "rent_zestimate": item.rent_zestimate, "zpid": item.zpid},
-            })
-        return results
-
-    def _get_skip_trace_events(
-        self, db: Session, property_id: int | None, search: str | None,
-        start_date: datetime | None, end_date: datetime | None,
-    ) -> list[dict]:
-        query = db.query(SkipTrace)
-        if property_id is not None:
-            query = query.filter(SkipTrace.property_id == property_id)
-        if search:
-            query = query.filter(SkipTrace.owner_name.ilike(f"%{search}%"))
-        if start_date:
-            query = query.filter(SkipTrace.created_at >= start_date)
-        if end_date:
-            query = query.filter(SkipTrace.created_at <= end_date)
-
-        results: list[dict] = []
-        for item in query.order_by(SkipTrace.created_at.desc()).limit(_PER_TYPE_LIMIT).all():
-            owner = item.owner_name or "Unknown"
-            phone_count = len(item.phone_numbers) if item.phone_numbers else 0
-            results.append({
-                "event_type": "skip_trace",
-                "timestamp": item.created_at,
-                "property_id": item.property_id,
-                "title": "Skip trace completed",
-                "description": f"Owner: {owner}, {phone_count} phone(s)",
-                "metadata": {
-                    "owner_name": item.owner_name,
-                    "phone_count": phone_count,
-                    "email_count": len(item.emails) if item.emails else 0,
-                },
-            })
-        return results
+        events: list[dict] = []
+        for row in rows:
+            source = self._by_key[row.source]
+            item = loaded[source.model].get(row.id)
+            if item is None:  # deleted between the two queries
+                continue
+            event = source.format(item)
+            event["timestamp"] = row.ts.isoformat() if isinstance(row.ts, datetime) else row.ts
+            events.append(event)
+        return events
+
+    # ── Event formatters ──
 
-    # ── Helpers ──
+    @staticmethod
+    def _conversation_event(item: ConversationHistory) -> dict:
+        return {
+            "event_type": "conversation",
+            "property_id": item.property_id,
+            "title": f"Tool: {item.tool_name}",
+            "description": item.output_summary or item.input_summary or "Tool executed",
+            "metadata": {
+                "tool_name": item.tool_name,
+                "success": bool(item.success),
+                "duration_ms": item.duration_ms,
+                "session_id": item.session_id,
+            },
+        }
 
     @staticmethod
-    def _in_range(ts: datetime | None, start: datetime | None, end: datetime | None) -> bool:
-        if ts is None:
-            return False
-        if start and ts < start:
-            return False
-        if end and ts > end:
-            return False
-        return True
+    def _notification_event(item: Notification) -> dict:
+        return {
+            "event_type": "notification",
+            "property_id": item.property_id,
+            "title": item.title,
+            "description": item.message or "",
+            "metadata": {
+                "notification_type": item.type.value,
+                "priority": item.priority.value,
+                "is_read": item.is_read,
+            },
+        }
+
+    @staticmethod
+    def _note_event(item: PropertyNote) -> dict:
+        preview = item.content[:120] + "..." if len(item.content) > 120 else item.content
+        return {
+            "event_type": "note",
+            "property_id": item.property_id,
+            "title": f"Note ({item.source.value})",
+            "description": preview,
+            "metadata": {"source": item.source.value, "created_by": item.created_by},
+        }
+
+    @staticmethod
+    def _task_event(item: ScheduledTask) -> dict:
+        return {
+            "event_type": "task",
+            "property_id": item.property_id,
+            "title": f"Task: {item.title}",
+            "description": item.description or f"{item.task_type.value} scheduled",
+            "metadata": {
+                "task_type": item.task_type.value,
+                "status": item.status.value,
+                "scheduled_at": item.scheduled_at.isoformat() if item.scheduled_at else None,
+            },
+        }
+
+    @staticmethod
+    def _contract_event(c: Contract, action: str, title: str, description: str) -> dict:
+        return {
+            "event_type": "contract",
+            "property_id": c.property_id,
+            "title": f"{title}: {c.name}",
+            "description": description,
+            "metadata": {
+                "contract_id": c.id,
+                "contract_name": c.name,
+                "status": c.status.value,
+                "is_required": c.is_required,
+                "action": action,
+            },
+        }
+
+    def _contract_created_event(self, c: Contract) -> dict:
+        return self._contract_event(c, "created", "Contract created", f"Status: {c.status.value}")
+
+    def _contract_sent_event(self, c: Contract) -> dict:
+        return self._contract_event(c, "sent", "Contract sent", "Sent for signature")
+
+    def _contract_completed_event(self, c: Contract) -> dict:
+        return self._contract_event(c, "completed", "Contract completed", "All parties signed")
+
+    @staticmethod
+    def _enrichment_event(item: ZillowEnrichment) -> dict:
+        z_str = f"${item.zestimate:,.0f}" if item.zestimate else "N/A"
+        return {
+            "event_type": "enrichment",
+            "property_id": item.property_id,
+            "title": "Zillow enrichment",
+            "description": f"Zestimate: {z_str}",
+            "metadata": {"zestimate": item.zestimate, "rent_zestimate": item.rent_zestimate, "zpid": item.zpid},
+        }
+
+    @staticmethod
+    def _skip_trace_event(item: SkipTrace) -> dict:
+        owner = item.owner_name or "Unknown"
+        phone_count = len(item.phone_numbers) if item.phone_numbers else 0
+        return {
+            "event_type": "skip_trace",
+            "property_id": item.property_id,
+            "title": "Skip trace completed",
+            "description": f"Owner: {owner}, {phone_count} phone(s)",
+            "metadata": {
+                "owner_name": item.owner_name,
+                "phone_count": phone_count,
+                "email_count": len(item.emails) if item.emails else 0,
+            },
+        }
+
+    # ── Helpers ──
 
     @staticmethod
     def _build_voice_summary(events: list[dict], total_events: int, property_id: int | None) -> str:
@@ -1,5 +1,7 @@
 from datetime import date
 
+import numpy as np
+
 
 def clamp(value: float, min_value: float = 0.0, max_value: float = 1.0) -> float:
     return max(min_value, min(value, max_value))
@@ -105,3 +107,63 @@ def similarity_score(
     )
 
     return round(clamp(score), 6)
+
+
+def recency_cutoff(max_recency_months: int, today: date | None = None) -> date:
+    """Earliest date whose ``recency_months`` is at most ``max_recency_months``."""
+    today = today or date.today()
+    month_index = today.year * 12 + (today.month - 1) - max_recency_months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def similarity_scores(
+    *,
+    distance_mi: np.ndarray,
+    radius_mi: float,
+    target_sqft: int | None,
+    candidate_sqft: np.ndarray,
+    target_beds: int | None,
+    candidate_beds: np.ndarray,
+    target_baths: float | None,
+    candidate_baths: np.ndarray,
+    months: np.ndarray,
+) -> np.ndarray:
+    """Vectorized ``similarity_score`` over a candidate set; missing candidate values are NaN."""
+    distance_mi = np.asarray(distance_mi, dtype=float)
+    candidate_sqft = np.asarray(candidate_sqft, dtype=float)
+    candidate_beds = np.asarray(candidate_beds, dtype=float)
+    candidate_baths = np.asarray(candidate_baths, dtype=float)
+    months = np.asarray(months, dtype=float)
+
+    distance_component = np.clip(1.0 - distance_mi / max(radius_mi, 0.1), 0.0, 1.0)
+
+    sqft_component = np.full(distance_mi.shape, 0.5)
+    if target_sqft:
+        known = ~np.isnan(candidate_sqft) & (candidate_sqft != 0)
+        sqft_component[known] = np.clip(
+            1.0 - np.abs(candidate_sqft[known] - target_sqft) / max(target_sqft, 1), 0.0, 1.0
+        )
+
+    bed_component = np.full(distance_mi.shape, 0.5)
+    if target_beds is not None:
+        known = ~np.isnan(candidate_beds)
+        diff = np.abs(candidate_beds[known] - target_beds)
+        bed_component[known] = np.where(diff == 0, 1.0, np.where(diff == 1, 0.6, 0.0))
+
+    bath_component = np.full(distance_mi.shape, 0.5)
+    if target_baths is not None:
+        known = ~np.isnan(candidate_baths)
+        diff = np.abs(candidate_baths[known] - target_baths)
+        bath_component[known] = np.where(diff == 0, 1.0, np.where(diff <= 1, 0.6, 0.0))
+
+    recency_component = np.clip(1.0 - months / 12.0, 0.0, 1.0)
+    bed_bath_component = (bed_component + bath_component) / 2.0
+
+    score = (
+        (0.35 * distance_component)
+        + (0.30 * sqft_component)
+        + (0.20 * bed_bath_component)
+        + (0.15 * recency_component)
+    )
+
+    return np.round(np.clip(score, 0.0, 1.0), 6)
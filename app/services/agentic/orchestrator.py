@@ -13,13 +13,60 @@ class MultiAgentOrchestrator:
     """
     Dependency-aware scheduler for agent tasks.
 
-    - Executes ready agents in parallel batches.
-    - Preserves deterministic order within each batch from the original plan order.
-    - Stops when max_steps is reached.
+    - Starts an agent as soon as all of its dependencies have completed.
+    - Keeps up to max_parallel_agents agents in flight at all times.
+    - Ranks the ready queue by longest remaining critical path, using
+      per-agent cost estimates (e.g. historical runtime_ms) when provided.
+      Ties fall back to the original plan order, so runs stay deterministic.
+    - Stops starting new agents once max_steps agents have been launched.
     """
 
-    def __init__(self, max_parallel_agents: int = 3):
+    DEFAULT_COST = 1.0
+
+    def __init__(
+        self,
+        max_parallel_agents: int = 3,
+        estimated_costs: dict[str, float] | None = None,
+    ):
         self.max_parallel_agents = max(1, int(max_parallel_agents))
+        self.estimated_costs = dict(estimated_costs or {})
+
+    def _cost_for(self, name: str, fallback: float) -> float:
+        cost = self.estimated_costs.get(name)
+        if cost is None or cost <= 0:
+            return fallback
+        return float(cost)
+
+    def critical_path_lengths(self, specs: list[AgentSpec]) -> dict[str, float]:
+        """Return the longest cost path from each agent to the end of the plan."""
+        names = {spec.name for spec in specs}
+        known = [c for n, c in self.estimated_costs.items() if n in names and c and c > 0]
+        # Unknown agents are assumed to take a typical (median) amount of time.
+        fallback = sorted(known)[len(known) // 2] if known else self.DEFAULT_COST
+
+        dependents: dict[str, list[str]] = {spec.name: [] for spec in specs}
+        for spec in specs:
+            for dep in spec.dependencies:
+                if dep in dependents:
+                    dependents[dep].append(spec.name)
+
+        lengths: dict[str, float] = {}
+
+        def _length(name: str, visiting: set[str]) -> float:
+            if name in lengths:
+                return lengths[name]
+            if name in visiting:
+                # Cycles are reported by run(); treat the back-edge as free here.
+                return 0.0
+            visiting.add(name)
+            tail = max((_length(child, visiting) for child in dependents[name]), default=0.0)
+            visiting.discard(name)
+            lengths[name] = self._cost_for(name, fallback) + tail
+            return lengths[name]
+
+        for spec in specs:
+            _length(spec.name, set())
+        return lengths
 
     async def run(
         self,
@@ -27,36 +74,59 @@ class MultiAgentOrchestrator:
         run_agent: Callable[[str], Awaitable[Any]],
         max_steps: int | None = None,
     ) -> list[tuple[str, Any]]:
+        """Run all agents and return ``(name, result)`` pairs in completion order."""
         if not specs:
             return []
 
-        ordered_names = [spec.name for spec in specs]
+        plan_index = {spec.name: idx for idx, spec in enumerate(specs)}
         deps_by_name = {spec.name: set(spec.dependencies) for spec in specs}
-        pending = list(ordered_names)
+        priority = self.critical_path_lengths(specs)
+        pending = [spec.name for spec in specs]
         completed: set[str] = set()
         executions: list[tuple[str, Any]] = []
+        running: dict[asyncio.Task, str] = {}
+        started = 0
         allowed_steps = max_steps if max_steps is None else max(0, int(max_steps))
 
-        while pending:
-            if allowed_steps is not None and len(executions) >= allowed_steps:
-                break
-
-            ready = [name for name in pending if deps_by_name[name].issubset(completed)]
-            if not ready:
-                blocked = ", ".join(sorted(pending))
-                raise RuntimeError(f"No runnable agents left; unresolved dependencies for: {blocked}")
+        def _rank(name: str) -> tuple[float, int]:
+            return (-priority[name], plan_index[name])
 
-            remaining = len(pending) if allowed_steps is None else max(0, allowed_steps - len(executions))
-            batch_size = min(self.max_parallel_agents, len(ready), remaining)
-            if batch_size <= 0:
-                break
+        try:
+            while pending or running:
+                can_start = allowed_steps is None or started < allowed_steps
+                if can_start and pending:
+                    ready = sorted(
+                        (name for name in pending if deps_by_name[name].issubset(completed)),
+                        key=_rank,
+                    )
+                    if not ready and not running:
+                        blocked = ", ".join(sorted(pending))
+                        raise RuntimeError(
+                            f"No runnable agents left; unresolved dependencies for: {blocked}"
+                        )
+                    for name in ready:
+                        if len(running) >= self.max_parallel_agents:
+                            break
+                        if allowed_steps is not None and started >= allowed_steps:
+                            break
+                        pending.remove(name)
+                        running[asyncio.ensure_future(run_agent(name))] = name
+                        started += 1
 
-            batch = ready[:batch_size]
-            results = await asyncio.gather(*(run_agent(name) for name in batch))
+                if not running:
+                    break
 
-            for name, result in zip(batch, results):
-                pending.remove(name)
-                completed.add(name)
-                executions.append((name, result))
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                # Record finishers in plan order when several complete in the same tick.
+                for task in sorted(done, key=lambda t: plan_index[running[t]]):
+                    name = running.pop(task)
+                    result = task.result()
+                    completed.add(name)
+                    executions.append((name, result))
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
 
         return executions
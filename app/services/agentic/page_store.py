@@ -0,0 +1,191 @@
+"""Content-addressed blob store for cached portal pages.
+
+Pages are compressed and stored under the SHA-256 of their content, so
+identical pages fetched from different URLs share one blob and re-caching an
+unchanged page writes nothing. Only metadata (hashes, sizes, expiry) lives in
+the ``portal_cache`` table; see ``PortalCacheService``.
+
+Blobs are zstd frames when ``zstandard`` is installed and zlib streams
+otherwise; ``decompress`` tells them apart by the zstd frame magic, so a
+store written by either build stays readable.
+
+Backends:
+  local — files under ``PORTAL_CACHE_DIR`` (default ``data/portal_cache``)
+  s3    — any S3-compatible bucket (``PORTAL_CACHE_S3_*`` settings)
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+
+    _ZSTD_LEVEL = 10
+    _compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+    _decompressor = zstandard.ZstdDecompressor()
+    ZSTD_AVAILABLE = True
+except ImportError:
+    _compressor = _decompressor = None
+    ZSTD_AVAILABLE = False
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def compress(data: bytes) -> bytes:
+    if ZSTD_AVAILABLE:
+        return _compressor.compress(data)
+    return zlib.compress(data, 6)
+
+
+def decompress(blob: bytes) -> bytes:
+    if blob[:4] == _ZSTD_MAGIC:
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required to read this page blob")
+        return _decompressor.decompress(blob)
+    return zlib.decompress(blob)
+
+
+class PageBlobStore(ABC):
+    """Stores compressed blobs by content hash."""
+
+    @abstractmethod
+    def read(self, key: str) -> bytes | None:
+        """Raw (compressed) blob, or None if missing."""
+
+    @abstractmethod
+    def write(self, key: str, blob: bytes) -> None:
+        ...
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    def put(self, data: bytes) -> tuple[str, int]:
+        """Store ``data`` unless already present; returns (hash, compressed size)."""
+        key = content_hash(data)
+        blob = compress(data)
+        if not self.exists(key):
+            self.write(key, blob)
+        return key, len(blob)
+
+    def get(self, key: str) -> bytes | None:
+        blob = self.read(key)
+        if blob is None:
+            return None
+        try:
+            return decompress(blob)
+        except Exception as e:
+            logger.warning("Unreadable page blob %s: %s", key, e)
+            return None
+
+
+class LocalPageBlobStore(PageBlobStore):
+    """Blobs as files under ``root``, fanned out as ``ab/cd/<hash>``."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key[2:4] / key
+
+    def read(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write(self, key: str, blob: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so readers never see a partial blob.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+class S3PageBlobStore(PageBlobStore):
+    """Blobs as objects in an S3-compatible bucket."""
+
+    def __init__(self, bucket: str, prefix: str = "portal-cache/", client=None, endpoint_url: str | None = None):
+        if client is None:
+            import boto3
+
+            client = boto3.client(
+                "s3",
+                endpoint_url=endpoint_url or None,
+                aws_access_key_id=settings.aws_access_key_id or None,
+                aws_secret_access_key=settings.aws_secret_access_key or None,
+                region_name=settings.aws_region,
+            )
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key[:2]}/{key}"
+
+    @staticmethod
+    def _is_missing(error: Exception) -> bool:
+        code = getattr(error, "response", {}).get("Error", {}).get("Code")
+        return code in ("404", "NoSuchKey", "NotFound")
+
+    def read(self, key: str) -> bytes | None:
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=self._key(key))["Body"].read()
+        except Exception as e:
+            if self._is_missing(e):
+                return None
+            raise
+
+    def write(self, key: str, blob: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self._key(key), Body=blob)
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+            return True
+        except Exception as e:
+            if self._is_missing(e):
+                return False
+            raise
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+
+
+def build_page_store_from_settings() -> PageBlobStore:
+    if settings.portal_cache_backend == "s3":
+        return S3PageBlobStore(
+            bucket=settings.portal_cache_s3_bucket or settings.aws_s3_bucket,
+            prefix=settings.portal_cache_s3_prefix,
+            endpoint_url=settings.portal_cache_s3_endpoint_url,
+        )
+    return LocalPageBlobStore(settings.portal_cache_dir)
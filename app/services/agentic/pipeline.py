@@ -5,6 +5,7 @@ from time import perf_counter
 from typing import Any, Awaitable, Callable
 
 from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
@@ -416,7 +417,10 @@ class AgenticResearchService:
         for spec in specs:
             spec.dependencies = {dep for dep in spec.dependencies if dep in spec_names}
 
-        orchestrator = MultiAgentOrchestrator(max_parallel_agents=max_parallel_agents)
+        orchestrator = MultiAgentOrchestrator(
+            max_parallel_agents=max_parallel_agents,
+            estimated_costs=self._load_worker_runtime_estimates(db=db, worker_names=spec_names),
+        )
 
         async def _run_agent(name: str) -> WorkerExecution:
             worker_fn = worker_fns.get(name)
@@ -456,6 +460,36 @@ class AgenticResearchService:
 
         return self.get_full_output(db=db, property_id=job.research_property_id, job_id=job.id)
 
+    def _load_worker_runtime_estimates(
+        self,
+        db: Session,
+        worker_names: set[str],
+        sample_size: int = 200,
+    ) -> dict[str, float]:
+        """Average runtime_ms per worker over its most recent successful runs."""
+        if not worker_names:
+            return {}
+        try:
+            recent = (
+                db.query(WorkerRun.worker_name, WorkerRun.runtime_ms)
+                .filter(
+                    WorkerRun.worker_name.in_(worker_names),
+                    WorkerRun.status.in_(("success", "partial")),
+                )
+                .order_by(WorkerRun.id.desc())
+                .limit(sample_size * len(worker_names))
+                .subquery()
+            )
+            rows = (
+                db.query(recent.c.worker_name, func.avg(recent.c.runtime_ms))
+                .group_by(recent.c.worker_name)
+                .all()
+            )
+        except Exception as exc:
+            self.logger.warning("Could not load worker runtime estimates: %s", exc)
+            return {}
+        return {name: float(avg_ms) for name, avg_ms in rows if avg_ms is not None}
+
     def _build_agent_specs(self, job: AgenticJob, max_steps: int | None = None) -> list[AgentSpec]:
         core_specs = [
             AgentSpec(name="normalize_geocode", dependencies=set()),
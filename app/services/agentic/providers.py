@@ -1,14 +1,19 @@
 import hashlib
+import logging
 from abc import ABC, abstractmethod
-from datetime import timedelta
-from typing import Any
+from datetime import timedelta, timezone
+from typing import AbstractSet, Any
 
-import httpx
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models.portal_cache import PortalCache
+from app.services.agentic.page_store import PageBlobStore, build_page_store_from_settings
 from app.services.agentic.utils import utcnow
+from app.utils.http_clients import http_clients
+
+logger = logging.getLogger(__name__)
 
 
 class SearchProvider(ABC):
@@ -77,7 +82,7 @@ class ExaSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("exa") as client:
                 response = await client.post(
                     f"{self.base_url}/search",
                     headers=headers,
@@ -124,13 +129,27 @@ def build_search_provider_from_settings() -> SearchProvider:
 
 
 class PortalCacheService:
-    def __init__(self, ttl_hours: int = 24):
+    """Portal page cache: metadata in ``portal_cache``, pages in a blob store.
+
+    HTML and the text extracted from it are stored compressed and
+    content-addressed (see ``page_store``), so the database only holds hashes
+    and expiry, and ``get_text`` never loads the HTML.
+    """
+
+    def __init__(self, ttl_hours: int = 24, store: PageBlobStore | None = None):
         self.ttl_hours = ttl_hours
+        self._store = store
+
+    @property
+    def store(self) -> PageBlobStore:
+        if self._store is None:
+            self._store = build_page_store_from_settings()
+        return self._store
 
     def _url_hash(self, url: str) -> str:
         return hashlib.sha256(url.strip().lower().encode("utf-8")).hexdigest()
 
-    def get(self, db: Session, url: str) -> str | None:
+    def _live_record(self, db: Session, url: str) -> PortalCache | None:
         record = (
             db.query(PortalCache)
             .filter(PortalCache.url_hash == self._url_hash(url))
@@ -138,19 +157,54 @@ class PortalCacheService:
         )
         if not record:
             return None
+        expires_at = record.expires_at
+        if expires_at.tzinfo is None:  # SQLite drops the offset
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        if expires_at <= utcnow():
+            return None
+        return record
 
-        if record.expires_at <= utcnow():
+    def _read(self, key: str) -> str | None:
+        data = self.store.get(key)
+        return data.decode("utf-8") if data is not None else None
+
+    def get(self, db: Session, url: str) -> str | None:
+        record = self._live_record(db, url)
+        if record is None:
             return None
+        if record.content_hash is None:
+            return record.raw_html
+        # A blob removed under us (garbage collection race) is just a miss.
+        return self._read(record.content_hash)
+
+    def get_text(self, db: Session, url: str) -> str | None:
+        record = self._live_record(db, url)
+        if record is None or record.text_hash is None:
+            return None
+        return self._read(record.text_hash)
 
-        return record.raw_html
+    def set(self, db: Session, url: str, raw_html: str, text: str | None = None) -> None:
+        html = raw_html.encode("utf-8")
+        content_hash, stored_bytes = self.store.put(html)
+        text_hash = self.store.put(text.encode("utf-8"))[0] if text is not None else None
 
-    def set(self, db: Session, url: str, raw_html: str) -> None:
         url_hash = self._url_hash(url)
         expires_at = utcnow() + timedelta(hours=self.ttl_hours)
         existing = db.query(PortalCache).filter(PortalCache.url_hash == url_hash).first()
+        replaced: set[str] = set()
         if existing:
+            if existing.content_hash != content_hash:
+                replaced.update(h for h in (existing.content_hash, existing.text_hash) if h)
+            elif text_hash is None:
+                text_hash = existing.text_hash
+            elif existing.text_hash:
+                replaced.add(existing.text_hash)
             existing.source_url = url
-            existing.raw_html = raw_html
+            existing.raw_html = None
+            existing.content_hash = content_hash
+            existing.text_hash = text_hash
+            existing.html_bytes = len(html)
+            existing.stored_bytes = stored_bytes
             existing.captured_at = utcnow()
             existing.expires_at = expires_at
         else:
@@ -158,12 +212,69 @@ class PortalCacheService:
                 PortalCache(
                     url_hash=url_hash,
                     source_url=url,
-                    raw_html=raw_html,
+                    content_hash=content_hash,
+                    text_hash=text_hash,
+                    html_bytes=len(html),
+                    stored_bytes=stored_bytes,
                     captured_at=utcnow(),
                     expires_at=expires_at,
                 )
             )
         db.commit()
+        self._release(db, replaced - {content_hash, text_hash})
+
+    def set_text(self, db: Session, url: str, text: str) -> None:
+        """Cache extracted text for an already cached page."""
+        record = self._live_record(db, url)
+        if record is None:
+            return
+        text_hash = self.store.put(text.encode("utf-8"))[0]
+        previous, record.text_hash = record.text_hash, text_hash
+        db.commit()
+        if previous and previous != text_hash:
+            self._release(db, {previous})
+
+    # AbstractSet: ``set`` in this class body is the ``set`` method above
+    def _release(self, db: Session, hashes: AbstractSet[str]) -> int:
+        """Delete blobs no cache entry references any more; returns how many."""
+        if not hashes:
+            return 0
+        referenced = {
+            h
+            for row in db.query(PortalCache.content_hash, PortalCache.text_hash).filter(
+                or_(PortalCache.content_hash.in_(hashes), PortalCache.text_hash.in_(hashes))
+            )
+            for h in row
+        }
+        removed = 0
+        for key in hashes - referenced:
+            try:
+                self.store.delete(key)
+                removed += 1
+            except Exception as e:
+                logger.warning("Failed to delete page blob %s: %s", key, e)
+        return removed
+
+    def collect_garbage(self, db: Session, batch_size: int = 500) -> dict[str, int]:
+        """Drop expired entries and the blobs only they referenced."""
+        now = utcnow()
+        entries = blobs = 0
+        while True:
+            expired = (
+                db.query(PortalCache.id, PortalCache.content_hash, PortalCache.text_hash)
+                .filter(PortalCache.expires_at <= now)
+                .limit(batch_size)
+                .all()
+            )
+            if not expired:
+                break
+            db.query(PortalCache).filter(PortalCache.id.in_([row.id for row in expired])).delete(
+                synchronize_session=False
+            )
+            db.commit()
+            entries += len(expired)
+            blobs += self._release(db, {h for row in expired for h in (row.content_hash, row.text_hash) if h})
+        return {"entries_removed": entries, "blobs_removed": blobs}
 
 
 class PortalFetcher:
@@ -175,7 +286,7 @@ class PortalFetcher:
         if cached is not None:
             return cached
 
-        async with httpx.AsyncClient() as client:
+        async with http_clients.session("portal") as client:
             response = await client.get(url, timeout=float(timeout_seconds))
             response.raise_for_status()
             html = response.text
@@ -186,9 +297,15 @@ class PortalFetcher:
     async def extract_text(self, db: Session, url: str, timeout_seconds: int = 20) -> str:
         from bs4 import BeautifulSoup  # Lazy import to avoid hard dependency for search-only flows.
 
+        cached = self.cache_service.get_text(db, url)
+        if cached is not None:
+            return cached
+
         html = await self.fetch_html(db=db, url=url, timeout_seconds=timeout_seconds)
         soup = BeautifulSoup(html, "html.parser")
-        return soup.get_text(" ", strip=True)
+        text = soup.get_text(" ", strip=True)
+        self.cache_service.set_text(db, url, text)
+        return text
 
 
 # Hook for future JS-heavy portal support with Playwright.
@@ -14,7 +14,6 @@ from app.models.agentic_property import ResearchProperty
 from app.models.comp_rental import CompRental
 from app.models.comp_sale import CompSale
 from app.models.property import Property, PropertyStatus
-from app.models.zillow_enrichment import ZillowEnrichment
 from app.services.agentic.comps import (
     distance_proxy_mi,
     passes_hard_filters,
@@ -27,6 +26,7 @@ from app.services.agentic.workers._shared import (
     effective_comp_score,
     source_quality_score,
 )
+from app.services.comp_index import CompCandidates, find_comp_candidates, rank_comp_candidates
 
 
 # ---------------------------------------------------------------------------
@@ -66,61 +66,20 @@ async def worker_comps_sales(
     web_calls = 0
 
     # 1) Internal deterministic candidates (existing properties table).
-    query = db.query(Property)
-    if rp.state:
-        query = query.filter(Property.state.ilike(rp.state))
-    if rp.city:
-        query = query.filter(Property.city.ilike(rp.city))
-
-    candidates = query.limit(250).all()
-
     internal_selected: list[dict[str, Any]] = []
-    for candidate in candidates:
-        if candidate.address.strip().lower() == (rp.raw_address or "").strip().lower():
-            continue
-
-        candidate_date = (candidate.updated_at or candidate.created_at)
-        candidate_sale_date = candidate_date.date() if candidate_date else None
-        distance = distance_proxy_mi(
-            target_zip=rp.zip_code,
-            candidate_zip=candidate.zip_code,
-            target_city=rp.city,
-            candidate_city=candidate.city,
-            target_state=rp.state,
-            candidate_state=candidate.state,
-        )
-
-        if not passes_hard_filters(
-            distance_mi=distance,
-            radius_mi=radius,
-            sale_or_list_date=candidate_sale_date,
-            max_recency_months=12,
-            target_sqft=target_sqft,
-            candidate_sqft=candidate.square_feet,
-            target_beds=target_beds,
-            candidate_beds=candidate.bedrooms,
-            target_baths=target_baths,
-            candidate_baths=candidate.bathrooms,
-        ):
-            continue
-
-        score = similarity_score(
-            distance_mi=distance,
-            radius_mi=radius,
-            target_sqft=target_sqft,
-            candidate_sqft=candidate.square_feet,
-            target_beds=target_beds,
-            candidate_beds=candidate.bedrooms,
-            target_baths=target_baths,
-            candidate_baths=candidate.bathrooms,
-            sale_or_list_date=candidate_sale_date,
-        )
-
+    for candidate, distance, score, _ in _internal_comp_candidates(
+        db,
+        rp,
+        radius=radius,
+        target_sqft=target_sqft,
+        target_beds=target_beds,
+        target_baths=target_baths,
+    ):
         internal_selected.append(
             {
                 "address": f"{candidate.address}, {candidate.city}, {candidate.state} {candidate.zip_code}",
                 "distance_mi": distance,
-                "sale_date": candidate_sale_date,
+                "sale_date": CompCandidates.listed_date(candidate),
                 "sale_price": candidate.price,
                 "sqft": candidate.square_feet,
                 "beds": candidate.bedrooms,
@@ -128,6 +87,8 @@ async def worker_comps_sales(
                 "year_built": candidate.year_built,
                 "similarity_score": score,
                 "source_url": f"internal://properties/{candidate.id}",
+                "geo_lat": candidate.geo_lat,
+                "geo_lng": candidate.geo_lng,
                 "details": {
                     "property_id": candidate.id,
                     "origin": "internal_crm",
@@ -194,6 +155,8 @@ async def worker_comps_sales(
                 job_id=job.id,
                 address=comp["address"],
                 distance_mi=comp["distance_mi"],
+                geo_lat=comp.get("geo_lat"),
+                geo_lng=comp.get("geo_lng"),
                 sale_date=comp["sale_date"],
                 sale_price=comp["sale_price"],
                 sqft=comp["sqft"],
@@ -280,81 +243,30 @@ async def worker_comps_rentals(
     errors: list[str] = []
     web_calls = 0
 
-    # 1) Internal deterministic candidates.
-    query = db.query(Property)
-    if rp.state:
-        query = query.filter(Property.state.ilike(rp.state))
-    if rp.city:
-        query = query.filter(Property.city.ilike(rp.city))
-
-    candidates = query.limit(250).all()
-
+    # 1) Internal deterministic candidates with a Zillow rent signal.
     internal_selected: list[dict[str, Any]] = []
-    for candidate in candidates:
-        if candidate.address.strip().lower() == (rp.raw_address or "").strip().lower():
-            continue
-
-        rental_signal = None
-
-        zillow = (
-            db.query(ZillowEnrichment)
-            .filter(ZillowEnrichment.property_id == candidate.id)
-            .first()
-        )
-        if zillow and zillow.rent_zestimate:
-            rental_signal = zillow.rent_zestimate
-
-        if rental_signal is None:
-            continue
-
-        candidate_date = (candidate.updated_at or candidate.created_at)
-        candidate_listed_date = candidate_date.date() if candidate_date else None
-        distance = distance_proxy_mi(
-            target_zip=rp.zip_code,
-            candidate_zip=candidate.zip_code,
-            target_city=rp.city,
-            candidate_city=candidate.city,
-            target_state=rp.state,
-            candidate_state=candidate.state,
-        )
-
-        if not passes_hard_filters(
-            distance_mi=distance,
-            radius_mi=radius,
-            sale_or_list_date=candidate_listed_date,
-            max_recency_months=12,
-            target_sqft=target_sqft,
-            candidate_sqft=candidate.square_feet,
-            target_beds=target_beds,
-            candidate_beds=candidate.bedrooms,
-            target_baths=target_baths,
-            candidate_baths=candidate.bathrooms,
-        ):
-            continue
-
-        score = similarity_score(
-            distance_mi=distance,
-            radius_mi=radius,
-            target_sqft=target_sqft,
-            candidate_sqft=candidate.square_feet,
-            target_beds=target_beds,
-            candidate_beds=candidate.bedrooms,
-            target_baths=target_baths,
-            candidate_baths=candidate.bathrooms,
-            sale_or_list_date=candidate_listed_date,
-        )
-
+    for candidate, distance, score, rental_signal in _internal_comp_candidates(
+        db,
+        rp,
+        radius=radius,
+        target_sqft=target_sqft,
+        target_beds=target_beds,
+        target_baths=target_baths,
+        with_rent=True,
+    ):
         internal_selected.append(
             {
                 "address": f"{candidate.address}, {candidate.city}, {candidate.state} {candidate.zip_code}",
                 "distance_mi": distance,
                 "rent": rental_signal,
-                "date_listed": candidate_listed_date,
+                "date_listed": CompCandidates.listed_date(candidate),
                 "sqft": candidate.square_feet,
                 "beds": candidate.bedrooms,
                 "baths": candidate.bathrooms,
                 "similarity_score": score,
                 "source_url": f"internal://properties/{candidate.id}",
+                "geo_lat": candidate.geo_lat,
+                "geo_lng": candidate.geo_lng,
                 "details": {
                     "property_id": candidate.id,
                     "origin": "internal_crm",
@@ -421,6 +333,8 @@ async def worker_comps_rentals(
                 job_id=job.id,
                 address=comp["address"],
                 distance_mi=comp["distance_mi"],
+                geo_lat=comp.get("geo_lat"),
+                geo_lng=comp.get("geo_lng"),
                 rent=comp["rent"],
                 date_listed=comp["date_listed"],
                 sqft=comp["sqft"],
@@ -470,6 +384,51 @@ async def worker_comps_rentals(
     }
 
 
+# ---------------------------------------------------------------------------
+# Internal candidates
+# ---------------------------------------------------------------------------
+
+
+def _internal_comp_candidates(
+    db: Session,
+    rp: ResearchProperty,
+    *,
+    radius: float,
+    target_sqft: int | None,
+    target_beds: int | None,
+    target_baths: float | None,
+    with_rent: bool = False,
+) -> list[tuple[Property, float, float, float | None]]:
+    """(property, distance_mi, similarity_score, rent) for CRM properties passing the hard filters."""
+    candidates = find_comp_candidates(
+        db,
+        lat=rp.geo_lat,
+        lng=rp.geo_lng,
+        radius_mi=radius,
+        city=rp.city,
+        state=rp.state,
+        zip_code=rp.zip_code,
+        target_sqft=target_sqft,
+        target_beds=target_beds,
+        target_baths=target_baths,
+        max_recency_months=12,
+        exclude_address=rp.raw_address,
+        with_rent=with_rent,
+    )
+    scores = rank_comp_candidates(
+        candidates,
+        radius_mi=radius,
+        target_sqft=target_sqft,
+        target_beds=target_beds,
+        target_baths=target_baths,
+    )
+    rents = candidates.rents or [None] * len(candidates)
+    return [
+        (prop, round(float(distance), 3), float(score), rent)
+        for prop, distance, score, rent in zip(candidates.properties, candidates.distance_mi, scores, rents)
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Dedupe & ranking
 # ---------------------------------------------------------------------------
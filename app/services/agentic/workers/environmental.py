@@ -5,12 +5,12 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import httpx
 from sqlalchemy.orm import Session
 
 from app.models.agentic_job import AgenticJob
 from app.services.agentic.workers._shared import EvidenceDraft
 from app.services.agentic.workers._context import ServiceContext
+from app.utils.http_clients import http_clients
 
 
 async def worker_flood_zone(
@@ -46,7 +46,7 @@ async def worker_flood_zone(
     try:
         # FEMA National Flood Hazard Layer (NFHL) ArcGIS REST API
         # This is the official free FEMA endpoint
-        async with httpx.AsyncClient() as client:
+        async with http_clients.session("gov_data") as client:
             response = await client.get(
                 "https://hazards.fema.gov/arcgis/rest/services/public/NFHL/MapServer/28/query",
                 params={
@@ -181,7 +181,7 @@ async def worker_epa_environmental(
     ]
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_clients.session("gov_data") as client:
             for layer_id, key, label in layers:
                 resp = await client.get(f"{base_url}/{layer_id}/query", params=base_params)
                 web_calls += 1
@@ -240,7 +240,7 @@ async def worker_wildfire_hazard(
         return {"data": {"wildfire_hazard": wildfire_data}, "unknowns": [{"field": "wildfire", "reason": "No geocode"}], "errors": [], "evidence": [], "web_calls": 0, "cost_usd": 0.0}
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_clients.session("gov_data") as client:
             # USFS raster layer — use identify operation
             resp = await client.get(
                 "https://apps.fs.usda.gov/arcx/rest/services/RDW_Wildfire/RMRS_WildfireHazardPotential_2023/MapServer/identify",
@@ -322,7 +322,7 @@ async def worker_hud_opportunity(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_clients.session("gov_data") as client:
             # Layer 13: Block group level (school + jobs)
             resp1 = await client.get(
                 "https://egis.hud.gov/arcgis/rest/services/affht/AffhtMapService/MapServer/13/query",
@@ -386,7 +386,7 @@ async def worker_wetlands(
         return {"data": {"wetlands": wetlands_data}, "unknowns": [{"field": "wetlands", "reason": "No geocode"}], "errors": [], "evidence": [], "web_calls": 0, "cost_usd": 0.0}
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_clients.session("gov_data") as client:
             resp = await client.get(
                 "https://fwspublicservices.wim.usgs.gov/wetlandsmapservice/rest/services/Wetlands/MapServer/identify",
                 params={
@@ -446,7 +446,7 @@ async def worker_historic_places(
         return {"data": {"historic_places": historic_data}, "unknowns": [{"field": "historic", "reason": "No geocode"}], "errors": [], "evidence": [], "web_calls": 0, "cost_usd": 0.0}
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_clients.session("gov_data") as client:
             resp = await client.get(
                 "https://mapservices.nps.gov/arcgis/rest/services/cultural_resources/nrhp_locations/MapServer/0/query",
                 params={
@@ -511,7 +511,7 @@ async def worker_seismic_hazard(
         return {"data": {"seismic_hazard": seismic_data}, "unknowns": [{"field": "seismic", "reason": "No geocode"}], "errors": [], "evidence": [], "web_calls": 0, "cost_usd": 0.0}
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_clients.session("gov_data") as client:
             # 1. Peak ground acceleration (raster identify)
             resp1 = await client.get(
                 "https://earthquake.usgs.gov/arcgis/rest/services/haz/USpga250_2014/MapServer/identify",
@@ -619,7 +619,7 @@ async def worker_school_district(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_clients.session("gov_data") as client:
             # Unified school district
             resp1 = await client.get(
                 "https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb/School/MapServer/0/query",
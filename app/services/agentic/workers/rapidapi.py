@@ -6,7 +6,6 @@ import logging
 import re
 from typing import Any
 
-import httpx
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -15,6 +14,7 @@ from app.models.agentic_property import ResearchProperty
 from app.services.agentic.workers._shared import EvidenceDraft
 from app.services.agentic.workers._context import ServiceContext
 from app.services.agentic.workers._shared import source_quality_score
+from app.utils.http_clients import http_clients
 
 
 async def worker_us_real_estate(
@@ -44,7 +44,7 @@ async def worker_us_real_estate(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_clients.session("rapidapi") as client:
             # 1) Noise score (lat/lng based)
             if lat and lng:
                 try:
@@ -190,7 +190,7 @@ async def worker_walk_score(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_clients.session("rapidapi") as client:
             resp = await client.get(
                 "https://walk-score.p.rapidapi.com/score",
                 params={
@@ -277,7 +277,7 @@ async def worker_redfin(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_clients.session("rapidapi") as client:
             # Step 1: Auto-complete to find property URL
             resp = await client.get(
                 "https://redfin-com-data.p.rapidapi.com/auto-complete",
@@ -412,7 +412,7 @@ async def worker_rentcast(
         params["squareFootage"] = facts["sqft"]
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_clients.session("rapidapi") as client:
             resp = await client.get(
                 "https://api.rentcast.io/v1/avm/rent/long-term",
                 params=params,
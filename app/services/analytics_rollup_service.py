@@ -0,0 +1,195 @@
+"""
+Analytics rollups
+
+Maintains ``analytics_daily_rollups``: event counts and value sums per agent,
+UTC day and event type. ``record`` upserts one event into its day as it is
+tracked; ``rebuild`` recomputes a range from ``analytics_events`` (backfill
+after migration, nightly repair for events written by other paths).
+
+``totals`` answers "what happened since X" with a single grouped query: whole
+days come from the rollup, and the partial first day is counted from raw
+events (an index range over at most one day), so results match a scan of
+``analytics_events`` exactly.
+
+Usage:
+    analytics_rollup_service.record(db, agent_id, "property_view", now, None)
+    totals = analytics_rollup_service.totals(db, agent_id, since)
+    # {"property_view": (count, value_cents), ...}
+"""
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.analytics_event import AnalyticsDailyRollup, AnalyticsEvent
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class AnalyticsRollupService:
+    """Per-agent daily aggregates over analytics events."""
+
+    # ── Writes ──
+
+    def record(
+        self,
+        db: Session,
+        agent_id: int,
+        event_type: str,
+        occurred_at: datetime,
+        value: Optional[int] = None,
+    ) -> None:
+        """Add one event to its day's rollup. The caller commits."""
+        day = _as_utc(occurred_at).date()
+        table = AnalyticsDailyRollup.__table__
+        row = {"agent_id": agent_id, "day": day, "event_type": event_type,
+               "event_count": 1, "value_sum": value or 0}
+
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = pg_insert if dialect == "postgresql" else sqlite_insert
+            stmt = insert(table).values(**row)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["agent_id", "day", "event_type"],
+                set_={
+                    "event_count": table.c.event_count + 1,
+                    "value_sum": table.c.value_sum + (value or 0),
+                },
+            )
+            db.execute(stmt)
+            return
+
+        existing = (
+            db.query(AnalyticsDailyRollup)
+            .filter_by(agent_id=agent_id, day=day, event_type=event_type)
+            .with_for_update()
+            .first()
+        )
+        if existing:
+            existing.event_count += 1
+            existing.value_sum += value or 0
+        else:
+            db.add(AnalyticsDailyRollup(**row))
+
+    def rebuild(self, db: Session, since: Optional[date] = None, agent_id: Optional[int] = None) -> int:
+        """Recompute rollups from raw events for days >= ``since`` (all days if None).
+
+        Recomputed rows are upserted over the live ones rather than deleted
+        and reinserted, so a concurrent ``record`` never hits a missing row or
+        races the rebuild into a unique violation; rows whose events are all
+        gone are removed afterwards. Returns the number of rollup rows written.
+        """
+        day = self._utc_day(db)
+        grouped = (
+            select(
+                AnalyticsEvent.agent_id,
+                day.label("day"),
+                AnalyticsEvent.event_type,
+                func.count(AnalyticsEvent.id),
+                func.coalesce(func.sum(AnalyticsEvent.value), 0),
+            )
+            .where(AnalyticsEvent.agent_id.isnot(None), AnalyticsEvent.created_at.isnot(None))
+            .group_by(AnalyticsEvent.agent_id, day, AnalyticsEvent.event_type)
+        )
+        if since is not None:
+            start = datetime.combine(since, time.min, tzinfo=timezone.utc)
+            grouped = grouped.where(AnalyticsEvent.created_at >= start)
+        if agent_id is not None:
+            grouped = grouped.where(AnalyticsEvent.agent_id == agent_id)
+
+        table = AnalyticsDailyRollup.__table__
+        in_range = []
+        if since is not None:
+            in_range.append(table.c.day >= since)
+        if agent_id is not None:
+            in_range.append(table.c.agent_id == agent_id)
+        columns = ["agent_id", "day", "event_type", "event_count", "value_sum"]
+
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = pg_insert if dialect == "postgresql" else sqlite_insert
+            stmt = insert(table).from_select(columns, grouped)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["agent_id", "day", "event_type"],
+                set_={
+                    "event_count": stmt.excluded.event_count,
+                    "value_sum": stmt.excluded.value_sum,
+                },
+            )
+            result = db.execute(stmt)
+            has_events = (
+                select(AnalyticsEvent.id)
+                .where(
+                    AnalyticsEvent.agent_id == table.c.agent_id,
+                    AnalyticsEvent.event_type == table.c.event_type,
+                    day == table.c.day,
+                )
+                .exists()
+            )
+            db.execute(table.delete().where(*in_range, ~has_events))
+        else:
+            # No upsert: hold the range locked so ``record`` waits for the rebuild.
+            db.execute(select(table.c.id).where(*in_range).with_for_update())
+            db.execute(table.delete().where(*in_range))
+            result = db.execute(table.insert().from_select(columns, grouped))
+        db.commit()
+        return result.rowcount or 0
+
+    # ── Reads ──
+
+    def totals(
+        self,
+        db: Session,
+        agent_id: int,
+        since: datetime,
+        event_types: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Tuple[int, int]]:
+        """Event count and value sum (cents) per event type since ``since``."""
+        since = _as_utc(since)
+        first_full_day = since.date() + timedelta(days=1)
+        boundary_end = datetime.combine(first_full_day, time.min, tzinfo=timezone.utc)
+        types = list(event_types) if event_types is not None else None
+
+        rolled = select(
+            AnalyticsDailyRollup.event_type.label("event_type"),
+            AnalyticsDailyRollup.event_count.label("n"),
+            AnalyticsDailyRollup.value_sum.label("v"),
+        ).where(
+            AnalyticsDailyRollup.agent_id == agent_id,
+            AnalyticsDailyRollup.day >= first_full_day,
+        )
+        partial = select(
+            AnalyticsEvent.event_type.label("event_type"),
+            literal(1).label("n"),
+            func.coalesce(AnalyticsEvent.value, 0).label("v"),
+        ).where(
+            AnalyticsEvent.agent_id == agent_id,
+            AnalyticsEvent.created_at >= since,
+            AnalyticsEvent.created_at < boundary_end,
+        )
+        if types is not None:
+            rolled = rolled.where(AnalyticsDailyRollup.event_type.in_(types))
+            partial = partial.where(AnalyticsEvent.event_type.in_(types))
+
+        combined = union_all(rolled, partial).subquery()
+        rows = db.execute(
+            select(combined.c.event_type, func.sum(combined.c.n), func.sum(combined.c.v))
+            .group_by(combined.c.event_type)
+        ).all()
+        return {event_type: (int(n or 0), int(v or 0)) for event_type, n, v in rows}
+
+    @staticmethod
+    def _utc_day(db: Session):
+        if db.get_bind().dialect.name == "postgresql":
+            return func.date(func.timezone("UTC", AnalyticsEvent.created_at))
+        return func.date(AnalyticsEvent.created_at)
+
+
+analytics_rollup_service = AnalyticsRollupService()
@@ -13,18 +13,22 @@ from app.models.skip_trace import SkipTrace
 from app.models.zillow_enrichment import ZillowEnrichment
 from app.models.analytics_event import AnalyticsEvent
 from app.models.contact import Contact
+from app.services.analytics_rollup_service import analytics_rollup_service
 
 
 class AnalyticsService:
     """Portfolio-level analytics aggregated from existing data."""
 
     def get_portfolio_summary(self, db: Session) -> dict:
-        pipeline = self._pipeline_stats(db)
-        value = self._portfolio_value(db)
+        properties = self._property_aggregates(db)
+        zillow = self._zillow_aggregates(db)
+
+        pipeline = self._pipeline_stats(db, properties)
+        value = self._portfolio_value(db, properties, zillow)
         contracts = self._contract_stats(db)
         activity = self._activity_stats(db)
         scores = self._deal_score_stats(db)
-        coverage = self._enrichment_coverage(db)
+        coverage = self._enrichment_coverage(db, properties, zillow)
 
         voice_summary = self._build_voice_summary(pipeline, value, contracts, scores)
 
@@ -66,32 +70,67 @@ class AnalyticsService:
         }
 
     # ── Stats helpers ──
+    # Each entity is read with one grouped query; the portfolio summary
+    # shares the property and Zillow aggregates between its sections.
 
-    def _pipeline_stats(self, db: Session) -> dict:
-        total = db.query(func.count(Property.id)).scalar() or 0
+    @staticmethod
+    def _label(value) -> Optional[str]:
+        if value is None:
+            return None
+        return value.value if hasattr(value, "value") else str(value)
+
+    def _property_aggregates(self, db: Session) -> list:
+        """Count and price sum per (status, type) — one pass over properties."""
+        return (
+            db.query(
+                Property.status,
+                Property.property_type,
+                func.count(Property.id).label("count"),
+                func.count(Property.price).label("priced"),
+                func.sum(Property.price).label("price_sum"),
+            )
+            .group_by(Property.status, Property.property_type)
+            .all()
+        )
 
-        by_status = {}
-        status_rows = db.query(Property.status, func.count(Property.id)).group_by(Property.status).all()
-        for status_val, count in status_rows:
-            if count > 0 and status_val:
-                by_status[status_val.value if hasattr(status_val, 'value') else str(status_val)] = count
+    def _zillow_aggregates(self, db: Session):
+        return (
+            db.query(
+                func.count(ZillowEnrichment.id).label("count"),
+                func.sum(ZillowEnrichment.zestimate).label("zestimate_sum"),
+            )
+            .join(Property)
+            .one()
+        )
 
-        by_type = {}
-        type_rows = db.query(Property.property_type, func.count(Property.id)).group_by(Property.property_type).all()
-        for ptype_val, count in type_rows:
-            if count > 0 and ptype_val:
-                by_type[ptype_val.value if hasattr(ptype_val, 'value') else str(ptype_val)] = count
+    def _pipeline_stats(self, db: Session, properties: Optional[list] = None) -> dict:
+        if properties is None:
+            properties = self._property_aggregates(db)
+
+        total = 0
+        by_status: Dict[str, int] = {}
+        by_type: Dict[str, int] = {}
+        for row in properties:
+            total += row.count
+            status = self._label(row.status)
+            if status:
+                by_status[status] = by_status.get(status, 0) + row.count
+            ptype = self._label(row.property_type)
+            if ptype:
+                by_type[ptype] = by_type.get(ptype, 0) + row.count
 
         return {"total": total, "by_status": by_status, "by_type": by_type}
 
-    def _portfolio_value(self, db: Session) -> dict:
-        total_price = db.query(func.sum(Property.price)).scalar() or 0
-        avg_price = db.query(func.avg(Property.price)).scalar() or 0
-        total_zestimate = (
-            db.query(func.sum(ZillowEnrichment.zestimate))
-            .join(Property)
-            .scalar()
-        ) or 0
+    def _portfolio_value(self, db: Session, properties: Optional[list] = None, zillow=None) -> dict:
+        if properties is None:
+            properties = self._property_aggregates(db)
+        if zillow is None:
+            zillow = self._zillow_aggregates(db)
+
+        total_price = sum(row.price_sum or 0 for row in properties)
+        priced = sum(row.priced for row in properties)
+        avg_price = total_price / priced if priced else 0
+        total_zestimate = zillow.zestimate_sum or 0
 
         return {
             "total_price": round(total_price, 2),
@@ -101,22 +140,25 @@ class AnalyticsService:
         }
 
     def _contract_stats(self, db: Session) -> dict:
-        total = db.query(func.count(Contract.id)).scalar() or 0
+        rows = (
+            db.query(Contract.status, Contract.is_required, func.count(Contract.id))
+            .group_by(Contract.status, Contract.is_required)
+            .all()
+        )
 
-        by_status = {}
-        for status in ContractStatus:
-            count = db.query(func.count(Contract.id)).filter(Contract.status == status).scalar() or 0
-            if count > 0:
-                by_status[status.value] = count
+        unsigned_statuses = {ContractStatus.DRAFT, ContractStatus.SENT, ContractStatus.PENDING_SIGNATURE}
+        counts: Dict[ContractStatus, int] = {}
+        total = 0
+        unsigned_required = 0
+        for status, is_required, count in rows:
+            total += count
+            if status is not None:
+                counts[status] = counts.get(status, 0) + count
+            if is_required and status in unsigned_statuses:
+                unsigned_required += count
 
-        unsigned_required = (
-            db.query(func.count(Contract.id))
-            .filter(
-                Contract.is_required.is_(True),
-                Contract.status.in_([ContractStatus.DRAFT, ContractStatus.SENT, ContractStatus.PENDING_SIGNATURE]),
-            )
-            .scalar()
-        ) or 0
+        # Keep the enum's declaration order in the response
+        by_status = {status.value: counts[status] for status in ContractStatus if counts.get(status)}
 
         return {
             "total": total,
@@ -126,15 +168,21 @@ class AnalyticsService:
 
     def _activity_stats(self, db: Session) -> dict:
         now = datetime.now(timezone.utc)
+        day_ago = now - timedelta(hours=24)
+        week_ago = now - timedelta(days=7)
+        month_ago = now - timedelta(hours=720)
 
-        def count_since(hours):
-            cutoff = now - timedelta(hours=hours)
-            return db.query(func.count(ConversationHistory.id)).filter(
-                ConversationHistory.created_at >= cutoff
-            ).scalar() or 0
+        counts = (
+            db.query(
+                func.count(case((ConversationHistory.created_at >= day_ago, 1))).label("last_24h"),
+                func.count(case((ConversationHistory.created_at >= week_ago, 1))).label("last_7d"),
+                func.count(ConversationHistory.id).label("last_30d"),
+            )
+            .filter(ConversationHistory.created_at >= month_ago)
+            .one()
+        )
 
         # Most active properties (last 7 days) - FIXED: Use joinedload to avoid N+1
-        week_ago = now - timedelta(days=7)
         most_active = (
             db.query(
                 ConversationHistory.property_id,
@@ -162,26 +210,42 @@ class AnalyticsService:
         ]
 
         return {
-            "last_24h": count_since(24),
-            "last_7d": count_since(168),
-            "last_30d": count_since(720),
+            "last_24h": counts.last_24h or 0,
+            "last_7d": counts.last_7d or 0,
+            "last_30d": counts.last_30d or 0,
             "most_active_properties": most_active_list,
         }
 
     def _deal_score_stats(self, db: Session) -> dict:
-        scored = db.query(Property).filter(Property.deal_score.isnot(None)).all()
+        grades = (
+            db.query(
+                Property.score_grade,
+                func.count(Property.id).label("count"),
+                func.sum(Property.deal_score).label("score_sum"),
+            )
+            .filter(Property.deal_score.isnot(None))
+            .group_by(Property.score_grade)
+            .all()
+        )
+        scored = sum(row.count for row in grades)
         if not scored:
             return {"avg_score": None, "distribution": {}, "top_5": []}
 
-        avg = sum(p.deal_score for p in scored) / len(scored)
+        avg = sum(row.score_sum or 0 for row in grades) / scored
 
         distribution = {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0}
-        for p in scored:
-            grade = p.score_grade or "F"
+        for row in grades:
+            grade = row.score_grade or "F"
             if grade in distribution:
-                distribution[grade] += 1
+                distribution[grade] += row.count
 
-        top_5 = sorted(scored, key=lambda p: p.deal_score or 0, reverse=True)[:5]
+        top_5 = (
+            db.query(Property.id, Property.address, Property.deal_score, Property.score_grade)
+            .filter(Property.deal_score.isnot(None))
+            .order_by(Property.deal_score.desc(), Property.id)
+            .limit(5)
+            .all()
+        )
         top_5_list = [
             {
                 "property_id": p.id,
@@ -198,16 +262,16 @@ class AnalyticsService:
             "top_5": top_5_list,
         }
 
-    def _enrichment_coverage(self, db: Session) -> dict:
-        total = db.query(func.count(Property.id)).scalar() or 0
+    def _enrichment_coverage(self, db: Session, properties: Optional[list] = None, zillow=None) -> dict:
+        if properties is None:
+            properties = self._property_aggregates(db)
+        total = sum(row.count for row in properties)
         if total == 0:
             return {"total": 0, "zillow_pct": 0, "skip_trace_pct": 0}
 
-        with_zillow = (
-            db.query(func.count(ZillowEnrichment.id))
-            .join(Property)
-            .scalar()
-        ) or 0
+        if zillow is None:
+            zillow = self._zillow_aggregates(db)
+        with_zillow = zillow.count or 0
 
         with_skip = (
             db.query(func.count(func.distinct(SkipTrace.property_id)))
@@ -255,57 +319,26 @@ class AnalyticsService:
     def get_dashboard_overview(self, db: Session, agent_id: int, days: int = 30) -> Dict[str, Any]:
         """
         Get key performance indicators for the dashboard.
+
+        One query per entity: event KPIs from the daily rollups, property
+        counts as conditional aggregates, signed contracts.
         """
         start_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-        # Event counts
-        property_views = db.query(func.count(AnalyticsEvent.id)).filter(
-            and_(
-                AnalyticsEvent.agent_id == agent_id,
-                AnalyticsEvent.event_type == "property_view",
-                AnalyticsEvent.created_at >= start_date
-            )
-        ).scalar() or 0
-
-        leads_created = db.query(func.count(AnalyticsEvent.id)).filter(
-            and_(
-                AnalyticsEvent.agent_id == agent_id,
-                AnalyticsEvent.event_type == "lead_created",
-                AnalyticsEvent.created_at >= start_date
-            )
-        ).scalar() or 0
-
-        conversions = db.query(func.count(AnalyticsEvent.id)).filter(
-            and_(
-                AnalyticsEvent.agent_id == agent_id,
-                AnalyticsEvent.event_type == "conversion",
-                AnalyticsEvent.created_at >= start_date
-            )
-        ).scalar() or 0
-
-        # Total value (revenue attribution)
-        total_value = db.query(func.sum(AnalyticsEvent.value)).filter(
-            and_(
-                AnalyticsEvent.agent_id == agent_id,
-                AnalyticsEvent.created_at >= start_date
-            )
-        ).scalar() or 0
-
-        # Active properties
-        active_properties = db.query(func.count(Property.id)).filter(
-            and_(
-                Property.agent_id == agent_id,
-                Property.status != PropertyStatus.COMPLETE
-            )
-        ).scalar() or 0
-
-        # New properties this period
-        new_properties = db.query(func.count(Property.id)).filter(
-            and_(
-                Property.agent_id == agent_id,
-                Property.created_at >= start_date
-            )
-        ).scalar() or 0
+        # Event counts and revenue attribution
+        events = analytics_rollup_service.totals(db, agent_id, start_date)
+        property_views = events.get("property_view", (0, 0))[0]
+        leads_created = events.get("lead_created", (0, 0))[0]
+        conversions = events.get("conversion", (0, 0))[0]
+        total_value = sum(value for _, value in events.values())
+
+        # Active properties and new properties this period
+        properties = db.query(
+            func.count(case((Property.status != PropertyStatus.COMPLETE, 1))).label("active"),
+            func.count(case((Property.created_at >= start_date, 1))).label("new"),
+        ).filter(Property.agent_id == agent_id).one()
+        active_properties = properties.active or 0
+        new_properties = properties.new or 0
 
         # Contracts signed (join through Property)
         contracts_signed = db.query(func.count(Contract.id)).join(
@@ -373,17 +406,13 @@ class AnalyticsService:
             ("contract_signed", "Deals Closed"),
         ]
 
+        event_counts = analytics_rollup_service.totals(
+            db, agent_id, start_date, [event_type for event_type, _ in stages if event_type != "contact_added"]
+        )
+
         funnel_data = []
 
         for event_type, stage_name in stages:
-            count = db.query(func.count(AnalyticsEvent.id)).filter(
-                and_(
-                    AnalyticsEvent.agent_id == agent_id,
-                    AnalyticsEvent.event_type == event_type,
-                    AnalyticsEvent.created_at >= start_date
-                )
-            ).scalar() or 0
-
             # For contact_added, count from contacts table (join through Property)
             if event_type == "contact_added":
                 count = db.query(func.count(Contact.id)).join(
@@ -394,6 +423,8 @@ class AnalyticsService:
                         Contact.created_at >= start_date
                     )
                 ).scalar() or 0
+            else:
+                count = event_counts.get(event_type, (0, 0))[0]
 
             funnel_data.append({"stage": stage_name, "count": count})
 
@@ -599,7 +630,7 @@ class AnalyticsService:
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
     ) -> AnalyticsEvent:
-        """Track an analytics event."""
+        """Track an analytics event and fold it into the agent's daily rollup."""
         event = AnalyticsEvent(
             agent_id=agent_id,
             event_type=event_type,
@@ -615,9 +646,12 @@ class AnalyticsService:
             utm_campaign=utm_campaign,
             ip_address=ip_address,
             user_agent=user_agent,
+            created_at=datetime.now(timezone.utc),
         )
 
         db.add(event)
+        if agent_id is not None:
+            analytics_rollup_service.record(db, agent_id, event_type, event.created_at, value)
         db.commit()
         db.refresh(event)
 
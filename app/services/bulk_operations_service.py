@@ -1,17 +1,37 @@
-"""Bulk Operations Engine — execute operations across multiple properties."""
+"""Bulk Operations Engine — execute operations across multiple properties.
+
+Each operation fans out over its properties with a per-operation concurrency
+limit (overridable with ``params["concurrency"]``). Operations that call a
+rate-limited upstream consult its circuit breaker: nothing new starts while
+the circuit is open and concurrency shrinks while it is recording failures.
+Writes are committed every COMMIT_BATCH_SIZE results.
+
+``execute()`` runs inline and returns the full result. ``create_job()`` +
+``run_job()`` persist the run as a ``BulkJob``: progress is committed with
+each batch (and broadcast over the WebSocket), and a job interrupted by a
+worker restart resumes with the properties it had not finished.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
 
 from sqlalchemy.orm import Session
 
+from app.database import SessionLocal
+from app.models.bulk_job import BulkJob, BulkJobStatus
 from app.models.property import Property, PropertyStatus, PropertyType
 from app.models.zillow_enrichment import ZillowEnrichment
 from app.models.skip_trace import SkipTrace
 from app.services.contract_auto_attach import contract_auto_attach_service
 from app.services.property_recap_service import property_recap_service
+from app.utils.circuit_breaker import CircuitBreaker, circuit_breakers
+from app.websocket import job_topic, manager
 
 logger = logging.getLogger(__name__)
 
@@ -65,11 +85,49 @@ _OPERATION_META = [
 ]
 
 
+@dataclass(frozen=True)
+class OperationPolicy:
+    """How a bulk operation fans out across properties."""
+
+    concurrency: int = 1
+    # Circuit breaker guarding the upstream: items are not started while it
+    # is open, and concurrency shrinks while it is recording failures.
+    breaker: str | None = None
+    # Item runs in its own session (the service it calls commits by itself).
+    isolated: bool = False
+
+
+_POLICIES: dict[str, OperationPolicy] = {
+    "enrich": OperationPolicy(concurrency=8, breaker="zillow"),
+    "skip_trace": OperationPolicy(concurrency=5, breaker="skip_trace"),
+    "attach_contracts": OperationPolicy(),
+    "generate_recaps": OperationPolicy(concurrency=4, isolated=True),
+    "update_status": OperationPolicy(),
+    "check_compliance": OperationPolicy(concurrency=4, isolated=True),
+}
+
+MAX_CONCURRENCY = 16
+COMMIT_BATCH_SIZE = 10
+
+ItemHandler = Callable[[Property], Awaitable[dict]]
+
+
+def _result(prop: Property, status: str, detail: str) -> dict:
+    return {"property_id": prop.id, "address": prop.address, "status": status, "detail": detail}
+
+
+def _count(results: list[dict], status: str) -> int:
+    return sum(1 for r in results if r["status"] == status)
+
+
 class BulkOperationsService:
     MAX_BATCH_SIZE = 50
 
     SUPPORTED_OPERATIONS = {m["name"] for m in _OPERATION_META}
 
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self.session_factory = session_factory
+
     # ── Main entry point ──
 
     async def execute(
@@ -81,8 +139,7 @@ class BulkOperationsService:
         params: dict[str, Any] | None = None,
     ) -> dict:
         """Execute *operation* on properties matching IDs/filters."""
-        if operation not in self.SUPPORTED_OPERATIONS:
-            raise ValueError(f"Unsupported operation: {operation}. Choose from: {sorted(self.SUPPORTED_OPERATIONS)}")
+        self._check_operation(operation)
 
         params = params or {}
         properties = self._resolve_properties(db, property_ids, filters)
@@ -98,20 +155,11 @@ class BulkOperationsService:
                 "voice_summary": "No properties matched your selection.",
             }
 
-        handler = {
-            "enrich": self._bulk_enrich,
-            "skip_trace": self._bulk_skip_trace,
-            "attach_contracts": self._bulk_attach_contracts,
-            "generate_recaps": self._bulk_generate_recaps,
-            "update_status": self._bulk_update_status,
-            "check_compliance": self._bulk_check_compliance,
-        }[operation]
+        results = await self._run(db, operation, properties, params)
 
-        results = await handler(db, properties, params)
-
-        succeeded = sum(1 for r in results if r["status"] == "success")
-        failed = sum(1 for r in results if r["status"] == "error")
-        skipped = sum(1 for r in results if r["status"] == "skipped")
+        succeeded = _count(results, "success")
+        failed = _count(results, "error")
+        skipped = _count(results, "skipped")
 
         voice = self._build_voice_summary(operation, len(properties), succeeded, failed, skipped)
 
@@ -125,6 +173,126 @@ class BulkOperationsService:
             "voice_summary": voice,
         }
 
+    def _check_operation(self, operation: str) -> None:
+        if operation not in self.SUPPORTED_OPERATIONS:
+            raise ValueError(f"Unsupported operation: {operation}. Choose from: {sorted(self.SUPPORTED_OPERATIONS)}")
+
+    # ── Jobs (persisted, resumable) ──
+
+    def create_job(
+        self,
+        db: Session,
+        operation: str,
+        property_ids: list[int] | None = None,
+        filters: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> BulkJob:
+        """Resolve the target properties now and persist a pending job for ``run_job``."""
+        self._check_operation(operation)
+        properties = self._resolve_properties(db, property_ids, filters)
+        job = BulkJob(
+            operation=operation,
+            params=params or {},
+            status=BulkJobStatus.PENDING,
+            property_ids=[p.id for p in properties],
+            results=[],
+            total=len(properties),
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+
+    def get_job(self, db: Session, job_id: int) -> BulkJob | None:
+        return db.query(BulkJob).filter(BulkJob.id == job_id).first()
+
+    def unfinished_job_ids(self, db: Session) -> list[int]:
+        rows = (
+            db.query(BulkJob.id)
+            .filter(BulkJob.status.in_([BulkJobStatus.PENDING, BulkJobStatus.RUNNING]))
+            .order_by(BulkJob.id.asc())
+            .all()
+        )
+        return [row[0] for row in rows]
+
+    def reopen_job(self, db: Session, job_id: int) -> bool:
+        """Move a failed job back to pending; False if it is not (or no longer) failed."""
+        reopened = (
+            db.query(BulkJob)
+            .filter(BulkJob.id == job_id, BulkJob.status == BulkJobStatus.FAILED)
+            .update({"status": BulkJobStatus.PENDING, "completed_at": None}, synchronize_session=False)
+        )
+        db.commit()
+        return reopened == 1
+
+    async def run_job(self, job_id: int) -> dict | None:
+        """Run (or resume) a bulk job; properties already in its results are skipped."""
+        db = self.session_factory()
+        job: BulkJob | None = None
+        try:
+            job = self.get_job(db, job_id)
+            if job is None or job.status in BulkJobStatus.TERMINAL:
+                return None
+
+            done = {r["property_id"] for r in job.results or []}
+            remaining = [pid for pid in job.property_ids if pid not in done]
+            if done:
+                logger.info("Resuming bulk job %s: %d of %d left", job.id, len(remaining), job.total)
+
+            job.status = BulkJobStatus.RUNNING
+            job.started_at = job.started_at or datetime.now(timezone.utc)
+            job.error = None
+            db.commit()
+
+            found = {p.id: p for p in db.query(Property).filter(Property.id.in_(remaining)).all()} if remaining else {}
+            missing = [
+                {"property_id": pid, "address": None, "status": "error", "detail": "Property not found"}
+                for pid in remaining
+                if pid not in found
+            ]
+            if missing:
+                self._append_job_results(job, missing)
+                db.commit()
+
+            properties = [found[pid] for pid in remaining if pid in found]
+            await self._run(db, job.operation, properties, job.params or {}, job=job)
+
+            job.status = BulkJobStatus.COMPLETED
+            job.completed_at = datetime.now(timezone.utc)
+            job.voice_summary = self._build_voice_summary(
+                job.operation, job.total, job.succeeded, job.failed, job.skipped
+            )
+            db.commit()
+            await self._broadcast_progress(job)
+            return job.to_dict()
+        except Exception as exc:
+            logger.exception("Bulk job %s failed", job_id)
+            db.rollback()
+            if job is not None:
+                job.status = BulkJobStatus.FAILED
+                job.error = str(exc)
+                job.completed_at = datetime.now(timezone.utc)
+                db.commit()
+                await self._broadcast_progress(job)
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def _append_job_results(job: BulkJob, new_results: list[dict]) -> None:
+        results = list(job.results or []) + new_results
+        job.results = results
+        job.succeeded = _count(results, "success")
+        job.failed = _count(results, "error")
+        job.skipped = _count(results, "skipped")
+
+    @staticmethod
+    async def _broadcast_progress(job: BulkJob) -> None:
+        try:
+            await manager.publish(job_topic("bulk", job.id), {"type": "bulk_job_progress", "job": job.to_dict()})
+        except Exception as exc:
+            logger.debug("Bulk job progress broadcast failed: %s", exc)
+
     # ── Property resolution ──
 
     def _resolve_properties(
@@ -176,203 +344,293 @@ class BulkOperationsService:
 
         return properties[: self.MAX_BATCH_SIZE]
 
+
+    # ── Execution engine ──
+
+    def _concurrency(self, policy: OperationPolicy, params: dict) -> int:
+        requested = params.get("concurrency")
+        if requested is None:
+            return policy.concurrency
+        try:
+            return max(1, min(int(requested), MAX_CONCURRENCY))
+        except (TypeError, ValueError):
+            return policy.concurrency
+
+    @staticmethod
+    def _throttled(limit: int, breaker: CircuitBreaker | None) -> int:
+        """Concurrency allowed right now: halved per recent failure, one probe when half-open."""
+        if breaker is None:
+            return limit
+        if breaker.state == "half-open":
+            return 1
+        return max(1, limit >> min(breaker.failure_count, 8))
+
+    async def _run(
+        self,
+        db: Session,
+        operation: str,
+        properties: list[Property],
+        params: dict,
+        *,
+        job: BulkJob | None = None,
+    ) -> list[dict]:
+        """Run *operation* over *properties* with bounded concurrency.
+
+        Writes made on ``db`` (and the job's progress) are committed every
+        COMMIT_BATCH_SIZE results instead of once per property.
+        """
+        policy = _POLICIES[operation]
+        limit = self._concurrency(policy, params)
+        breaker = circuit_breakers.get(policy.breaker) if policy.breaker else None
+
+        item = self._item_handler(db, operation, properties, params)
+        if isinstance(item, str):
+            results = [_result(p, "error", item) for p in properties]
+            if job is not None:
+                self._append_job_results(job, results)
+                db.commit()
+            return results
+
+        results: list[dict] = []
+        pending: list[dict] = []
+
+        async def flush() -> None:
+            if not pending:
+                return
+            batch = list(pending)
+            pending.clear()
+            if job is not None:
+                self._append_job_results(job, batch)
+            try:
+                db.commit()
+            except Exception as exc:
+                db.rollback()
+                logger.warning("Bulk %s commit failed: %s", operation, exc)
+                if not policy.isolated:
+                    for r in batch:
+                        if r["status"] == "success":
+                            r["status"] = "error"
+                            r["detail"] = f"Commit failed: {exc}"
+                if job is not None:
+                    self._append_job_results(job, batch)
+                    db.commit()
+            if job is not None:
+                await self._broadcast_progress(job)
+
+        async def guarded(prop: Property) -> dict:
+            try:
+                return await item(prop)
+            except Exception as exc:
+                logger.warning("Bulk %s failed for property %s: %s", operation, prop.id, exc)
+                return _result(prop, "error", str(exc))
+
+        queue = deque(properties)
+        running: set[asyncio.Task] = set()
+        while queue or running:
+            while queue and len(running) < self._throttled(limit, breaker):
+                prop = queue.popleft()
+                if breaker is not None and not breaker.is_available():
+                    done_result = _result(prop, "error", f"{breaker.name} temporarily unavailable (circuit open)")
+                    results.append(done_result)
+                    pending.append(done_result)
+                    continue
+                running.add(asyncio.create_task(guarded(prop)))
+            if not running:
+                continue
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                results.append(result)
+                pending.append(result)
+            if len(pending) >= COMMIT_BATCH_SIZE:
+                await flush()
+
+        await flush()
+        order = {p.id: i for i, p in enumerate(properties)}
+        results.sort(key=lambda r: order.get(r["property_id"], len(order)))
+        return results
+
+    def _item_handler(self, db: Session, operation: str, properties: list[Property], params: dict) -> ItemHandler | str:
+        """Per-property coroutine for *operation*, or an error message that applies to every property."""
+        return {
+            "enrich": self._enrich_items,
+            "skip_trace": self._skip_trace_items,
+            "attach_contracts": self._attach_contracts_items,
+            "generate_recaps": self._generate_recaps_items,
+            "update_status": self._update_status_items,
+            "check_compliance": self._check_compliance_items,
+        }[operation](db, properties, params)
+
+    async def _in_own_session(self, prop: Property, work: Callable[[Session, Property], Awaitable[dict]]) -> dict:
+        item_db = self.session_factory()
+        try:
+            own = item_db.query(Property).filter(Property.id == prop.id).first()
+            if own is None:
+                return _result(prop, "error", "Property not found")
+            return await work(item_db, own)
+        except Exception:
+            item_db.rollback()
+            raise
+        finally:
+            item_db.close()
+
     # ── Operation handlers ──
 
-    async def _bulk_enrich(self, db: Session, properties: list[Property], params: dict) -> list[dict]:
+    def _enrich_items(self, db: Session, properties: list[Property], params: dict) -> ItemHandler:
         force = params.get("force", False)
         svc = _get_zillow_service()
-        results: list[dict] = []
 
-        # FIXED: Batch load all enrichments to avoid N+1 queries
+        # Batch load all enrichments to avoid N+1 queries
         prop_ids = [p.id for p in properties]
         enrichments = db.query(ZillowEnrichment).filter(
             ZillowEnrichment.property_id.in_(prop_ids)
         ).all()
         enrichment_map = {e.property_id: e for e in enrichments}
 
-        for prop in properties:
-            try:
-                existing = enrichment_map.get(prop.id)
+        async def enrich(prop: Property) -> dict:
+            existing = enrichment_map.get(prop.id)
+
+            if not force and existing and existing.zestimate:
+                return _result(prop, "skipped", "Already enriched")
+
+            full_address = f"{prop.address}, {prop.city}, {prop.state} {prop.zip_code or ''}".strip()
+            data = await svc.enrich_by_address(full_address)
+
+            zestimate = data.get("zestimate")
+            rent_zestimate = data.get("rent_zestimate") or data.get("rentZestimate")
+            zpid = data.get("zpid")
+
+            if existing:
+                existing.zestimate = zestimate
+                existing.rent_zestimate = rent_zestimate
+                if zpid:
+                    existing.zpid = int(zpid)
+                existing.photos = data.get("photos")
+                existing.reso_facts = data.get("reso_facts") or data.get("resoFacts")
+                existing.schools = data.get("schools")
+                existing.tax_history = data.get("tax_history") or data.get("taxHistory")
+                existing.price_history = data.get("price_history") or data.get("priceHistory")
+            else:
+                new_e = ZillowEnrichment(
+                    property_id=prop.id,
+                    zpid=int(zpid) if zpid else None,
+                    zestimate=zestimate,
+                    rent_zestimate=rent_zestimate,
+                    photos=data.get("photos"),
+                    reso_facts=data.get("reso_facts") or data.get("resoFacts"),
+                    schools=data.get("schools"),
+                    tax_history=data.get("tax_history") or data.get("taxHistory"),
+                    price_history=data.get("price_history") or data.get("priceHistory"),
+                )
+                db.add(new_e)
+                enrichment_map[prop.id] = new_e
 
-                if not force and existing and existing.zestimate:
-                    results.append({"property_id": prop.id, "address": prop.address, "status": "skipped", "detail": "Already enriched"})
-                    continue
+            detail = f"Zestimate: ${zestimate:,.0f}" if zestimate else "Enriched (no Zestimate)"
+            return _result(prop, "success", detail)
 
-                full_address = f"{prop.address}, {prop.city}, {prop.state} {prop.zip_code or ''}".strip()
-                data = await svc.enrich_by_address(full_address)
-
-                zestimate = data.get("zestimate")
-                rent_zestimate = data.get("rent_zestimate") or data.get("rentZestimate")
-                zpid = data.get("zpid")
-
-                if existing:
-                    existing.zestimate = zestimate
-                    existing.rent_zestimate = rent_zestimate
-                    if zpid:
-                        existing.zpid = int(zpid)
-                    existing.photos = data.get("photos")
-                    existing.reso_facts = data.get("reso_facts") or data.get("resoFacts")
-                    existing.schools = data.get("schools")
-                    existing.tax_history = data.get("tax_history") or data.get("taxHistory")
-                    existing.price_history = data.get("price_history") or data.get("priceHistory")
-                else:
-                    new_e = ZillowEnrichment(
-                        property_id=prop.id,
-                        zpid=int(zpid) if zpid else None,
-                        zestimate=zestimate,
-                        rent_zestimate=rent_zestimate,
-                        photos=data.get("photos"),
-                        reso_facts=data.get("reso_facts") or data.get("resoFacts"),
-                        schools=data.get("schools"),
-                        tax_history=data.get("tax_history") or data.get("taxHistory"),
-                        price_history=data.get("price_history") or data.get("priceHistory"),
-                    )
-                    db.add(new_e)
-                    enrichment_map[prop.id] = new_e  # Update map for potential re-use
+        return enrich
 
-                db.commit()
-                detail = f"Zestimate: ${zestimate:,.0f}" if zestimate else "Enriched (no Zestimate)"
-                results.append({"property_id": prop.id, "address": prop.address, "status": "success", "detail": detail})
-            except Exception as exc:
-                db.rollback()
-                logger.warning("Bulk enrich failed for property %s: %s", prop.id, exc)
-                results.append({"property_id": prop.id, "address": prop.address, "status": "error", "detail": str(exc)})
-
-        return results
-
-    async def _bulk_skip_trace(self, db: Session, properties: list[Property], params: dict) -> list[dict]:
+    def _skip_trace_items(self, db: Session, properties: list[Property], params: dict) -> ItemHandler:
         force = params.get("force", False)
         svc = _get_skip_trace_service()
-        results: list[dict] = []
 
-        # FIXED: Batch load all skip traces to avoid N+1 queries
+        # Batch load all skip traces to avoid N+1 queries
         prop_ids = [p.id for p in properties]
         skip_traces = db.query(SkipTrace).filter(
             SkipTrace.property_id.in_(prop_ids)
         ).all()
         skip_trace_map = {st.property_id: st for st in skip_traces}
 
-        for prop in properties:
-            try:
-                existing = skip_trace_map.get(prop.id)
-
-                if not force and existing and existing.owner_name and existing.owner_name != "Unknown":
-                    results.append({"property_id": prop.id, "address": prop.address, "status": "skipped", "detail": f"Already traced: {existing.owner_name}"})
-                    continue
-
-                data = await svc.skip_trace(
-                    address=prop.address,
-                    city=prop.city,
-                    state=prop.state,
-                    zip_code=prop.zip_code or "",
+        async def skip_trace(prop: Property) -> dict:
+            existing = skip_trace_map.get(prop.id)
+
+            if not force and existing and existing.owner_name and existing.owner_name != "Unknown":
+                return _result(prop, "skipped", f"Already traced: {existing.owner_name}")
+
+            data = await svc.skip_trace(
+                address=prop.address,
+                city=prop.city,
+                state=prop.state,
+                zip_code=prop.zip_code or "",
+            )
+
+            owner_name = data.get("owner_name", "Unknown")
+            phones = data.get("phone_numbers", [])
+            emails = data.get("email_addresses", data.get("emails", []))
+
+            if existing:
+                existing.owner_name = owner_name
+                existing.phone_numbers = phones
+                existing.emails = emails
+                existing.mailing_address = data.get("mailing_address")
+                existing.raw_response = data
+            else:
+                new_st = SkipTrace(
+                    property_id=prop.id,
+                    owner_name=owner_name,
+                    phone_numbers=phones,
+                    emails=emails,
+                    mailing_address=data.get("mailing_address"),
+                    raw_response=data,
                 )
+                db.add(new_st)
+                skip_trace_map[prop.id] = new_st
 
-                owner_name = data.get("owner_name", "Unknown")
-                phones = data.get("phone_numbers", [])
-                emails = data.get("email_addresses", data.get("emails", []))
-
-                if existing:
-                    existing.owner_name = owner_name
-                    existing.phone_numbers = phones
-                    existing.emails = emails
-                    existing.mailing_address = data.get("mailing_address")
-                    existing.raw_response = data
-                else:
-                    new_st = SkipTrace(
-                        property_id=prop.id,
-                        owner_name=owner_name,
-                        phone_numbers=phones,
-                        emails=emails,
-                        mailing_address=data.get("mailing_address"),
-                        raw_response=data,
-                    )
-                    db.add(new_st)
+            return _result(prop, "success", f"Owner: {owner_name}, {len(phones)} phone(s)")
 
-                db.commit()
-                phone_count = len(phones)
-                results.append({"property_id": prop.id, "address": prop.address, "status": "success", "detail": f"Owner: {owner_name}, {phone_count} phone(s)"})
-            except Exception as exc:
-                db.rollback()
-                logger.warning("Bulk skip trace failed for property %s: %s", prop.id, exc)
-                results.append({"property_id": prop.id, "address": prop.address, "status": "error", "detail": str(exc)})
+        return skip_trace
 
-        return results
+    def _attach_contracts_items(self, db: Session, properties: list[Property], params: dict) -> ItemHandler:
+        async def attach(prop: Property) -> dict:
+            attached = contract_auto_attach_service.auto_attach_contracts(db, prop)
+            count = len(attached)
+            return _result(prop, "success", f"{count} contract(s) attached" if count else "No matching templates")
 
-    async def _bulk_attach_contracts(self, db: Session, properties: list[Property], params: dict) -> list[dict]:
-        results: list[dict] = []
-        for prop in properties:
-            try:
-                attached = contract_auto_attach_service.auto_attach_contracts(db, prop)
-                db.commit()
-                count = len(attached)
-                detail = f"{count} contract(s) attached" if count else "No matching templates"
-                results.append({"property_id": prop.id, "address": prop.address, "status": "success", "detail": detail})
-            except Exception as exc:
-                db.rollback()
-                logger.warning("Bulk attach contracts failed for property %s: %s", prop.id, exc)
-                results.append({"property_id": prop.id, "address": prop.address, "status": "error", "detail": str(exc)})
-        return results
+        return attach
 
-    async def _bulk_generate_recaps(self, db: Session, properties: list[Property], params: dict) -> list[dict]:
-        results: list[dict] = []
-        for prop in properties:
-            try:
-                recap = await property_recap_service.generate_recap(db=db, property=prop, trigger="bulk_operation")
-                db.commit()
-                results.append({"property_id": prop.id, "address": prop.address, "status": "success", "detail": f"Recap v{recap.version}"})
-            except Exception as exc:
-                db.rollback()
-                logger.warning("Bulk recap failed for property %s: %s", prop.id, exc)
-                results.append({"property_id": prop.id, "address": prop.address, "status": "error", "detail": str(exc)})
-        return results
+    def _generate_recaps_items(self, db: Session, properties: list[Property], params: dict) -> ItemHandler:
+        async def work(item_db: Session, prop: Property) -> dict:
+            recap = await property_recap_service.generate_recap(db=item_db, property=prop, trigger="bulk_operation")
+            item_db.commit()
+            return _result(prop, "success", f"Recap v{recap.version}")
 
-    async def _bulk_update_status(self, db: Session, properties: list[Property], params: dict) -> list[dict]:
+        return lambda prop: self._in_own_session(prop, work)
+
+    def _update_status_items(self, db: Session, properties: list[Property], params: dict) -> ItemHandler | str:
         target_status_str = params.get("status")
         if not target_status_str:
-            return [{"property_id": p.id, "address": p.address, "status": "error", "detail": "Missing 'status' param"} for p in properties]
+            return "Missing 'status' param"
 
         try:
             target_status = PropertyStatus(target_status_str)
         except ValueError:
-            return [{"property_id": p.id, "address": p.address, "status": "error", "detail": f"Invalid status: {target_status_str}"} for p in properties]
+            return f"Invalid status: {target_status_str}"
 
-        results: list[dict] = []
-        for prop in properties:
-            try:
-                if prop.status == target_status:
-                    results.append({"property_id": prop.id, "address": prop.address, "status": "skipped", "detail": f"Already {target_status.value}"})
-                    continue
+        async def update_status(prop: Property) -> dict:
+            if prop.status == target_status:
+                return _result(prop, "skipped", f"Already {target_status.value}")
+            old_status = prop.status.value
+            prop.status = target_status
+            return _result(prop, "success", f"{old_status} → {target_status.value}")
 
-                old_status = prop.status.value
-                prop.status = target_status
-                db.commit()
-                results.append({"property_id": prop.id, "address": prop.address, "status": "success", "detail": f"{old_status} → {target_status.value}"})
-            except Exception as exc:
-                db.rollback()
-                logger.warning("Bulk status update failed for property %s: %s", prop.id, exc)
-                results.append({"property_id": prop.id, "address": prop.address, "status": "error", "detail": str(exc)})
-        return results
+        return update_status
 
-    async def _bulk_check_compliance(self, db: Session, properties: list[Property], params: dict) -> list[dict]:
+    def _check_compliance_items(self, db: Session, properties: list[Property], params: dict) -> ItemHandler:
         engine = _get_compliance_engine()
-        results: list[dict] = []
-        for prop in properties:
-            try:
-                check = await engine.run_compliance_check(db, prop, check_type="full")
-                db.commit()
-                detail = f"Passed: {check.passed_count}, Failed: {check.failed_count}, Warnings: {check.warning_count}"
-                results.append({"property_id": prop.id, "address": prop.address, "status": "success", "detail": detail})
-            except Exception as exc:
-                db.rollback()
-                logger.warning("Bulk compliance check failed for property %s: %s", prop.id, exc)
-                results.append({"property_id": prop.id, "address": prop.address, "status": "error", "detail": str(exc)})
-        return results
+
+        async def work(item_db: Session, prop: Property) -> dict:
+            check = await engine.run_compliance_check(item_db, prop, check_type="full")
+            item_db.commit()
+            detail = f"Passed: {check.passed_count}, Failed: {check.failed_count}, Warnings: {check.warning_count}"
+            return _result(prop, "success", detail)
+
+        return lambda prop: self._in_own_session(prop, work)
 
     # ── Helpers ──
 
     def list_operations(self) -> list[dict]:
         """Return metadata about each supported operation."""
-        return list(_OPERATION_META)
+        return [{**m, "default_concurrency": _POLICIES[m["name"]].concurrency} for m in _OPERATION_META]
 
     @staticmethod
     def _build_voice_summary(operation: str, total: int, succeeded: int, failed: int, skipped: int) -> str:
@@ -1,57 +1,165 @@
 """
-Simple in-memory TTL cache for external API responses.
+Bounded in-memory TTL cache for external API responses.
+
+Entries expire after their TTL and the cache is capped by entry count and an
+approximate byte budget; the least-recently-used entries are evicted first.
+Expiry is checked on access and swept incrementally on writes, so no
+periodic full scan is required.
 """
-from datetime import datetime, timedelta
-from typing import Optional, Any, Dict
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Optional, Any, Dict, NamedTuple
+
+# How many least-recently-used entries to inspect for expiry on each write.
+_SWEEP_BATCH = 8
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: float
+    size: int
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate the memory cost of a cached value in bytes."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
 
 
 class TTLCache:
-    """Time-To-Live cache with automatic expiration."""
+    """Time-To-Live cache with LRU eviction and hit/miss counters."""
 
-    def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.name = name
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        if name:
+            _registry[name] = self
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size
 
     def get(self, key: str) -> Optional[Any]:
         """Get value if not expired, otherwise None."""
-        entry = self._cache.get(key)
-        if entry is None:
-            return None
-        if datetime.now() > entry["expires_at"]:
-            del self._cache[key]
-            return None
-        return entry["value"]
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if time.monotonic() > entry.expires_at:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry.value
 
     def set(self, key: str, value: Any, ttl_seconds: int):
         """Store value with TTL in seconds."""
-        self._cache[key] = {
-            "value": value,
-            "expires_at": datetime.now() + timedelta(seconds=ttl_seconds),
-        }
+        size = _estimate_size(value)
+        with self._lock:
+            now = time.monotonic()
+            if key in self._cache:
+                self._remove(key)
+            if size > self.max_bytes:
+                # Never admit a single value larger than the whole budget.
+                return
+            self._cache[key] = _Entry(value, now + ttl_seconds, size)
+            self._bytes += size
+            self._sweep_oldest(now)
+            while len(self._cache) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._cache))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _sweep_oldest(self, now: float) -> None:
+        """Drop expired entries among the least-recently-used few (amortized expiry)."""
+        expired = [
+            k for k, entry in islice(self._cache.items(), _SWEEP_BATCH)
+            if now > entry.expires_at
+        ]
+        for k in expired:
+            self._remove(k)
+            self.expirations += 1
 
     def delete(self, key: str):
         """Remove a key."""
-        self._cache.pop(key, None)
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
 
     def clear(self):
         """Clear all entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
 
     def cleanup_expired(self):
         """Remove expired entries to prevent memory growth."""
-        now = datetime.now()
-        expired = [k for k, v in self._cache.items() if now > v["expires_at"]]
-        for k in expired:
-            del self._cache[k]
+        with self._lock:
+            now = time.monotonic()
+            expired = [k for k, v in self._cache.items() if now > v.expires_at]
+            for k in expired:
+                self._remove(k)
+            self.expirations += len(expired)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def stats(self, count_expired: bool = False) -> Dict[str, int]:
+        """Return cache statistics from running totals.
+
+        ``count_expired`` also splits entries into valid and expired-but-not-yet-swept,
+        which scans the whole cache; /metrics scrapes leave it off.
+        """
+        with self._lock:
+            stats = {
+                "total_entries": len(self._cache),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+            if count_expired:
+                now = time.monotonic()
+                valid = sum(1 for v in self._cache.values() if now <= v.expires_at)
+                stats["valid_entries"] = valid
+                stats["expired_entries"] = stats["total_entries"] - valid
+            return stats
+
+
+_registry: Dict[str, TTLCache] = {}
+
 
-    def stats(self) -> Dict[str, int]:
-        """Return cache statistics."""
-        now = datetime.now()
-        total = len(self._cache)
-        valid = sum(1 for v in self._cache.values() if now <= v["expires_at"])
-        return {"total_entries": total, "valid_entries": valid, "expired_entries": total - valid}
+def all_caches() -> Dict[str, TTLCache]:
+    """Return every named in-process cache (used by /cache/stats and /metrics)."""
+    return dict(_registry)
 
 
 # Global cache instances
-google_places_cache = TTLCache()
-zillow_cache = TTLCache()
-docuseal_cache = TTLCache()
+google_places_cache = TTLCache("google_places", max_entries=5_000, max_bytes=32 * 1024 * 1024)
+zillow_cache = TTLCache("zillow", max_entries=5_000, max_bytes=64 * 1024 * 1024)
+docuseal_cache = TTLCache("docuseal", max_entries=500, max_bytes=8 * 1024 * 1024)
@@ -0,0 +1,276 @@
+"""Concurrent, paced dialer for voice campaigns.
+
+Each tick takes the due targets of every active campaign, paces each campaign
+with its own token bucket (``rate_limit_per_minute`` tokens per minute, at
+most one minute of burst) and starts the Vapi calls concurrently across
+campaigns under a global concurrency cap. Launch order is round-robin across
+campaigns, so a large campaign cannot starve the others of dial slots.
+
+Due targets are claimed before any call goes out: one UPDATE moves them from
+queued to in_progress and stamps ``claimed_at``, and only the rows it returns
+are dialed, so overlapping ticks, other replicas and the process endpoints
+never call the same target twice. Every attempt resolves its property and
+recap in its own session; the target rows are detached from the tick session
+and their outcomes are written back in batches of ``write_batch_size`` with
+one executemany UPDATE each. The UPDATE only applies while a row is still
+held by this claim, so a webhook that already recorded the call's outcome is
+never overwritten.
+
+Usage:
+    summaries = await dialer.run(db, campaigns, max_calls_per_campaign=5)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable
+
+from sqlalchemy import and_, bindparam, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.voice_campaign import VoiceCampaign, VoiceCampaignTarget
+from app.utils.rate_limit import TokenBucket
+
+_targets = VoiceCampaignTarget.__table__
+
+if TYPE_CHECKING:
+    from app.services.voice_campaign_service import VoiceCampaignService
+
+logger = logging.getLogger(__name__)
+
+WRITE_BATCH_SIZE = 50
+
+# Target columns an attempt may change; written back by primary key.
+_TARGET_FIELDS = (
+    "status",
+    "attempts_made",
+    "next_attempt_at",
+    "last_attempt_at",
+    "last_call_id",
+    "last_call_status",
+    "last_disposition",
+    "last_error",
+    "completed_at",
+)
+
+# Written by primary key, and only while the row is still held by this tick's
+# claim: a webhook that completed or rescheduled the target in the meantime
+# wins over the attempt's (older) outcome.
+_WRITE_TARGET = (
+    update(_targets)
+    .where(
+        and_(
+            _targets.c.id == bindparam("target_id"),
+            _targets.c.status == "in_progress",
+            _targets.c.claimed_at == bindparam("claim"),
+        )
+    )
+    .values({field: bindparam(f"new_{field}") for field in _TARGET_FIELDS})
+)
+
+_RESULT_KEYS = {
+    "started": "calls_started",
+    "retry": "retries_scheduled",
+    "exhausted": "exhausted",
+}
+
+
+def empty_summary() -> dict[str, int]:
+    return {
+        "targets_processed": 0,
+        "calls_started": 0,
+        "retries_scheduled": 0,
+        "exhausted": 0,
+    }
+
+
+@dataclass(frozen=True)
+class CampaignView:
+    """Read-only campaign fields an attempt needs, safe to share across sessions."""
+
+    id: int
+    name: str
+    call_purpose: str
+    property_id: int | None
+    assistant_overrides: dict[str, Any] | None
+    max_attempts: int
+    retry_delay_minutes: int
+
+    @classmethod
+    def of(cls, campaign: VoiceCampaign) -> "CampaignView":
+        return cls(
+            id=campaign.id,
+            name=campaign.name,
+            call_purpose=campaign.call_purpose,
+            property_id=campaign.property_id,
+            assistant_overrides=campaign.assistant_overrides,
+            max_attempts=campaign.max_attempts,
+            retry_delay_minutes=campaign.retry_delay_minutes,
+        )
+
+
+def round_robin(queues: dict[int, list[VoiceCampaignTarget]]) -> list[VoiceCampaignTarget]:
+    """Interleave per-campaign queues: first target of each campaign, then the second, ..."""
+    order: list[VoiceCampaignTarget] = []
+    depth = max((len(q) for q in queues.values()), default=0)
+    for i in range(depth):
+        for queue in queues.values():
+            if i < len(queue):
+                order.append(queue[i])
+    return order
+
+
+class _TargetWriter:
+    """Buffers target outcomes and writes them with one executemany UPDATE per batch."""
+
+    def __init__(self, db: Session, batch_size: int, claimed_at: datetime):
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.claimed_at = claimed_at
+        self.rows: list[dict[str, Any]] = []
+        self.batches = 0
+
+    def add(self, target: VoiceCampaignTarget) -> None:
+        row = {f"new_{field}": getattr(target, field) for field in _TARGET_FIELDS}
+        row["target_id"] = target.id
+        row["claim"] = self.claimed_at
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.rows:
+            return
+        rows, self.rows = self.rows, []
+        try:
+            self.db.execute(_WRITE_TARGET, rows)
+            self.db.commit()
+            self.batches += 1
+        except Exception:
+            self.db.rollback()
+            logger.exception("Failed to write %d campaign target updates", len(rows))
+
+
+class CampaignDialer:
+    def __init__(
+        self,
+        service: "VoiceCampaignService",
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_concurrency: int | None = None,
+        write_batch_size: int = WRITE_BATCH_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.service = service
+        self.session_factory = session_factory
+        self.max_concurrency = max(1, max_concurrency or settings.campaign_dialer_max_concurrency)
+        self.write_batch_size = write_batch_size
+        self.clock = clock
+        self._buckets: dict[int, TokenBucket] = {}
+
+    def bucket(self, campaign: VoiceCampaign) -> TokenBucket:
+        bucket = self._buckets.get(campaign.id)
+        if bucket is None:
+            bucket = self._buckets[campaign.id] = TokenBucket(campaign.rate_limit_per_minute, clock=self.clock)
+        else:
+            bucket.set_rate(campaign.rate_limit_per_minute)
+        return bucket
+
+    def _claim(
+        self,
+        db: Session,
+        campaigns: list[VoiceCampaign],
+        *,
+        max_calls_per_campaign: int,
+        now: datetime,
+    ) -> dict[int, list[VoiceCampaignTarget]]:
+        queues: dict[int, list[VoiceCampaignTarget]] = {}
+        granted: dict[int, int] = {}
+        for campaign in campaigns:
+            campaign.last_run_at = now
+            granted[campaign.id] = tokens = self.bucket(campaign).take(max(1, max_calls_per_campaign))
+            queues[campaign.id] = self.service._due_targets(db, campaign.id, now=now, limit=tokens) if tokens else []
+
+        candidates = [target.id for targets in queues.values() for target in targets]
+        claimed = set(db.scalars(
+            update(_targets)
+            .where(
+                _targets.c.id.in_(candidates),
+                _targets.c.status == "queued",
+                _targets.c.next_attempt_at <= now,
+            )
+            .values(status="in_progress", claimed_at=now)
+            .returning(_targets.c.id)
+        )) if candidates else set()
+
+        # Attempts mutate detached copies of the claimed rows; outcomes reach
+        # the database only through the batched writer. Rows another tick
+        # claimed first are left alone and their tokens go back.
+        for campaign in campaigns:
+            targets = queues[campaign.id]
+            for target in targets:
+                db.expunge(target)
+            queues[campaign.id] = [target for target in targets if target.id in claimed]
+            self.bucket(campaign).refund(granted[campaign.id] - len(queues[campaign.id]))
+            for target in queues[campaign.id]:
+                target.status = "in_progress"
+                target.claimed_at = now
+        return queues
+
+    async def _attempt(self, campaign: CampaignView, target: VoiceCampaignTarget, now: datetime) -> str:
+        attempt_db = self.session_factory()
+        try:
+            return await self.service._process_target_attempt(attempt_db, campaign=campaign, target=target, now=now)
+        except Exception as exc:
+            logger.exception("Campaign %s target %s attempt failed", campaign.id, target.id)
+            return self.service._schedule_retry_or_exhaust(
+                campaign=campaign,
+                target=target,
+                now=now,
+                error=f"Attempt failed: {exc}",
+            )
+        finally:
+            attempt_db.rollback()
+            attempt_db.close()
+
+    async def run(
+        self,
+        db: Session,
+        campaigns: list[VoiceCampaign],
+        *,
+        max_calls_per_campaign: int,
+    ) -> dict[int, dict[str, int]]:
+        """Dial the due targets of ``campaigns`` once; returns a summary per campaign id."""
+        now = self.service._utcnow()
+        views = {c.id: CampaignView.of(c) for c in campaigns}
+        queues = self._claim(db, campaigns, max_calls_per_campaign=max_calls_per_campaign, now=now)
+        db.commit()
+
+        summaries = {campaign_id: empty_summary() for campaign_id in views}
+        writer = _TargetWriter(db, self.write_batch_size, claimed_at=now)
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def dial(target: VoiceCampaignTarget) -> None:
+            async with slots:
+                result = await self._attempt(views[target.campaign_id], target, now)
+            summary = summaries[target.campaign_id]
+            summary["targets_processed"] += 1
+            key = _RESULT_KEYS.get(result)
+            if key:
+                summary[key] += 1
+            writer.add(target)
+
+        # Tasks queue on the semaphore in creation order, so round-robin
+        # creation keeps campaigns interleaved under the global cap.
+        await asyncio.gather(*(dial(target) for target in round_robin(queues)))
+        writer.flush()
+
+        for campaign in campaigns:
+            self.service._refresh_campaign_completion(db, campaign)
+        db.commit()
+        return summaries
@@ -0,0 +1,221 @@
+"""
+Radius search for comparable properties over the geohash index.
+
+``find_comp_candidates`` turns the subject's search circle into geohash prefix
+ranges (see ``app.utils.geo``) and pushes the comp hard filters — sqft within
+±25%, beds and baths within one, listing recency — into the same SQL query,
+so only plausible rows leave the database. Exact haversine distances are then
+computed over the whole candidate set at once and rows outside the circle are
+dropped.
+
+Subjects without coordinates fall back to a city/state scan ranked by
+``distance_proxy_mi``. Candidates without coordinates (never geocoded or
+enriched) are matched the same way when the subject's city/state is given,
+and flagged in ``proxy_distance``.
+
+Usage:
+    candidates = find_comp_candidates(db, lat=40.73, lng=-74.17, radius_mi=1.0, target_sqft=1500)
+    scores = rank_comp_candidates(candidates, radius_mi=1.0, target_sqft=1500)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Iterable
+
+import numpy as np
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from app.models.property import Property, PropertyStatus
+from app.models.zillow_enrichment import ZillowEnrichment
+from app.services.agentic.comps import (
+    distance_proxy_mi,
+    recency_cutoff,
+    recency_months,
+    similarity_scores,
+)
+from app.utils.geo import bounding_box, covering_cells, haversine_mi, prefix_range
+
+MAX_CANDIDATES = 1000
+
+
+@dataclass
+class CompCandidates:
+    """Candidate properties inside the search radius, aligned with their distances."""
+
+    properties: list[Property] = field(default_factory=list)
+    distance_mi: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    rents: list[float] | None = None
+    exact_distance: bool = True
+    # True where the distance is the city/state proxy (candidate has no coordinates)
+    proxy_distance: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+
+    def __len__(self) -> int:
+        return len(self.properties)
+
+    @staticmethod
+    def listed_date(prop: Property) -> date | None:
+        value = prop.updated_at or prop.created_at
+        return value.date() if value else None
+
+
+def _column(values: Iterable[float | int | None]) -> np.ndarray:
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+def find_comp_candidates(
+    db: Session,
+    *,
+    lat: float | None,
+    lng: float | None,
+    radius_mi: float,
+    city: str | None = None,
+    state: str | None = None,
+    zip_code: str | None = None,
+    target_sqft: int | None = None,
+    target_beds: int | None = None,
+    target_baths: float | None = None,
+    max_recency_months: int | None = None,
+    statuses: Iterable[PropertyStatus] | None = None,
+    exclude_ids: Iterable[int] = (),
+    exclude_address: str | None = None,
+    with_rent: bool = False,
+    limit: int = MAX_CANDIDATES,
+    today: date | None = None,
+) -> CompCandidates:
+    """Properties within ``radius_mi`` of (lat, lng) that pass the comp hard filters.
+
+    With ``with_rent`` only properties carrying a Zillow rent zestimate are
+    returned and ``rents`` holds that zestimate for each of them.
+    """
+    exact = lat is not None and lng is not None
+    query = db.query(Property, ZillowEnrichment.rent_zestimate) if with_rent else db.query(Property)
+    if with_rent:
+        query = query.join(ZillowEnrichment, ZillowEnrichment.property_id == Property.id).filter(
+            ZillowEnrichment.rent_zestimate.isnot(None),
+            ZillowEnrichment.rent_zestimate != 0,
+        )
+
+    if target_sqft:
+        query = query.filter(
+            or_(
+                Property.square_feet.is_(None),
+                Property.square_feet == 0,
+                Property.square_feet.between(target_sqft * 0.75, target_sqft * 1.25),
+            )
+        )
+    if target_beds is not None:
+        query = query.filter(
+            or_(Property.bedrooms.is_(None), Property.bedrooms.between(target_beds - 1, target_beds + 1))
+        )
+    if target_baths is not None:
+        query = query.filter(
+            or_(Property.bathrooms.is_(None), Property.bathrooms.between(target_baths - 1.0, target_baths + 1.0))
+        )
+
+    listed_at = func.coalesce(Property.updated_at, Property.created_at)
+    if max_recency_months is not None:
+        cutoff = recency_cutoff(max_recency_months, today)
+        query = query.filter(listed_at >= datetime(cutoff.year, cutoff.month, cutoff.day))
+
+    if statuses is not None:
+        query = query.filter(Property.status.in_(list(statuses)))
+    exclude_ids = list(exclude_ids)
+    if exclude_ids:
+        query = query.filter(Property.id.notin_(exclude_ids))
+    if exclude_address:
+        query = query.filter(func.lower(func.trim(Property.address)) != exclude_address.strip().lower())
+
+    def fetch(located) -> tuple[list[Property], list[float] | None]:
+        rows = located.order_by(listed_at.desc(), Property.id.desc()).limit(limit).all()
+        if with_rent:
+            return [prop for prop, _ in rows], [rent for _, rent in rows]
+        return rows, None
+
+    def in_city(located):
+        if state:
+            located = located.filter(Property.state.ilike(state))
+        if city:
+            located = located.filter(Property.city.ilike(city))
+        return located
+
+    def proxy_distances(props: list[Property]) -> np.ndarray:
+        return np.array(
+            [
+                distance_proxy_mi(
+                    target_zip=zip_code,
+                    candidate_zip=p.zip_code,
+                    target_city=city,
+                    candidate_city=p.city,
+                    target_state=state,
+                    candidate_state=p.state,
+                )
+                for p in props
+            ],
+            dtype=float,
+        )
+
+    if exact:
+        ranges = [prefix_range(cell) for cell in covering_cells(lat, lng, radius_mi)]
+        located = query.filter(or_(*(Property.geohash.between(low, high) for low, high in ranges)))
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_mi)
+        located = located.filter(Property.geo_lat.between(min_lat, max_lat))
+        if min_lng >= -180.0 and max_lng <= 180.0:
+            located = located.filter(Property.geo_lng.between(min_lng, max_lng))
+        properties, rents = fetch(located)
+        distances = np.atleast_1d(
+            haversine_mi(
+                lat,
+                lng,
+                _column(p.geo_lat for p in properties),
+                _column(p.geo_lng for p in properties),
+            )
+        )
+        proxy = np.zeros(len(properties), dtype=bool)
+
+        if city or state:
+            unplaced, unplaced_rents = fetch(in_city(query.filter(Property.geo_lat.is_(None))))
+            if unplaced:
+                properties = properties + unplaced
+                rents = rents + unplaced_rents if rents is not None else None
+                distances = np.concatenate([distances, proxy_distances(unplaced)])
+                proxy = np.concatenate([proxy, np.ones(len(unplaced), dtype=bool)])
+    else:
+        properties, rents = fetch(in_city(query))
+        distances = np.atleast_1d(proxy_distances(properties))
+        proxy = np.ones(len(properties), dtype=bool)
+
+    inside = np.flatnonzero(distances <= radius_mi)[:limit]
+    return CompCandidates(
+        properties=[properties[i] for i in inside],
+        distance_mi=distances[inside],
+        rents=[rents[i] for i in inside] if rents is not None else None,
+        exact_distance=exact,
+        proxy_distance=proxy[inside],
+    )
+
+
+def rank_comp_candidates(
+    candidates: CompCandidates,
+    *,
+    radius_mi: float,
+    target_sqft: int | None = None,
+    target_beds: int | None = None,
+    target_baths: float | None = None,
+    today: date | None = None,
+) -> np.ndarray:
+    """``similarity_score`` of every candidate, computed in one vectorized pass."""
+    props = candidates.properties
+    return similarity_scores(
+        distance_mi=candidates.distance_mi,
+        radius_mi=radius_mi,
+        target_sqft=target_sqft,
+        candidate_sqft=_column(p.square_feet for p in props),
+        target_beds=target_beds,
+        candidate_beds=_column(p.bedrooms for p in props),
+        target_baths=target_baths,
+        candidate_baths=_column(p.bathrooms for p in props),
+        months=np.array([recency_months(CompCandidates.listed_date(p), today) for p in props], dtype=float),
+    )
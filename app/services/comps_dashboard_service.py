@@ -9,12 +9,14 @@ from sqlalchemy.orm import Session
 
 from app.models.property import Property, PropertyStatus
 from app.models.zillow_enrichment import ZillowEnrichment
+from app.services.comp_index import find_comp_candidates
 
 
 class CompsDashboardService:
     """Aggregate comp sales, rentals, and internal portfolio into a unified analysis."""
 
     MARKET_TOLERANCE_PCT = 5.0  # within 5% = "at_market"
+    INTERNAL_COMP_RADIUS_MI = 5.0
 
     # ── Public API ──
 
@@ -250,20 +252,21 @@ class CompsDashboardService:
         return sales
 
     def _load_internal_portfolio_comps(self, db: Session, prop: Property) -> list[dict]:
-        candidates = (
-            db.query(Property)
-            .filter(
-                Property.id != prop.id,
-                Property.city == prop.city,
-                Property.state == prop.state,
-                Property.status.in_([PropertyStatus.NEW_PROPERTY, PropertyStatus.ENRICHED, PropertyStatus.RESEARCHED, PropertyStatus.WAITING_FOR_CONTRACTS, PropertyStatus.COMPLETE]),
-            )
-            .limit(50)
-            .all()
+        candidates = find_comp_candidates(
+            db,
+            lat=prop.geo_lat,
+            lng=prop.geo_lng,
+            radius_mi=self.INTERNAL_COMP_RADIUS_MI,
+            city=prop.city,
+            state=prop.state,
+            zip_code=prop.zip_code,
+            statuses=[PropertyStatus.NEW_PROPERTY, PropertyStatus.ENRICHED, PropertyStatus.RESEARCHED, PropertyStatus.WAITING_FOR_CONTRACTS, PropertyStatus.COMPLETE],
+            exclude_ids=[prop.id],
+            limit=50,
         )
 
         scored = []
-        for c in candidates:
+        for c, distance, proxy in zip(candidates.properties, candidates.distance_mi, candidates.proxy_distance):
             score = self._simple_similarity(prop, c)
             if score >= 0.3:
                 scored.append({
@@ -275,10 +278,11 @@ class CompsDashboardService:
                     "baths": c.bathrooms,
                     "sqft": c.square_feet,
                     "status": c.status.value if c.status else "unknown",
+                    "distance_mi": None if proxy else round(float(distance), 2),
                     "similarity_score": round(score, 2),
                 })
 
-        scored.sort(key=lambda x: x["similarity_score"], reverse=True)
+        scored.sort(key=lambda x: (-x["similarity_score"], x["distance_mi"] or 0.0))
         return scored[:10]
 
     def _simple_similarity(self, subject: Property, candidate: Property) -> float:
@@ -0,0 +1,330 @@
+"""Materialized contact list membership.
+
+List members live in ``contact_list_members`` so reading a list, counting it
+or paging through it never re-runs its smart rule. Membership is kept current
+three ways:
+
+- ``sync_contacts`` re-checks just the contacts a commit touched against the
+  smart lists of their agents, and ``drop_contacts`` removes deleted ones
+  (both wired to session events in ``app.models.contact_lists``);
+- ``expire_members`` drops members that aged out of a time-window rule
+  (``last_7_days`` ...) with one indexed delete;
+- ``rebuild`` recomputes a list from scratch, on rule changes and
+  periodically from the worker to reconcile anything the incremental path
+  can't see (bulk SQL writes, a property changing agent).
+
+``total_contacts`` on the list row is adjusted with every change, so counts
+are a column read.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Iterator, Optional
+
+from sqlalchemy import case, delete, exists, func, insert, literal, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.contact import Contact
+from app.models.contact_lists import ContactList, ContactListMember, ListType, SmartListRule
+from app.models.direct_mail import DirectMail
+from app.models.property import Property
+
+logger = logging.getLogger(__name__)
+
+QUERY_CHUNK_SIZE = 500
+PAGE_SIZE = 1000
+
+_WINDOWS = {
+    SmartListRule.LAST_24_HOURS: timedelta(hours=24),
+    SmartListRule.LAST_2_DAYS: timedelta(days=2),
+    SmartListRule.LAST_7_DAYS: timedelta(days=7),
+    SmartListRule.LAST_30_DAYS: timedelta(days=30),
+    SmartListRule.LAST_90_DAYS: timedelta(days=90),
+}
+
+# Every contact has a property, and a contact belongs to an agent only through
+# its property, so a "no property" list has no agent-scoped members to select.
+UNSUPPORTED_RULES = frozenset({SmartListRule.NO_PROPERTY})
+
+
+def _chunks(values: list, size: int = QUERY_CHUNK_SIZE) -> Iterable[list]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def window_start(rule: Optional[str], now: datetime) -> Optional[datetime]:
+    """Earliest contact creation time a time-window rule accepts (None for other rules)."""
+    if rule in _WINDOWS:
+        return now - _WINDOWS[rule]
+    if rule == SmartListRule.THIS_WEEK:
+        return (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+    if rule == SmartListRule.THIS_MONTH:
+        return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    return None
+
+
+def rule_conditions(agent_id: int, rule: Optional[str], filters: Optional[dict[str, Any]], now: datetime) -> list:
+    """WHERE clauses selecting a smart list's contacts (contacts outer-joined to their property).
+
+    Contacts belong to an agent through their property, and location filters
+    match the property's city/state/zip. Raises ValueError for
+    ``UNSUPPORTED_RULES``.
+    """
+    if rule in UNSUPPORTED_RULES:
+        raise ValueError(f"Smart list rule {rule!r} is not supported")
+    conditions = [Property.agent_id == agent_id]
+    start = window_start(rule, now)
+    if start is not None:
+        conditions.append(Contact.created_at >= start)
+    elif rule == SmartListRule.HAS_PROPERTY:
+        conditions.append(Contact.property_id.isnot(None))
+    elif rule == SmartListRule.NO_PHONE:
+        conditions.append(Contact.phone.is_(None))
+    elif rule == SmartListRule.HAS_EMAIL:
+        conditions.append(Contact.email.isnot(None))
+    elif rule == SmartListRule.UNSCONTACTED:
+        conditions.append(~exists().where(DirectMail.contact_id == Contact.id))
+
+    filters = filters or {}
+    if "city" in filters:
+        conditions.append(Property.city.ilike(f"%{filters['city']}%"))
+    if "state" in filters:
+        conditions.append(Property.state == filters["state"])
+    if "zip_code" in filters:
+        conditions.append(Property.zip_code == filters["zip_code"])
+    return conditions
+
+
+def _matching(agent_id: int, rule: Optional[str], filters: Optional[dict[str, Any]], now: datetime):
+    return (
+        select(Contact.id, Contact.created_at)
+        .select_from(Contact)
+        .outerjoin(Property, Property.id == Contact.property_id)
+        .where(*rule_conditions(agent_id, rule, filters, now))
+    )
+
+
+def _adjust_count(db: Session, list_id: int, delta: int, newest: Optional[datetime] = None) -> None:
+    values: dict[str, Any] = {"total_contacts": func.coalesce(ContactList.total_contacts, 0) + delta}
+    if newest is not None:
+        values["last_contact_added_at"] = case(
+            (
+                or_(ContactList.last_contact_added_at.is_(None), ContactList.last_contact_added_at < newest),
+                newest,
+            ),
+            else_=ContactList.last_contact_added_at,
+        )
+    db.execute(
+        update(ContactList)
+        .where(ContactList.id == list_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _recount(db: Session, contact_list: ContactList) -> None:
+    count, newest = db.execute(
+        select(func.count(), func.max(ContactListMember.contact_created_at))
+        .where(ContactListMember.list_id == contact_list.id)
+    ).one()
+    contact_list.total_contacts = count
+    contact_list.last_contact_added_at = newest
+
+
+# ── Whole-list operations ──
+
+def rebuild(db: Session, contact_list: ContactList, now: Optional[datetime] = None) -> None:
+    """Recompute a smart list's members from its rule (recount other lists)."""
+    now = now or datetime.utcnow()
+    if contact_list.list_type == ListType.SMART and contact_list.smart_rule:
+        db.execute(delete(ContactListMember).where(ContactListMember.list_id == contact_list.id))
+        matching = _matching(contact_list.agent_id, contact_list.smart_rule, contact_list.filters, now).subquery()
+        db.execute(
+            insert(ContactListMember).from_select(
+                ["list_id", "contact_id", "contact_created_at", "added_at"],
+                select(literal(contact_list.id), matching.c.id, matching.c.created_at, literal(now)),
+            )
+        )
+        contact_list.last_refreshed_at = now
+    _recount(db, contact_list)
+    db.commit()
+
+
+def expire_members(db: Session, contact_list: ContactList, now: Optional[datetime] = None) -> int:
+    """Drop members that aged out of a time-window rule; returns how many."""
+    if contact_list.list_type != ListType.SMART:
+        return 0
+    start = window_start(contact_list.smart_rule, now or datetime.utcnow())
+    if start is None:
+        return 0
+    removed = db.execute(
+        delete(ContactListMember).where(
+            ContactListMember.list_id == contact_list.id,
+            ContactListMember.contact_created_at < start,
+        )
+    ).rowcount
+    if removed:
+        contact_list.total_contacts = max(0, (contact_list.total_contacts or 0) - removed)
+        db.commit()
+    return removed
+
+
+def add_members(db: Session, contact_list: ContactList, contact_ids: Iterable[int]) -> int:
+    """Add existing contacts to a list (duplicates ignored); returns how many were added."""
+    wanted = list(dict.fromkeys(contact_ids))
+    rows = []
+    now = datetime.utcnow()
+    for chunk in _chunks(wanted):
+        present = set(db.scalars(
+            select(ContactListMember.contact_id).where(
+                ContactListMember.list_id == contact_list.id,
+                ContactListMember.contact_id.in_(chunk),
+            )
+        ))
+        rows.extend(
+            {"list_id": contact_list.id, "contact_id": cid, "contact_created_at": created_at, "added_at": now}
+            for cid, created_at in db.execute(
+                select(Contact.id, Contact.created_at).where(Contact.id.in_(chunk))
+            )
+            if cid not in present
+        )
+    if rows:
+        db.execute(insert(ContactListMember), rows)
+        contact_list.total_contacts = (contact_list.total_contacts or 0) + len(rows)
+        newest = max((r["contact_created_at"] for r in rows if r["contact_created_at"]), default=None)
+        if newest and (not contact_list.last_contact_added_at or newest > contact_list.last_contact_added_at):
+            contact_list.last_contact_added_at = newest
+    db.commit()
+    return len(rows)
+
+
+def remove_members(db: Session, contact_list: ContactList, contact_ids: Iterable[int]) -> int:
+    """Remove contacts from a list; returns how many were members."""
+    removed = 0
+    for chunk in _chunks(list(dict.fromkeys(contact_ids))):
+        removed += db.execute(
+            delete(ContactListMember).where(
+                ContactListMember.list_id == contact_list.id,
+                ContactListMember.contact_id.in_(chunk),
+            )
+        ).rowcount
+    if removed:
+        contact_list.total_contacts = max(0, (contact_list.total_contacts or 0) - removed)
+    db.commit()
+    return removed
+
+
+def replace_members(db: Session, contact_list: ContactList, contact_ids: Iterable[int]) -> None:
+    db.execute(delete(ContactListMember).where(ContactListMember.list_id == contact_list.id))
+    contact_list.total_contacts = 0
+    contact_list.last_contact_added_at = None
+    add_members(db, contact_list, contact_ids)
+
+
+def iter_member_ids(db: Session, list_id: int, page_size: int = PAGE_SIZE) -> Iterator[list[int]]:
+    """Member contact ids in id order, a keyset page at a time."""
+    last_id = 0
+    while True:
+        page = list(db.scalars(
+            select(ContactListMember.contact_id)
+            .where(ContactListMember.list_id == list_id, ContactListMember.contact_id > last_id)
+            .order_by(ContactListMember.contact_id)
+            .limit(page_size)
+        ))
+        if not page:
+            return
+        yield page
+        last_id = page[-1]
+
+
+# ── Incremental maintenance ──
+
+def sync_contacts(db: Session, contact_ids: Iterable[int]) -> None:
+    """Bring smart list membership up to date for contacts created or updated in a transaction.
+
+    Runs inside the caller's transaction and does not commit.
+    """
+    now = datetime.utcnow()
+    for chunk in _chunks(sorted(set(contact_ids))):
+        _sync_chunk(db, chunk, now)
+
+
+def drop_contacts(db: Session, contact_ids: Iterable[int]) -> None:
+    """Remove contacts about to be deleted from every list, keeping counts in step."""
+    for chunk in _chunks(sorted(set(contact_ids))):
+        removed = db.execute(
+            select(ContactListMember.list_id, func.count())
+            .where(ContactListMember.contact_id.in_(chunk))
+            .group_by(ContactListMember.list_id)
+        ).all()
+        if not removed:
+            continue
+        db.execute(delete(ContactListMember).where(ContactListMember.contact_id.in_(chunk)))
+        for list_id, count in removed:
+            _adjust_count(db, list_id, -count)
+
+
+def _sync_chunk(db: Session, contact_ids: list[int], now: datetime) -> None:
+    agent_ids = set(db.scalars(
+        select(Property.agent_id)
+        .join(Contact, Contact.property_id == Property.id)
+        .where(Contact.id.in_(contact_ids))
+    ))
+    current: dict[int, set[int]] = {}
+    for list_id, contact_id in db.execute(
+        select(ContactListMember.list_id, ContactListMember.contact_id)
+        .join(ContactList, ContactList.id == ContactListMember.list_id)
+        .where(ContactListMember.contact_id.in_(contact_ids), ContactList.list_type == ListType.SMART)
+    ):
+        current.setdefault(list_id, set()).add(contact_id)
+
+    lists = db.execute(
+        select(ContactList.id, ContactList.agent_id, ContactList.smart_rule, ContactList.filters).where(
+            ContactList.list_type == ListType.SMART,
+            ContactList.smart_rule.isnot(None),
+            ContactList.smart_rule.notin_(UNSUPPORTED_RULES),
+            (ContactList.agent_id.in_(agent_ids) | ContactList.id.in_(list(current))),
+        )
+    ).all()
+
+    for list_id, agent_id, rule, filters in lists:
+        matching = dict(db.execute(
+            _matching(agent_id, rule, filters, now).where(Contact.id.in_(contact_ids))
+        ).all())
+        members = current.get(list_id, set())
+        added = [cid for cid in matching if cid not in members]
+        removed = [cid for cid in members if cid not in matching]
+        if added:
+            db.execute(insert(ContactListMember), [
+                {"list_id": list_id, "contact_id": cid, "contact_created_at": matching[cid], "added_at": now}
+                for cid in added
+            ])
+        if removed:
+            db.execute(delete(ContactListMember).where(
+                ContactListMember.list_id == list_id,
+                ContactListMember.contact_id.in_(removed),
+            ))
+        if added or removed:
+            newest = max((matching[cid] for cid in added if matching[cid]), default=None)
+            _adjust_count(db, list_id, len(added) - len(removed), newest)
+
+
+# ── Periodic maintenance ──
+
+def refresh_due_lists(db: Session, now: Optional[datetime] = None) -> dict[str, int]:
+    """Expire time-window members on every smart list and rebuild lists past their refresh interval."""
+    now = now or datetime.utcnow()
+    summary = {"expired": 0, "rebuilt": 0}
+    for contact_list in db.query(ContactList).filter(
+        ContactList.list_type == ListType.SMART,
+        or_(ContactList.smart_rule.is_(None), ContactList.smart_rule.notin_(UNSUPPORTED_RULES)),
+    ).all():
+        interval = timedelta(hours=contact_list.refresh_interval_hours or 24)
+        if contact_list.auto_refresh and (
+            not contact_list.last_refreshed_at or now - contact_list.last_refreshed_at > interval
+        ):
+            rebuild(db, contact_list, now)
+            summary["rebuilt"] += 1
+        else:
+            summary["expired"] += expire_members(db, contact_list, now)
+    return summary
@@ -237,7 +237,7 @@ def persist_context_to_graph(db: Session, session_id: str = "default") -> None:
             fulfilled=promise.get("fulfilled", False),
         )
 
-    db.flush()
+    memory_graph_service.flush(db)
 
 
 def resolve_property_reference(
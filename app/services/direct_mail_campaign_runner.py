@@ -0,0 +1,604 @@
+"""Bulk execution pipeline for direct mail campaigns.
+
+A run goes through three steps:
+
+1. Materialize: on the first run, the campaign's recipients are resolved with
+   a few bulk IN queries (target contacts, seller contacts of target
+   properties, skip traces, properties) and one DRAFT ``DirectMail`` row per
+   recipient is inserted in bulk. Recipients without a mailing address get a
+   FAILED row.
+2. Send: DRAFT pieces are streamed in keyset chunks to a bounded pool of
+   workers. Each worker verifies the address (cached by normalized address,
+   paced within Lob's rate limit by ``LobClient``) and submits the postcard or
+   letter with an idempotency key derived from the piece id.
+3. Write back: outcomes are buffered and written with one executemany UPDATE
+   per batch; campaign counters are recomputed from the pieces at the end.
+
+One run at a time: a run first claims its campaign with a single conditional
+UPDATE (status 'sending' plus a lease it renews with every write-back batch)
+and does nothing if another run holds it. A crashed run's lease expires, so
+its campaign can be claimed again. Pieces carry a ``recipient_key`` unique
+within the campaign, so a recipient is never materialized twice.
+
+Resume: pieces still DRAFT after a crash or a transient Lob error are picked
+up by the next run. A piece whose submission succeeded but whose write-back
+was lost is resubmitted with the same idempotency key, so Lob returns the
+original mailpiece instead of printing a second one.
+
+Usage:
+    summary = await DirectMailCampaignRunner().run(campaign_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable, Optional
+
+import httpx
+from jinja2 import Template
+from sqlalchemy import case, func, insert, or_, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.agent import Agent
+from app.models.agent_brand import AgentBrand
+from app.models.contact import Contact, ContactRole
+from app.models.direct_mail import DirectMail, DirectMailCampaign, DirectMailTemplate, MailStatus, MailType
+from app.models.property import Property
+from app.models.skip_trace import SkipTrace
+from app.services.contact_list_membership import sync_contacts
+from app.services.lob_service import LobClient
+
+logger = logging.getLogger(__name__)
+
+QUERY_CHUNK_SIZE = 500
+WRITE_BATCH_SIZE = 100
+# How long a run holds its campaign without writing back a batch
+RUN_LEASE = timedelta(minutes=10)
+
+# Piece columns a send attempt may change; written back by primary key.
+_PIECE_FIELDS = (
+    "mail_status",
+    "to_address",
+    "lob_mailpiece_id",
+    "lob_object_id",
+    "estimated_cost",
+    "tracking_url",
+    "description",
+)
+
+_SENT_STATUSES = (
+    MailStatus.SCHEDULED,
+    MailStatus.PROCESSING,
+    MailStatus.MAILED,
+    MailStatus.IN_TRANSIT,
+    MailStatus.DELIVERED,
+)
+
+
+def _chunks(values: list, size: int = QUERY_CHUNK_SIZE) -> Iterable[list]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+@dataclass
+class Recipient:
+    name: str
+    to_address: Optional[dict[str, str]]
+    contact_id: Optional[int] = None
+    property_id: Optional[int] = None
+    property_address: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Identifies the recipient within a campaign (``DirectMail.recipient_key``)."""
+        if self.contact_id is not None:
+            return f"contact:{self.contact_id}"
+        return f"property:{self.property_id}"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def run_in_progress(campaign: DirectMailCampaign, now: Optional[datetime] = None) -> bool:
+    """Whether a run currently holds the campaign's lease."""
+    lease = campaign.run_lease_expires_at
+    if campaign.status != "sending" or lease is None:
+        return False
+    if lease.tzinfo is None:
+        lease = lease.replace(tzinfo=timezone.utc)
+    return lease > (now or _utcnow())
+
+
+def _lease_free(now: datetime):
+    return or_(
+        DirectMailCampaign.status.is_(None),
+        DirectMailCampaign.status != "sending",
+        DirectMailCampaign.run_lease_expires_at.is_(None),
+        DirectMailCampaign.run_lease_expires_at < now,
+    )
+
+
+def claim_campaign(db: Session, campaign_id: int) -> bool:
+    """Take the campaign for a run (status 'sending' plus a lease); False if another run holds it."""
+    now = _utcnow()
+    claimed = db.execute(
+        update(DirectMailCampaign)
+        .where(DirectMailCampaign.id == campaign_id, _lease_free(now))
+        .values(status="sending", run_lease_expires_at=now + RUN_LEASE)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return claimed == 1
+
+
+@dataclass
+class CampaignContent:
+    """What every piece of a campaign is printed from."""
+
+    front_html: Optional[str]
+    back_html: Optional[str]
+    file_url: Optional[str]
+    from_address: dict[str, str]
+    merge_variables: dict[str, Any] = field(default_factory=dict)
+
+
+def _mailing_address(name: str, skip_trace: Optional[SkipTrace], prop: Optional[Property]) -> Optional[dict[str, str]]:
+    """Owner's mailing address from skip trace data, else the property address."""
+    if skip_trace is not None and skip_trace.mailing_address:
+        return {
+            "name": name,
+            "address_line1": skip_trace.mailing_address,
+            "address_city": skip_trace.mailing_city or "",
+            "address_state": skip_trace.mailing_state or "",
+            "address_zip": skip_trace.mailing_zip or "",
+        }
+    if prop is not None and prop.address:
+        return {
+            "name": name,
+            "address_line1": prop.address,
+            "address_city": prop.city or "",
+            "address_state": prop.state or "",
+            "address_zip": prop.zip_code or "",
+        }
+    return None
+
+
+def load_recipients(db: Session, campaign: DirectMailCampaign) -> list[Recipient]:
+    """Resolve a campaign's recipients with a bounded number of IN queries."""
+    property_ids = list(dict.fromkeys(campaign.target_property_ids or []))
+    contact_ids = list(dict.fromkeys(campaign.target_contact_ids or []))
+
+    contacts: list[Contact] = []
+    for chunk in _chunks(contact_ids):
+        contacts.extend(db.query(Contact).filter(Contact.id.in_(chunk)).all())
+
+    sellers: dict[int, list[Contact]] = {}
+    for chunk in _chunks(property_ids):
+        rows = (
+            db.query(Contact)
+            .filter(Contact.property_id.in_(chunk), Contact.role == ContactRole.SELLER)
+            .order_by(Contact.id)
+            .all()
+        )
+        for contact in rows:
+            sellers.setdefault(contact.property_id, []).append(contact)
+
+    all_property_ids = list(dict.fromkeys(property_ids + [c.property_id for c in contacts if c.property_id]))
+    properties: dict[int, Property] = {}
+    skip_traces: dict[int, SkipTrace] = {}
+    for chunk in _chunks(all_property_ids):
+        properties.update((p.id, p) for p in db.query(Property).filter(Property.id.in_(chunk)))
+        # Newest skip trace per property wins.
+        for trace in db.query(SkipTrace).filter(SkipTrace.property_id.in_(chunk)).order_by(SkipTrace.id):
+            skip_traces[trace.property_id] = trace
+
+    recipients: list[Recipient] = []
+    seen_contacts: set[int] = set()
+
+    def add_contact(contact: Contact) -> None:
+        if contact.id in seen_contacts:
+            return
+        seen_contacts.add(contact.id)
+        prop = properties.get(contact.property_id)
+        recipients.append(Recipient(
+            name=contact.name,
+            to_address=_mailing_address(contact.name, skip_traces.get(contact.property_id), prop),
+            contact_id=contact.id,
+            property_id=contact.property_id,
+            property_address=prop.address if prop else None,
+        ))
+
+    for property_id in property_ids:
+        prop = properties.get(property_id)
+        if prop is None:
+            continue
+        if sellers.get(property_id):
+            for contact in sellers[property_id]:
+                add_contact(contact)
+            continue
+        trace = skip_traces.get(property_id)
+        if trace is not None:
+            name = trace.owner_name or "Property Owner"
+            recipients.append(Recipient(
+                name=name,
+                to_address=_mailing_address(name, trace, prop),
+                property_id=property_id,
+                property_address=prop.address,
+            ))
+
+    for contact in contacts:
+        add_contact(contact)
+    return recipients
+
+
+def _return_address(db: Session, agent_id: int) -> dict[str, str]:
+    agent = db.query(Agent).filter(Agent.id == agent_id).first()
+    brand = db.query(AgentBrand).filter(AgentBrand.agent_id == agent_id).first()
+    return {
+        "name": (agent.name if agent else None) or "Real Estate Agent",
+        "company": (brand.company_name if brand else None) or "",
+        "address_line1": (brand.office_address if brand else None) or "123 Main St",
+        "address_city": (agent.city if agent else None) or "Anytown",
+        "address_state": "CA",
+        "address_zip": "90210",
+        "address_country": "US",
+    }
+
+
+def load_content(db: Session, campaign: DirectMailCampaign) -> CampaignContent:
+    """Campaign template (saved or built-in, by campaign type) and return address.
+
+    Raises ValueError when the campaign has no usable template.
+    """
+    from app.templates.direct_mail import get_template
+
+    if campaign.template_id:
+        template = db.query(DirectMailTemplate).filter(DirectMailTemplate.id == campaign.template_id).first()
+        if template is None:
+            raise ValueError("Template not found")
+        front, back, file_url = template.front_html_template, template.back_html_template, template.pdf_url_template
+    else:
+        builtin = get_template(campaign.campaign_type or "")
+        front, back, file_url = builtin["front_html"], builtin.get("back_html"), None
+
+    from_address = (campaign.filters or {}).get("from_address") or _return_address(db, campaign.agent_id)
+    agent = db.query(Agent).filter(Agent.id == campaign.agent_id).first()
+    return CampaignContent(
+        front_html=front,
+        back_html=back,
+        file_url=file_url,
+        from_address=from_address,
+        merge_variables={
+            "agent_name": agent.name if agent else "",
+            "agent_phone": (agent.phone if agent else "") or "",
+            "agent_email": agent.email if agent else "",
+        },
+    )
+
+
+def _verified_to_address(original: dict[str, str], verified: dict[str, Any]) -> dict[str, str]:
+    components = verified.get("components") or {}
+    if not verified.get("primary_line"):
+        return original
+    return {
+        "name": original.get("name", ""),
+        "address_line1": verified["primary_line"],
+        "address_line2": verified.get("secondary_line") or "",
+        "address_city": components.get("city") or original.get("address_city", ""),
+        "address_state": components.get("state") or original.get("address_state", ""),
+        "address_zip": components.get("zip_code") or original.get("address_zip", ""),
+    }
+
+
+def _is_transient(error: Exception) -> bool:
+    """Errors worth retrying on the next run (network trouble, 429, 5xx)."""
+    if isinstance(error, httpx.HTTPStatusError):
+        code = error.response.status_code
+        return code == 429 or code >= 500
+    return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
+
+class _PieceWriter:
+    """Buffers piece outcomes and writes them with one executemany UPDATE per batch."""
+
+    def __init__(self, db: Session, batch_size: int, campaign_id: Optional[int] = None):
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.campaign_id = campaign_id
+        self.rows: list[dict[str, Any]] = []
+        self.batches = 0
+
+    def add(self, row: dict[str, Any]) -> None:
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.rows:
+            return
+        rows, self.rows = self.rows, []
+        try:
+            self.db.execute(update(DirectMail), rows)
+            if self.campaign_id is not None:
+                # Each write-back renews the run's hold on its campaign
+                self.db.execute(
+                    update(DirectMailCampaign)
+                    .where(DirectMailCampaign.id == self.campaign_id)
+                    .values(run_lease_expires_at=_utcnow() + RUN_LEASE)
+                    .execution_options(synchronize_session=False)
+                )
+            self.db.commit()
+            self.batches += 1
+        except Exception:
+            self.db.rollback()
+            logger.exception("Failed to write %d mailpiece updates", len(rows))
+
+
+class DirectMailCampaignRunner:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        client_factory: Callable[[], LobClient] = LobClient,
+        max_concurrency: int | None = None,
+        write_batch_size: int = WRITE_BATCH_SIZE,
+    ):
+        self.session_factory = session_factory
+        self.client_factory = client_factory
+        self.max_concurrency = max(1, max_concurrency or settings.lob_max_concurrency)
+        self.write_batch_size = write_batch_size
+        self._templates: dict[str, Template] = {}
+
+    # ── Materialize ──
+
+    def materialize(self, db: Session, campaign: DirectMailCampaign, content: CampaignContent) -> int:
+        """Insert one DRAFT piece per recipient unless the campaign already has pieces."""
+        if db.query(DirectMail.id).filter(DirectMail.campaign_id == campaign.id).first() is not None:
+            return 0
+
+        recipients = load_recipients(db, campaign)
+        rows = [
+            {
+                "agent_id": campaign.agent_id,
+                "campaign_id": campaign.id,
+                "recipient_key": r.key,
+                "property_id": r.property_id,
+                "contact_id": r.contact_id,
+                "mail_type": campaign.mail_type,
+                "mail_status": MailStatus.DRAFT if r.to_address else MailStatus.FAILED,
+                "to_address": r.to_address or {"name": r.name},
+                "from_address": content.from_address,
+                "front_html": content.front_html,
+                "back_html": content.back_html,
+                "file_url": content.file_url,
+                "postcard_size": campaign.postcard_size,
+                "color": campaign.color,
+                "double_sided": campaign.double_sided,
+                "merge_variables": {
+                    **content.merge_variables,
+                    "name": r.name,
+                    "property_address": r.property_address or "Your Property",
+                },
+                "campaign_name": campaign.name,
+                "campaign_type": campaign.campaign_type,
+                "description": None if r.to_address else "No mailing address",
+            }
+            for r in recipients
+        ]
+        for chunk in _chunks(rows):
+            db.execute(insert(DirectMail), chunk)
+        # Bulk inserts skip the session hooks; take mailed contacts off "uncontacted" lists here.
+        sync_contacts(db, [r["contact_id"] for r in rows if r["contact_id"]])
+        campaign.total_recipients = len(rows)
+        db.commit()
+        return len(rows)
+
+    # ── Send ──
+
+    def _render(self, html: Optional[str], variables: dict[str, Any]) -> str:
+        if not html:
+            return ""
+        template = self._templates.get(html)
+        if template is None:
+            template = self._templates[html] = Template(html)
+        return template.render(**variables)
+
+    def _pending_chunks(self, db: Session, campaign_id: int) -> Iterable[list]:
+        last_id = 0
+        while True:
+            chunk = (
+                db.query(
+                    DirectMail.id,
+                    DirectMail.mail_type,
+                    DirectMail.to_address,
+                    DirectMail.from_address,
+                    DirectMail.front_html,
+                    DirectMail.back_html,
+                    DirectMail.file_url,
+                    DirectMail.merge_variables,
+                    DirectMail.postcard_size,
+                    DirectMail.letter_size,
+                    DirectMail.color,
+                    DirectMail.double_sided,
+                    DirectMail.send_after,
+                )
+                .filter(
+                    DirectMail.campaign_id == campaign_id,
+                    DirectMail.mail_status == MailStatus.DRAFT,
+                    DirectMail.id > last_id,
+                )
+                .order_by(DirectMail.id)
+                .limit(QUERY_CHUNK_SIZE)
+                .all()
+            )
+            if not chunk:
+                return
+            yield chunk
+            last_id = chunk[-1].id
+
+    async def _send_piece(self, client: LobClient, piece) -> dict[str, Any]:
+        """Verify and submit one piece; returns its row update."""
+        row: dict[str, Any] = {"id": piece.id}
+        verified = await client.verify_address_cached(piece.to_address)
+        if verified.get("deliverability") == "undeliverable":
+            row.update(mail_status=MailStatus.FAILED, description="Undeliverable address")
+            return row
+
+        to_address = _verified_to_address(piece.to_address, verified)
+        variables = piece.merge_variables or {}
+        key = f"direct-mail-{piece.id}"
+        if piece.mail_type == MailType.POSTCARD:
+            result = await client.create_postcard(
+                to_address=to_address,
+                from_address=piece.from_address,
+                front_html=self._render(piece.front_html, variables),
+                back_html=self._render(piece.back_html, variables),
+                size=piece.postcard_size.value if piece.postcard_size else "4x6",
+                send_after=piece.send_after,
+                idempotency_key=key,
+            )
+        elif piece.mail_type == MailType.LETTER:
+            result = await client.create_letter(
+                to_address=to_address,
+                from_address=piece.from_address,
+                file_url=piece.file_url,
+                color=bool(piece.color),
+                double_sided=piece.double_sided is not False,
+                size=piece.letter_size.value if piece.letter_size else "letter",
+                send_after=piece.send_after,
+                merge_variables=variables,
+                idempotency_key=key,
+            )
+        else:
+            row.update(mail_status=MailStatus.FAILED, description="Checks cannot be sent by campaigns")
+            return row
+
+        row.update(
+            mail_status=LobClient.map_lob_status(result.get("status") or "processing"),
+            to_address=to_address,
+            lob_mailpiece_id=result.get("id"),
+            lob_object_id=result.get("id"),
+            estimated_cost=(result.get("expected_cost") or 0) / 100,
+            tracking_url=result.get("url"),
+            description=None,
+        )
+        return row
+
+    async def _attempt(self, client: LobClient, piece) -> tuple[str, dict[str, Any]]:
+        """Send one piece; returns its outcome and full row update."""
+        row = {"id": piece.id, **dict.fromkeys(_PIECE_FIELDS), "mail_status": MailStatus.DRAFT, "to_address": piece.to_address}
+        try:
+            row.update(await self._send_piece(client, piece))
+            return ("failed" if row["mail_status"] == MailStatus.FAILED else "sent"), row
+        except Exception as e:
+            if _is_transient(e):
+                logger.info("Mailpiece %s left pending after transient error: %s", piece.id, e)
+                row["description"] = f"Retry pending: {e}"
+                return "pending", row
+            logger.warning("Mailpiece %s failed: %s", piece.id, e)
+            row.update(mail_status=MailStatus.FAILED, description=f"Failed to send: {e}")
+            return "failed", row
+
+    async def send_pending(self, db: Session, campaign_id: int, client: LobClient) -> dict[str, int]:
+        """Send the campaign's DRAFT pieces through a bounded worker pool."""
+        summary = {"sent": 0, "failed": 0, "pending": 0}
+        writer = _PieceWriter(db, self.write_batch_size, campaign_id)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+
+        async def worker() -> None:
+            while (piece := await queue.get()) is not None:
+                outcome, row = await self._attempt(client, piece)
+                summary[outcome] += 1
+                writer.add(row)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+        try:
+            for chunk in self._pending_chunks(db, campaign_id):
+                for piece in chunk:
+                    await queue.put(piece)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            writer.flush()
+        return summary
+
+    # ── Campaign ──
+
+    def refresh_counts(self, db: Session, campaign: DirectMailCampaign) -> int:
+        """Recompute campaign counters from its pieces; returns how many are still pending."""
+        sent, failed, pending, cost = db.query(
+            func.sum(case((DirectMail.mail_status.in_(_SENT_STATUSES), 1), else_=0)),
+            func.sum(case((DirectMail.mail_status == MailStatus.FAILED, 1), else_=0)),
+            func.sum(case((DirectMail.mail_status == MailStatus.DRAFT, 1), else_=0)),
+            func.sum(DirectMail.estimated_cost),
+        ).filter(DirectMail.campaign_id == campaign.id).one()
+        campaign.sent_count = int(sent or 0)
+        campaign.failed_count = int(failed or 0)
+        campaign.total_cost = float(cost or 0.0)
+        return int(pending or 0)
+
+    async def run(self, campaign_id: int) -> dict[str, int]:
+        """Run or resume a campaign; returns counts for this run (empty if it did not run)."""
+        db = self.session_factory()
+        client = None
+        try:
+            if not claim_campaign(db, campaign_id):
+                logger.info("Direct mail campaign %s is already being sent; skipping", campaign_id)
+                return {}
+            campaign = db.query(DirectMailCampaign).filter(DirectMailCampaign.id == campaign_id).first()
+            if campaign is None:
+                return {}
+            try:
+                content = load_content(db, campaign)
+            except ValueError as e:
+                campaign.status = "failed"
+                campaign.description = str(e)
+                campaign.run_lease_expires_at = None
+                db.commit()
+                return {}
+
+            created = self.materialize(db, campaign, content)
+
+            client = self.client_factory()
+            summary = await self.send_pending(db, campaign_id, client)
+            summary["created"] = created
+
+            db.expire(campaign)
+            pending = self.refresh_counts(db, campaign)
+            campaign.description = f"Sent {campaign.sent_count} mailpieces"
+            if campaign.failed_count:
+                campaign.description += f", {campaign.failed_count} failed"
+            if pending:
+                campaign.description += f", {pending} pending (execute again to resume)"
+            else:
+                campaign.status = "completed"
+            campaign.run_lease_expires_at = None
+            db.commit()
+            return summary
+        finally:
+            if client is not None:
+                await client.close()
+            db.close()
+
+
+async def execute_campaign(campaign_id: int) -> dict[str, int]:
+    """Run or resume a direct mail campaign (background task / arq job entry point)."""
+    return await DirectMailCampaignRunner().run(campaign_id)
+
+
+def unfinished_campaign_ids(db: Session) -> list[int]:
+    """Campaigns left mid-send that no live run holds."""
+    return [
+        row.id
+        for row in db.query(DirectMailCampaign.id).filter(
+            DirectMailCampaign.status == "sending", _lease_free(_utcnow())
+        )
+    ]
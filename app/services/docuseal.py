@@ -3,9 +3,9 @@ DocuSeal API integration service for document signing.
 
 API Documentation: https://www.docuseal.com/docs/api
 """
-import httpx
 from typing import Optional, Dict, Any, List
 from app.config import settings
+from app.utils.http_clients import http_clients
 
 
 class DocuSealClient:
@@ -55,7 +55,7 @@ class DocuSealClient:
         # if message:
         #     payload["message"] = message
 
-        async with httpx.AsyncClient() as client:
+        async with http_clients.session("docuseal") as client:
             response = await client.post(
                 url,
                 json=payload,
@@ -91,7 +91,7 @@ class DocuSealClient:
         """
         url = f"{self.base_url}/submissions/{submission_id}"
 
-        async with httpx.AsyncClient() as client:
+        async with http_clients.session("docuseal") as client:
             response = await client.get(
                 url,
                 headers=self.headers,
@@ -121,7 +121,7 @@ class DocuSealClient:
         if template_id:
             params["template_id"] = template_id
 
-        async with httpx.AsyncClient() as client:
+        async with http_clients.session("docuseal") as client:
             response = await client.get(
                 url,
                 params=params,
@@ -143,7 +143,7 @@ class DocuSealClient:
         """
         url = f"{self.base_url}/submissions/{submission_id}/archive"
 
-        async with httpx.AsyncClient() as client:
+        async with http_clients.session("docuseal") as client:
             response = await client.post(
                 url,
                 headers=self.headers,
@@ -172,7 +172,7 @@ class DocuSealClient:
         url = f"{self.base_url}/templates"
         params = {"limit": limit}
 
-        async with httpx.AsyncClient() as client:
+        async with http_clients.session("docuseal") as client:
             response = await client.get(
                 url,
                 params=params,
@@ -0,0 +1,352 @@
+"""
+Embedding Pipeline
+
+Bulk backfill/refresh of embeddings for properties, recaps, dossiers and
+evidence. Rows are streamed in keyset-paginated chunks (``id > last_id``),
+rows whose content hash matches ``embedding_hash`` are skipped, the rest are
+packed into requests up to the batch/token limits and embedded by a bounded
+number of concurrent batches. Vectors are written back with one executemany
+UPDATE per batch.
+
+The embedding backend is pluggable: ``EMBEDDING_BACKEND=stub`` swaps the
+OpenAI API for deterministic local vectors (offline runs and benchmarks), and
+``OPENAI_EMBEDDINGS_BASE_URL`` points the OpenAI backend at any compatible
+endpoint.
+
+Usage:
+    result = await embedding_pipeline.run("all", only_missing=False)
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Optional, Protocol
+
+import numpy as np
+from sqlalchemy import inspect, literal_column, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.dossier import Dossier
+from app.models.evidence_item import EvidenceItem
+from app.models.property import Property
+from app.models.property_recap import PropertyRecap
+from app.services.embedding_service import (
+    EMBEDDING_DIMS,
+    EMBEDDING_MODEL,
+    MAX_INPUT_CHARS,
+    content_hash,
+    embedding_service,
+)
+
+logger = logging.getLogger(__name__)
+
+# OpenAI limits: 2048 inputs and 300k tokens per embeddings request
+MAX_BATCH_ITEMS = 2048
+MAX_BATCH_TOKENS = 300_000
+
+
+def estimate_tokens(text_input: str) -> int:
+    """Cheap upper-bound token estimate (~4 chars per token)."""
+    return len(text_input) // 4 + 1
+
+
+# ── Backends ────────────────────────────────────────────────────────
+
+
+class EmbeddingBackend(Protocol):
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        ...
+
+
+class OpenAIEmbeddingBackend:
+    """OpenAI (or compatible) embeddings over the shared pooled HTTP client."""
+
+    def __init__(self, model: str = EMBEDDING_MODEL, base_url: Optional[str] = None):
+        self.model = model
+        self.base_url = base_url or os.getenv("OPENAI_EMBEDDINGS_BASE_URL") or None
+
+    def _client(self):
+        from openai import AsyncOpenAI
+        from app.utils.http_clients import http_clients
+
+        if not settings.openai_api_key:
+            raise ValueError("OPENAI_API_KEY not set")
+        return AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            base_url=self.base_url,
+            http_client=http_clients.get("openai"),
+            max_retries=2,
+        )
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        resp = await self._client().embeddings.create(model=self.model, input=texts)
+        return [d.embedding for d in sorted(resp.data, key=lambda d: d.index)]
+
+
+class StubEmbeddingBackend:
+    """Deterministic unit vectors derived from the text; no network.
+
+    ``latency_ms`` (per request) and ``per_item_ms`` simulate API round trips.
+    """
+
+    def __init__(self, dims: int = EMBEDDING_DIMS, latency_ms: float = 0.0, per_item_ms: float = 0.0):
+        self.dims = dims
+        self.latency_ms = latency_ms
+        self.per_item_ms = per_item_ms
+        self.requests = 0
+
+    def vector(self, text_input: str) -> list[float]:
+        seed = int.from_bytes(hashlib.sha256(text_input.encode()).digest()[:8], "little")
+        vec = np.random.default_rng(seed).standard_normal(self.dims).astype(np.float32)
+        vec /= np.linalg.norm(vec)
+        return vec.tolist()
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.requests += 1
+        delay = (self.latency_ms + self.per_item_ms * len(texts)) / 1000
+        if delay:
+            await asyncio.sleep(delay)
+        return [self.vector(t) for t in texts]
+
+
+def get_embedding_backend() -> EmbeddingBackend:
+    if os.getenv("EMBEDDING_BACKEND", "openai").lower() == "stub":
+        return StubEmbeddingBackend()
+    return OpenAIEmbeddingBackend()
+
+
+# ── Sources ─────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class EmbeddingSource:
+    table: str
+    model: type
+    to_text: Callable[[object], str]
+
+
+SOURCES: dict[str, EmbeddingSource] = {
+    "properties": EmbeddingSource("properties", Property, embedding_service._property_text),
+    "property_recaps": EmbeddingSource("property_recaps", PropertyRecap, embedding_service._recap_text),
+    "dossiers": EmbeddingSource("dossiers", Dossier, embedding_service._dossier_text),
+    "evidence": EmbeddingSource("evidence", EvidenceItem, embedding_service._evidence_text),
+}
+
+
+@dataclass
+class _Item:
+    id: int
+    text: str
+    hash: str
+
+
+@dataclass
+class TableStats:
+    scanned: int = 0
+    embedded: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    errors: int = 0
+    batches: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "total": self.embedded + self.unchanged + self.skipped + self.errors,
+            "embedded": self.embedded,
+            "unchanged": self.unchanged,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "batches": self.batches,
+        }
+
+
+@dataclass
+class _Batch:
+    items: list[_Item] = field(default_factory=list)
+    tokens: int = 0
+
+
+# ── Pipeline ────────────────────────────────────────────────────────
+
+
+class EmbeddingPipeline:
+    def __init__(
+        self,
+        backend: Optional[EmbeddingBackend] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        chunk_size: int = 500,
+        max_batch_items: int = MAX_BATCH_ITEMS,
+        max_batch_tokens: int = MAX_BATCH_TOKENS,
+        max_concurrency: int = 4,
+        max_retries: int = 2,
+    ):
+        self._backend = backend
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+        self.max_batch_items = max_batch_items
+        self.max_batch_tokens = max_batch_tokens
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+
+    @property
+    def backend(self) -> EmbeddingBackend:
+        if self._backend is None:
+            self._backend = get_embedding_backend()
+        return self._backend
+
+    async def run(self, table: str = "all", only_missing: bool = True) -> dict:
+        """Embed rows of one table (or "all").
+
+        ``only_missing`` restricts the scan to rows without an embedding
+        (backfill); otherwise every row is scanned and re-embedded when its
+        text changed (refresh).
+        """
+        start = time.time()
+        names = list(SOURCES) if table == "all" else [table]
+        unknown = [n for n in names if n not in SOURCES]
+        if unknown:
+            raise ValueError(f"Unknown embedding table: {unknown[0]}")
+
+        supported = await asyncio.to_thread(self._tables_with_embedding_column)
+        results = {}
+        for name in names:
+            if name not in supported:
+                logger.info("Skipping %s: no embedding column (pgvector not installed)", name)
+                results[name] = {**TableStats().as_dict(), "unsupported": True}
+                continue
+            stats = TableStats()
+            await self._run_table(SOURCES[name], only_missing, stats)
+            results[name] = stats.as_dict()
+
+        return {"tables": results, "duration_seconds": round(time.time() - start, 2)}
+
+    def _tables_with_embedding_column(self) -> set[str]:
+        db = self.session_factory()
+        try:
+            inspector = inspect(db.get_bind())
+            return {
+                name for name in SOURCES
+                if inspector.has_table(name)
+                and any(c["name"] == "embedding" for c in inspector.get_columns(name))
+            }
+        finally:
+            db.close()
+
+    # ── Reading ─────────────────────────────────────────────────────
+
+    def _read_chunk(self, source: EmbeddingSource, after_id: int, only_missing: bool) -> list:
+        db = self.session_factory()
+        try:
+            has_vector = literal_column(f"{source.table}.embedding IS NOT NULL")
+            query = db.query(source.model, has_vector).filter(source.model.id > after_id)
+            if only_missing:
+                query = query.filter(text(f"{source.table}.embedding IS NULL"))
+            rows = query.order_by(source.model.id).limit(self.chunk_size).all()
+            # A row without a vector has nothing to keep, whatever its hash says
+            return [
+                (row.id, source.to_text(row), row.embedding_hash if vector else None)
+                for row, vector in rows
+            ]
+        finally:
+            db.close()
+
+    async def _stream(self, source: EmbeddingSource, only_missing: bool) -> AsyncIterator[list]:
+        after_id = 0
+        while True:
+            chunk = await asyncio.to_thread(self._read_chunk, source, after_id, only_missing)
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < self.chunk_size:
+                return
+            after_id = chunk[-1][0]
+
+    # ── Batching ────────────────────────────────────────────────────
+
+    async def _run_table(self, source: EmbeddingSource, only_missing: bool, stats: TableStats) -> None:
+        slots = asyncio.Semaphore(self.max_concurrency)
+        tasks: set[asyncio.Task] = set()
+        batch = _Batch()
+
+        async def submit(current: _Batch) -> None:
+            # Blocks the reader while max_concurrency batches are in flight
+            await slots.acquire()
+            task = asyncio.create_task(self._embed_batch(source, current.items, stats))
+            tasks.add(task)
+            task.add_done_callback(lambda t: (tasks.discard(t), slots.release()))
+
+        async for chunk in self._stream(source, only_missing):
+            for record_id, txt, stored_hash in chunk:
+                stats.scanned += 1
+                if not txt or not txt.strip():
+                    stats.skipped += 1
+                    continue
+                txt = txt[:MAX_INPUT_CHARS]
+                digest = content_hash(txt)
+                # A changed hash re-embeds; when backfilling, a NULL embedding always does
+                if digest == stored_hash and not only_missing:
+                    stats.unchanged += 1
+                    continue
+                tokens = estimate_tokens(txt)
+                if batch.items and (
+                    len(batch.items) >= self.max_batch_items
+                    or batch.tokens + tokens > self.max_batch_tokens
+                ):
+                    await submit(batch)
+                    batch = _Batch()
+                batch.items.append(_Item(record_id, txt, digest))
+                batch.tokens += tokens
+
+        if batch.items:
+            await submit(batch)
+        if tasks:
+            await asyncio.gather(*list(tasks))
+
+    async def _embed_batch(self, source: EmbeddingSource, items: list[_Item], stats: TableStats) -> None:
+        texts = [item.text for item in items]
+        for attempt in range(self.max_retries + 1):
+            try:
+                vectors = await self.backend.embed(texts)
+                if len(vectors) != len(items):
+                    raise ValueError(f"Expected {len(items)} embeddings, got {len(vectors)}")
+                break
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.warning("Embedding batch of %d %s failed: %s", len(items), source.table, e)
+                    stats.errors += len(items)
+                    return
+                await asyncio.sleep(0.5 * 2 ** attempt)
+
+        try:
+            await asyncio.to_thread(self._write_batch, source.table, items, vectors)
+        except Exception as e:
+            logger.warning("Writing %d %s embeddings failed: %s", len(items), source.table, e)
+            stats.errors += len(items)
+            return
+        stats.batches += 1
+        stats.embedded += len(items)
+
+    def _write_batch(self, table: str, items: list[_Item], vectors: list[list[float]]) -> None:
+        db = self.session_factory()
+        try:
+            db.execute(
+                text(f"UPDATE {table} SET embedding = :vec, embedding_hash = :hash WHERE id = :id"),
+                [
+                    {"vec": str(list(vec)), "hash": item.hash, "id": item.id}
+                    for item, vec in zip(items, vectors)
+                ],
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+# Singleton
+embedding_pipeline = EmbeddingPipeline()
@@ -3,9 +3,10 @@ Embedding Service
 
 Generates OpenAI text-embedding-3-small vectors (1536 dims) and performs
 pgvector similarity searches across properties, recaps, dossiers, and evidence.
+Bulk backfill/refresh lives in ``embedding_pipeline``.
 """
+import hashlib
 import logging
-import time
 from typing import Optional
 
 from openai import OpenAI
@@ -22,6 +23,14 @@ logger = logging.getLogger(__name__)
 
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMS = 1536
+# ~8000 tokens; longer inputs are truncated to stay within model limits
+MAX_INPUT_CHARS = 32000
+
+
+def content_hash(text_input: str) -> str:
+    """Hash of the text as it is sent to the model (tied to the model name)."""
+    payload = f"{EMBEDDING_MODEL}:{text_input[:MAX_INPUT_CHARS]}"
+    return hashlib.sha256(payload.encode()).hexdigest()
 
 
 class EmbeddingService:
@@ -43,8 +52,7 @@ class EmbeddingService:
         """Generate a 1536-dim embedding for a single text."""
         if not text_input or not text_input.strip():
             raise ValueError("Cannot embed empty text")
-        # Truncate to ~8000 tokens (~32K chars) to stay within model limits
-        truncated = text_input[:32000]
+        truncated = text_input[:MAX_INPUT_CHARS]
         resp = self.client.embeddings.create(
             model=EMBEDDING_MODEL,
             input=truncated,
@@ -55,7 +63,7 @@ class EmbeddingService:
         """Generate embeddings for up to 2048 texts in one API call."""
         if not texts:
             return []
-        truncated = [t[:32000] for t in texts if t and t.strip()]
+        truncated = [t[:MAX_INPUT_CHARS] for t in texts if t and t.strip()]
         resp = self.client.embeddings.create(
             model=EMBEDDING_MODEL,
             input=truncated,
@@ -92,63 +100,67 @@ class EmbeddingService:
             parts.append(prop.title)
         return " | ".join(p for p in parts if p)
 
-    def embed_property(self, db: Session, property_id: int) -> bool:
-        """Embed a property and store the vector."""
-        prop = db.query(Property).get(property_id)
-        if not prop:
-            return False
-        txt = self._property_text(prop)
+    @staticmethod
+    def _recap_text(recap: PropertyRecap) -> str:
+        return recap.recap_text or ""
+
+    @staticmethod
+    def _dossier_text(dossier: Dossier) -> str:
+        return dossier.markdown or ""
+
+    @staticmethod
+    def _evidence_text(ev: EvidenceItem) -> str:
+        if not ev.claim:
+            return ""
+        txt = ev.claim
+        if ev.raw_excerpt:
+            txt += " | " + ev.raw_excerpt
+        return txt
+
+    def _embed_record(self, db: Session, table: str, record, txt: str) -> bool:
+        """Embed ``txt`` for one row unless its content hash is unchanged and it has a vector."""
         if not txt.strip():
             return False
+        digest = content_hash(txt)
+        if record.embedding_hash == digest and db.execute(
+            text(f"SELECT embedding IS NOT NULL FROM {table} WHERE id = :id"), {"id": record.id}
+        ).scalar():
+            return True
         vec = self.generate_embedding(txt)
         db.execute(
-            text("UPDATE properties SET embedding = :vec WHERE id = :pid"),
-            {"vec": str(vec), "pid": property_id},
+            text(f"UPDATE {table} SET embedding = :vec, embedding_hash = :hash WHERE id = :id"),
+            {"vec": str(vec), "hash": digest, "id": record.id},
         )
         db.commit()
         return True
 
+    def embed_property(self, db: Session, property_id: int) -> bool:
+        """Embed a property and store the vector."""
+        prop = db.query(Property).get(property_id)
+        if not prop:
+            return False
+        return self._embed_record(db, "properties", prop, self._property_text(prop))
+
     def embed_recap(self, db: Session, recap_id: int) -> bool:
         """Embed a property recap's text."""
         recap = db.query(PropertyRecap).get(recap_id)
-        if not recap or not recap.recap_text:
+        if not recap:
             return False
-        vec = self.generate_embedding(recap.recap_text)
-        db.execute(
-            text("UPDATE property_recaps SET embedding = :vec WHERE id = :rid"),
-            {"vec": str(vec), "rid": recap_id},
-        )
-        db.commit()
-        return True
+        return self._embed_record(db, "property_recaps", recap, self._recap_text(recap))
 
     def embed_dossier(self, db: Session, dossier_id: int) -> bool:
         """Embed a research dossier's markdown."""
         dossier = db.query(Dossier).get(dossier_id)
-        if not dossier or not dossier.markdown:
+        if not dossier:
             return False
-        vec = self.generate_embedding(dossier.markdown)
-        db.execute(
-            text("UPDATE dossiers SET embedding = :vec WHERE id = :did"),
-            {"vec": str(vec), "did": dossier_id},
-        )
-        db.commit()
-        return True
+        return self._embed_record(db, "dossiers", dossier, self._dossier_text(dossier))
 
     def embed_evidence(self, db: Session, evidence_id: int) -> bool:
         """Embed an evidence item's claim + excerpt."""
         ev = db.query(EvidenceItem).get(evidence_id)
-        if not ev or not ev.claim:
+        if not ev:
             return False
-        txt = ev.claim
-        if ev.raw_excerpt:
-            txt += " | " + ev.raw_excerpt
-        vec = self.generate_embedding(txt)
-        db.execute(
-            text("UPDATE evidence SET embedding = :vec WHERE id = :eid"),
-            {"vec": str(vec), "eid": evidence_id},
-        )
-        db.commit()
-        return True
+        return self._embed_record(db, "evidence", ev, self._evidence_text(ev))
 
     # ── Semantic search ─────────────────────────────────────────────
 
@@ -317,86 +329,6 @@ class EmbeddingService:
             for r in rows
         ]
 
-    # ── Backfill ────────────────────────────────────────────────────
-
-    def backfill(self, db: Session, table: str = "all") -> dict:
-        """Backfill embeddings for existing records missing them."""
-        start = time.time()
-        results = {}
-
-        tables_to_process = []
-        if table in ("all", "properties"):
-            tables_to_process.append("properties")
-        if table in ("all", "property_recaps"):
-            tables_to_process.append("property_recaps")
-        if table in ("all", "dossiers"):
-            tables_to_process.append("dossiers")
-        if table in ("all", "evidence"):
-            tables_to_process.append("evidence")
-
-        for tbl in tables_to_process:
-            embedded = 0
-            skipped = 0
-            errors = 0
-
-            if tbl == "properties":
-                rows = db.execute(text("SELECT id FROM properties WHERE embedding IS NULL")).fetchall()
-                for row in rows:
-                    try:
-                        if self.embed_property(db, row.id):
-                            embedded += 1
-                        else:
-                            skipped += 1
-                    except Exception as e:
-                        logger.warning(f"Error embedding property {row.id}: {e}")
-                        errors += 1
-
-            elif tbl == "property_recaps":
-                rows = db.execute(text("SELECT id FROM property_recaps WHERE embedding IS NULL")).fetchall()
-                for row in rows:
-                    try:
-                        if self.embed_recap(db, row.id):
-                            embedded += 1
-                        else:
-                            skipped += 1
-                    except Exception as e:
-                        logger.warning(f"Error embedding recap {row.id}: {e}")
-                        errors += 1
-
-            elif tbl == "dossiers":
-                rows = db.execute(text("SELECT id FROM dossiers WHERE embedding IS NULL")).fetchall()
-                for row in rows:
-                    try:
-                        if self.embed_dossier(db, row.id):
-                            embedded += 1
-                        else:
-                            skipped += 1
-                    except Exception as e:
-                        logger.warning(f"Error embedding dossier {row.id}: {e}")
-                        errors += 1
-
-            elif tbl == "evidence":
-                rows = db.execute(text("SELECT id FROM evidence WHERE embedding IS NULL")).fetchall()
-                for row in rows:
-                    try:
-                        if self.embed_evidence(db, row.id):
-                            embedded += 1
-                        else:
-                            skipped += 1
-                    except Exception as e:
-                        logger.warning(f"Error embedding evidence {row.id}: {e}")
-                        errors += 1
-
-            results[tbl] = {
-                "total": embedded + skipped + errors,
-                "embedded": embedded,
-                "skipped": skipped,
-                "errors": errors,
-            }
-
-        duration = round(time.time() - start, 2)
-        return {"tables": results, "duration_seconds": duration}
-
 
 # Singleton
 embedding_service = EmbeddingService()
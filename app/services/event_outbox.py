@@ -0,0 +1,155 @@
+"""Durable event outbox on a Redis Stream.
+
+Events for durable subscribers are appended to ``EVENT_OUTBOX_STREAM``
+instead of being handled in the publishing process. The arq worker consumes
+the stream in a consumer group and hands each event to its own
+``EventBus.dispatch_durable``; an entry is acknowledged only after it was
+handled, so events outlive a restart of either side. Entries left pending by
+a consumer that died are reclaimed after ``claim_idle_ms``. An event the
+worker has no durable subscriber for is left pending and logged as an
+error, to be picked up once one is registered (see
+``app.services.event_subscribers``).
+
+Usage:
+    # API process (wired automatically when EVENT_OUTBOX_ENABLED=true)
+    event_bus.outbox = RedisStreamOutbox()
+
+    # arq worker startup
+    register_durable_subscribers(event_bus)
+    task = asyncio.create_task(RedisStreamOutbox().consume(event_bus, consumer="worker-1"))
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from app.config import settings
+from app.services.redis_cache import get_async_redis
+
+logger = logging.getLogger(__name__)
+
+CONSUMER_GROUP = "event-bus-workers"
+
+
+def encode_event(event: Any) -> str:
+    """JSON for an event dataclass (or dict), tagged with its class name."""
+    if dataclasses.is_dataclass(event):
+        body = {"cls": type(event).__name__, "data": dataclasses.asdict(event)}
+    else:
+        body = {"cls": None, "data": event}
+    return json.dumps(body, default=lambda v: v.isoformat() if isinstance(v, datetime) else str(v))
+
+
+def decode_event(payload: str) -> Any:
+    """Rebuild an event encoded by ``encode_event``."""
+    from app.services import observer
+
+    body = json.loads(payload)
+    cls = getattr(observer, body.get("cls") or "", None)
+    data = body["data"]
+    if not (isinstance(cls, type) and dataclasses.is_dataclass(cls)):
+        return data
+    for f in dataclasses.fields(cls):
+        if f.type is datetime and isinstance(data.get(f.name), str):
+            data[f.name] = datetime.fromisoformat(data[f.name])
+    return cls(**data)
+
+
+class RedisStreamOutbox:
+    """Append-only event log on a Redis Stream, consumed by a consumer group."""
+
+    def __init__(
+        self,
+        stream: Optional[str] = None,
+        maxlen: Optional[int] = None,
+        group: str = CONSUMER_GROUP,
+        claim_idle_ms: int = 60_000,
+        redis_factory: Callable = get_async_redis,
+    ):
+        self.stream = stream or settings.event_outbox_stream
+        self.maxlen = maxlen or settings.event_outbox_maxlen
+        self.group = group
+        self.claim_idle_ms = claim_idle_ms
+        self.redis_factory = redis_factory
+        self.appended = 0
+        self.delivered = 0
+        self.unhandled = 0
+
+    async def append(self, event_type, event: Any) -> bool:
+        """Append an event; False when Redis is unavailable (caller dispatches locally)."""
+        redis = await self.redis_factory()
+        if redis is None:
+            return False
+        try:
+            await redis.xadd(
+                self.stream,
+                {"event_type": event_type.value, "payload": encode_event(event)},
+                maxlen=self.maxlen,
+                approximate=True,
+            )
+        except Exception as e:
+            logger.warning("Event outbox append failed, dispatching locally: %s", e)
+            return False
+        self.appended += 1
+        return True
+
+    async def _ensure_group(self, redis) -> None:
+        try:
+            await redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _deliver(self, redis, bus, entries) -> None:
+        from app.services.observer import EventType
+
+        for entry_id, fields in entries:
+            try:
+                event_type = EventType(fields["event_type"])
+                event = decode_event(fields["payload"])
+            except Exception as e:
+                logger.error("Dropping malformed outbox entry %s: %s", entry_id, e)
+            else:
+                if not await bus.dispatch_durable(event_type, event):
+                    self.unhandled += 1
+                    logger.error(
+                        "No durable subscriber for outbox event %s (%s); leaving it pending",
+                        entry_id, event_type.value,
+                    )
+                    continue
+                self.delivered += 1
+            await redis.xack(self.stream, self.group, entry_id)
+
+    async def consume(self, bus, consumer: str, count: int = 100, block_ms: int = 5000) -> None:
+        """Deliver outbox events to ``bus`` until cancelled."""
+        redis = None
+        while True:
+            try:
+                if redis is None:
+                    redis = await self.redis_factory()
+                    if redis is None:
+                        await asyncio.sleep(5)
+                        continue
+                    await self._ensure_group(redis)
+
+                # Entries a dead consumer claimed but never acknowledged
+                _, stale, *_ = await redis.xautoclaim(
+                    self.stream, self.group, consumer, self.claim_idle_ms, start_id="0-0", count=count
+                )
+                if stale:
+                    await self._deliver(redis, bus, stale)
+
+                batches = await redis.xreadgroup(
+                    self.group, consumer, {self.stream: ">"}, count=count, block=block_ms
+                )
+                for _, entries in batches or []:
+                    await self._deliver(redis, bus, entries)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Event outbox consumer error: %s", e)
+                redis = None
+                await asyncio.sleep(1)
@@ -0,0 +1,38 @@
+"""Durable event bus subscribers.
+
+Durable subscribers have to be known on both sides of the outbox: the API
+process only appends an event to the stream when it has a durable subscriber
+for its type, and the arq worker hands what it reads back to its own
+subscribers. Both call ``register_durable_subscribers`` on startup, so declare
+durable handlers in ``DURABLE_SUBSCRIBERS`` rather than subscribing them with
+``durable=True`` somewhere only one process imports.
+
+Usage:
+    DURABLE_SUBSCRIBERS = [
+        (EventType.CONTRACT_COMPLETED, notify_closing_team, "closing_team_notifier"),
+    ]
+"""
+
+from typing import Callable, List, Tuple
+
+from app.services.observer import EventBus, EventType
+
+# (event type, handler, subscriber name)
+DURABLE_SUBSCRIBERS: List[Tuple[EventType, Callable, str]] = []
+
+
+def register_durable_subscribers(bus: EventBus) -> int:
+    """Subscribe every durable handler to ``bus`` once; returns how many were added."""
+    registered = {
+        (event_type, subscriber.name)
+        for event_type, subscribers in bus.subscribers.items()
+        for subscriber in subscribers
+        if subscriber.durable
+    }
+    added = 0
+    for event_type, handler, name in DURABLE_SUBSCRIBERS:
+        if (event_type, name) in registered:
+            continue
+        bus.subscribe(event_type, handler, name=name, durable=True)
+        added += 1
+    return added
@@ -1,8 +1,15 @@
+import hashlib
 from typing import Any
 
-import httpx
 
 from app.config import settings
+from app.services.tiered_cache import tiered_cache
+from app.utils.http_clients import http_clients
+
+# Finished research tasks never change, so they are cached; in-flight polls
+# and duplicate task submissions are coalesced into a single upstream call.
+exa_task_cache = tiered_cache("exa_research", ttl=86400)
+_TERMINAL_STATUSES = {"completed", "failed", "canceled", "cancelled"}
 
 
 class ExaResearchService:
@@ -106,7 +113,15 @@ class ExaResearchService:
         if not instructions.strip():
             raise ValueError("instructions cannot be empty")
 
-        async with httpx.AsyncClient() as client:
+        fingerprint = hashlib.sha256(f"{model}:{instructions}".encode()).hexdigest()
+        return await exa_task_cache.get_or_load(
+            f"create:{fingerprint}",
+            lambda: self._post_research_task(instructions, model),
+            ttl=0,
+        )
+
+    async def _post_research_task(self, instructions: str, model: str) -> dict[str, Any]:
+        async with http_clients.session("exa") as client:
             response = await client.post(
                 f"{self.base_url}/research/v1",
                 headers=self._headers(),
@@ -123,7 +138,14 @@ class ExaResearchService:
         if not task_id.strip():
             raise ValueError("task_id cannot be empty")
 
-        async with httpx.AsyncClient() as client:
+        return await exa_task_cache.get_or_load(
+            f"task:{task_id.strip()}",
+            lambda: self._fetch_research_task(task_id),
+            cache_if=lambda payload: (self.extract_status(payload) or "").lower() in _TERMINAL_STATUSES,
+        )
+
+    async def _fetch_research_task(self, task_id: str) -> dict[str, Any]:
+        async with http_clients.session("exa") as client:
             response = await client.get(
                 f"{self.base_url}/research/v1/{task_id.strip()}",
                 headers=self._headers(),
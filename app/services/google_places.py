@@ -1,6 +1,9 @@
-import httpx
 from app.config import settings
 from app.services.cache import google_places_cache
+from app.services.tiered_cache import tiered_cache
+from app.utils.http_clients import http_clients
+
+places_tiered_cache = tiered_cache("google_places", l1=google_places_cache, ttl=3600)
 
 
 class GooglePlacesService:
@@ -16,12 +19,16 @@ class GooglePlacesService:
         Get address suggestions from Google Places Autocomplete.
         Returns a list of predictions with place_id and description.
         """
-        cache_key = f"autocomplete:{input_text}:{country}"
-        cached = google_places_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        async with httpx.AsyncClient() as client:
+        cache_key = f"autocomplete:{input_text}:{types}:{country}"
+        return await places_tiered_cache.get_or_load(
+            cache_key,
+            lambda: self._fetch_autocomplete(input_text, types, country),
+            ttl=3600,  # 1 hour
+            cache_if=bool,
+        )
+
+    async def _fetch_autocomplete(self, input_text: str, types: str, country: str) -> list[dict]:
+        async with http_clients.session("google_places") as client:
             response = await client.get(
                 f"{self.BASE_URL}/autocomplete/json",
                 params={
@@ -48,7 +55,6 @@ class GooglePlacesService:
                 for p in data.get("predictions", [])
             ]
 
-            google_places_cache.set(cache_key, results, ttl_seconds=3600)  # 1 hour
             return results
 
     async def get_place_details(self, place_id: str) -> dict | None:
@@ -57,11 +63,14 @@ class GooglePlacesService:
         Returns parsed address components.
         """
         cache_key = f"place:{place_id}"
-        cached = google_places_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        async with httpx.AsyncClient() as client:
+        return await places_tiered_cache.get_or_load(
+            cache_key,
+            lambda: self._fetch_place_details(place_id),
+            ttl=86400,  # 24 hours
+        )
+
+    async def _fetch_place_details(self, place_id: str) -> dict | None:
+        async with http_clients.session("google_places") as client:
             response = await client.get(
                 f"{self.BASE_URL}/details/json",
                 params={
@@ -94,7 +103,6 @@ class GooglePlacesService:
                 "lng": result.get("geometry", {}).get("location", {}).get("lng"),
             }
 
-            google_places_cache.set(cache_key, details, ttl_seconds=86400)  # 24 hours
             return details
 
 
@@ -1,7 +1,8 @@
 """Hybrid Search Engine — SQLite FTS5 + Vector Cosine Similarity.
 
 Combines full-text search with semantic vector search for optimal results.
-No external vector database required — runs entirely in SQLite.
+No external vector database required — embeddings persist in SQLite and are
+served from a resident in-memory index (see ``app.services.vector_index``).
 """
 
 import logging
@@ -18,6 +19,7 @@ from sqlalchemy import text, and_, or_, func
 from app.models.property import Property
 from app.models.contact import Contact
 from app.config import settings
+from app.services.vector_index import PropertyVectorIndex
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,7 @@ class HybridSearchEngine:
 
         self.db_path = db_path
         self.conn = None
+        self.vector_index = PropertyVectorIndex()
         self._initialize()
 
     def _initialize(self):
@@ -51,6 +54,7 @@ class HybridSearchEngine:
             self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
             self._setup_fts5_tables()
             self._setup_vector_tables()
+            self._load_vector_index()
             logger.info("Hybrid search engine initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize hybrid search: {e}")
@@ -132,6 +136,52 @@ class HybridSearchEngine:
 
         self.conn.commit()
 
+    def _load_vector_index(self):
+        """Load persisted property embeddings into the resident vector index."""
+        if not self.conn:
+            return
+
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT e.property_id, e.embedding, p.workspace_id, p.agent_id
+                FROM property_embeddings e
+                LEFT JOIN properties p ON p.id = e.property_id
+            """)
+        except sqlite3.Error:
+            # No properties table in this database (e.g. PostgreSQL deployments)
+            cursor.execute("SELECT property_id, embedding, NULL, NULL FROM property_embeddings")
+
+        self.vector_index.clear()
+        loaded = 0
+        for prop_id, embedding_blob, workspace_id, agent_id in cursor.fetchall():
+            if not embedding_blob:
+                continue
+            try:
+                self.vector_index.upsert(
+                    prop_id,
+                    np.frombuffer(embedding_blob, dtype=np.float32),
+                    workspace_id=workspace_id,
+                    agent_id=agent_id,
+                )
+                loaded += 1
+            except ValueError as e:
+                logger.warning(f"Skipping embedding for property {prop_id}: {e}")
+        if loaded:
+            logger.info(f"Loaded {loaded} property embeddings into vector index")
+
+    def _lookup_property_owner(self, property_id: int) -> Tuple[Optional[int], Optional[int]]:
+        """Return (workspace_id, agent_id) for a property from the local database."""
+        if not self.conn:
+            return None, None
+        try:
+            row = self.conn.execute(
+                "SELECT workspace_id, agent_id FROM properties WHERE id = ?", (property_id,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None, None
+        return (row[0], row[1]) if row else (None, None)
+
     def search_properties(
         self,
         db: Session,
@@ -252,50 +302,22 @@ class HybridSearchEngine:
         agent_id: Optional[int],
         limit: int
     ) -> List[Dict]:
-        """Vector similarity search using cosine similarity."""
+        """Vector similarity search using the resident cosine-similarity index."""
         if not self.conn:
             return []
 
-        cursor = self.conn.cursor()
-
-        # Get all embeddings (with filters)
-        sql = "SELECT property_id, embedding FROM property_embeddings WHERE 1=1"
-        params = []
-
-        if workspace_id is not None:
-            sql += " AND property_id IN (SELECT id FROM properties WHERE workspace_id = ?)"
-            params.append(workspace_id)
-        if agent_id is not None:
-            sql += " AND property_id IN (SELECT id FROM properties WHERE agent_id = ?)"
-            params.append(agent_id)
-
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
-
-        # Calculate cosine similarities
-        similarities = []
-        query_norm = np.linalg.norm(query_embedding)
-
-        for prop_id, embedding_blob in rows:
-            # Deserialize embedding
-            embedding = np.frombuffer(embedding_blob, dtype=np.float32)
-
-            # Cosine similarity
-            emb_norm = np.linalg.norm(embedding)
-            if emb_norm > 0 and query_norm > 0:
-                similarity = np.dot(embedding, query_embedding) / (emb_norm * query_norm)
-            else:
-                similarity = 0
-
-            similarities.append({
-                "property_id": prop_id,
-                "vector_score": float(similarity)
-            })
-
-        # Sort by similarity
-        similarities.sort(key=lambda x: x["vector_score"], reverse=True)
+        try:
+            matches = self.vector_index.search(
+                query_embedding, limit=limit, workspace_id=workspace_id, agent_id=agent_id
+            )
+        except ValueError as e:
+            logger.warning(f"Vector search failed: {e}")
+            return []
 
-        return similarities[:limit]
+        return [
+            {"property_id": prop_id, "vector_score": score}
+            for prop_id, score in matches
+        ]
 
     def _combine_scores(
         self,
@@ -353,13 +375,22 @@ class HybridSearchEngine:
             logger.error(f"Embedding API failed, using fallback: {e}")
             return np.random.randn(1536).tolist()
 
-    def index_property(self, property_id: int, text: str, embedding: Optional[List[float]] = None):
+    def index_property(
+        self,
+        property_id: int,
+        text: str,
+        embedding: Optional[List[float]] = None,
+        workspace_id: Optional[int] = None,
+        agent_id: Optional[int] = None,
+    ):
         """Index a property for FTS5 and vector search.
 
         Args:
             property_id: Property ID
             text: Text content to index (address, description, etc.)
             embedding: Vector embedding (optional)
+            workspace_id: Owning workspace, used for filtered vector search
+            agent_id: Owning agent, used for filtered vector search
         """
         if not self.conn:
             return
@@ -383,6 +414,13 @@ class HybridSearchEngine:
 
             self.conn.commit()
 
+            if embedding:
+                if workspace_id is None and agent_id is None:
+                    workspace_id, agent_id = self._lookup_property_owner(property_id)
+                self.vector_index.upsert(
+                    property_id, embedding, workspace_id=workspace_id, agent_id=agent_id
+                )
+
         except Exception as e:
             logger.error(f"Failed to index property {property_id}: {e}")
             self.conn.rollback()
@@ -391,12 +429,7 @@ class HybridSearchEngine:
         """Check if any embeddings exist."""
         if not self.conn:
             return False
-
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM property_embeddings")
-        row = cursor.fetchone()
-        count = row[0] if row else 0
-        return count > 0
+        return len(self.vector_index) > 0
 
     def search_similar_properties(
         self,
@@ -416,55 +449,17 @@ class HybridSearchEngine:
         """
         if not self.conn:
             # Fallback to database query without vectors
-            prop = db.query(Property).filter(Property.id == property_id).first()
-            if not prop:
-                return []
-
-            # Simple similarity by city and property type
-            similar = db.query(Property).filter(
-                Property.id != property_id,
-                Property.city == prop.city,
-                Property.property_type == prop.property_type
-            ).limit(limit).all()
+            return self._similar_by_attributes(db, property_id, limit)
 
-            return similar
+        ref_embedding = self.vector_index.get_vector(property_id)
 
-        cursor = self.conn.cursor()
-
-        # Get reference property embedding
-        cursor.execute(
-            "SELECT embedding FROM property_embeddings WHERE property_id = ?",
-            (property_id,)
-        )
-        row = cursor.fetchone()
-
-        if not row:
+        if ref_embedding is None:
             # No embedding found, fallback to DB query
-            return self.search_similar_properties(db, property_id, limit)
-
-        ref_embedding = np.frombuffer(row[0], dtype=np.float32)
+            return self._similar_by_attributes(db, property_id, limit)
 
-        # Get all other embeddings
-        cursor.execute(
-            "SELECT property_id, embedding FROM property_embeddings WHERE property_id != ?",
-            (property_id,)
+        similarities = self.vector_index.search(
+            ref_embedding, limit=limit, exclude_ids=[property_id]
         )
-        rows = cursor.fetchall()
-
-        # Calculate similarities
-        similarities = []
-        ref_norm = np.linalg.norm(ref_embedding)
-
-        for prop_id, embedding_blob in rows:
-            embedding = np.frombuffer(embedding_blob, dtype=np.float32)
-            emb_norm = np.linalg.norm(embedding)
-
-            if emb_norm > 0 and ref_norm > 0:
-                similarity = np.dot(embedding, ref_embedding) / (emb_norm * ref_norm)
-                similarities.append((prop_id, float(similarity)))
-
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
 
         # Fetch top properties
         top_ids = [pid for pid, _ in similarities[:limit]]
@@ -479,6 +474,18 @@ class HybridSearchEngine:
 
         return sorted_properties
 
+    def _similar_by_attributes(self, db: Session, property_id: int, limit: int) -> List[Property]:
+        """Simple similarity by city and property type (no vectors)."""
+        prop = db.query(Property).filter(Property.id == property_id).first()
+        if not prop:
+            return []
+
+        return db.query(Property).filter(
+            Property.id != property_id,
+            Property.city == prop.city,
+            Property.property_type == prop.property_type
+        ).limit(limit).all()
+
     def close(self):
         """Close database connection."""
         if self.conn:
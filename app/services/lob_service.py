@@ -4,13 +4,18 @@ Lob.com Direct Mail API Service
 Handles all communication with Lob's API for sending postcards, letters, and checks.
 """
 
-import os
+import asyncio
+import logging
+import re
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import httpx
 from jinja2 import Template
 
 from app.config import settings
+from app.utils.rate_limit import TokenBucket
+from app.services.tiered_cache import tiered_cache
+from app.utils.http_clients import http_clients
 from app.schemas.direct_mail import (
     AddressSchema,
     PostcardSize,
@@ -19,6 +24,49 @@ from app.schemas.direct_mail import (
     MailStatus
 )
 
+logger = logging.getLogger(__name__)
+
+# Verified addresses barely change; cached by normalized address.
+lob_verification_cache = tiered_cache("lob_verification", ttl=30 * 86400)
+
+_MAX_RATE_LIMIT_RETRIES = 3
+
+_STREET_SUFFIXES = {
+    "STREET": "ST", "AVENUE": "AVE", "ROAD": "RD", "DRIVE": "DR", "BOULEVARD": "BLVD",
+    "LANE": "LN", "COURT": "CT", "PLACE": "PL", "TERRACE": "TER", "CIRCLE": "CIR",
+    "PARKWAY": "PKWY", "HIGHWAY": "HWY", "SUITE": "STE", "APARTMENT": "APT",
+    "NORTH": "N", "SOUTH": "S", "EAST": "E", "WEST": "W",
+}
+
+
+def normalize_address_key(address: Dict[str, str]) -> str:
+    """Cache key for an address: upper-cased, punctuation-free, common suffixes abbreviated, ZIP5."""
+    def clean(value) -> str:
+        words = re.sub(r"[^A-Z0-9 ]", " ", str(value or "").upper()).split()
+        return " ".join(_STREET_SUFFIXES.get(w, w) for w in words)
+
+    zip5 = re.sub(r"[^0-9]", "", str(address.get("address_zip") or ""))[:5]
+    return "|".join((
+        clean(address.get("address_line1")),
+        clean(address.get("address_line2")),
+        clean(address.get("address_city")),
+        clean(address.get("address_state")),
+        zip5,
+    ))
+
+
+class LobRateLimiter:
+    """Paces requests on a token bucket; callers wait for a token instead of hitting 429s."""
+
+    def __init__(self, rate_per_minute: int, burst: int | None = None):
+        self.bucket = TokenBucket(rate_per_minute, capacity=burst)
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while not self.bucket.take(1):
+                await asyncio.sleep(self.bucket.seconds_until_available())
+
 
 class LobClient:
     """
@@ -45,13 +93,23 @@ class LobClient:
         "failed": MailStatus.FAILED,
     }
 
-    def __init__(self, api_key: str = None, test_mode: bool = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        test_mode: bool = None,
+        base_url: str = None,
+        rate_limit_per_minute: int = None,
+        max_concurrency: int = None,
+    ):
         """
         Initialize Lob client
 
         Args:
             api_key: Lob API key (defaults to settings.lob_api_key)
             test_mode: If True, uses test mode (no actual mail sent, defaults to settings.lob_test_mode)
+            base_url: API base URL (defaults to settings.lob_base_url)
+            rate_limit_per_minute: Request pacing (defaults to settings.lob_rate_limit_per_minute)
+            max_concurrency: Requests in flight for batch operations (defaults to settings.lob_max_concurrency)
         """
         self.api_key = api_key or settings.lob_api_key
         self.test_mode = test_mode if test_mode is not None else settings.lob_test_mode
@@ -59,20 +117,43 @@ class LobClient:
         if not self.api_key:
             raise ValueError("LOB_API_KEY must be set in environment or passed to constructor")
 
+        self.max_concurrency = max(1, max_concurrency or settings.lob_max_concurrency)
+        rate = rate_limit_per_minute or settings.lob_rate_limit_per_minute
+        # Lob allows short bursts; allow five seconds' worth.
+        self.rate_limiter = LobRateLimiter(rate, burst=max(1, rate // 12))
+
+        # Per-key headers, but connections come from the shared Lob pool.
         self.client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
+            base_url=base_url or settings.lob_base_url or self.BASE_URL,
             headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Lob-Version": self.API_VERSION,
                 "Content-Type": "application/json"
             },
-            timeout=30.0
+            timeout=30.0,
+            transport=http_clients.transport("lob"),
         )
 
     async def close(self):
-        """Close the HTTP client"""
+        """Close the HTTP client (the shared connection pool stays open)"""
         await self.client.aclose()
 
+    async def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send a paced request, backing off and retrying when Lob answers 429."""
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            await self.rate_limiter.acquire()
+            response = await getattr(self.client, method)(path, **kwargs)
+            if response.status_code != 429 or attempt == _MAX_RATE_LIMIT_RETRIES:
+                break
+            try:
+                delay = float(response.headers.get("Retry-After", 1))
+            except (TypeError, ValueError):
+                delay = 1.0
+            logger.info("Lob rate limited on %s; retrying in %.1fs", path, delay)
+            await asyncio.sleep(delay)
+        response.raise_for_status()
+        return response
+
     # ==========================================================================
     # ADDRESS VERIFICATION
     # ==========================================================================
@@ -101,35 +182,48 @@ class LobClient:
             "zip_code": address.get("address_zip", "")
         }
 
-        response = await self.client.post("/us_verifications", json=payload)
-        response.raise_for_status()
-
+        response = await self._send("post", "/us_verifications", json=payload)
         return response.json()
 
+    async def verify_address_cached(self, address: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Verify an address, reusing earlier results for the same normalized address
+
+        Concurrent lookups of one address share a single request. The
+        ``recipient`` of a cached result is replaced with this address's name.
+        """
+        key = f"{'test' if self.test_mode else 'live'}:{normalize_address_key(address)}"
+        verified = await lob_verification_cache.get_or_load(key, lambda: self.verify_address(address))
+        return {**verified, "recipient": address.get("name", "")}
+
     async def verify_address_batch(
         self,
-        addresses: List[Dict[str, str]]
+        addresses: List[Dict[str, str]],
+        max_concurrency: int = None
     ) -> List[Dict[str, Any]]:
         """
-        Verify multiple addresses
+        Verify multiple addresses concurrently, within the client's rate limit
 
         Args:
             addresses: List of address dictionaries
+            max_concurrency: Requests in flight (defaults to the client's max_concurrency)
 
         Returns:
-            List of verified addresses
+            List of verified addresses, in input order
         """
-        results = []
-        for address in addresses:
-            try:
-                verified = await self.verify_address(address)
-                results.append(verified)
-            except Exception as e:
-                results.append({
-                    "error": str(e),
-                    "original_address": address
-                })
-        return results
+        slots = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def verify(address: Dict[str, str]) -> Dict[str, Any]:
+            async with slots:
+                try:
+                    return await self.verify_address_cached(address)
+                except Exception as e:
+                    return {
+                        "error": str(e),
+                        "original_address": address
+                    }
+
+        return list(await asyncio.gather(*(verify(address) for address in addresses)))
 
     # ==========================================================================
     # POSTCARDS
@@ -144,7 +238,8 @@ class LobClient:
         size: str = "4x6",
         merge_variables: Dict[str, Any] = None,
         send_after: datetime = None,
-        metadata: Dict[str, Any] = None
+        metadata: Dict[str, Any] = None,
+        idempotency_key: str = None
     ) -> Dict[str, Any]:
         """
         Send a postcard
@@ -158,6 +253,7 @@ class LobClient:
             merge_variables: Variables to merge into HTML templates
             send_after: Schedule for future sending
             metadata: Additional metadata
+            idempotency_key: Resubmitting with the same key returns the original postcard
 
         Returns:
             Lob postcard response
@@ -188,9 +284,9 @@ class LobClient:
         if self.test_mode:
             payload["test_mode"] = True
 
-        response = await self.client.post("/postcards", json=payload)
-        response.raise_for_status()
-
+        response = await self._send(
+            "post", "/postcards", json=payload, headers=self._idempotency_headers(idempotency_key)
+        )
         return response.json()
 
     async def get_postcard(self, postcard_id: str) -> Dict[str, Any]:
@@ -236,7 +332,8 @@ class LobClient:
         size: str = "letter",
         send_after: datetime = None,
         metadata: Dict[str, Any] = None,
-        merge_variables: Dict[str, Any] = None
+        merge_variables: Dict[str, Any] = None,
+        idempotency_key: str = None
     ) -> Dict[str, Any]:
         """
         Send a letter
@@ -253,6 +350,7 @@ class LobClient:
             send_after: Schedule for future sending
             metadata: Additional metadata
             merge_variables: Variables for template merging
+            idempotency_key: Resubmitting with the same key returns the original letter
 
         Returns:
             Lob letter response
@@ -284,9 +382,9 @@ class LobClient:
         if self.test_mode:
             payload["test_mode"] = True
 
-        response = await self.client.post("/letters", json=payload)
-        response.raise_for_status()
-
+        response = await self._send(
+            "post", "/letters", json=payload, headers=self._idempotency_headers(idempotency_key)
+        )
         return response.json()
 
     async def get_letter(self, letter_id: str) -> Dict[str, Any]:
@@ -433,6 +531,10 @@ class LobClient:
     # HELPER METHODS
     # ==========================================================================
 
+    @staticmethod
+    def _idempotency_headers(idempotency_key: Optional[str]) -> Dict[str, str]:
+        return {"Idempotency-Key": idempotency_key} if idempotency_key else {}
+
     def _format_address(self, address: Dict[str, str]) -> Dict[str, str]:
         """
         Format address dictionary for Lob API
@@ -1,16 +1,43 @@
-"""Persistent memory graph for voice sessions."""
+"""Persistent memory graph for voice sessions.
+
+Writes are buffered per database session: ``upsert_node`` and ``upsert_edge``
+merge into an in-memory ``GraphWriteBuffer`` kept in ``db.info``, and the
+buffer is written with one multi-row ``INSERT ... ON CONFLICT DO UPDATE`` for
+nodes and one for edges when the session commits (or before a graph read, or
+on ``flush``). A voice turn that remembers a property, a contact and a
+contract therefore costs two statements instead of a SELECT and an
+INSERT/UPDATE per node and edge. Node ids and session state values seen by
+the session are cached in the buffer, so repeat lookups skip the database.
+
+``get_session_summary`` loads recent nodes, recent edges and the session
+state keys in a single UNION ALL query.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from hashlib import sha1
 from typing import Any
 
+from sqlalchemy import Integer, String, case, cast, desc, event, func, literal, null, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.models.voice_memory import VoiceMemoryEdge, VoiceMemoryNode
 
+SESSION_STATE_KEYS = (
+    "last_property_id",
+    "last_property_address",
+    "last_contact_id",
+    "last_contact_name",
+    "last_contract_id",
+    "last_contract_name",
+)
+
+_BUFFER_KEY = "memory_graph_buffer"
+
 
 @dataclass
 class MemoryRef:
@@ -18,6 +45,70 @@ class MemoryRef:
     node_key: str
 
 
+@dataclass
+class PendingNode:
+    """A node upsert waiting for the next flush; ``id`` is set once written."""
+    session_id: str
+    node_type: str
+    node_key: str
+    summary: str | None
+    payload: dict[str, Any] | None
+    importance: float
+    last_seen_at: datetime
+    id: int | None = None
+
+
+@dataclass
+class PendingEdge:
+    session_id: str
+    source: tuple[str, str, str]
+    target: tuple[str, str, str]
+    relation: str
+    weight: float
+    payload: dict[str, Any] | None
+    last_seen_at: datetime
+
+
+@dataclass
+class GraphWriteBuffer:
+    """Per-database-session graph writes and caches."""
+    nodes: dict[tuple[str, str, str], PendingNode] = field(default_factory=dict)
+    edges: dict[tuple, PendingEdge] = field(default_factory=dict)
+    node_ids: dict[tuple[str, str, str], int] = field(default_factory=dict)
+    state: dict[tuple[str, str], Any] = field(default_factory=dict)
+
+    def discard(self, session_id: str | None = None) -> None:
+        if session_id is None:
+            self.nodes.clear()
+            self.edges.clear()
+            self.node_ids.clear()
+            self.state.clear()
+            return
+        for cache in (self.nodes, self.edges, self.node_ids, self.state):
+            for key in [k for k in cache if k[0] == session_id]:
+                del cache[key]
+
+
+def _buffer(db: Session) -> GraphWriteBuffer:
+    buffer = db.info.get(_BUFFER_KEY)
+    if buffer is None:
+        buffer = db.info[_BUFFER_KEY] = GraphWriteBuffer()
+    return buffer
+
+
+def _write_buffer(db: Session) -> GraphWriteBuffer:
+    """The buffer, with the session's transaction begun so a rollback discards it."""
+    if not db.in_transaction():
+        # Session.rollback() is a no-op without a transaction, so writes
+        # buffered before any SQL would otherwise survive it.
+        db.begin()
+    return _buffer(db)
+
+
+def _greater(left, right):
+    return case((left > right, left), else_=right)
+
+
 class MemoryGraphService:
     """Store and retrieve durable conversational context as a graph."""
 
@@ -30,20 +121,14 @@ class MemoryGraphService:
         summary: str | None = None,
         payload: dict[str, Any] | None = None,
         importance: float = 0.5,
-    ) -> VoiceMemoryNode:
-        node = (
-            db.query(VoiceMemoryNode)
-            .filter(
-                VoiceMemoryNode.session_id == session_id,
-                VoiceMemoryNode.node_type == node_type,
-                VoiceMemoryNode.node_key == node_key,
-            )
-            .first()
-        )
-
+    ) -> PendingNode:
+        """Queue a node upsert; written on the next flush or commit."""
+        buffer = _write_buffer(db)
+        ref = (session_id, node_type, node_key)
         now = datetime.utcnow()
+        node = buffer.nodes.get(ref)
         if node is None:
-            node = VoiceMemoryNode(
+            node = buffer.nodes[ref] = PendingNode(
                 session_id=session_id,
                 node_type=node_type,
                 node_key=node_key,
@@ -51,16 +136,15 @@ class MemoryGraphService:
                 payload=payload,
                 importance=importance,
                 last_seen_at=now,
+                id=buffer.node_ids.get(ref),
             )
-            db.add(node)
-            db.flush()
-            return node
-
-        node.summary = summary or node.summary
-        node.payload = payload if payload is not None else node.payload
-        node.importance = max(node.importance, importance)
-        node.last_seen_at = now
-        db.flush()
+        else:
+            node.summary = summary or node.summary
+            node.payload = payload if payload is not None else node.payload
+            node.importance = max(node.importance, importance)
+            node.last_seen_at = now
+        if node_type == "session_state" and payload is not None:
+            buffer.state[(session_id, node_key)] = payload.get("value")
         return node
 
     def upsert_edge(
@@ -72,53 +156,169 @@ class MemoryGraphService:
         relation: str,
         weight: float = 1.0,
         payload: dict[str, Any] | None = None,
-    ) -> VoiceMemoryEdge:
-        source_node = self.upsert_node(
-            db,
-            session_id=session_id,
-            node_type=source.node_type,
-            node_key=source.node_key,
-        )
-        target_node = self.upsert_node(
-            db,
-            session_id=session_id,
-            node_type=target.node_type,
-            node_key=target.node_key,
-        )
-
-        edge = (
-            db.query(VoiceMemoryEdge)
-            .filter(
-                VoiceMemoryEdge.session_id == session_id,
-                VoiceMemoryEdge.source_node_id == source_node.id,
-                VoiceMemoryEdge.target_node_id == target_node.id,
-                VoiceMemoryEdge.relation == relation,
-            )
-            .first()
-        )
-
+    ) -> PendingEdge:
+        """Queue an edge upsert (and its endpoint nodes); written on the next flush or commit."""
+        self.upsert_node(db, session_id=session_id, node_type=source.node_type, node_key=source.node_key)
+        self.upsert_node(db, session_id=session_id, node_type=target.node_type, node_key=target.node_key)
+
+        buffer = _write_buffer(db)
+        source_ref = (session_id, source.node_type, source.node_key)
+        target_ref = (session_id, target.node_type, target.node_key)
+        ref = (session_id, source_ref, target_ref, relation)
         now = datetime.utcnow()
+        edge = buffer.edges.get(ref)
         if edge is None:
-            edge = VoiceMemoryEdge(
+            edge = buffer.edges[ref] = PendingEdge(
                 session_id=session_id,
-                source_node_id=source_node.id,
-                target_node_id=target_node.id,
+                source=source_ref,
+                target=target_ref,
                 relation=relation,
                 weight=weight,
                 payload=payload,
                 last_seen_at=now,
             )
-            db.add(edge)
-            db.flush()
-            return edge
+        else:
+            edge.weight = max(edge.weight, weight)
+            edge.payload = payload if payload is not None else edge.payload
+            edge.last_seen_at = now
+        return edge
 
-        edge.weight = max(edge.weight, weight)
-        edge.payload = payload if payload is not None else edge.payload
-        edge.last_seen_at = now
+    # ─── FLUSH ───
+
+    def flush(self, db: Session) -> None:
+        """Write buffered nodes and edges to the database (does not commit)."""
+        buffer = db.info.get(_BUFFER_KEY)
+        if buffer is None or not (buffer.nodes or buffer.edges):
+            return
+        nodes, edges = list(buffer.nodes.values()), list(buffer.edges.values())
+        buffer.nodes.clear()
+        buffer.edges.clear()
+
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = pg_insert if dialect == "postgresql" else sqlite_insert
+            self._write_nodes(db, insert, nodes, buffer)
+            if edges:
+                self._write_edges(db, insert, edges, buffer)
+        else:
+            for node in nodes:
+                self._write_node_row(db, node, buffer)
+            for edge in edges:
+                self._write_edge_row(db, edge, buffer)
         db.flush()
-        return edge
 
-    def remember_session_state(self, db: Session, session_id: str, key: str, value: Any) -> VoiceMemoryNode:
+    def _write_nodes(self, db: Session, insert, nodes: list[PendingNode], buffer: GraphWriteBuffer) -> None:
+        table = VoiceMemoryNode.__table__
+        stmt = insert(table).values([
+            {
+                "session_id": n.session_id,
+                "node_type": n.node_type,
+                "node_key": n.node_key,
+                "summary": n.summary,
+                # SQL NULL (not JSON null), so the conflict update keeps the stored payload
+                "payload": n.payload if n.payload is not None else null(),
+                "importance": n.importance,
+                "last_seen_at": n.last_seen_at,
+            }
+            for n in nodes
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["session_id", "node_type", "node_key"],
+            set_={
+                "summary": func.coalesce(stmt.excluded.summary, table.c.summary),
+                "payload": func.coalesce(stmt.excluded.payload, table.c.payload),
+                "importance": _greater(stmt.excluded.importance, table.c.importance),
+                "last_seen_at": stmt.excluded.last_seen_at,
+                "updated_at": func.now(),
+            },
+        ).returning(table.c.id, table.c.session_id, table.c.node_type, table.c.node_key)
+        for row in db.execute(stmt):
+            buffer.node_ids[(row.session_id, row.node_type, row.node_key)] = row.id
+        for n in nodes:
+            n.id = buffer.node_ids.get((n.session_id, n.node_type, n.node_key))
+
+    def _write_edges(self, db: Session, insert, edges: list[PendingEdge], buffer: GraphWriteBuffer) -> None:
+        table = VoiceMemoryEdge.__table__
+        stmt = insert(table).values([
+            {
+                "session_id": e.session_id,
+                "source_node_id": buffer.node_ids[e.source],
+                "target_node_id": buffer.node_ids[e.target],
+                "relation": e.relation,
+                "weight": e.weight,
+                "payload": e.payload if e.payload is not None else null(),
+                "last_seen_at": e.last_seen_at,
+            }
+            for e in edges
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["session_id", "source_node_id", "target_node_id", "relation"],
+            set_={
+                "weight": _greater(stmt.excluded.weight, table.c.weight),
+                "payload": func.coalesce(stmt.excluded.payload, table.c.payload),
+                "last_seen_at": stmt.excluded.last_seen_at,
+            },
+        )
+        db.execute(stmt)
+
+    def _write_node_row(self, db: Session, pending: PendingNode, buffer: GraphWriteBuffer) -> None:
+        """Portable SELECT-then-INSERT/UPDATE for databases without ON CONFLICT."""
+        node = (
+            db.query(VoiceMemoryNode)
+            .filter(
+                VoiceMemoryNode.session_id == pending.session_id,
+                VoiceMemoryNode.node_type == pending.node_type,
+                VoiceMemoryNode.node_key == pending.node_key,
+            )
+            .first()
+        )
+        if node is None:
+            node = VoiceMemoryNode(
+                session_id=pending.session_id,
+                node_type=pending.node_type,
+                node_key=pending.node_key,
+                summary=pending.summary,
+                payload=pending.payload,
+                importance=pending.importance,
+                last_seen_at=pending.last_seen_at,
+            )
+            db.add(node)
+        else:
+            node.summary = pending.summary or node.summary
+            node.payload = pending.payload if pending.payload is not None else node.payload
+            node.importance = max(node.importance, pending.importance)
+            node.last_seen_at = pending.last_seen_at
+        db.flush()
+        pending.id = buffer.node_ids[(pending.session_id, pending.node_type, pending.node_key)] = node.id
+
+    def _write_edge_row(self, db: Session, pending: PendingEdge, buffer: GraphWriteBuffer) -> None:
+        source_id, target_id = buffer.node_ids[pending.source], buffer.node_ids[pending.target]
+        edge = (
+            db.query(VoiceMemoryEdge)
+            .filter(
+                VoiceMemoryEdge.session_id == pending.session_id,
+                VoiceMemoryEdge.source_node_id == source_id,
+                VoiceMemoryEdge.target_node_id == target_id,
+                VoiceMemoryEdge.relation == pending.relation,
+            )
+            .first()
+        )
+        if edge is None:
+            db.add(VoiceMemoryEdge(
+                session_id=pending.session_id,
+                source_node_id=source_id,
+                target_node_id=target_id,
+                relation=pending.relation,
+                weight=pending.weight,
+                payload=pending.payload,
+                last_seen_at=pending.last_seen_at,
+            ))
+        else:
+            edge.weight = max(edge.weight, pending.weight)
+            edge.payload = pending.payload if pending.payload is not None else edge.payload
+            edge.last_seen_at = pending.last_seen_at
+
+    def remember_session_state(self, db: Session, session_id: str, key: str, value: Any) -> PendingNode:
         value_payload = {"value": value}
         return self.upsert_node(
             db,
@@ -131,18 +331,19 @@ class MemoryGraphService:
         )
 
     def get_session_state(self, db: Session, session_id: str, key: str) -> Any | None:
-        node = (
-            db.query(VoiceMemoryNode)
-            .filter(
+        buffer = _buffer(db)
+        if (session_id, key) in buffer.state:
+            return buffer.state[(session_id, key)]
+        payload = db.execute(
+            select(VoiceMemoryNode.payload).where(
                 VoiceMemoryNode.session_id == session_id,
                 VoiceMemoryNode.node_type == "session_state",
                 VoiceMemoryNode.node_key == key,
             )
-            .first()
-        )
-        if not node or not node.payload:
-            return None
-        return node.payload.get("value")
+        ).scalar()
+        value = payload.get("value") if payload else None
+        buffer.state[(session_id, key)] = value
+        return value
 
     def remember_property(
         self,
@@ -152,7 +353,7 @@ class MemoryGraphService:
         address: str | None = None,
         city: str | None = None,
         state: str | None = None,
-    ) -> VoiceMemoryNode:
+    ) -> PendingNode:
         payload = {
             "property_id": property_id,
             "address": address,
@@ -181,7 +382,7 @@ class MemoryGraphService:
         name: str,
         role: str | None = None,
         property_id: int | None = None,
-    ) -> VoiceMemoryNode:
+    ) -> PendingNode:
         payload = {
             "contact_id": contact_id,
             "name": name,
@@ -220,7 +421,7 @@ class MemoryGraphService:
         status: str | None = None,
         property_id: int | None = None,
         contact_id: int | None = None,
-    ) -> VoiceMemoryNode:
+    ) -> PendingNode:
         payload = {
             "contract_id": contract_id,
             "name": name,
@@ -262,7 +463,7 @@ class MemoryGraphService:
 
     # ─── SPACEBOT-ALIGNED MEMORY TYPES ───
 
-    def remember_fact(self, db: Session, session_id: str, fact: str, category: str | None = None) -> VoiceMemoryNode:
+    def remember_fact(self, db: Session, session_id: str, fact: str, category: str | None = None) -> PendingNode:
         """Store a learned fact (Spacebot: 'Fact' type).
         Examples: 'Property 5 has a pool', 'Miami market is up 5%', 'Closing takes 30 days'
         """
@@ -278,7 +479,7 @@ class MemoryGraphService:
             importance=0.75,
         )
 
-    def remember_preference(self, db: Session, session_id: str, preference: str, entity_type: str | None = None, entity_id: str | None = None) -> VoiceMemoryNode:
+    def remember_preference(self, db: Session, session_id: str, preference: str, entity_type: str | None = None, entity_id: str | None = None) -> PendingNode:
         """Store user preferences (Spacebot: 'Preference' type).
         Examples: 'Prefers condos over houses', 'Wants properties under $500k', 'Likes modern kitchens'
         """
@@ -306,7 +507,7 @@ class MemoryGraphService:
             )
         return node
 
-    def remember_decision(self, db: Session, session_id: str, decision: str, context: dict[str, Any] | None = None) -> VoiceMemoryNode:
+    def remember_decision(self, db: Session, session_id: str, decision: str, context: dict[str, Any] | None = None) -> PendingNode:
         """Store decisions made (Spacebot: 'Decision' type).
         Examples: 'Selected offer at $480k', 'Chose FHA financing', 'Decided to counter-offer'
         """
@@ -322,7 +523,7 @@ class MemoryGraphService:
             importance=0.95,
         )
 
-    def remember_identity(self, db: Session, session_id: str, entity_type: str, entity_id: str, identity_data: dict[str, Any]) -> VoiceMemoryNode:
+    def remember_identity(self, db: Session, session_id: str, entity_type: str, entity_id: str, identity_data: dict[str, Any]) -> PendingNode:
         """Store identity information (Spacebot: 'Identity' type).
         Examples: 'John Smith is a first-time buyer', 'Property 5 is a luxury condo', 'Seller is motivated'
         """
@@ -364,7 +565,7 @@ class MemoryGraphService:
         )
         return node
 
-    def remember_event(self, db: Session, session_id: str, event_type: str, description: str, entities: list[dict[str, str]] | None = None, timestamp: datetime | None = None) -> VoiceMemoryNode:
+    def remember_event(self, db: Session, session_id: str, event_type: str, description: str, entities: list[dict[str, str]] | None = None, timestamp: datetime | None = None) -> PendingNode:
         """Store events that happened (Spacebot: 'Event' type).
         Examples: 'Phone call with John Smith', 'Property showing at 123 Main St', 'Contract signed'
         """
@@ -402,7 +603,7 @@ class MemoryGraphService:
                     )
         return node
 
-    def remember_observation(self, db: Session, session_id: str, observation: str, category: str | None = None, confidence: float = 0.8) -> VoiceMemoryNode:
+    def remember_observation(self, db: Session, session_id: str, observation: str, category: str | None = None, confidence: float = 0.8) -> PendingNode:
         """Store agent observations (Spacebot: 'Observation' type).
         Examples: 'Market is slowing down', 'Buyers are negotiating harder', 'Properties under $400k move fast'
         """
@@ -418,7 +619,7 @@ class MemoryGraphService:
             importance=0.82,
         )
 
-    def remember_goal(self, db: Session, session_id: str, goal: str, metadata: dict[str, Any] | None = None, priority: str = "high") -> VoiceMemoryNode:
+    def remember_goal(self, db: Session, session_id: str, goal: str, metadata: dict[str, Any] | None = None, priority: str = "high") -> PendingNode:
         """Store goals to achieve (Spacebot: 'Goal' type).
         Examples: 'Close deal on property 5 by Friday', 'Find 3 Miami condos under $400k'
         """
@@ -439,7 +640,7 @@ class MemoryGraphService:
             importance=importance,
         )
 
-    def remember_todo(self, db: Session, session_id: str, task: str, due_at: str | None = None, property_id: int | None = None, contact_id: int | None = None) -> VoiceMemoryNode:
+    def remember_todo(self, db: Session, session_id: str, task: str, due_at: str | None = None, property_id: int | None = None, contact_id: int | None = None) -> PendingNode:
         """Store actionable todos (Spacebot: 'Todo' type).
         Examples: 'Call John Smith by Friday', 'Send contract by 5 PM', 'Follow up on property 5'
         """
@@ -477,7 +678,7 @@ class MemoryGraphService:
 
     # ─── LEGACY SUPPORT (mapped to new types) ───
 
-    def remember_objection(self, db: Session, session_id: str, text: str, topic: str | None = None) -> VoiceMemoryNode:
+    def remember_objection(self, db: Session, session_id: str, text: str, topic: str | None = None) -> PendingNode:
         """Legacy method - now mapped to 'preference' type."""
         return self.remember_preference(db, session_id, preference=text, entity_type="objection", entity_id=topic)
 
@@ -488,7 +689,7 @@ class MemoryGraphService:
         promise_text: str,
         due_at: str | None = None,
         fulfilled: bool = False,
-    ) -> VoiceMemoryNode:
+    ) -> PendingNode:
         """Legacy method - now mapped to 'todo' type."""
         node = self.remember_todo(
             db,
@@ -502,7 +703,7 @@ class MemoryGraphService:
             node.payload["kind"] = "promise"
         return node
 
-    def remember_goal(self, db: Session, session_id: str, goal: str, metadata: dict[str, Any] | None = None) -> VoiceMemoryNode:
+    def remember_goal(self, db: Session, session_id: str, goal: str, metadata: dict[str, Any] | None = None) -> PendingNode:
         key = sha1(f"{goal}|{datetime.utcnow().isoformat()}".encode("utf-8")).hexdigest()[:16]
         payload = {"goal": goal, "metadata": metadata or {}}
         return self.upsert_node(
@@ -516,60 +717,79 @@ class MemoryGraphService:
         )
 
     def get_session_summary(self, db: Session, session_id: str, max_nodes: int = 25) -> dict[str, Any]:
-        nodes = (
-            db.query(VoiceMemoryNode)
-            .filter(VoiceMemoryNode.session_id == session_id)
-            .order_by(VoiceMemoryNode.last_seen_at.desc())
+        """Recent nodes, recent edges and session state, loaded with one UNION ALL query."""
+        self.flush(db)
+        n, e = VoiceMemoryNode, VoiceMemoryEdge
+        no_int, no_str = cast(null(), Integer), cast(null(), String)
+
+        def _node_columns(kind: str):
+            return (
+                literal(kind).label("kind"), n.id, n.node_type, n.node_key, n.summary, n.payload,
+                n.importance.label("score"), n.last_seen_at,
+                no_int.label("source_node_id"), no_int.label("target_node_id"), no_str.label("relation"),
+            )
+
+        recent_nodes_q = (
+            select(*_node_columns("node"))
+            .where(n.session_id == session_id)
+            .order_by(n.last_seen_at.desc())
             .limit(max_nodes)
-            .all()
+            .subquery()
         )
-        edges = (
-            db.query(VoiceMemoryEdge)
-            .filter(VoiceMemoryEdge.session_id == session_id)
-            .order_by(VoiceMemoryEdge.last_seen_at.desc())
+        state_q = (
+            select(*_node_columns("state"))
+            .where(n.session_id == session_id, n.node_type == "session_state", n.node_key.in_(SESSION_STATE_KEYS))
+            .subquery()
+        )
+        recent_edges_q = (
+            select(
+                literal("edge").label("kind"), e.id, no_str.label("node_type"), no_str.label("node_key"),
+                no_str.label("summary"), e.payload, e.weight.label("score"), e.last_seen_at,
+                e.source_node_id, e.target_node_id, e.relation,
+            )
+            .where(e.session_id == session_id)
+            .order_by(e.last_seen_at.desc())
             .limit(max_nodes)
-            .all()
+            .subquery()
         )
-
-        def _state(key: str) -> Any | None:
-            return self.get_session_state(db, session_id, key)
-
-        recent_nodes = [
-            {
-                "id": n.id,
-                "node_type": n.node_type,
-                "node_key": n.node_key,
-                "summary": n.summary,
-                "payload": n.payload,
-                "importance": n.importance,
-                "last_seen_at": n.last_seen_at.isoformat() if n.last_seen_at else None,
-            }
-            for n in nodes
-        ]
-
-        recent_edges = [
-            {
-                "id": e.id,
-                "source_node_id": e.source_node_id,
-                "target_node_id": e.target_node_id,
-                "relation": e.relation,
-                "weight": e.weight,
-                "payload": e.payload,
-                "last_seen_at": e.last_seen_at.isoformat() if e.last_seen_at else None,
-            }
-            for e in edges
-        ]
+        rows = db.execute(
+            union_all(*(select(*q.c) for q in (recent_nodes_q, state_q, recent_edges_q)))
+            .order_by("kind", desc("last_seen_at"))
+        ).all()
+
+        buffer = _buffer(db)
+        session_state = {key: None for key in SESSION_STATE_KEYS}
+        recent_nodes, recent_edges = [], []
+        for row in rows:
+            last_seen_at = row.last_seen_at.isoformat() if row.last_seen_at else None
+            if row.kind == "state":
+                session_state[row.node_key] = row.payload.get("value") if row.payload else None
+            elif row.kind == "node":
+                recent_nodes.append({
+                    "id": row.id,
+                    "node_type": row.node_type,
+                    "node_key": row.node_key,
+                    "summary": row.summary,
+                    "payload": row.payload,
+                    "importance": row.score,
+                    "last_seen_at": last_seen_at,
+                })
+            else:
+                recent_edges.append({
+                    "id": row.id,
+                    "source_node_id": row.source_node_id,
+                    "target_node_id": row.target_node_id,
+                    "relation": row.relation,
+                    "weight": row.score,
+                    "payload": row.payload,
+                    "last_seen_at": last_seen_at,
+                })
+        for key, value in session_state.items():
+            buffer.state[(session_id, key)] = value
 
         return {
             "session_id": session_id,
-            "session_state": {
-                "last_property_id": _state("last_property_id"),
-                "last_property_address": _state("last_property_address"),
-                "last_contact_id": _state("last_contact_id"),
-                "last_contact_name": _state("last_contact_name"),
-                "last_contract_id": _state("last_contract_id"),
-                "last_contract_name": _state("last_contract_name"),
-            },
+            "session_state": session_state,
             "recent_nodes": recent_nodes,
             "recent_edges": recent_edges,
             "node_count": len(recent_nodes),
@@ -578,6 +798,7 @@ class MemoryGraphService:
 
     def clear_session(self, db: Session, session_id: str) -> dict[str, int]:
         """Delete all graph memory for a session."""
+        _buffer(db).discard(session_id)
         edges_deleted = (
             db.query(VoiceMemoryEdge)
             .filter(VoiceMemoryEdge.session_id == session_id)
@@ -593,3 +814,19 @@ class MemoryGraphService:
 
 
 memory_graph_service = MemoryGraphService()
+
+
+@event.listens_for(Session, "before_commit")
+def _flush_memory_graph(session: Session) -> None:
+    memory_graph_service.flush(session)
+
+
+# after_rollback only fires once a connection was used; after_soft_rollback
+# also covers writes buffered before any statement ran.
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_memory_graph(session: Session, previous_transaction) -> None:
+    if previous_transaction.nested:
+        return
+    buffer = session.info.get(_BUFFER_KEY)
+    if buffer is not None:
+        buffer.discard()
@@ -7,6 +7,8 @@ import json
 from sqlalchemy.orm import Session
 
 from app.models.notification import Notification, NotificationType, NotificationPriority
+from app.models.property import Property
+from app.websocket import BROADCAST_TOPIC, agent_topic, property_topic
 
 
 class NotificationService:
@@ -51,6 +53,19 @@ class NotificationService:
         db.refresh(notification)
         return notification
 
+    def get_topics(self, db: Session, notification: Notification) -> list[str]:
+        """WebSocket topics a notification is published on: its agent (or the
+        property's owner) and its property, else everyone."""
+        topics = []
+        agent_id = notification.agent_id
+        if notification.property_id:
+            topics.append(property_topic(notification.property_id))
+            if agent_id is None:
+                agent_id = db.query(Property.agent_id).filter(Property.id == notification.property_id).scalar()
+        if agent_id is not None:
+            topics.append(agent_topic(agent_id))
+        return topics if agent_id is not None else topics + [BROADCAST_TOPIC]
+
     def get_websocket_payload(self, notification: Notification) -> dict:
         """Convert notification to WebSocket payload"""
         return {
@@ -113,7 +128,7 @@ class NotificationService:
 
         # Broadcast via WebSocket
         if manager:
-            await manager.broadcast(self.get_websocket_payload(notification))
+            await manager.publish(self.get_topics(db, notification), self.get_websocket_payload(notification))
 
         return notification
 
@@ -162,7 +177,7 @@ class NotificationService:
         )
 
         if manager:
-            await manager.broadcast(self.get_websocket_payload(notification))
+            await manager.publish(self.get_topics(db, notification), self.get_websocket_payload(notification))
 
         return notification
 
@@ -207,7 +222,7 @@ class NotificationService:
         )
 
         if manager:
-            await manager.broadcast(self.get_websocket_payload(notification))
+            await manager.publish(self.get_topics(db, notification), self.get_websocket_payload(notification))
 
         return notification
 
@@ -253,7 +268,7 @@ class NotificationService:
         )
 
         if manager:
-            await manager.broadcast(self.get_websocket_payload(notification))
+            await manager.publish(self.get_topics(db, notification), self.get_websocket_payload(notification))
 
         return notification
 
@@ -295,7 +310,7 @@ class NotificationService:
         )
 
         if manager:
-            await manager.broadcast(self.get_websocket_payload(notification))
+            await manager.publish(self.get_topics(db, notification), self.get_websocket_payload(notification))
 
         return notification
 
@@ -340,7 +355,7 @@ class NotificationService:
         )
 
         if manager:
-            await manager.broadcast(self.get_websocket_payload(notification))
+            await manager.publish(self.get_topics(db, notification), self.get_websocket_payload(notification))
 
         return notification
 
@@ -381,7 +396,7 @@ class NotificationService:
         )
 
         if manager:
-            await manager.broadcast(self.get_websocket_payload(notification))
+            await manager.publish(self.get_topics(db, notification), self.get_websocket_payload(notification))
 
         return notification
 
@@ -436,7 +451,7 @@ class NotificationService:
         )
 
         if manager:
-            await manager.broadcast(self.get_websocket_payload(notification))
+            await manager.publish(self.get_topics(db, notification), self.get_websocket_payload(notification))
 
         return notification
 
@@ -22,22 +22,42 @@ Usage:
     event_bus.subscribe("property.created", handle_property_created)
 
     # Publish events
-    event_bus.publish("property.created", PropertyEvent(
+    await event_bus.publish("property.created", PropertyEvent(
         property_id=5,
         agent_id=2,
         timestamp=datetime.now()
     ))
+
+Dispatch is asynchronous: ``publish`` records the event and puts it on each
+subscriber's bounded queue, then returns. Every subscriber has its own worker
+task(s), so a slow handler never delays the publisher or other subscribers.
+A full queue drops the event for that subscriber and counts it.
+
+Subscribers registered with ``durable=True`` are delivered through the
+durable outbox (a Redis Stream consumed by the arq worker, see
+``app.services.event_outbox``) when ``EVENT_OUTBOX_ENABLED`` is set, so their
+events survive restarts. Without the outbox they are dispatched in-process
+like any other subscriber.
 """
 
+import asyncio
+import inspect
 import logging
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Callable, Optional, Any
+from itertools import islice
+from typing import Deque, Dict, List, Callable, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
-import json
+
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Handler latencies kept per subscriber for percentile stats
+LATENCY_SAMPLES = 256
+
 
 class EventType(str, Enum):
     """Types of events that can be published."""
@@ -138,29 +158,46 @@ class WorkflowEvent:
 
 
 class EventSubscriber:
-    """A subscriber to event bus events."""
+    """A subscriber to event bus events, with its own queue and worker tasks."""
 
     def __init__(
         self,
         event_type: EventType,
         handler: Callable,
         name: Optional[str] = None,
-        filter_func: Optional[Callable] = None
+        filter_func: Optional[Callable] = None,
+        concurrency: int = 1,
+        queue_size: int = 1000,
+        durable: bool = False
     ):
         """Initialize an event subscriber.
 
         Args:
             event_type: Type of event to subscribe to
-            handler: Callback function to handle events
+            handler: Callback function (sync or async) to handle events
             name: Optional name for the subscriber
             filter_func: Optional filter function (returns True to handle event)
+            concurrency: Worker tasks handling this subscriber's events (1 keeps them in order)
+            queue_size: Events buffered for this subscriber before new ones are dropped
+            durable: Deliver through the durable outbox when it is enabled
         """
         self.event_type = event_type
         self.handler = handler
         self.name = name or handler.__name__
         self.filter_func = filter_func
+        self.concurrency = max(1, concurrency)
+        self.queue_size = queue_size
+        self.durable = durable
         self.call_count = 0
+        self.error_count = 0
+        self.dropped_count = 0
         self.last_called: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.total_latency_ms = 0.0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def handle(self, event: Any) -> None:
         """Handle an event if it passes the filter.
@@ -173,21 +210,107 @@ class EventSubscriber:
             return
 
         # Call handler
-        await self.handler(event)
+        started = time.perf_counter()
+        try:
+            result = self.handler(event)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self.error_count += 1
+            self.last_error = str(e)
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._latencies.append(elapsed_ms)
+            self.total_latency_ms += elapsed_ms
 
         # Update stats
         self.call_count += 1
         self.last_called = datetime.now()
 
+    def enqueue(self, event: Any) -> bool:
+        """Queue an event for this subscriber's workers; False if the queue is full."""
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.dropped_count += 1
+            return False
+
+    def _ensure_workers(self) -> None:
+        # Queues and tasks belong to one event loop; start fresh on a new one.
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._queue is not None:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._workers = [loop.create_task(self._work(self._queue)) for _ in range(self.concurrency)]
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        while True:
+            event = await queue.get()
+            try:
+                await self.handle(event)
+            except Exception as e:
+                # Log error but keep consuming
+                logger.error("Error in subscriber %s: %s", self.name, e)
+            finally:
+                queue.task_done()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    def stop(self) -> None:
+        """Cancel the worker tasks; queued events are discarded."""
+        for task in self._workers:
+            task.cancel()
+        self._workers = []
+        self._queue = None
+        self._loop = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Call, error and latency metrics for this subscriber."""
+        latencies = sorted(self._latencies)
+        handled = self.call_count + self.error_count
+        return {
+            "name": self.name,
+            "event_type": self.event_type.value,
+            "call_count": self.call_count,
+            "error_count": self.error_count,
+            "dropped_count": self.dropped_count,
+            "queue_depth": self.queue_depth,
+            "concurrency": self.concurrency,
+            "durable": self.durable,
+            "avg_latency_ms": round(self.total_latency_ms / handled, 2) if handled else None,
+            "p95_latency_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2) if latencies else None,
+            "last_called": self.last_called.isoformat() if self.last_called else None,
+            "last_error": self.last_error,
+        }
+
 
 class EventBus:
     """Central event bus for publishing and subscribing to events."""
 
-    def __init__(self):
-        """Initialize event bus."""
+    def __init__(self, max_history_size: int = 1000, queue_size: Optional[int] = None, outbox=None):
+        """Initialize event bus.
+
+        Args:
+            max_history_size: Events kept in the in-memory history ring buffer
+            queue_size: Default per-subscriber queue size (settings.event_bus_queue_size)
+            outbox: Durable outbox for durable subscribers (see app.services.event_outbox)
+        """
         self.subscribers: Dict[EventType, List[EventSubscriber]] = {}
-        self.event_history: List[Dict[str, Any]] = []
-        self.max_history_size = 1000
+        self.max_history_size = max_history_size
+        self.event_history: Deque[Dict[str, Any]] = deque(maxlen=max_history_size)
+        self.queue_size = queue_size or settings.event_bus_queue_size
+        self.outbox = outbox
         self.publish_count = 0
         self.enabled = True
 
@@ -196,15 +319,21 @@ class EventBus:
         event_type: EventType,
         handler: Callable,
         name: Optional[str] = None,
-        filter_func: Optional[Callable] = None
+        filter_func: Optional[Callable] = None,
+        concurrency: int = 1,
+        queue_size: Optional[int] = None,
+        durable: bool = False
     ) -> EventSubscriber:
         """Subscribe to an event type.
 
         Args:
             event_type: Type of event to subscribe to
-            handler: Callback function to handle events
+            handler: Callback function (sync or async) to handle events
             name: Optional name for the subscriber
             filter_func: Optional filter function (receives event, returns bool)
+            concurrency: Worker tasks for this subscriber (1 handles events in order)
+            queue_size: Events buffered for this subscriber (defaults to the bus setting)
+            durable: Deliver through the durable outbox when it is enabled
 
         Returns:
             EventSubscriber instance
@@ -223,7 +352,10 @@ class EventBus:
             event_type=event_type,
             handler=handler,
             name=name,
-            filter_func=filter_func
+            filter_func=filter_func,
+            concurrency=concurrency,
+            queue_size=queue_size or self.queue_size,
+            durable=durable
         )
 
         if event_type not in self.subscribers:
@@ -249,7 +381,7 @@ class EventBus:
         # Find and remove subscriber
         for i, subscriber in enumerate(self.subscribers[event_type]):
             if subscriber.handler == handler:
-                self.subscribers[event_type].pop(i)
+                self.subscribers[event_type].pop(i).stop()
                 return True
 
         return False
@@ -257,6 +389,9 @@ class EventBus:
     async def publish(self, event_type: EventType, event: Any) -> None:
         """Publish an event to all subscribers.
 
+        Returns once the event is queued; subscribers handle it on their own
+        worker tasks. Use ``drain()`` to wait for them.
+
         Args:
             event_type: Type of event to publish
             event: Event data (PropertyEvent, ContractEvent, etc.)
@@ -276,14 +411,51 @@ class EventBus:
         # Update publish count
         self.publish_count += 1
 
-        # Notify subscribers
-        if event_type in self.subscribers:
-            for subscriber in self.subscribers[event_type]:
-                try:
-                    await subscriber.handle(event)
-                except Exception as e:
-                    # Log error but don't stop other subscribers
-                    logger.error(f"Error in subscriber {subscriber.name}: {e}")
+        subscribers = self.subscribers.get(event_type, [])
+        if not subscribers:
+            return
+
+        # Durable subscribers are served from the outbox when it takes the event
+        if self.outbox is not None and any(s.durable for s in subscribers):
+            if await self.outbox.append(event_type, event):
+                subscribers = [s for s in subscribers if not s.durable]
+
+        # Queue for each subscriber's workers
+        for subscriber in subscribers:
+            if not subscriber.enqueue(event):
+                logger.warning("Event queue full for subscriber %s; dropped %s", subscriber.name, event_type.value)
+
+    async def dispatch_durable(self, event_type: EventType, event: Any) -> int:
+        """Handle an outbox event with this process's durable subscribers, in turn.
+
+        Returns how many durable subscribers the event was handed to.
+        """
+        handled = 0
+        for subscriber in self.subscribers.get(event_type, []):
+            if not subscriber.durable:
+                continue
+            handled += 1
+            try:
+                await subscriber.handle(event)
+            except Exception as e:
+                logger.error("Error in durable subscriber %s: %s", subscriber.name, e)
+        return handled
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled."""
+        for subscribers in list(self.subscribers.values()):
+            for subscriber in subscribers:
+                await subscriber.join()
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Give queued events up to ``timeout`` seconds, then stop all workers."""
+        try:
+            await asyncio.wait_for(self.drain(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Event bus stopped with events still queued")
+        for subscribers in self.subscribers.values():
+            for subscriber in subscribers:
+                subscriber.stop()
 
     def _add_to_history(self, event_type: EventType, event: Any) -> None:
         """Add event to history.
@@ -299,13 +471,9 @@ class EventBus:
             "data": self._serialize_event(event)
         }
 
-        # Add to history
+        # Ring buffer: the oldest event falls off when full
         self.event_history.append(event_dict)
 
-        # Trim history if needed
-        if len(self.event_history) > self.max_history_size:
-            self.event_history = self.event_history[-self.max_history_size:]
-
     def _serialize_event(self, event: Any) -> Dict[str, Any]:
         """Serialize event to dictionary.
 
@@ -340,19 +508,14 @@ class EventBus:
         Returns:
             List of event dictionaries
         """
-        history = self.event_history
+        # History is in publish order; walk it newest first
+        history = reversed(self.event_history)
 
         # Filter by event type
         if event_type:
-            history = [
-                e for e in history
-                if e["event_type"] == event_type.value
-            ]
-
-        # Sort by timestamp (newest first) and limit
-        history = sorted(history, key=lambda x: x["timestamp"], reverse=True)[:limit]
+            history = (e for e in history if e["event_type"] == event_type.value)
 
-        return history
+        return list(islice(history, limit))
 
     def get_subscriber_stats(self) -> Dict[str, Any]:
         """Get statistics about subscribers.
@@ -376,12 +539,7 @@ class EventBus:
             all_subscribers.extend(subscribers)
 
         stats["top_subscribers"] = [
-            {
-                "name": sub.name,
-                "event_type": sub.event_type.value,
-                "call_count": sub.call_count,
-                "last_called": sub.last_called.isoformat() if sub.last_called else None
-            }
+            sub.stats()
             for sub in sorted(all_subscribers, key=lambda x: x.call_count, reverse=True)[:10]
         ]
 
@@ -389,7 +547,7 @@ class EventBus:
 
     def clear_history(self) -> None:
         """Clear event history."""
-        self.event_history = []
+        self.event_history.clear()
 
     def enable(self) -> None:
         """Enable event publishing."""
@@ -403,6 +561,11 @@ class EventBus:
 # Global singleton instance
 event_bus = EventBus()
 
+if settings.event_outbox_enabled:
+    from app.services.event_outbox import RedisStreamOutbox
+
+    event_bus.outbox = RedisStreamOutbox()
+
 
 # Convenience functions for common events
 async def publish_property_created(property_id: int, agent_id: int, **metadata):
@@ -27,6 +27,7 @@ from app.schemas.photo_order import (
     PhotoOrderCreate, PhotoOrderUpdate, PhotoOrderItemCreate,
     PhotoOrderTemplateCreate, PhotoOrderVoiceSummary
 )
+from app.utils.http_clients import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -155,11 +156,12 @@ class ProxyPicsClient:
         payload.update(kwargs)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_clients.session("proxypics") as client:
                 response = await client.post(
                     f"{self.base_url}/photo_requests",
                     json=payload,
-                    headers=headers
+                    headers=headers,
+                    timeout=self.timeout
                 )
                 response.raise_for_status()
                 return response.json()
@@ -181,10 +183,11 @@ class ProxyPicsClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_clients.session("proxypics") as client:
                 response = await client.get(
                     f"{self.base_url}/photo_requests/{photo_request_id}",
-                    headers=headers
+                    headers=headers,
+                    timeout=self.timeout
                 )
                 response.raise_for_status()
                 return response.json()
@@ -207,11 +210,12 @@ class ProxyPicsClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_clients.session("proxypics") as client:
                 response = await client.get(
                     f"{self.base_url}/photo_requests",
                     params={"page": page, "per_page": per_page},
-                    headers=headers
+                    headers=headers,
+                    timeout=self.timeout
                 )
                 response.raise_for_status()
                 return response.json()
@@ -238,10 +242,11 @@ class ProxyPicsClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_clients.session("proxypics") as client:
                 response = await client.delete(
                     f"{self.base_url}/photo_requests/{photo_request_id}",
-                    headers=headers
+                    headers=headers,
+                    timeout=self.timeout
                 )
                 response.raise_for_status()
                 return response.json()
@@ -269,10 +274,11 @@ class ProxyPicsClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_clients.session("proxypics") as client:
                 response = await client.post(
                     f"{self.base_url}/photo_requests/{photo_request_id}/approve",
-                    headers=headers
+                    headers=headers,
+                    timeout=self.timeout
                 )
                 response.raise_for_status()
                 return response.json()
@@ -306,11 +312,12 @@ class ProxyPicsClient:
             payload["clarification"] = clarification
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_clients.session("proxypics") as client:
                 response = await client.post(
                     f"{self.base_url}/photo_requests/{photo_request_id}/reject",
                     json=payload,
-                    headers=headers
+                    headers=headers,
+                    timeout=self.timeout
                 )
                 response.raise_for_status()
                 return response.json()
@@ -339,11 +346,12 @@ class ProxyPicsClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_clients.session("proxypics") as client:
                 response = await client.post(
                     f"{self.base_url}/photo_requests/{photo_request_id}/extend",
                     json={"expires_at": expires_at},
-                    headers=headers
+                    headers=headers,
+                    timeout=self.timeout
                 )
                 response.raise_for_status()
                 return response.json()
@@ -53,6 +53,9 @@ async def run_auto_enrich_pipeline(property_id: int) -> None:
             logger.warning(f"Pipeline: enrichment failed for property {property_id}: {enrich_result}")
         else:
             _save_enrichment(db, prop.id, enrich_result)
+            if prop.geo_lat is None and enrich_result.get("latitude") is not None:
+                prop.geo_lat = enrich_result["latitude"]
+                prop.geo_lng = enrich_result.get("longitude")
 
         # Save skip trace (if successful)
         if isinstance(skip_result, Exception):
@@ -1,6 +1,7 @@
 """Redis-backed response cache for high-traffic endpoints.
 
-Uses the same Redis instance as the arq job queue.
+Uses the same Redis instance as the arq job queue through the asyncio
+client, so lookups never block the event loop.
 Falls back gracefully when Redis is unavailable.
 """
 import hashlib
@@ -16,20 +17,21 @@ _redis_client = None
 _redis_available: Optional[bool] = None
 
 
-def _get_redis():
-    """Lazy-init Redis client, reusing arq settings."""
+async def get_async_redis():
+    """Lazy-init the shared asyncio Redis client, reusing arq settings."""
     global _redis_client, _redis_available
     if _redis_available is False:
         return None
     if _redis_client is not None:
         return _redis_client
     try:
-        import redis
+        from redis import asyncio as aioredis
         host = os.getenv("REDIS_HOST", "localhost")
         port = int(os.getenv("REDIS_PORT", 6379))
         db = int(os.getenv("REDIS_DB", 0))
-        _redis_client = redis.Redis(host=host, port=port, db=db, decode_responses=True, socket_timeout=2)
-        _redis_client.ping()
+        client = aioredis.Redis(host=host, port=port, db=db, decode_responses=True, socket_timeout=2)
+        await client.ping()
+        _redis_client = client
         _redis_available = True
         logger.info("Redis cache connected")
         return _redis_client
@@ -39,6 +41,18 @@ def _get_redis():
         return None
 
 
+async def close_redis() -> None:
+    """Close the shared client (called on application shutdown)."""
+    global _redis_client, _redis_available
+    if _redis_client is not None:
+        try:
+            await _redis_client.aclose()
+        except Exception:
+            pass
+    _redis_client = None
+    _redis_available = None
+
+
 def cache_key(prefix: str, *args, **kwargs) -> str:
     """Generate a deterministic cache key."""
     raw = f"{prefix}:{json.dumps(args, default=str)}:{json.dumps(kwargs, sort_keys=True, default=str)}"
@@ -47,11 +61,11 @@ def cache_key(prefix: str, *args, **kwargs) -> str:
 
 async def cache_get(key: str) -> Optional[Any]:
     """Get a value from Redis cache."""
-    r = _get_redis()
+    r = await get_async_redis()
     if r is None:
         return None
     try:
-        val = r.get(key)
+        val = await r.get(key)
         return json.loads(val) if val else None
     except Exception:
         return None
@@ -59,36 +73,36 @@ async def cache_get(key: str) -> Optional[Any]:
 
 async def cache_set(key: str, value: Any, ttl: int = 300) -> None:
     """Set a value in Redis cache with TTL in seconds."""
-    r = _get_redis()
+    r = await get_async_redis()
     if r is None:
         return
     try:
-        r.setex(key, ttl, json.dumps(value, default=str))
+        await r.setex(key, ttl, json.dumps(value, default=str))
     except Exception:
         pass
 
 
 async def cache_delete(pattern: str) -> None:
     """Delete cache keys matching a pattern."""
-    r = _get_redis()
+    r = await get_async_redis()
     if r is None:
         return
     try:
-        keys = r.keys(f"rc:*{pattern}*")
+        keys = [k async for k in r.scan_iter(match=f"rc:*{pattern}*", count=500)]
         if keys:
-            r.delete(*keys)
+            await r.delete(*keys)
     except Exception:
         pass
 
 
 async def cache_stats() -> dict:
     """Get cache statistics."""
-    r = _get_redis()
+    r = await get_async_redis()
     if r is None:
         return {"status": "unavailable"}
     try:
-        info = r.info("memory")
-        keys = r.dbsize()
+        info = await r.info("memory")
+        keys = await r.dbsize()
         return {
             "status": "connected",
             "keys": keys,
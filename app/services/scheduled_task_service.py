@@ -1,12 +1,17 @@
-"""CRUD service for scheduled tasks."""
+"""CRUD service for scheduled tasks, plus lease-based claiming for the task runner."""
 
+import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from app.models.scheduled_task import ScheduledTask, TaskStatus, TaskType
 
+logger = logging.getLogger(__name__)
+
 
 class ScheduledTaskService:
 
@@ -39,8 +44,15 @@ class ScheduledTaskService:
         db.add(task)
         db.commit()
         db.refresh(task)
+        self._wake_runner()
         return task
 
+    @staticmethod
+    def _wake_runner():
+        # The in-process runner sleeps until the next due task; a new task may be due sooner
+        from app.services.task_runner import task_runner
+        task_runner.wake()
+
     def list_tasks(
         self,
         db: Session,
@@ -85,12 +97,113 @@ class ScheduledTaskService:
     def mark_completed(self, db: Session, task: ScheduledTask):
         task.status = TaskStatus.COMPLETED
         task.last_run_at = datetime.now(timezone.utc)
+        task.lease_owner = None
+        task.lease_expires_at = None
         db.commit()
 
     def mark_failed(self, db: Session, task: ScheduledTask):
         task.status = TaskStatus.FAILED
+        task.lease_owner = None
+        task.lease_expires_at = None
         db.commit()
 
+    # ── Leases ──
+
+    @staticmethod
+    def _claimable(now: datetime):
+        """Due pending tasks, and running tasks whose runner's lease has expired."""
+        return or_(
+            and_(ScheduledTask.status == TaskStatus.PENDING, ScheduledTask.scheduled_at <= now),
+            and_(
+                ScheduledTask.status == TaskStatus.RUNNING,
+                or_(ScheduledTask.lease_expires_at.is_(None), ScheduledTask.lease_expires_at < now),
+            ),
+        )
+
+    def claim_due_tasks(self, db: Session, owner: str, limit: int, lease_seconds: int) -> list[int]:
+        """Lease up to ``limit`` due tasks to ``owner`` and return their ids.
+
+        Postgres locks candidate rows with ``FOR UPDATE SKIP LOCKED`` so
+        concurrent runners claim disjoint sets without waiting on each other.
+        Other databases claim row by row with a compare-and-swap on
+        ``lease_version``; a runner that loses the race simply skips the row.
+        """
+        if limit <= 0:
+            return []
+        now = datetime.now(timezone.utc)
+        claim = dict(
+            status=TaskStatus.RUNNING,
+            lease_owner=owner,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            lease_version=ScheduledTask.lease_version + 1,
+            attempts=ScheduledTask.attempts + 1,
+        )
+        candidates = (
+            select(ScheduledTask.id, ScheduledTask.lease_version)
+            .where(self._claimable(now))
+            .order_by(ScheduledTask.scheduled_at.asc())
+            .limit(limit)
+        )
+
+        try:
+            if db.get_bind().dialect.name == "postgresql":
+                ids = [row.id for row in db.execute(candidates.with_for_update(skip_locked=True))]
+                if ids:
+                    db.execute(
+                        update(ScheduledTask).where(ScheduledTask.id.in_(ids)).values(**claim)
+                        .execution_options(synchronize_session=False)
+                    )
+                db.commit()
+                return ids
+
+            claimed = []
+            for task_id, version in db.execute(candidates).all():
+                result = db.execute(
+                    update(ScheduledTask)
+                    .where(ScheduledTask.id == task_id, ScheduledTask.lease_version == version)
+                    .values(**claim)
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+                if result.rowcount == 1:
+                    claimed.append(task_id)
+            return claimed
+        except OperationalError as e:
+            # Lock contention (e.g. SQLite "database is locked"): try again next tick
+            db.rollback()
+            logger.warning("Claiming scheduled tasks failed: %s", e)
+            return []
+
+    def extend_lease(self, db: Session, task_id: int, owner: str, lease_seconds: int) -> bool:
+        """Push out the lease of a task ``owner`` is still running. False if it lost the lease."""
+        result = db.execute(
+            update(ScheduledTask)
+            .where(
+                ScheduledTask.id == task_id,
+                ScheduledTask.lease_owner == owner,
+                ScheduledTask.status == TaskStatus.RUNNING,
+            )
+            .values(lease_expires_at=datetime.now(timezone.utc) + timedelta(seconds=lease_seconds))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount == 1
+
+    def next_wakeup_at(self, db: Session) -> Optional[datetime]:
+        """Earliest time a task becomes claimable: next pending task or lease expiry."""
+        next_due, next_expiry = db.execute(
+            select(
+                select(func.min(ScheduledTask.scheduled_at))
+                .where(ScheduledTask.status == TaskStatus.PENDING)
+                .scalar_subquery(),
+                select(func.min(ScheduledTask.lease_expires_at))
+                .where(ScheduledTask.status == TaskStatus.RUNNING)
+                .scalar_subquery(),
+            )
+        ).one()
+        times = [t if t.tzinfo else t.replace(tzinfo=timezone.utc) for t in (next_due, next_expiry) if t]
+        return min(times) if times else None
+
     def create_next_occurrence(self, db: Session, task: ScheduledTask) -> Optional[ScheduledTask]:
         if not task.repeat_interval_hours:
             return None
@@ -1,9 +1,18 @@
 import random
 import hashlib
 from typing import Any
-import httpx
 from app.config import settings
+from app.services.tiered_cache import tiered_cache
 from app.utils.circuit_breaker import circuit_breakers
+from app.utils.http_clients import http_clients
+
+# Owner lookups are billed per call and change rarely.
+skip_trace_cache = tiered_cache("skip_trace", ttl=7 * 86400, stale_ttl=86400)
+
+
+def _found_owner(result: dict[str, Any]) -> bool:
+    """Only real hits are cached; a "no people found" placeholder is retried next time."""
+    return bool(result.get("raw_response", {}).get("person_count"))
 
 
 class RapidAPISkipTraceService:
@@ -23,6 +32,19 @@ class RapidAPISkipTraceService:
         Perform skip trace using RapidAPI.
         Returns owner contact information for the given address.
         """
+        cache_key = " ".join(
+            part.strip().lower() for part in (address, city, state, zip_code) if part
+        )
+        return await skip_trace_cache.get_or_load(
+            cache_key,
+            lambda: self._fetch_skip_trace(address, city, state, zip_code),
+            cache_if=_found_owner,
+        )
+
+    async def _fetch_skip_trace(
+        self, address: str, city: str, state: str, zip_code: str
+    ) -> dict[str, Any]:
+        """Call the RapidAPI skip trace endpoints (uncached)."""
         breaker = circuit_breakers.get("skip_trace")
         if not breaker.is_available():
             raise RuntimeError("Skip trace API temporarily unavailable (circuit open)")
@@ -36,7 +58,7 @@ class RapidAPISkipTraceService:
         citystatezip = f"{city}, {state} {zip_code}"
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("rapidapi") as client:
                 response = await client.get(
                     f"{self.base_url}/search/byaddress",
                     params={
@@ -1,82 +1,260 @@
-"""Background task runner — checks for due scheduled tasks every minute."""
+"""Background task runner — claims due scheduled tasks with leases and runs them concurrently.
+
+Due ``ScheduledTask`` rows are leased to this runner (see
+``ScheduledTaskService.claim_due_tasks``), so API replicas and the arq worker
+can share the table without running a task twice. Each task runs with its own
+session, at most ``max_concurrency`` at a time, and renews its lease while it
+runs; a task whose runner died is reclaimed once the lease expires.
+
+Between claims the loop sleeps until the next task is due (or a lease
+expires), capped at ``TASK_LOOP_INTERVAL``; ``task_runner.wake()`` cuts the
+sleep short when a task is created in-process.
+
+Pipeline and analytics alert checks run on their own timers so a slow check
+never delays a reminder.
+"""
 
 import asyncio
 import logging
+import os
+import socket
+import uuid
 from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
-from app.models.scheduled_task import TaskType
+from app.models.scheduled_task import ScheduledTask, TaskType
 
 logger = logging.getLogger(__name__)
 
-TASK_LOOP_INTERVAL = 60  # seconds
+TASK_LOOP_INTERVAL = 60  # seconds — longest sleep between claims
 PIPELINE_CHECK_INTERVAL = 300  # 5 minutes
 ALERT_CHECK_INTERVAL = 600  # 10 minutes
 
-_last_pipeline_check = datetime.now(timezone.utc)
-_last_alert_check = datetime.now(timezone.utc)
+TASK_CONCURRENCY = int(os.getenv("TASK_RUNNER_CONCURRENCY", "4"))
+TASK_LEASE_SECONDS = int(os.getenv("TASK_RUNNER_LEASE_SECONDS", "300"))
+MAX_TASK_ATTEMPTS = 3  # claims (including reclaims after a crash) before giving up
 
 
-async def run_task_loop(interval_seconds: int = TASK_LOOP_INTERVAL):
-    """Background loop that checks for due tasks."""
-    global _last_pipeline_check, _last_alert_check
-    from app.services.scheduled_task_service import scheduled_task_service
-    from app.services.pipeline_automation_service import pipeline_automation_service
+class TaskRunner:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_concurrency: int = TASK_CONCURRENCY,
+        lease_seconds: int = TASK_LEASE_SECONDS,
+        max_sleep_seconds: float = TASK_LOOP_INTERVAL,
+    ):
+        self.session_factory = session_factory
+        self.max_concurrency = max_concurrency
+        self.lease_seconds = lease_seconds
+        self.max_sleep_seconds = max_sleep_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._running: set[asyncio.Task] = set()
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = False
 
-    logger.info("→ Task runner loop started (interval=%ds)", interval_seconds)
+    # ── Loop ──
 
-    iteration = 0
-    while True:
-        iteration += 1
-        logger.info("→ Task loop iteration #%d at %s", iteration, datetime.now(timezone.utc))
-        await asyncio.sleep(interval_seconds)
-        await asyncio.sleep(interval_seconds)
-        db = SessionLocal()
-        try:
-            due_tasks = scheduled_task_service.get_due_tasks(db)
-            if due_tasks:
-                logger.info("Found %d due task(s)", len(due_tasks))
-            for task in due_tasks:
-                try:
-                    await _execute_task(db, task, scheduled_task_service)
-                except Exception as e:
-                    logger.error("Task %d failed: %s", task.id, e)
-                    scheduled_task_service.mark_failed(db, task)
+    async def run_forever(self):
+        """Claim and run due tasks until ``stop()``."""
+        from app.services.scheduled_task_service import scheduled_task_service
 
-            # Pipeline automation check every 5 minutes
-            now = datetime.now(timezone.utc)
-            if (now - _last_pipeline_check).total_seconds() >= PIPELINE_CHECK_INTERVAL:
-                try:
-                    result = pipeline_automation_service.run_pipeline_check(db)
-                    if result.get("transitioned", 0) > 0:
-                        logger.info("Pipeline check: %d transitions", result["transitioned"])
-                except Exception as e:
-                    logger.error("Pipeline check error: %s", e)
-                _last_pipeline_check = now
-
-            # Analytics alert check every 10 minutes
-            if (now - _last_alert_check).total_seconds() >= ALERT_CHECK_INTERVAL:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        logger.info("→ Task runner started (owner=%s, concurrency=%d)", self.owner, self.max_concurrency)
+
+        while not self._stopping:
+            self._wake.clear()
+            try:
+                await self._claim_and_start()
+                delay = await asyncio.to_thread(self._seconds_until_next, scheduled_task_service)
+            except Exception as e:
+                logger.error("Task loop error: %s", e)
+                delay = self.max_sleep_seconds
+            if delay > 0:
                 try:
-                    from app.services.analytics_alert_service import AnalyticsAlertService
-                    alert_service = AnalyticsAlertService(db)
-                    triggers = alert_service.check_alert_rules()
-                    if triggers:
-                        logger.info("Alert check: %d alerts triggered", len(triggers))
-                        for trigger in triggers:
-                            logger.info("  - Triggered: %s (rule %d)", trigger.message, trigger.alert_rule_id)
-                except Exception as e:
-                    logger.error("Alert check error: %s", e)
-                _last_alert_check = now
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_once(self) -> int:
+        """Claim every task due now, run them and wait for completion (arq cron tick)."""
+        started = 0
+        while True:
+            started += await self._claim_and_start()
+            if not self._running:
+                return started
+            # Refill slots as tasks finish
+            await asyncio.wait(set(self._running), return_when=asyncio.FIRST_COMPLETED)
+
+    def wake(self):
+        """Re-check for due tasks now. Safe to call from any thread."""
+        loop, event = self._loop, self._wake
+        if loop is None or event is None or loop.is_closed():
+            return
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        if current is loop:
+            event.set()
+        else:
+            loop.call_soon_threadsafe(event.set)
+
+    def stop(self):
+        """Stop claiming; in-flight tasks finish or are reclaimed after their lease."""
+        self._stopping = True
+        self.wake()
+
+    def status(self) -> dict:
+        return {"owner": self.owner, "running": len(self._running), "max_concurrency": self.max_concurrency}
+
+    def _seconds_until_next(self, service) -> float:
+        if len(self._running) >= self.max_concurrency:
+            return self.max_sleep_seconds  # a finishing task wakes the loop
+        db = self.session_factory()
+        try:
+            next_at = service.next_wakeup_at(db)
+        finally:
+            db.close()
+        if next_at is None:
+            return self.max_sleep_seconds
+        delay = (next_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(delay, 0.0), self.max_sleep_seconds)
+
+    # ── Claiming and running ──
+
+    async def _claim_and_start(self) -> int:
+        from app.services.scheduled_task_service import scheduled_task_service
+
+        free = self.max_concurrency - len(self._running)
+        if free <= 0:
+            return 0
+        ids = await asyncio.to_thread(self._claim, scheduled_task_service, free)
+        if ids:
+            logger.info("Claimed %d due task(s)", len(ids))
+        for task_id in ids:
+            job = asyncio.create_task(self._run_claimed(task_id))
+            self._running.add(job)
+            job.add_done_callback(self._on_done)
+        return len(ids)
+
+    def _claim(self, service, limit: int) -> list[int]:
+        db = self.session_factory()
+        try:
+            return service.claim_due_tasks(db, self.owner, limit, self.lease_seconds)
+        finally:
+            db.close()
+
+    def _on_done(self, job: asyncio.Task):
+        self._running.discard(job)
+        if self._wake is not None:
+            self._wake.set()  # a slot freed up
+
+    async def _run_claimed(self, task_id: int):
+        from app.services.scheduled_task_service import scheduled_task_service
+
+        heartbeat = asyncio.create_task(self._renew_lease(task_id))
+        db = self.session_factory()
+        task = None
+        try:
+            task = db.get(ScheduledTask, task_id)
+            if task is None:
+                return
+            if task.attempts > MAX_TASK_ATTEMPTS:
+                logger.error("Task %d abandoned after %d attempts", task.id, task.attempts - 1)
+                scheduled_task_service.mark_failed(db, task)
+                return
+            await _execute_task(db, task, scheduled_task_service)
         except Exception as e:
-            logger.error("Task loop error: %s", e)
+            logger.error("Task %d failed: %s", task_id, e)
+            if task is not None:
+                try:
+                    db.rollback()
+                    scheduled_task_service.mark_failed(db, task)
+                except Exception as mark_error:
+                    logger.error("Could not mark task %d failed: %s", task_id, mark_error)
         finally:
+            heartbeat.cancel()
             db.close()
 
+    async def _renew_lease(self, task_id: int):
+        from app.services.scheduled_task_service import scheduled_task_service
 
-async def _execute_task(db, task, service):
-    """Execute a single scheduled task."""
-    service.mark_running(db, task)
+        def renew() -> bool:
+            db = self.session_factory()
+            try:
+                return scheduled_task_service.extend_lease(db, task_id, self.owner, self.lease_seconds)
+            finally:
+                db.close()
+
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                if not await asyncio.to_thread(renew):
+                    logger.warning("Lost lease on task %d", task_id)
+                    return
+            except Exception as e:
+                logger.warning("Lease renewal for task %d failed: %s", task_id, e)
+
+
+task_runner = TaskRunner()
+
+
+# ── Periodic checks ──
+
+
+def _run_pipeline_check():
+    from app.services.pipeline_automation_service import pipeline_automation_service
+
+    db = SessionLocal()
+    try:
+        result = pipeline_automation_service.run_pipeline_check(db)
+        if result.get("transitioned", 0) > 0:
+            logger.info("Pipeline check: %d transitions", result["transitioned"])
+    finally:
+        db.close()
 
+
+def _run_alert_check():
+    from app.services.analytics_alert_service import AnalyticsAlertService
+
+    db = SessionLocal()
+    try:
+        triggers = AnalyticsAlertService(db).check_alert_rules()
+        if triggers:
+            logger.info("Alert check: %d alerts triggered", len(triggers))
+            for trigger in triggers:
+                logger.info("  - Triggered: %s (rule %d)", trigger.message, trigger.alert_rule_id)
+    finally:
+        db.close()
+
+
+async def _periodic(name: str, fn: Callable[[], None], interval_seconds: int):
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(fn)
+        except Exception as e:
+            logger.error("%s error: %s", name, e)
+
+
+async def run_task_loop(interval_seconds: int = TASK_LOOP_INTERVAL):
+    """In-process scheduler: the task runner plus pipeline and alert checks."""
+    task_runner.max_sleep_seconds = interval_seconds
+    await asyncio.gather(
+        task_runner.run_forever(),
+        _periodic("Pipeline check", _run_pipeline_check, PIPELINE_CHECK_INTERVAL),
+        _periodic("Alert check", _run_alert_check, ALERT_CHECK_INTERVAL),
+    )
+
+
+async def _execute_task(db, task, service):
+    """Execute a single scheduled task (already claimed and marked running)."""
     if task.task_type == TaskType.REMINDER:
         _create_notification(db, task)
     elif task.task_type == TaskType.FOLLOW_UP:
@@ -41,7 +41,10 @@ def ensure_task_runner_started():
 
 def get_task_runner_status() -> dict:
     """Get the status of the task runner."""
+    from app.services.task_runner import task_runner
+
     return {
         "started": _task_runner_started,
-        "task_running": _task_runner_task is not None and not _task_runner_task.done()
+        "task_running": _task_runner_task is not None and not _task_runner_task.done(),
+        **task_runner.status(),
     }
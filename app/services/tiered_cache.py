@@ -0,0 +1,268 @@
+"""
+Two-tier read-through cache for external API responses.
+
+L1 is the bounded in-process ``TTLCache``; L2 is the shared Redis instance
+(via the asyncio client in ``redis_cache``). Loads are single-flight: while
+one coroutine is fetching a key, concurrent callers for the same key await
+the same result instead of calling the upstream API again.
+
+Entries carry a freshness deadline. Once it passes, the cached value is
+still served for ``stale_ttl`` seconds while a single background refresh
+runs (stale-while-revalidate).
+
+Usage:
+    zillow_tiered = TieredCache("zillow", l1=zillow_cache, ttl=21600)
+    data = await zillow_tiered.get_or_load(address_key, lambda: fetch(address))
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.services.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "rc:t"
+
+
+class TieredCache:
+    """L1 (in-process) + L2 (Redis) cache with request coalescing."""
+
+    def __init__(
+        self,
+        namespace: str,
+        l1: Optional[TTLCache] = None,
+        ttl: int = 3600,
+        stale_ttl: int = 0,
+        l1_max_ttl: int = 300,
+        use_l2: bool = True,
+    ):
+        self.namespace = namespace
+        self.l1 = l1 if l1 is not None else TTLCache(namespace)
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        # L1 holds entries briefly so invalidations on other workers converge
+        # (only when the entry was also written to L2).
+        self.l1_max_ttl = l1_max_ttl
+        self.use_l2 = use_l2
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self._refreshing: set[str] = set()
+        self._refresh_tasks: set[asyncio.Task] = set()
+        self.coalesced = 0
+        self.loads = 0
+        self.l2_hits = 0
+
+    def _redis_key(self, key: str) -> str:
+        return f"{_KEY_PREFIX}:{self.namespace}:{key}"
+
+    async def _redis(self):
+        if not self.use_l2:
+            return None
+        from app.services.redis_cache import get_async_redis
+        return await get_async_redis()
+
+    # ------------------------------------------------------------------
+    # Tier access
+    # ------------------------------------------------------------------
+
+    async def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        envelope = self.l1.get(key)
+        if envelope is not None:
+            return envelope
+
+        r = await self._redis()
+        if r is None:
+            return None
+        try:
+            raw = await r.get(self._redis_key(key))
+        except Exception as e:
+            logger.debug("L2 read failed for %s:%s: %s", self.namespace, key, e)
+            return None
+        if not raw:
+            return None
+        try:
+            envelope = json.loads(raw)
+        except ValueError:
+            return None
+        self.l2_hits += 1
+        remaining = int(envelope.get("expires_at", 0) - time.time())
+        if remaining > 0:
+            self.l1.set(key, envelope, ttl_seconds=min(remaining, self.l1_max_ttl))
+        return envelope
+
+    async def _write(self, key: str, value: Any, ttl: int, stale_ttl: int) -> None:
+        now = time.time()
+        envelope = {
+            "value": value,
+            "fresh_until": now + ttl,
+            "expires_at": now + ttl + stale_ttl,
+        }
+
+        shared = False
+        r = await self._redis()
+        if r is not None:
+            try:
+                await r.setex(self._redis_key(key), ttl + stale_ttl, json.dumps(envelope, default=str))
+                shared = True
+            except Exception as e:
+                logger.debug("L2 write failed for %s:%s: %s", self.namespace, key, e)
+
+        # Without L2 the in-process copy is the only one, so it keeps the full TTL.
+        l1_ttl = min(ttl + stale_ttl, self.l1_max_ttl) if shared else ttl + stale_ttl
+        self.l1.set(key, envelope, ttl_seconds=l1_ttl)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return a cached (fresh or stale) value without loading."""
+        envelope = await self._read(key)
+        if envelope is None or time.time() > envelope.get("expires_at", 0):
+            return None
+        return envelope["value"]
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        await self._write(key, value, self.ttl if ttl is None else ttl, self.stale_ttl)
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        cache_if: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Return the cached value for ``key`` or load it exactly once.
+
+        ``None`` results are never cached. ``cache_if`` can veto caching of
+        other results (e.g. in-progress job status) while still sharing the
+        result with coalesced callers.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+
+        if ttl > 0:
+            envelope = await self._read(key)
+            if envelope is not None:
+                now = time.time()
+                if now <= envelope.get("fresh_until", 0):
+                    return envelope["value"]
+                if now <= envelope.get("expires_at", 0):
+                    self._schedule_refresh(key, loader, ttl, stale_ttl, cache_if)
+                    return envelope["value"]
+
+        return await self._load(key, loader, ttl, stale_ttl, cache_if)
+
+    async def _load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        cache_if: Optional[Callable[[Any], bool]],
+    ) -> Any:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self.loads += 1
+            value = await loader()
+            if value is not None and ttl > 0 and (cache_if is None or cache_if(value)):
+                await self._write(key, value, ttl, stale_ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an un-awaited failure doesn't log a warning.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        cache_if: Optional[Callable[[Any], bool]],
+    ) -> None:
+        if key in self._refreshing or key in self._inflight:
+            return
+        self._refreshing.add(key)
+
+        async def _refresh():
+            try:
+                await self._load(key, loader, ttl, stale_ttl, cache_if)
+            except Exception as e:
+                logger.warning("Background refresh failed for %s:%s: %s", self.namespace, key, e)
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(_refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def invalidate(self, key: str) -> None:
+        self.l1.delete(key)
+        r = await self._redis()
+        if r is None:
+            return
+        try:
+            await r.delete(self._redis_key(key))
+        except Exception:
+            pass
+
+    async def invalidate_namespace(self) -> int:
+        """Drop every entry in this namespace from both tiers."""
+        self.l1.clear()
+        r = await self._redis()
+        if r is None:
+            return 0
+        removed = 0
+        try:
+            batch = []
+            async for k in r.scan_iter(match=f"{_KEY_PREFIX}:{self.namespace}:*", count=500):
+                batch.append(k)
+                if len(batch) >= 500:
+                    removed += await r.delete(*batch)
+                    batch = []
+            if batch:
+                removed += await r.delete(*batch)
+        except Exception as e:
+            logger.warning("Namespace invalidation failed for %s: %s", self.namespace, e)
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+            "l2_hits": self.l2_hits,
+            "inflight": len(self._inflight),
+        }
+
+
+_tiers: Dict[str, TieredCache] = {}
+
+
+def tiered_cache(namespace: str, **kwargs) -> TieredCache:
+    """Return the shared TieredCache for a namespace, creating it on first use."""
+    cache = _tiers.get(namespace)
+    if cache is None:
+        cache = TieredCache(namespace, **kwargs)
+        _tiers[namespace] = cache
+    return cache
+
+
+def all_tiered_caches() -> Dict[str, TieredCache]:
+    return dict(_tiers)
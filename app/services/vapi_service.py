@@ -14,6 +14,7 @@ from app.config import settings
 from app.models.property import Property
 from app.models.property_recap import PropertyRecap
 from app.services.property_recap_service import property_recap_service
+from app.utils.http_clients import http_clients
 
 
 class VAPIService:
@@ -22,7 +23,7 @@ class VAPIService:
     def __init__(self):
         self.api_key = settings.vapi_api_key
         self.phone_number_id = settings.vapi_phone_number_id or None
-        self.base_url = "https://api.vapi.ai"
+        self.base_url = settings.vapi_base_url.rstrip("/")
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -97,7 +98,7 @@ class VAPIService:
 
         # Make API call to VAPI (async to avoid blocking event loop)
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with http_clients.session("vapi") as client:
                 response = await client.post(
                     f"{self.base_url}/call/phone",
                     headers=self.headers,
@@ -308,7 +309,7 @@ Market context:
         """Get status of a VAPI call"""
         self._ensure_api_key()
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with http_clients.session("vapi") as client:
                 response = await client.get(
                     f"{self.base_url}/call/{call_id}",
                     headers=self.headers,
@@ -323,7 +324,7 @@ Market context:
         """End an ongoing VAPI call"""
         self._ensure_api_key()
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with http_clients.session("vapi") as client:
                 response = await client.patch(
                     f"{self.base_url}/call/{call_id}",
                     headers=self.headers,
@@ -0,0 +1,254 @@
+"""Resident vector index for property embeddings.
+
+Keeps every embedding in one contiguous, pre-normalized float32 matrix so a
+query is a single matrix-vector product followed by argpartition top-k.
+Workspace/agent filters are kept as parallel id arrays and turned into
+boolean masks at query time.
+
+An optional IVF (inverted file) layer clusters rows around k-means centroids
+so large indexes only score the ``n_probe`` closest clusters.
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for "no workspace/agent" — never matches a real filter value.
+_NO_OWNER = -1
+
+
+class PropertyVectorIndex:
+    """In-memory cosine-similarity index keyed by property_id."""
+
+    def __init__(self, dimension: Optional[int] = None, initial_capacity: int = 1024):
+        self.dimension = dimension
+        self._capacity = max(1, initial_capacity)
+        self._size = 0
+        self._matrix: Optional[np.ndarray] = None
+        self._ids = np.zeros(self._capacity, dtype=np.int64)
+        self._workspace_ids = np.full(self._capacity, _NO_OWNER, dtype=np.int64)
+        self._agent_ids = np.full(self._capacity, _NO_OWNER, dtype=np.int64)
+        self._positions: Dict[int, int] = {}
+        self._lock = threading.RLock()
+
+        # IVF state (built on demand, dropped when rows change)
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments: Optional[np.ndarray] = None
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, property_id: int) -> bool:
+        return property_id in self._positions
+
+    @staticmethod
+    def _normalize(vector: Iterable[float]) -> np.ndarray:
+        arr = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(arr)
+        if norm > 0:
+            arr = arr / norm
+        return arr
+
+    def _ensure_capacity(self, needed: int) -> None:
+        if self._matrix is not None and needed <= self._capacity:
+            return
+        new_capacity = self._capacity
+        while new_capacity < needed:
+            new_capacity *= 2
+        matrix = np.zeros((new_capacity, self.dimension), dtype=np.float32)
+        if self._matrix is not None:
+            matrix[: self._size] = self._matrix[: self._size]
+        self._matrix = matrix
+        for name, fill in (("_ids", 0), ("_workspace_ids", _NO_OWNER), ("_agent_ids", _NO_OWNER)):
+            old = getattr(self, name)
+            grown = np.full(new_capacity, fill, dtype=np.int64)
+            grown[: self._size] = old[: self._size]
+            setattr(self, name, grown)
+        self._capacity = new_capacity
+
+    def upsert(
+        self,
+        property_id: int,
+        embedding: Iterable[float],
+        workspace_id: Optional[int] = None,
+        agent_id: Optional[int] = None,
+    ) -> None:
+        """Insert or replace a single property's vector."""
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self.dimension is None:
+                self.dimension = vector.shape[0]
+            if vector.shape[0] != self.dimension:
+                raise ValueError(
+                    f"Embedding dimension {vector.shape[0]} does not match index dimension {self.dimension}"
+                )
+            pos = self._positions.get(property_id)
+            if pos is None:
+                self._ensure_capacity(self._size + 1)
+                pos = self._size
+                self._size += 1
+                self._positions[property_id] = pos
+                self._ids[pos] = property_id
+            self._matrix[pos] = vector
+            self._workspace_ids[pos] = _NO_OWNER if workspace_id is None else workspace_id
+            self._agent_ids[pos] = _NO_OWNER if agent_id is None else agent_id
+            self._centroids = None
+            self._assignments = None
+
+    def remove(self, property_id: int) -> bool:
+        """Drop a property from the index (swap-with-last, O(dimension))."""
+        with self._lock:
+            pos = self._positions.pop(property_id, None)
+            if pos is None:
+                return False
+            last = self._size - 1
+            if pos != last:
+                self._matrix[pos] = self._matrix[last]
+                self._ids[pos] = self._ids[last]
+                self._workspace_ids[pos] = self._workspace_ids[last]
+                self._agent_ids[pos] = self._agent_ids[last]
+                self._positions[int(self._ids[pos])] = pos
+            self._size = last
+            self._centroids = None
+            self._assignments = None
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._size = 0
+            self._positions.clear()
+            self._centroids = None
+            self._assignments = None
+
+    def get_vector(self, property_id: int) -> Optional[np.ndarray]:
+        pos = self._positions.get(property_id)
+        if pos is None:
+            return None
+        return self._matrix[pos].copy()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _filter_mask(
+        self,
+        workspace_id: Optional[int],
+        agent_id: Optional[int],
+        exclude_ids: Optional[Iterable[int]],
+    ) -> Optional[np.ndarray]:
+        n = self._size
+        mask = None
+        if workspace_id is not None:
+            mask = self._workspace_ids[:n] == workspace_id
+        if agent_id is not None:
+            agent_mask = self._agent_ids[:n] == agent_id
+            mask = agent_mask if mask is None else mask & agent_mask
+        if exclude_ids:
+            excluded = [self._positions[i] for i in exclude_ids if i in self._positions]
+            if excluded:
+                if mask is None:
+                    mask = np.ones(n, dtype=bool)
+                mask[excluded] = False
+        return mask
+
+    def search(
+        self,
+        query: Iterable[float],
+        limit: int = 10,
+        workspace_id: Optional[int] = None,
+        agent_id: Optional[int] = None,
+        exclude_ids: Optional[Iterable[int]] = None,
+        n_probe: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """Return ``(property_id, cosine_similarity)`` pairs, best first.
+
+        When an IVF layer has been built and ``n_probe`` is given, only rows in
+        the ``n_probe`` nearest clusters are scored (approximate search).
+        """
+        with self._lock:
+            n = self._size
+            if n == 0 or limit <= 0:
+                return []
+            q = self._normalize(query)
+            if q.shape[0] != self.dimension:
+                raise ValueError(
+                    f"Query dimension {q.shape[0]} does not match index dimension {self.dimension}"
+                )
+
+            candidates: Optional[np.ndarray] = None
+            if n_probe is not None and self._centroids is not None:
+                centroid_scores = self._centroids @ q
+                probe = min(n_probe, centroid_scores.shape[0])
+                nearest = np.argpartition(-centroid_scores, probe - 1)[:probe]
+                candidates = np.flatnonzero(np.isin(self._assignments, nearest))
+
+            mask = self._filter_mask(workspace_id, agent_id, exclude_ids)
+            if candidates is None:
+                scores = self._matrix[:n] @ q
+                if mask is not None:
+                    scores = np.where(mask, scores, -np.inf)
+                rows = np.arange(n)
+            else:
+                if mask is not None:
+                    candidates = candidates[mask[candidates]]
+                rows = candidates
+                scores = self._matrix[rows] @ q
+
+            valid = np.isfinite(scores)
+            if not valid.all():
+                rows, scores = rows[valid], scores[valid]
+            if scores.shape[0] == 0:
+                return []
+
+            k = min(limit, scores.shape[0])
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [(int(self._ids[rows[i]]), float(scores[i])) for i in top]
+
+    # ------------------------------------------------------------------
+    # IVF (approximate) layer
+    # ------------------------------------------------------------------
+
+    def build_ivf(self, n_lists: Optional[int] = None, iterations: int = 10, seed: int = 0) -> int:
+        """Cluster rows with spherical k-means; returns the number of lists built."""
+        with self._lock:
+            n = self._size
+            if n == 0:
+                return 0
+            n_lists = n_lists or max(1, int(np.sqrt(n)))
+            n_lists = min(n_lists, n)
+            data = self._matrix[:n]
+            rng = np.random.default_rng(seed)
+            centroids = data[rng.choice(n, size=n_lists, replace=False)].copy()
+            assignments = np.zeros(n, dtype=np.int64)
+            for _ in range(max(1, iterations)):
+                assignments = np.argmax(data @ centroids.T, axis=1)
+                for c in range(n_lists):
+                    members = data[assignments == c]
+                    if members.shape[0]:
+                        centroid = members.sum(axis=0)
+                        norm = np.linalg.norm(centroid)
+                        centroids[c] = centroid / norm if norm > 0 else centroid
+            self._centroids = centroids
+            self._assignments = assignments
+            return n_lists
+
+    @property
+    def has_ivf(self) -> bool:
+        return self._centroids is not None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": self._size,
+            "capacity": self._capacity,
+            "dimension": self.dimension or 0,
+            "ivf_lists": 0 if self._centroids is None else int(self._centroids.shape[0]),
+        }
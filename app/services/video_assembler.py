@@ -8,12 +8,12 @@ import logging
 import tempfile
 from pathlib import Path
 from typing import List, Dict, Optional
-import httpx
 import asyncio
 import subprocess
 import json
 
 from app.config import settings
+from app.utils.http_clients import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -184,10 +184,12 @@ class VideoAssemblerService:
         """Download video/audio file to temp directory."""
         path = self.temp_dir / filename
 
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.get(url)
+        client = http_clients.get("media")
+        async with client.stream("GET", url) as response:
             response.raise_for_status()
-            path.write_bytes(response.content)
+            with path.open("wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size=1024 * 1024):
+                    f.write(chunk)
 
         logger.debug(f"Downloaded {filename}: {path.stat().st_size} bytes")
         return path
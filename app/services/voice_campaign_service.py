@@ -1,7 +1,8 @@
 """Voice campaign orchestration service.
 
 Implements campaign lifecycle, target enrollment, queue processing, retries,
-and webhook-driven outcome updates for Vapi outbound calls.
+and webhook-driven outcome updates for Vapi outbound calls. Queue processing
+is delegated to ``CampaignDialer`` (paced, concurrent call starts).
 """
 
 from __future__ import annotations
@@ -17,6 +18,7 @@ from app.database import SessionLocal
 from app.models.contact import Contact
 from app.models.property import Property
 from app.models.voice_campaign import VoiceCampaign, VoiceCampaignTarget
+from app.services.campaign_dialer import CampaignDialer, CampaignView
 from app.services.vapi_service import vapi_service
 
 logger = logging.getLogger(__name__)
@@ -41,6 +43,7 @@ class CampaignTargetStatus:
 class VoiceCampaignService:
     def __init__(self):
         self._process_lock = asyncio.Lock()
+        self.dialer = CampaignDialer(self)
 
     @staticmethod
     def _utcnow() -> datetime:
@@ -373,7 +376,7 @@ class VoiceCampaignService:
             query = query.filter(VoiceCampaignTarget.status == status.lower().strip())
         return query.order_by(VoiceCampaignTarget.id.asc()).limit(limit).all()
 
-    def _resolve_target_property(self, db: Session, campaign: VoiceCampaign, target: VoiceCampaignTarget) -> Property | None:
+    def _resolve_target_property(self, db: Session, campaign: VoiceCampaign | CampaignView, target: VoiceCampaignTarget) -> Property | None:
         property_id = target.property_id or campaign.property_id
         if not property_id and target.contact_id:
             contact = db.query(Contact).filter(Contact.id == target.contact_id).first()
@@ -384,10 +387,23 @@ class VoiceCampaignService:
             return None
         return db.query(Property).filter(Property.id == property_id).first()
 
+    def _due_targets(self, db: Session, campaign_id: int, *, now: datetime, limit: int) -> list[VoiceCampaignTarget]:
+        return (
+            db.query(VoiceCampaignTarget)
+            .filter(
+                VoiceCampaignTarget.campaign_id == campaign_id,
+                VoiceCampaignTarget.status == CampaignTargetStatus.QUEUED,
+                VoiceCampaignTarget.next_attempt_at <= now,
+            )
+            .order_by(VoiceCampaignTarget.next_attempt_at.asc(), VoiceCampaignTarget.id.asc())
+            .limit(limit)
+            .all()
+        )
+
     def _schedule_retry_or_exhaust(
         self,
         *,
-        campaign: VoiceCampaign,
+        campaign: VoiceCampaign | CampaignView,
         target: VoiceCampaignTarget,
         now: datetime,
         error: str,
@@ -410,7 +426,7 @@ class VoiceCampaignService:
         self,
         db: Session,
         *,
-        campaign: VoiceCampaign,
+        campaign: VoiceCampaign | CampaignView,
         target: VoiceCampaignTarget,
         now: datetime,
     ) -> str:
@@ -454,6 +470,13 @@ class VoiceCampaignService:
                 now=now,
                 error=f"Call initiation failed: {exc}",
             )
+        if not response.get("success", True):
+            return self._schedule_retry_or_exhaust(
+                campaign=campaign,
+                target=target,
+                now=now,
+                error=f"Call initiation failed: {response.get('error')}",
+            )
 
         target.status = CampaignTargetStatus.IN_PROGRESS
         target.last_call_id = response.get("call_id")
@@ -482,44 +505,8 @@ class VoiceCampaignService:
         campaign: VoiceCampaign,
         max_calls: int,
     ) -> dict[str, int]:
-        now = self._utcnow()
-        campaign.last_run_at = now
-
-        budget = max(1, min(max_calls, campaign.rate_limit_per_minute))
-        targets = (
-            db.query(VoiceCampaignTarget)
-            .filter(
-                VoiceCampaignTarget.campaign_id == campaign.id,
-                VoiceCampaignTarget.status == CampaignTargetStatus.QUEUED,
-                VoiceCampaignTarget.next_attempt_at <= now,
-            )
-            .order_by(VoiceCampaignTarget.next_attempt_at.asc(), VoiceCampaignTarget.id.asc())
-            .limit(budget)
-            .all()
-        )
-
-        summary = {
-            "targets_processed": 0,
-            "calls_started": 0,
-            "retries_scheduled": 0,
-            "exhausted": 0,
-        }
-
-        for target in targets:
-            summary["targets_processed"] += 1
-            result = await self._process_target_attempt(db, campaign=campaign, target=target, now=now)
-            if result == "started":
-                summary["calls_started"] += 1
-            elif result == "retry":
-                summary["retries_scheduled"] += 1
-            elif result == "exhausted":
-                summary["exhausted"] += 1
-
-            db.commit()
-
-        self._refresh_campaign_completion(db, campaign)
-        db.commit()
-        return summary
+        summaries = await self.dialer.run(db, [campaign], max_calls_per_campaign=max_calls)
+        return summaries[campaign.id]
 
     async def process_campaign_once_locked(
         self,
@@ -554,12 +541,12 @@ class VoiceCampaignService:
                     "exhausted": 0,
                 }
 
-                for campaign in campaigns:
-                    result = await self.process_campaign_once(
-                        db,
-                        campaign=campaign,
-                        max_calls=max_calls_per_campaign,
-                    )
+                results = await self.dialer.run(
+                    db,
+                    campaigns,
+                    max_calls_per_campaign=max_calls_per_campaign,
+                )
+                for result in results.values():
                     for key in ["targets_processed", "calls_started", "retries_scheduled", "exhausted"]:
                         summary[key] += result.get(key, 0)
 
@@ -2,15 +2,103 @@
 AI Website Generator Service
 
 Generates landing page content using Claude AI based on property data
+
+Sections are generated from a small dependency graph (``SECTION_GRAPH``):
+independent sections run concurrently and a section waits only for the
+sections it builds on. Each section is called with just the property fields
+it declares, and its output is memoized under a fingerprint of those fields,
+the template and the fingerprints of its dependencies, so regenerating an
+unchanged listing reuses the cached sections. Photos are not an input of any
+memoized section; they are placed into the hero, gallery and SEO image slots
+after generation, so a photo-only change never re-runs the model.
 """
-import os
-from typing import Dict, Optional
+import asyncio
+import copy
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from app.models.property import Property
 from app.models.zillow_enrichment import ZillowEnrichment
+from app.services.cache import TTLCache
 from app.services.website_templates import WebsiteTemplates
 
+# Bump when a section generator's output changes so memoized sections are regenerated.
+SECTION_VERSION = 2
+SECTION_TTL_SECONDS = 24 * 3600
+
+website_section_cache = TTLCache("website_sections", max_entries=2_000, max_bytes=16 * 1024 * 1024)
+
+
+@dataclass(frozen=True)
+class SectionSpec:
+    """One node of the section pipeline.
+
+    ``inputs`` are the ``property_data`` fields the generator reads (``zillow.x``
+    for enrichment fields); the generator only receives those, so the memo key
+    always covers everything the output depends on. Dependency results are
+    passed as keyword arguments named after the section.
+    """
+    name: str
+    method: str
+    inputs: Tuple[str, ...] = ()
+    depends_on: Tuple[str, ...] = ()
+    memoize: bool = True
+
+
+# Topologically ordered: dependencies come before the sections that use them
+SECTION_GRAPH: Tuple[SectionSpec, ...] = (
+    SectionSpec("hero", "_generate_hero_section",
+                ("address", "city", "price", "bedrooms", "bathrooms", "zillow.zestimate")),
+    # Not a page section: the full feature list shared by about and features
+    SectionSpec("key_features", "_generate_key_features",
+                ("bedrooms", "bathrooms", "square_feet", "property_type", "zillow.year_built", "zillow.lot_size")),
+    SectionSpec("features", "_generate_features_section", depends_on=("key_features",)),
+    SectionSpec("about", "_generate_about_section",
+                ("address", "city", "state", "price", "property_type", "bedrooms", "bathrooms", "square_feet",
+                 "zillow.description", "zillow.zestimate"),
+                depends_on=("key_features",)),
+    # Built from the photos alone, no model call
+    SectionSpec("gallery", "_generate_gallery_section", memoize=False),
+    SectionSpec("contact", "_generate_contact_section", ("address",)),
+    SectionSpec("cta", "_generate_cta_section", ("bedrooms", "bathrooms")),
+    SectionSpec("seo", "_generate_seo_metadata",
+                ("address", "city", "state", "price", "property_type", "bedrooms", "bathrooms", "square_feet")),
+)
+
+# Order of the sections in the generated content
+PAGE_SECTIONS = ("hero", "about", "features", "gallery", "contact", "cta")
+
+
+def section_inputs(spec: SectionSpec, property_data: Dict) -> Dict:
+    """The subset of ``property_data`` a section declares as its inputs."""
+    inputs: Dict = {}
+    for field in spec.inputs:
+        if field.startswith("zillow."):
+            enrichment = property_data.get("zillow")
+            if enrichment is None:
+                continue
+            key = field.split(".", 1)[1]
+            if key in enrichment:
+                inputs.setdefault("zillow", {})[key] = enrichment[key]
+        elif field in property_data:
+            inputs[field] = property_data[field]
+    if "zillow" in property_data:
+        inputs.setdefault("zillow", {})
+    return inputs
+
+
+def section_fingerprint(spec: SectionSpec, template: str, inputs: Dict, dependencies: Tuple[str, ...] = ()) -> str:
+    """Hash of everything a section's output depends on."""
+    payload = json.dumps(
+        [SECTION_VERSION, spec.name, template, inputs, list(dependencies)],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
 
 class WebsiteGeneratorService:
     """AI-powered landing page content generator"""
@@ -40,34 +128,69 @@ class WebsiteGeneratorService:
         template_structure = self.templates.get_template_structure(template)
 
         # Generate AI content for each section
+        results = await self._run_section_graph(property_data, template)
+
         content = {
             "template": template,
             "theme": self._generate_theme(template),
-            "sections": {}
+            "sections": {name: results[name] for name in PAGE_SECTIONS},
+            "seo": results["seo"],
         }
+        self._apply_photos(content, property_data)
 
-        # Generate hero section
-        content["sections"]["hero"] = await self._generate_hero_section(property_data)
-
-        # Generate about section
-        content["sections"]["about"] = await self._generate_about_section(property_data)
-
-        # Generate features section
-        content["sections"]["features"] = await self._generate_features_section(property_data)
+        return content
 
-        # Generate gallery section
-        content["sections"]["gallery"] = await self._generate_gallery_section(property_data)
+    async def _run_section_graph(self, property_data: Dict, template: str) -> Dict[str, Dict]:
+        """Generate every section in SECTION_GRAPH, independent ones concurrently"""
+        fingerprints: Dict[str, str] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        try:
+            for spec in SECTION_GRAPH:
+                if spec.memoize:
+                    inputs = section_inputs(spec, property_data)
+                    fingerprints[spec.name] = section_fingerprint(
+                        spec, template, inputs, tuple(fingerprints[name] for name in spec.depends_on)
+                    )
+                else:
+                    inputs = property_data
+                tasks[spec.name] = asyncio.create_task(
+                    self._build_section(spec, inputs, fingerprints.get(spec.name), tasks)
+                )
+            results = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return dict(zip(tasks, results))
+
+    async def _build_section(
+        self,
+        spec: SectionSpec,
+        inputs: Dict,
+        fingerprint: Optional[str],
+        tasks: Dict[str, asyncio.Task]
+    ) -> Dict:
+        """Generate one section after its dependencies, reusing a memoized result"""
+        dependencies = {name: await tasks[name] for name in spec.depends_on}
 
-        # generate contact section
-        content["sections"]["contact"] = await self._generate_contact_section(property_data)
+        key = f"{spec.name}:{fingerprint}" if spec.memoize else None
+        if key:
+            cached = website_section_cache.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
 
-        # Generate CTA section
-        content["sections"]["cta"] = await self._generate_cta_section(property_data)
+        section = await getattr(self, spec.method)(inputs, **dependencies)
 
-        # Generate SEO metadata
-        content["seo"] = await self._generate_seo_metadata(property_data)
+        if key:
+            website_section_cache.set(key, copy.deepcopy(section), SECTION_TTL_SECONDS)
+        return section
 
-        return content
+    def _apply_photos(self, content: Dict, property_data: Dict) -> None:
+        """Place the listing photos into the image slots of the generated sections"""
+        photos = property_data.get("zillow", {}).get("photos") or []
+        cover = photos[0] if photos else None
+        content["sections"]["hero"]["background_image"] = cover
+        content["seo"]["og_image"] = cover
 
     def _gather_property_data(self, property_obj: Property) -> Dict:
         """Gather all relevant property data"""
@@ -142,11 +265,10 @@ class WebsiteGeneratorService:
             "price_note": price_note,
             "primary_cta": "Schedule a Showing",
             "secondary_cta": "Download Brochure",
-            "background_image": property_data.get("zillow", {}).get("photos", [None])[0] if property_data.get("zillow", {}).get("photos") else None,
             "overlay": True
         }
 
-    async def _generate_about_section(self, property_data: Dict) -> Dict:
+    async def _generate_about_section(self, property_data: Dict, key_features: Dict) -> Dict:
         """Generate about/description section"""
         description = property_data.get("zillow", {}).get(
             "description",
@@ -155,22 +277,22 @@ class WebsiteGeneratorService:
             f"{property_data['bathrooms']} bathrooms with {property_data['square_feet']:,} square feet of living space."
         )
 
-        features = self._extract_key_features(property_data)
-
         return {
             "title": "About This Property",
             "description": description[:500] + "..." if description and len(description) > 500 else description,
-            "features": features,
+            "features": list(key_features["features"]),
             "highlights": self._generate_highlights(property_data)
         }
 
-    async def _generate_features_section(self, property_data: Dict) -> Dict:
-        """Generate features section"""
-        features = self._extract_key_features(property_data)
+    async def _generate_key_features(self, property_data: Dict) -> Dict:
+        """Extract the full feature list once for the sections that show it"""
+        return {"features": self._extract_key_features(property_data)}
 
+    async def _generate_features_section(self, property_data: Dict, key_features: Dict) -> Dict:
+        """Generate features section"""
         return {
             "title": "Property Features",
-            "features": features[:12],  # Limit to 12 features
+            "features": key_features["features"][:12],  # Limit to 12 features
             "layout": "grid"  # grid or list
         }
 
@@ -252,7 +374,6 @@ class WebsiteGeneratorService:
                 "property for sale",
                 f"{property_data['address']}"
             ],
-            "og_image": property_data.get("zillow", {}).get("photos", [None])[0],
             "twitter_card": "summary_large_image"
         }
 
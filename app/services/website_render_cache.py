@@ -0,0 +1,222 @@
+"""
+Render cache for public property websites.
+
+``WebsiteRenderer.render_website`` builds the whole page (HTML, CSS and JS)
+from the ``PropertyWebsite`` row. The output only changes when the website or
+its property changes, so pages are rendered once per *content version* — a
+hash of everything the render reads plus the property's ``updated_at`` — and
+kept pre-compressed (gzip, and brotli when the ``brotli`` package is
+installed) in a bounded in-process LRU keyed by website id. A new version
+replaces the old entry; the management endpoints also drop entries
+explicitly. Concurrent misses for the same page share one render.
+
+The version doubles as the ``ETag``, so revisits are answered with a 304 from
+the cached entry without rendering or compressing anything.
+
+Page views are recorded through a write-behind ``ActivityEventWriter`` on the
+``website_analytics`` table instead of a commit per hit.
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from app.middleware.activity_logger import ActivityEventWriter
+from app.models.property_website import PropertyWebsite, WebsiteAnalytics
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+# Bump when WebsiteRenderer output changes so cached pages are re-rendered.
+RENDERER_VERSION = 1
+
+_GZIP_LEVEL = 9
+_BROTLI_QUALITY = 11
+
+
+def content_version(website: PropertyWebsite, property_updated_at: Optional[datetime] = None) -> str:
+    """Hash of the render inputs; changes whenever the rendered page would."""
+    inputs = json.dumps(
+        [
+            RENDERER_VERSION,
+            website.id,
+            website.website_name,
+            website.website_slug,
+            website.template,
+            website.theme,
+            website.content,
+            property_updated_at.isoformat() if property_updated_at else None,
+            datetime.now().year,  # the footer's copyright year
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(inputs.encode()).hexdigest()[:32]
+
+
+@dataclass
+class RenderedPage:
+    version: str
+    html: bytes
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def etag(self) -> str:
+        return f'W/"{self.version}"'
+
+    @property
+    def size(self) -> int:
+        return len(self.html) + sum(len(body) for body in self.encoded.values())
+
+    def body(self, accept_encoding: str) -> tuple[bytes, Optional[str]]:
+        """The smallest stored representation the client accepts."""
+        accepted = {part.split(";")[0].strip().lower() for part in accept_encoding.split(",")}
+        for encoding in ("br", "gzip"):
+            if encoding in accepted and encoding in self.encoded:
+                return self.encoded[encoding], encoding
+        return self.html, None
+
+
+def build_page(version: str, html: str) -> RenderedPage:
+    raw = html.encode("utf-8")
+    page = RenderedPage(version=version, html=raw)
+    page.encoded["gzip"] = gzip.compress(raw, _GZIP_LEVEL, mtime=0)
+    if BROTLI_AVAILABLE:
+        page.encoded["br"] = brotli.compress(raw, mode=brotli.MODE_TEXT, quality=_BROTLI_QUALITY)
+    return page
+
+
+def etag_matches(if_none_match: Optional[str], page: RenderedPage) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return f'"{page.version}"' in tags
+
+
+class WebsiteRenderCache:
+    """Bounded LRU of rendered pages, one entry per website."""
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self._pages: "OrderedDict[int, RenderedPage]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._inflight: dict[tuple[int, str], "asyncio.Future[RenderedPage]"] = {}
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+        self.coalesced = 0
+
+    def get(self, website_id: int, version: str) -> Optional[RenderedPage]:
+        with self._lock:
+            page = self._pages.get(website_id)
+            if page is None or page.version != version:
+                self.misses += 1
+                return None
+            self._pages.move_to_end(website_id)
+            self.hits += 1
+            return page
+
+    def put(self, website_id: int, page: RenderedPage) -> None:
+        with self._lock:
+            old = self._pages.pop(website_id, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._pages[website_id] = page
+            self._bytes += page.size
+            while self._pages and (len(self._pages) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._pages.popitem(last=False)
+                self._bytes -= evicted.size
+
+    def invalidate(self, website_id: int) -> None:
+        with self._lock:
+            page = self._pages.pop(website_id, None)
+            if page is not None:
+                self._bytes -= page.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+            self._bytes = 0
+
+    async def get_or_render(self, db, website: PropertyWebsite, version: str) -> RenderedPage:
+        """Cached page for ``version``, rendering and compressing it on a miss."""
+        page = self.get(website.id, version)
+        if page is not None:
+            return page
+
+        key = (website.id, version)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            from app.services.website_renderer import WebsiteRenderer
+
+            html = await WebsiteRenderer(db).render_website(website)
+            # Brotli at quality 11 takes tens of ms; keep it off the event loop
+            page = await asyncio.to_thread(build_page, version, html)
+            self.renders += 1
+            self.put(website.id, page)
+            future.set_result(page)
+            return page
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._pages),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "renders": self.renders,
+            "coalesced": self.coalesced,
+            "brotli": BROTLI_AVAILABLE,
+        }
+
+
+website_render_cache = WebsiteRenderCache()
+
+# Write-behind recorder for public page views (started on app startup, flushed on shutdown)
+website_view_writer = ActivityEventWriter(
+    max_queue=50_000,
+    batch_size=500,
+    flush_interval_ms=1000,
+    table=WebsiteAnalytics.__table__,
+)
+
+
+def record_view(website_id: int, visitor_ip: Optional[str], user_agent: Optional[str], referrer: Optional[str]) -> None:
+    """Queue a page view; written synchronously when the writer is not running."""
+    website_view_writer.enqueue({
+        "website_id": website_id,
+        "event_type": "view",
+        "event_data": {},
+        "visitor_ip": visitor_ip,
+        "user_agent": user_agent,
+        "referrer": referrer,
+        "created_at": datetime.utcnow(),
+    })
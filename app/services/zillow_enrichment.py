@@ -1,11 +1,15 @@
 """
 Zillow property enrichment service using RapidAPI
 """
-import httpx
 from typing import Dict, Any, Optional
 from app.config import settings
 from app.services.cache import zillow_cache
+from app.services.tiered_cache import tiered_cache
 from app.utils.circuit_breaker import circuit_breakers
+from app.utils.http_clients import http_clients
+
+# L1 (in-process) + L2 (Redis); concurrent lookups for one address share a call.
+zillow_tiered_cache = tiered_cache("zillow", l1=zillow_cache, ttl=21600, stale_ttl=3600)
 
 
 class ZillowEnrichmentService:
@@ -30,10 +34,12 @@ class ZillowEnrichmentService:
             httpx.HTTPError: If API request fails
         """
         cache_key = f"zillow:{address.strip().lower()}"
-        cached = zillow_cache.get(cache_key)
-        if cached is not None:
-            return cached
+        return await zillow_tiered_cache.get_or_load(
+            cache_key, lambda: self._fetch_by_address(address)
+        )
 
+    async def _fetch_by_address(self, address: str) -> Dict[str, Any]:
+        """Call the Zillow API (uncached)."""
         breaker = circuit_breakers.get("zillow")
         if not breaker.is_available():
             raise RuntimeError("Zillow API temporarily unavailable (circuit open)")
@@ -48,7 +54,7 @@ class ZillowEnrichmentService:
         encoded_address = urllib.parse.quote(address)
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_clients.session("rapidapi") as client:
                 response = await client.get(
                     f"{self.base_url}/pro/byaddress",
                     params={"propertyaddress": address},
@@ -60,7 +66,6 @@ class ZillowEnrichmentService:
 
             # Parse the response
             result = self._parse_zillow_response(data)
-            zillow_cache.set(cache_key, result, ttl_seconds=21600)  # 6 hours
             breaker.record_success()
             return result
         except Exception as e:
@@ -6,6 +6,7 @@ Designed for Lob.com specifications.
 """
 
 import logging
+from typing import List
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,117 @@
+"""
+Geohash encoding, radius cell covers and haversine distance.
+
+Properties store a fixed-precision geohash next to their coordinates. A radius
+search turns the circle into a handful of geohash prefixes (the cell holding
+the centre plus its eight neighbours, at the finest precision whose cells are
+at least one radius across) and each prefix into a plain B-tree range scan:
+
+    for cell in covering_cells(lat, lng, radius_mi):
+        low, high = prefix_range(cell)   # geohash BETWEEN low AND high
+
+Exact distances are then computed with ``haversine_mi``, which accepts NumPy
+arrays as well as scalars.
+"""
+
+import math
+
+import numpy as np
+
+EARTH_RADIUS_MI = 3958.8
+MILES_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_MI / 180.0
+
+# Stored precision: 9 characters is a ~5m x 5m cell.
+GEOHASH_PRECISION = 9
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def encode_geohash(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    chars: list[str] = []
+    value = 0
+    bits = 0
+    even = True  # geohash interleaves bits starting with longitude
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            if lng >= mid:
+                value = value * 2 + 1
+                lng_lo = mid
+            else:
+                value *= 2
+                lng_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                value = value * 2 + 1
+                lat_lo = mid
+            else:
+                value *= 2
+                lat_hi = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            value = 0
+            bits = 0
+    return "".join(chars)
+
+
+def cell_size_deg(precision: int) -> tuple[float, float]:
+    """(height, width) in degrees of a geohash cell at ``precision``."""
+    total_bits = 5 * precision
+    lat_bits = total_bits // 2
+    lng_bits = total_bits - lat_bits
+    return 180.0 / 2**lat_bits, 360.0 / 2**lng_bits
+
+
+def radius_deg(lat: float, radius_mi: float) -> tuple[float, float]:
+    """(lat, lng) half-extents in degrees of a circle of ``radius_mi`` centred at ``lat``."""
+    dlat = radius_mi / MILES_PER_DEGREE_LAT
+    cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+    dlng = min(180.0, radius_mi / (MILES_PER_DEGREE_LAT * cos_lat))
+    return dlat, dlng
+
+
+def bounding_box(lat: float, lng: float, radius_mi: float) -> tuple[float, float, float, float]:
+    """(min_lat, max_lat, min_lng, max_lng) enclosing the circle; longitudes may pass ±180."""
+    dlat, dlng = radius_deg(lat, radius_mi)
+    return max(-90.0, lat - dlat), min(90.0, lat + dlat), lng - dlng, lng + dlng
+
+
+def covering_cells(lat: float, lng: float, radius_mi: float, max_precision: int = GEOHASH_PRECISION) -> list[str]:
+    """Geohash prefixes whose cells together cover the circle of ``radius_mi`` around (lat, lng)."""
+    dlat, dlng = radius_deg(lat, radius_mi)
+    precision = 0
+    for candidate in range(max_precision, 0, -1):
+        height, width = cell_size_deg(candidate)
+        if height >= dlat and width >= dlng:
+            precision = candidate
+            break
+    if precision == 0:
+        # Wider than a first-level cell: the whole globe.
+        return [""]
+
+    height, width = cell_size_deg(precision)
+    cells = set()
+    for step_lat in (-1, 0, 1):
+        for step_lng in (-1, 0, 1):
+            cell_lat = min(90.0, max(-90.0, lat + step_lat * height))
+            cell_lng = (lng + step_lng * width + 180.0) % 360.0 - 180.0
+            cells.add(encode_geohash(cell_lat, cell_lng, precision))
+    return sorted(cells)
+
+
+def prefix_range(prefix: str, precision: int = GEOHASH_PRECISION) -> tuple[str, str]:
+    """Inclusive (low, high) bounds of every stored geohash starting with ``prefix``."""
+    pad = precision - len(prefix)
+    return prefix + _BASE32[0] * pad, prefix + _BASE32[-1] * pad
+
+
+def haversine_mi(lat1, lng1, lat2, lng2):
+    """Great-circle distance in miles; arguments may be scalars or NumPy arrays."""
+    lat1, lng1, lat2, lng2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MI * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
@@ -0,0 +1,246 @@
+"""Shared, pooled HTTP clients for outbound integrations.
+
+Creating an ``httpx.AsyncClient`` per call pays a fresh TCP + TLS handshake
+every time. This registry keeps one long-lived client per upstream (RapidAPI,
+Exa, Lob, Shotstack, OpenAI, DocuSeal, ...) with its own keep-alive pool,
+connection cap and timeout, and closes them on application shutdown.
+
+Usage:
+    from app.utils.http_clients import http_clients
+
+    async with http_clients.session("rapidapi") as client:
+        response = await client.get(url, headers=headers)
+
+``session()`` never closes the shared client, so existing
+``async with httpx.AsyncClient() as client:`` blocks can switch over by
+changing a single line. Use ``get()`` when holding the client directly.
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from threading import Lock
+from typing import AsyncIterator, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class HttpClientProfile:
+    """Pool and timeout settings for one upstream."""
+
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    follow_redirects: bool = False
+
+
+# max_connections doubles as the per-host concurrency limit: extra requests
+# wait for a free connection instead of opening more sockets.
+PROFILES: dict[str, HttpClientProfile] = {
+    "default": HttpClientProfile(),
+    "rapidapi": HttpClientProfile(timeout=30.0, max_connections=20),
+    "google_places": HttpClientProfile(timeout=10.0, max_connections=20),
+    "exa": HttpClientProfile(timeout=60.0, max_connections=10),
+    "lob": HttpClientProfile(timeout=30.0, max_connections=10),
+    "shotstack": HttpClientProfile(timeout=60.0, max_connections=10),
+    "openai": HttpClientProfile(timeout=60.0, max_connections=20),
+    "docuseal": HttpClientProfile(timeout=30.0, max_connections=10),
+    "proxypics": HttpClientProfile(timeout=30.0, max_connections=5),
+    "vapi": HttpClientProfile(timeout=30.0, max_connections=20),
+    "gov_data": HttpClientProfile(timeout=15.0, max_connections=20, follow_redirects=True),
+    "portal": HttpClientProfile(timeout=20.0, max_connections=20, follow_redirects=True),
+    "media": HttpClientProfile(
+        timeout=300.0, max_connections=10, max_keepalive_connections=4, follow_redirects=True
+    ),
+}
+
+
+class _ClientStats:
+    __slots__ = ("requests", "errors", "in_flight")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    """Wraps the pooled transport to count requests, failures and in-flight calls."""
+
+    def __init__(self, inner: httpx.AsyncHTTPTransport, stats: _ClientStats):
+        self.inner = inner
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.requests += 1
+        self.stats.in_flight += 1
+        try:
+            response = await self.inner.handle_async_request(request)
+        except Exception:
+            self.stats.errors += 1
+            raise
+        finally:
+            self.stats.in_flight -= 1
+        if response.status_code >= 500:
+            self.stats.errors += 1
+        return response
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    def open_connections(self) -> int:
+        pool = getattr(self.inner, "_pool", None)
+        return len(getattr(pool, "connections", []) or [])
+
+
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    """Shares a registry pool with a caller-owned client; closing it is a no-op."""
+
+    def __init__(self, inner: _CountingTransport):
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class HttpClientRegistry:
+    """App-lifetime registry of pooled ``httpx.AsyncClient`` instances."""
+
+    def __init__(self):
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._transports: dict[str, _CountingTransport] = {}
+        self._loops: dict[str, Optional[asyncio.AbstractEventLoop]] = {}
+        self._stats: dict[str, _ClientStats] = {}
+        self._closing: set[asyncio.Future] = set()
+        self._lock = Lock()
+
+    @staticmethod
+    def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _build(self, name: str, profile: HttpClientProfile, **client_kwargs) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=profile.max_connections,
+            max_keepalive_connections=profile.max_keepalive_connections,
+            keepalive_expiry=profile.keepalive_expiry,
+        )
+        inner = httpx.AsyncHTTPTransport(
+            limits=limits,
+            http2=profile.http2 and HTTP2_AVAILABLE,
+            retries=1,
+        )
+        stats = self._stats.setdefault(name, _ClientStats())
+        transport = _CountingTransport(inner, stats)
+        self._transports[name] = transport
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(profile.timeout, connect=profile.connect_timeout),
+            follow_redirects=profile.follow_redirects,
+            **client_kwargs,
+        )
+
+    def get(self, name: str, profile: Optional[str] = None, **client_kwargs) -> httpx.AsyncClient:
+        """Get or create the shared client for an upstream.
+
+        ``profile`` selects pool settings from PROFILES (defaults to ``name``,
+        then "default"). Extra keyword arguments such as ``base_url`` and
+        ``headers`` only apply when the client is first created.
+        """
+        loop = self._current_loop()
+        with self._lock:
+            client = self._clients.get(name)
+            # Pooled connections are bound to the event loop that opened them.
+            if client is not None and not client.is_closed and self._loops.get(name) is loop:
+                return client
+            stale = (client, self._loops.get(name)) if client is not None and not client.is_closed else None
+            settings = PROFILES.get(profile or name) or PROFILES["default"]
+            client = self._build(name, settings, **client_kwargs)
+            self._clients[name] = client
+            self._loops[name] = loop
+        if stale is not None:
+            logger.debug("HTTP client %s rebuilt for a new event loop", name)
+            self._retire(name, *stale)
+        return client
+
+    def _retire(self, name: str, client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Close a replaced client, on the loop that opened its connections when it still runs."""
+        if loop is not None and loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            # Its loop is gone; close what can be closed from here
+            current = self._current_loop()
+            if current is None:
+                logger.debug("HTTP client %s replaced with no loop to close it on", name)
+                return
+            future = current.create_task(client.aclose())
+        self._closing.add(future)
+        future.add_done_callback(self._closed)
+
+    def _closed(self, future) -> None:
+        self._closing.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug("Error closing replaced HTTP client: %s", future.exception())
+
+    def transport(self, name: str, profile: Optional[str] = None) -> httpx.AsyncBaseTransport:
+        """Pooled transport for clients that need their own base_url/headers.
+
+        The returned transport is not closed when the owning client is.
+        """
+        self.get(name, profile=profile)
+        with self._lock:
+            return _BorrowedTransport(self._transports[name])
+
+    @asynccontextmanager
+    async def session(self, name: str, profile: Optional[str] = None, **client_kwargs) -> AsyncIterator[httpx.AsyncClient]:
+        """Async context manager yielding the shared client without closing it."""
+        yield self.get(name, profile=profile, **client_kwargs)
+
+    async def aclose_all(self) -> None:
+        """Close every client (call on application shutdown)."""
+        with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+            self._transports.clear()
+            self._loops.clear()
+        for name, client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug("Error closing HTTP client %s: %s", name, e)
+
+    def status(self) -> dict:
+        """Per-client request and connection counters."""
+        with self._lock:
+            return {
+                name: {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "in_flight": stats.in_flight,
+                    "open_connections": (
+                        self._transports[name].open_connections() if name in self._transports else 0
+                    ),
+                }
+                for name, stats in self._stats.items()
+            }
+
+
+# Global registry
+http_clients = HttpClientRegistry()
@@ -0,0 +1,56 @@
+"""Token bucket for pacing calls to rate-limited upstreams.
+
+Not thread-safe: each bucket is used from one event loop (the voice campaign
+dialer keeps one per campaign, ``LobClient`` one per client).
+
+Usage:
+    from app.utils.rate_limit import TokenBucket
+
+    bucket = TokenBucket(rate_per_minute=60)
+    granted = bucket.take(10)
+"""
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Refills ``rate_per_minute`` tokens per minute, holding at most ``capacity``."""
+
+    def __init__(self, rate_per_minute: int, capacity: int | None = None, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.rate_per_minute = max(1, int(rate_per_minute))
+        self.capacity = float(capacity or self.rate_per_minute)
+        self.tokens = self.capacity
+        self.updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        elapsed = max(0.0, now - self.updated)
+        self.updated = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_minute / 60.0)
+
+    def set_rate(self, rate_per_minute: int) -> None:
+        rate_per_minute = max(1, int(rate_per_minute))
+        if rate_per_minute == self.rate_per_minute:
+            return
+        self._refill()
+        self.rate_per_minute = rate_per_minute
+        self.capacity = float(rate_per_minute)
+        self.tokens = min(self.tokens, self.capacity)
+
+    def take(self, wanted: int) -> int:
+        """Take up to ``wanted`` whole tokens without waiting; returns how many were granted."""
+        self._refill()
+        granted = max(0, min(int(wanted), int(self.tokens)))
+        self.tokens -= granted
+        return granted
+
+    def refund(self, count: int) -> None:
+        if count > 0:
+            self.tokens = min(self.capacity, self.tokens + count)
+
+    def seconds_until_available(self) -> float:
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) * 60.0 / self.rate_per_minute
@@ -1,33 +1,331 @@
-"""WebSocket connection manager."""
+"""WebSocket pub/sub hub.
 
+Connections subscribe to topics such as ``agent:12``, ``property:7`` or
+``job:bulk:3``. ``publish`` serializes a message once and puts the text on
+the bounded outbound queue of every connection subscribed to any of its
+topics; each connection drains its queue with its own writer task, so a slow
+client only ever delays itself. A connection whose queue fills up, or whose
+send fails or times out, is dropped.
+
+Clients that do not ask for topics get ``DEFAULT_TOPICS`` plus their own
+agent topic. A client can change its subscriptions at any time by sending
+``{"action": "subscribe", "topics": [...]}`` (or ``"unsubscribe"``).
+
+When Redis is available, published messages are also forwarded on a pub/sub
+channel, so connections held by other worker processes receive them too. The
+listener resubscribes after Redis errors. ``close`` (called on application
+shutdown) stops the listener and the writer tasks.
+
+Usage:
+    await manager.publish([property_topic(prop.id), agent_topic(prop.agent_id)], payload)
+"""
+
+import asyncio
+import json
 import logging
-from typing import List
+import uuid
+from typing import Iterable, Optional
 
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+BROADCAST_TOPIC = "broadcast"
+DISPLAY_TOPIC = "display"
+ACTIVITY_TOPIC = "activity"
+DEFAULT_TOPICS = (BROADCAST_TOPIC, DISPLAY_TOPIC, ACTIVITY_TOPIC)
+
+SEND_QUEUE_SIZE = 256
+SEND_TIMEOUT_SECONDS = 10.0
+CLOSE_TIMEOUT_SECONDS = 2.0
+FANOUT_CHANNEL = "rc:ws:fanout"
+
+# Close codes for dropped consumers
+_CLOSE_SLOW = 1013  # try again later
+_CLOSE_ERROR = 1011
+
+
+def agent_topic(agent_id: int) -> str:
+    return f"agent:{agent_id}"
+
+
+def property_topic(property_id: int) -> str:
+    return f"property:{property_id}"
+
+
+def job_topic(kind: str, job_id: int | str) -> str:
+    return f"job:{kind}:{job_id}"
+
+
+def _dumps(message: dict) -> str:
+    # Same encoding as WebSocket.send_json, tolerant of datetimes and enums.
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class _Connection:
+    __slots__ = ("websocket", "agent_id", "topics", "queue", "writer")
+
+    def __init__(self, websocket: WebSocket, agent_id: Optional[int], queue_size: int):
+        self.websocket = websocket
+        self.agent_id = agent_id
+        self.topics: set[str] = set()
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.writer: Optional[asyncio.Task] = None
+
 
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    def __init__(self, queue_size: int = SEND_QUEUE_SIZE, send_timeout: float = SEND_TIMEOUT_SECONDS):
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self._connections: dict[WebSocket, _Connection] = {}
+        self._subscribers: dict[str, set[_Connection]] = {}
+        self._background: set[asyncio.Task] = set()
+        self._instance_id = uuid.uuid4().hex
+        self._listener_task: Optional[asyncio.Task] = None
+        self._closing = False
+        self._stats = {"published": 0, "delivered": 0, "dropped_slow": 0, "dropped_dead": 0, "remote": 0}
 
-    async def connect(self, websocket: WebSocket):
+    @property
+    def active_connections(self) -> list[WebSocket]:
+        return list(self._connections)
+
+    def stats(self) -> dict:
+        return {
+            **self._stats,
+            "connections": len(self._connections),
+            "topics": len(self._subscribers),
+            "listening": self._listener_task is not None and not self._listener_task.done(),
+        }
+
+    # ── Connections ──
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        agent_id: Optional[int] = None,
+        topics: Optional[Iterable[str]] = None,
+    ) -> None:
         await websocket.accept()
-        self.active_connections.append(websocket)
+        conn = _Connection(websocket, agent_id, self.queue_size)
+        self._connections[websocket] = conn
+        self.subscribe(websocket, DEFAULT_TOPICS if topics is None else topics)
+        if agent_id is not None:
+            self.subscribe(websocket, [agent_topic(agent_id)])
+        conn.writer = asyncio.create_task(self._write(conn))
+
+    def disconnect(self, websocket: WebSocket) -> None:
+        conn = self._connections.pop(websocket, None)
+        if conn is None:
+            return
+        for topic in conn.topics:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(conn)
+                if not subscribers:
+                    del self._subscribers[topic]
+        conn.topics.clear()
+        if conn.writer is not None and conn.writer is not asyncio.current_task():
+            conn.writer.cancel()
+
+    def subscribe(self, websocket: WebSocket, topics: Iterable[str]) -> list[str]:
+        """Subscribe a connection; returns the topics accepted.
 
-    def disconnect(self, websocket: WebSocket):
+        Agent topics other than the connection's own are refused.
+        """
+        conn = self._connections.get(websocket)
+        if conn is None:
+            return []
+        accepted = []
+        for topic in topics:
+            topic = str(topic).strip()
+            if not topic:
+                continue
+            if topic.startswith("agent:") and conn.agent_id is not None and topic != agent_topic(conn.agent_id):
+                continue
+            conn.topics.add(topic)
+            self._subscribers.setdefault(topic, set()).add(conn)
+            accepted.append(topic)
+        return accepted
+
+    def unsubscribe(self, websocket: WebSocket, topics: Iterable[str]) -> None:
+        conn = self._connections.get(websocket)
+        if conn is None:
+            return
+        for topic in topics:
+            conn.topics.discard(topic)
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(conn)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+    def handle_client_message(self, websocket: WebSocket, data: str) -> bool:
+        """Apply a subscribe/unsubscribe request from the client; False if ``data`` is not one."""
         try:
-            self.active_connections.remove(websocket)
+            message = json.loads(data)
         except ValueError:
+            return False
+        if not isinstance(message, dict) or message.get("action") not in ("subscribe", "unsubscribe"):
+            return False
+        topics = message.get("topics") or []
+        if isinstance(topics, str):
+            topics = [topics]
+        if message["action"] == "subscribe":
+            accepted = self.subscribe(websocket, topics)
+        else:
+            self.unsubscribe(websocket, topics)
+            accepted = []
+        conn = self._connections.get(websocket)
+        if conn is not None:
+            self._enqueue(conn, _dumps({
+                "action": "subscriptions",
+                "subscribed": accepted,
+                "topics": sorted(conn.topics),
+            }))
+        return True
+
+    # ── Publishing ──
+
+    async def publish(self, topics: str | Iterable[str], message: dict) -> int:
+        """Send ``message`` to every connection subscribed to any of ``topics``.
+
+        Returns how many local connections it was queued for.
+        """
+        topics = [topics] if isinstance(topics, str) else list(dict.fromkeys(topics))
+        text = _dumps(message)
+        self._stats["published"] += 1
+        delivered = self._deliver(topics, text)
+        await self._forward(topics, text)
+        return delivered
+
+    async def broadcast(self, message: dict) -> int:
+        """Publish to ``BROADCAST_TOPIC``, which clients subscribe to by default."""
+        return await self.publish(BROADCAST_TOPIC, message)
+
+    def _deliver(self, topics: list[str], text: str) -> int:
+        targets: set[_Connection] = set()
+        for topic in topics:
+            targets.update(self._subscribers.get(topic, ()))
+        delivered = 0
+        for conn in targets:
+            delivered += self._enqueue(conn, text)
+        self._stats["delivered"] += delivered
+        return delivered
+
+    def _enqueue(self, conn: _Connection, text: str) -> bool:
+        try:
+            conn.queue.put_nowait(text)
+            return True
+        except asyncio.QueueFull:
+            self._stats["dropped_slow"] += 1
+            logger.info("Dropping slow WebSocket consumer (agent %s)", conn.agent_id)
+            self._drop(conn, _CLOSE_SLOW)
+            return False
+
+    async def _write(self, conn: _Connection) -> None:
+        try:
+            while True:
+                text = await conn.queue.get()
+                await asyncio.wait_for(conn.websocket.send_text(text), self.send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if self._closing or asyncio.get_running_loop().is_closed():
+                return
+            self._stats["dropped_dead"] += 1
+            logger.debug("Dropping WebSocket connection after send failure: %s", e)
+            self._drop(conn, _CLOSE_ERROR)
+
+    def _drop(self, conn: _Connection, code: int) -> None:
+        if conn.websocket not in self._connections:
+            return
+        self.disconnect(conn.websocket)
+        self._spawn(self._close(conn.websocket, code))
+
+    async def _close(self, websocket: WebSocket, code: int) -> None:
+        try:
+            await asyncio.wait_for(websocket.close(code=code), CLOSE_TIMEOUT_SECONDS)
+        except Exception:
             pass
 
-    async def broadcast(self, message: dict):
-        for connection in self.active_connections:
+    def _spawn(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    # ── Cross-process fan-out (Redis pub/sub) ──
+
+    async def _forward(self, topics: list[str], text: str) -> None:
+        from app.services.redis_cache import get_async_redis
+        r = await get_async_redis()
+        if r is None:
+            return
+        try:
+            await r.publish(FANOUT_CHANNEL, json.dumps({"origin": self._instance_id, "topics": topics, "text": text}))
+        except Exception as e:
+            logger.warning("WebSocket fan-out publish failed: %s", e)
+
+    async def _listen(self) -> None:
+        """Deliver messages from other processes until cancelled, resubscribing after errors."""
+        from app.services.redis_cache import get_async_redis
+        while True:
+            r = await get_async_redis()
+            if r is None:
+                await asyncio.sleep(5)
+                continue
+            pubsub = r.pubsub()
             try:
-                await connection.send_json(message)
+                await pubsub.subscribe(FANOUT_CHANNEL)
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=5.0)
+                    if message is None:
+                        continue
+                    try:
+                        payload = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        continue
+                    if payload.get("origin") != self._instance_id and payload.get("text"):
+                        self._stats["remote"] += 1
+                        self._deliver(payload.get("topics") or [], payload["text"])
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.debug("Error sending to WS connection: %s", e)
+                logger.warning("WebSocket fan-out listener error, resubscribing: %s", e)
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def start_listener(self) -> None:
+        """Receive messages published by other processes (call on application startup)."""
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        task, self._listener_task = self._listener_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def close(self) -> None:
+        """Stop the listener and every connection's writer task (call on application shutdown)."""
+        self._closing = True
+        await self.stop_listener()
+        writers = [conn.writer for conn in self._connections.values() if conn.writer is not None]
+        for websocket in list(self._connections):
+            self.disconnect(websocket)
+        for task in writers:
+            task.cancel()
+        # Pending closes of dropped connections are bounded by CLOSE_TIMEOUT_SECONDS
+        tasks = writers + list(self._background)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._closing = False
 
 
 manager = ConnectionManager()
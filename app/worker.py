@@ -16,6 +16,7 @@ import os
 import sys
 
 from arq import cron
+from arq.worker import func
 from arq.connections import RedisSettings
 
 logger = logging.getLogger(__name__)
@@ -104,17 +105,13 @@ async def process_webhook_event(ctx, event_type: str, payload: dict):
 
 
 async def execute_campaign(ctx, campaign_id: int):
-    """Execute a direct mail or contact list campaign."""
-    from app.database import SessionLocal
-    from app.services.lob_service import execute_campaign as _exec
-    db = SessionLocal()
+    """Run or resume a direct mail or contact list campaign."""
+    from app.services.direct_mail_campaign_runner import execute_campaign as _exec
     try:
         await _exec(campaign_id)
     except Exception as e:
         logger.error("execute_campaign failed for %d: %s", campaign_id, e)
         raise
-    finally:
-        db.close()
 
 
 async def clone_voice_background(ctx, agent_id: int, agent_name: str, voice_sample_url: str):
@@ -142,24 +139,18 @@ async def generate_daily_digest(ctx):
 
 
 async def run_task_loop_tick(ctx):
-    """Single tick of the scheduled task runner (called by cron)."""
-    from app.database import SessionLocal
-    from app.services.scheduled_task_service import scheduled_task_service
-    from app.services.task_runner import _execute_task
+    """Claim and run due scheduled tasks (called by cron).
+
+    Tasks are leased, so this is safe alongside in-process runners.
+    """
+    from app.services.task_runner import task_runner
 
-    db = SessionLocal()
     try:
-        due_tasks = scheduled_task_service.get_due_tasks(db)
-        for task in due_tasks:
-            try:
-                await _execute_task(db, task, scheduled_task_service)
-            except Exception as e:
-                logger.error("Task %d failed: %s", task.id, e)
-                scheduled_task_service.mark_failed(db, task)
+        started = await task_runner.run_once()
+        if started:
+            logger.info("Task loop tick: %d task(s) run", started)
     except Exception as e:
         logger.error("Task loop tick error: %s", e)
-    finally:
-        db.close()
 
 
 async def run_pipeline_check(ctx):
@@ -195,13 +186,153 @@ async def run_alert_check(ctx):
         db.close()
 
 
+async def refresh_embeddings(ctx, table: str = "all", only_missing: bool = False):
+    """Embed new rows and re-embed rows whose text changed (called by cron)."""
+    from app.services.embedding_pipeline import embedding_pipeline
+    try:
+        result = await embedding_pipeline.run(table, only_missing=only_missing)
+        embedded = sum(t["embedded"] for t in result["tables"].values())
+        if embedded:
+            logger.info("Embedding refresh: %d rows embedded", embedded)
+    except Exception as e:
+        logger.error("Embedding refresh error: %s", e)
+
+
+async def rebuild_analytics_rollups(ctx, days: int | None = 2):
+    """Recompute recent analytics rollups from raw events (called by cron).
+
+    Repairs drift from events written outside ``track_event``; pass
+    ``days=None`` for a full rebuild.
+    """
+    from datetime import datetime, timedelta, timezone
+    from app.database import SessionLocal
+    from app.services.analytics_rollup_service import analytics_rollup_service
+
+    since = datetime.now(timezone.utc).date() - timedelta(days=days) if days is not None else None
+    db = SessionLocal()
+    try:
+        rows = await asyncio.to_thread(analytics_rollup_service.rebuild, db, since)
+        logger.info("Analytics rollups rebuilt: %d rows", rows)
+    except Exception as e:
+        logger.error("Analytics rollup rebuild error: %s", e)
+    finally:
+        db.close()
+
+
+async def prune_portal_cache(ctx):
+    """Drop expired portal cache entries and their page blobs (called by cron)."""
+    from app.database import SessionLocal
+    from app.services.agentic.providers import PortalCacheService
+    db = SessionLocal()
+    try:
+        result = await asyncio.to_thread(PortalCacheService().collect_garbage, db)
+        if result["entries_removed"]:
+            logger.info(
+                "Portal cache pruned: %d entries, %d blobs",
+                result["entries_removed"], result["blobs_removed"],
+            )
+    except Exception as e:
+        logger.error("Portal cache prune error: %s", e)
+    finally:
+        db.close()
+
+
+async def refresh_contact_lists(ctx):
+    """Expire aged-out smart list members and rebuild stale smart lists (called by cron)."""
+    from app.database import SessionLocal
+    from app.services.contact_list_membership import refresh_due_lists
+    db = SessionLocal()
+    try:
+        result = await asyncio.to_thread(refresh_due_lists, db)
+        if result["rebuilt"] or result["expired"]:
+            logger.info(
+                "Contact lists refreshed: %d rebuilt, %d members expired",
+                result["rebuilt"], result["expired"],
+            )
+    except Exception as e:
+        logger.error("Contact list refresh error: %s", e)
+    finally:
+        db.close()
+
+
+async def run_bulk_job(ctx, job_id: int):
+    """Run or resume a persisted bulk operation job."""
+    from app.services.bulk_operations_service import bulk_operations_service
+    try:
+        await bulk_operations_service.run_job(job_id)
+    except Exception as e:
+        logger.error("run_bulk_job failed for %d: %s", job_id, e)
+        raise
+
+
+async def resume_bulk_jobs(ctx):
+    """Re-queue bulk jobs left pending or running by a previous worker."""
+    from app.database import SessionLocal
+    from app.services.bulk_operations_service import bulk_operations_service
+    db = SessionLocal()
+    try:
+        job_ids = await asyncio.to_thread(bulk_operations_service.unfinished_job_ids, db)
+    finally:
+        db.close()
+    for job_id in job_ids:
+        # Same arq job id as the original enqueue: skipped if that run is
+        # still queued or in progress.
+        await ctx["redis"].enqueue_job("run_bulk_job", job_id, _job_id=f"bulk_job:{job_id}")
+    if job_ids:
+        logger.info("Re-queued %d unfinished bulk job(s)", len(job_ids))
+
+
+async def resume_direct_mail_campaigns(ctx):
+    """Re-queue direct mail campaigns a previous process left mid-send."""
+    from app.database import SessionLocal
+    from app.services.direct_mail_campaign_runner import unfinished_campaign_ids
+    db = SessionLocal()
+    try:
+        campaign_ids = await asyncio.to_thread(unfinished_campaign_ids, db)
+    finally:
+        db.close()
+    for campaign_id in campaign_ids:
+        await ctx["redis"].enqueue_job(
+            "execute_campaign", campaign_id, _job_id=f"direct_mail_campaign:{campaign_id}"
+        )
+    if campaign_ids:
+        logger.info("Re-queued %d unfinished direct mail campaign(s)", len(campaign_ids))
+
+
 async def startup(ctx):
     """Worker startup hook."""
     logger.info("arq worker started")
+    try:
+        await resume_bulk_jobs(ctx)
+    except Exception as e:
+        logger.error("Bulk job resume failed: %s", e)
+    try:
+        await resume_direct_mail_campaigns(ctx)
+    except Exception as e:
+        logger.error("Direct mail campaign resume failed: %s", e)
+    start_event_outbox_consumer(ctx)
+
+
+def start_event_outbox_consumer(ctx):
+    """Deliver durable event bus events from the Redis Stream outbox."""
+    from app.config import settings
+    if not settings.event_outbox_enabled:
+        return
+    import socket
+    from app.services.event_outbox import RedisStreamOutbox
+    from app.services.event_subscribers import register_durable_subscribers
+    from app.services.observer import event_bus
+    register_durable_subscribers(event_bus)
+    consumer = f"{socket.gethostname()}-{os.getpid()}"
+    ctx["event_outbox_task"] = asyncio.create_task(RedisStreamOutbox().consume(event_bus, consumer=consumer))
+    logger.info("Event outbox consumer %s started", consumer)
 
 
 async def shutdown(ctx):
     """Worker shutdown hook."""
+    task = ctx.get("event_outbox_task")
+    if task is not None:
+        task.cancel()
     logger.info("arq worker shutting down")
 
 
@@ -217,12 +348,19 @@ WORKER_FUNCTIONS = [
     run_agentic_research,
     perform_research,
     process_webhook_event,
-    execute_campaign,
+    func(execute_campaign, keep_result=0),
     clone_voice_background,
     generate_daily_digest,
     run_task_loop_tick,
     run_pipeline_check,
     run_alert_check,
+    refresh_embeddings,
+    rebuild_analytics_rollups,
+    prune_portal_cache,
+    refresh_contact_lists,
+    # No kept result, so the bulk_job:<id> arq job id frees up as soon as a
+    # run ends and the job can be resumed.
+    func(run_bulk_job, keep_result=0),
 ]
 
 
@@ -244,6 +382,10 @@ class WorkerSettings:
         cron(run_task_loop_tick, minute={0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59}),  # every minute
         cron(run_pipeline_check, minute={0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55}),  # every 5 min
         cron(run_alert_check, minute={0, 10, 20, 30, 40, 50}),  # every 10 min
+        cron(refresh_embeddings, minute={15}),  # hourly
+        cron(rebuild_analytics_rollups, hour={3}, minute={30}),  # nightly
+        cron(prune_portal_cache, minute={45}),  # hourly
+        cron(refresh_contact_lists, minute={2, 7, 12, 17, 22, 27, 32, 37, 42, 47, 52, 57}),  # every 5 min
     ]
 
     max_jobs = 10
@@ -31,12 +31,17 @@ import mcp_server.tools  # noqa: F401, E402
 
 async def main_stdio():
     """Run the MCP server over stdio (for Claude Desktop)"""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    from mcp_server.utils.http_client import aclose
+
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        await aclose()
 
 
 def main_sse(port: int = 8001):
@@ -73,7 +78,16 @@ def main_sse(port: int = 8001):
     async def health(request):
         return JSONResponse({"status": "ok", "server": "property-management-mcp", "transport": "sse"})
 
+    from contextlib import asynccontextmanager
+    from mcp_server.utils.http_client import aclose
+
+    @asynccontextmanager
+    async def lifespan(_app):
+        yield
+        await aclose()
+
     starlette_app = Starlette(
+        lifespan=lifespan,
         routes=[
             Route("/health", health),
             Route("/sse", handle_sse),
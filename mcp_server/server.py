@@ -1,4 +1,5 @@
 """MCP Server instance and tool registry."""
+import asyncio
 import time
 from typing import Any, Callable
 
@@ -28,11 +29,11 @@ async def list_tools() -> list[Tool]:
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     from .utils.activity_logging import log_activity_event, update_activity_event
     from .utils.context_enrichment import enrich_response
-    from .utils.http_client import api_post
+    from .utils.http_client import api_gather
 
     start_time = time.time()
-    event_id = log_activity_event(tool_name=name, metadata=arguments)
-    error_logged = False
+    # Log the pending event while the tool runs; its id is only needed at the end
+    event_task = asyncio.create_task(log_activity_event(tool_name=name, metadata=arguments))
 
     try:
         handler = _tool_handlers.get(name)
@@ -42,7 +43,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 
         # Auto-inject conversation context into response
         try:
-            result = enrich_response(
+            result = await enrich_response(
                 tool_name=name,
                 arguments=arguments or {},
                 result=result,
@@ -50,24 +51,26 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         except Exception:
             pass  # Never let context enrichment break the main response
 
-        # Log to conversation history
         duration_ms = int((time.time() - start_time) * 1000)
-        _log_conversation(name, arguments, result, success=True, duration_ms=duration_ms)
-
+        event_id = await event_task
+        await api_gather(
+            update_activity_event(event_id, status="success", duration_ms=duration_ms),
+            _log_conversation(name, arguments, result, success=True, duration_ms=duration_ms),
+            return_exceptions=True,
+        )
         return result
     except Exception as e:
-        error_logged = True
         duration_ms = int((time.time() - start_time) * 1000)
-        update_activity_event(event_id, status="error", duration_ms=duration_ms, error_message=str(e))
-        _log_conversation(name, arguments, None, success=False, duration_ms=duration_ms, error=str(e))
+        event_id = await event_task
+        await api_gather(
+            update_activity_event(event_id, status="error", duration_ms=duration_ms, error_message=str(e)),
+            _log_conversation(name, arguments, None, success=False, duration_ms=duration_ms, error=str(e)),
+            return_exceptions=True,
+        )
         return [TextContent(type="text", text=f"Error: {str(e)}")]
-    finally:
-        if not error_logged:
-            duration_ms = int((time.time() - start_time) * 1000)
-            update_activity_event(event_id, status="success", duration_ms=duration_ms)
 
 
-def _log_conversation(tool_name: str, arguments: Any, result: list[TextContent] | None, success: bool, duration_ms: int, error: str = None):
+async def _log_conversation(tool_name: str, arguments: Any, result: list[TextContent] | None, success: bool, duration_ms: int, error: str = None):
     """Log tool call to conversation history."""
     from .utils.http_client import api_post
 
@@ -110,7 +113,7 @@ def _log_conversation(tool_name: str, arguments: Any, result: list[TextContent]
         if property_id is not None:
             payload["property_id"] = property_id
 
-        api_post("/context/history/log", json=payload)
+        await api_post("/context/history/log", json=payload)
     except Exception:
         pass  # Don't fail the main operation if logging fails
 
@@ -26,7 +26,7 @@ async def handle_get_activity_timeline(arguments: dict) -> list[TextContent]:
     if arguments.get("search"):
         params["search"] = arguments["search"]
 
-    response = api_get("/activity-timeline/", params=params)
+    response = await api_get("/activity-timeline/", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -54,7 +54,7 @@ async def handle_get_property_timeline(arguments: dict) -> list[TextContent]:
     property_id = resolve_property_id(arguments)
 
     params: dict = {"limit": arguments.get("limit", 50)}
-    response = api_get(f"/activity-timeline/property/{property_id}", params=params)
+    response = await api_get(f"/activity-timeline/property/{property_id}", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -79,7 +79,7 @@ async def handle_get_recent_activity(arguments: dict) -> list[TextContent]:
     if arguments.get("property_id"):
         params["property_id"] = arguments["property_id"]
 
-    response = api_get("/activity-timeline/recent", params=params)
+    response = await api_get("/activity-timeline/recent", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -11,7 +11,7 @@ async def handle_autocomplete_address(arguments: dict) -> list[TextContent]:
     if not query:
         return [TextContent(type="text", text="Error: 'query' is required (partial address string).")]
 
-    response = api_post("/address/autocomplete", params={"query": query})
+    response = await api_post("/address/autocomplete", params={"query": query})
     response.raise_for_status()
     data = response.json()
 
@@ -34,7 +34,7 @@ async def handle_address_details(arguments: dict) -> list[TextContent]:
     if not place_id:
         return [TextContent(type="text", text="Error: 'place_id' is required. Run autocomplete_address first to obtain one.")]
 
-    response = api_post("/address/details", params={"place_id": place_id})
+    response = await api_post("/address/details", params={"place_id": place_id})
     response.raise_for_status()
     data = response.json()
 
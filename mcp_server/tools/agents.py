@@ -7,7 +7,7 @@ from ..utils.http_client import api_get, api_patch
 
 async def handle_list_agents(arguments: dict) -> list[TextContent]:
     """List all registered agents."""
-    response = api_get("/agents")
+    response = await api_get("/agents")
     response.raise_for_status()
     data = response.json()
 
@@ -42,7 +42,7 @@ async def handle_get_agent(arguments: dict) -> list[TextContent]:
     if not agent_id:
         return [TextContent(type="text", text="Error: agent_id is required.")]
 
-    response = api_get(f"/agents/{agent_id}")
+    response = await api_get(f"/agents/{agent_id}")
     response.raise_for_status()
     agent = response.json()
 
@@ -81,7 +81,7 @@ async def handle_update_agent(arguments: dict) -> list[TextContent]:
     if not update_fields:
         return [TextContent(type="text", text="Error: No fields to update. Provide at least one of: name, email, phone, brokerage, license_number, markets, specialties, bio, status.")]
 
-    response = api_patch(f"/agents/{agent_id}", json=update_fields)
+    response = await api_patch(f"/agents/{agent_id}", json=update_fields)
     response.raise_for_status()
     updated = response.json()
 
@@ -27,7 +27,7 @@ def _format_dict_section(title: str, data: dict, indent: int = 2) -> str:
 
 async def handle_get_portfolio_summary(arguments: dict) -> list[TextContent]:
     """Full portfolio analytics."""
-    response = api_get("/analytics/portfolio")
+    response = await api_get("/analytics/portfolio")
     response.raise_for_status()
     data = response.json()
 
@@ -60,7 +60,7 @@ async def handle_get_portfolio_summary(arguments: dict) -> list[TextContent]:
 
 async def handle_get_pipeline_summary(arguments: dict) -> list[TextContent]:
     """Pipeline status breakdown."""
-    response = api_get("/analytics/pipeline")
+    response = await api_get("/analytics/pipeline")
     response.raise_for_status()
     data = response.json()
 
@@ -82,7 +82,7 @@ async def handle_get_pipeline_summary(arguments: dict) -> list[TextContent]:
 
 async def handle_get_contract_summary(arguments: dict) -> list[TextContent]:
     """Contract status across all properties."""
-    response = api_get("/analytics/contracts")
+    response = await api_get("/analytics/contracts")
     response.raise_for_status()
     data = response.json()
 
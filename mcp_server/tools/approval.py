@@ -14,7 +14,7 @@ async def handle_request_approval(arguments: dict) -> list[TextContent]:
         "reason": arguments.get("reason", ""),
         "risk_level": arguments.get("risk_level", "medium"),
     }
-    response = api_post("/approval/request", json=payload)
+    response = await api_post("/approval/request", json=payload)
     response.raise_for_status()
     data = response.json()
 
@@ -34,7 +34,7 @@ async def handle_grant_approval(arguments: dict) -> list[TextContent]:
     if not request_id:
         return [TextContent(type="text", text="Error: 'request_id' is required.")]
 
-    response = api_post("/approval/grant", json={"request_id": request_id})
+    response = await api_post("/approval/grant", json={"request_id": request_id})
     response.raise_for_status()
     data = response.json()
 
@@ -51,7 +51,7 @@ async def handle_deny_approval(arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text="Error: 'request_id' is required.")]
 
     reason = arguments.get("reason", "")
-    response = api_post("/approval/deny", json={"request_id": request_id, "reason": reason})
+    response = await api_post("/approval/deny", json={"request_id": request_id, "reason": reason})
     response.raise_for_status()
     data = response.json()
 
@@ -65,7 +65,7 @@ async def handle_deny_approval(arguments: dict) -> list[TextContent]:
 async def handle_get_audit_log(arguments: dict) -> list[TextContent]:
     """Retrieve the approval audit log."""
     limit = arguments.get("limit", 20)
-    response = api_get("/approval/audit-log", params={"limit": limit})
+    response = await api_get("/approval/audit-log", params={"limit": limit})
     response.raise_for_status()
     data = response.json()
 
@@ -86,7 +86,7 @@ async def handle_get_audit_log(arguments: dict) -> list[TextContent]:
 
 async def handle_get_autonomy_level(arguments: dict) -> list[TextContent]:
     """Get the current AI autonomy level."""
-    response = api_get("/approval/autonomy-level")
+    response = await api_get("/approval/autonomy-level")
     response.raise_for_status()
     data = response.json()
 
@@ -107,7 +107,7 @@ async def handle_set_autonomy_level(arguments: dict) -> list[TextContent]:
             text="Error: 'level' must be one of: supervised, semi_auto, full_auto.",
         )]
 
-    response = api_put("/approval/autonomy-level", json={"level": level})
+    response = await api_put("/approval/autonomy-level", json={"level": level})
     response.raise_for_status()
     data = response.json()
 
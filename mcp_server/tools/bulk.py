@@ -25,7 +25,7 @@ async def handle_execute_bulk_operation(arguments: dict) -> list[TextContent]:
     if params:
         body["params"] = params
 
-    response = api_post("/bulk/execute", json=body)
+    response = await api_post("/bulk/execute", json=body)
     if response.status_code == 400:
         return [TextContent(type="text", text=f"Error: {response.json().get('detail', 'Bad request')}")]
     response.raise_for_status()
@@ -44,7 +44,7 @@ async def handle_execute_bulk_operation(arguments: dict) -> list[TextContent]:
 
 async def handle_list_bulk_operations(arguments: dict) -> list[TextContent]:
     """List available bulk operations."""
-    response = api_get("/bulk/operations")
+    response = await api_get("/bulk/operations")
     response.raise_for_status()
     data = response.json()
 
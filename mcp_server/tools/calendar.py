@@ -9,7 +9,7 @@ from ..utils.property_resolver import resolve_property_id
 
 async def handle_connect_calendar(arguments: dict) -> list[TextContent]:
     """Initiate Google Calendar OAuth connection."""
-    response = api_get("/calendar/auth/url")
+    response = await api_get("/calendar/auth/url")
     response.raise_for_status()
     data = response.json()
 
@@ -57,7 +57,7 @@ async def handle_create_calendar_event(arguments: dict) -> list[TextContent]:
     attendees = arguments.get("attendees", [])
     if all_parties and property_id:
         # Get all contacts for this property
-        contacts_response = api_get(f"/contacts/property/{property_id}")
+        contacts_response = await api_get(f"/contacts/property/{property_id}")
         contacts_response.raise_for_status()
         contacts_data = contacts_response.json()
 
@@ -75,7 +75,7 @@ async def handle_create_calendar_event(arguments: dict) -> list[TextContent]:
     if attendees:
         body["attendees"] = attendees
 
-    response = api_post("/calendar/events", json=body)
+    response = await api_post("/calendar/events", json=body)
     response.raise_for_status()
     data = response.json()
 
@@ -106,7 +106,7 @@ async def handle_list_calendar_events(arguments: dict) -> list[TextContent]:
     if arguments.get("event_type"):
         params["event_type"] = arguments["event_type"]
 
-    response = api_get("/calendar/events", params=params)
+    response = await api_get("/calendar/events", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -142,7 +142,7 @@ async def handle_list_calendar_events(arguments: dict) -> list[TextContent]:
 
 async def handle_sync_to_calendar(arguments: dict) -> list[TextContent]:
     """Manually trigger sync to Google Calendar."""
-    response = api_get("/calendar/connections")
+    response = await api_get("/calendar/connections")
     response.raise_for_status()
     connections = response.json().get("connections", [])
 
@@ -160,7 +160,7 @@ async def handle_sync_to_calendar(arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text="No active calendar connection with sync enabled.")]
 
     connection_id = connection["id"]
-    response = api_post(f"/calendar/sync/{connection_id}")
+    response = await api_post(f"/calendar/sync/{connection_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -181,7 +181,7 @@ async def handle_sync_to_calendar(arguments: dict) -> list[TextContent]:
 
 async def handle_list_calendars(arguments: dict) -> list[TextContent]:
     """List connected calendar accounts."""
-    response = api_get("/calendar/connections")
+    response = await api_get("/calendar/connections")
     response.raise_for_status()
     data = response.json()
 
@@ -227,7 +227,7 @@ async def handle_disconnect_calendar(arguments: dict) -> list[TextContent]:
 
     if not connection_id:
         # List connections first
-        response = api_get("/calendar/connections")
+        response = await api_get("/calendar/connections")
         response.raise_for_status()
         connections = response.json().get("connections", [])
 
@@ -244,7 +244,7 @@ async def handle_disconnect_calendar(arguments: dict) -> list[TextContent]:
                 text += f"ID {conn['id']}: {provider} ({name})\n"
             return [TextContent(type="text", text=text)]
 
-    response = api_post(f"/calendar/connections/{connection_id}/disconnect")
+    response = await api_post(f"/calendar/connections/{connection_id}/disconnect")
     response.raise_for_status()
     data = response.json()
 
@@ -275,7 +275,7 @@ async def handle_update_calendar_event(arguments: dict) -> list[TextContent]:
     if not body:
         return [TextContent(type="text", text="Error: No fields to update")]
 
-    response = api_post(f"/calendar/events/{event_id}", json=body)
+    response = await api_post(f"/calendar/events/{event_id}", json=body)
     response.raise_for_status()
     data = response.json()
 
@@ -294,7 +294,7 @@ async def handle_delete_calendar_event(arguments: dict) -> list[TextContent]:
     if not event_id:
         return [TextContent(type="text", text="Error: event_id is required")]
 
-    response = api_post(f"/calendar/events/{event_id}/delete")
+    response = await api_post(f"/calendar/events/{event_id}/delete")
     response.raise_for_status()
     data = response.json()
 
@@ -3,14 +3,14 @@ from mcp.types import Tool, TextContent
 from datetime import datetime, timedelta
 
 from ..server import register_tool
-from ..utils.http_client import api_get
+from ..utils.http_client import api_gather, api_get, api_get_json
 
 
 async def handle_calendar_insights(arguments: dict) -> list[TextContent]:
     """Get AI-powered insights from calendar history and patterns."""
     # Get calendar events
     days = arguments.get("days", 30)
-    response = api_get("/calendar/events", params={"days": days})
+    response = await api_get("/calendar/events", params={"days": days})
     response.raise_for_status()
 
     # For now, we'll analyze patterns from the events
@@ -62,27 +62,25 @@ async def handle_optimal_time(arguments: dict) -> list[TextContent]:
     duration = arguments.get("duration_minutes", 60)
     days_ahead = arguments.get("days_ahead", 7)
 
-    # Get calendar to check availability
-    response = api_get("/calendar/events", params={"days": days_ahead})
+    # Fetch the calendar and the property context together
+    calls = [api_get("/calendar/events", params={"days": days_ahead})]
+    if property_id:
+        calls.append(api_get_json(f"/properties/{property_id}", default={}))
+    response, *prop = await api_gather(*calls)
     response.raise_for_status()
     events = response.json()
 
-    # Get property context if provided
+    # Property context if provided
     property_context = {}
-    if property_id:
-        try:
-            prop_response = api_get(f"/properties/{property_id}")
-            prop_response.raise_for_status()
-            prop_data = prop_response.json()
-            property_context = {
-                "address": prop_data.get("address", ""),
-                "city": prop_data.get("city", ""),
-                "status": prop_data.get("status", ""),
-                "score": prop_data.get("score", 0),
-                "price": prop_data.get("price", 0),
-            }
-        except Exception:
-            pass
+    prop_data = prop[0] if prop else {}
+    if prop_data:
+        property_context = {
+            "address": prop_data.get("address", ""),
+            "city": prop_data.get("city", ""),
+            "status": prop_data.get("status", ""),
+            "score": prop_data.get("score", 0),
+            "price": prop_data.get("price", 0),
+        }
 
     # Multi-objective optimization
     text = _optimize_meeting_time(
@@ -358,7 +356,7 @@ async def handle_smart_schedule(arguments: dict) -> list[TextContent]:
     days = arguments.get("days", 7)
 
     # Get current schedule
-    response = api_get("/calendar/events", params={"days": days})
+    response = await api_get("/calendar/events", params={"days": days})
     response.raise_for_status()
     events = response.json().get("events", [])
 
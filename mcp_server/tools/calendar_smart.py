@@ -13,7 +13,7 @@ async def handle_check_conflicts(arguments: dict) -> list[TextContent]:
     property_id = arguments.get("property_id")
 
     # Get upcoming events
-    response = api_get("/calendar/events", params={"days": arguments.get("days", 14)})
+    response = await api_get("/calendar/events", params={"days": arguments.get("days", 14)})
     response.raise_for_status()
     data = response.json()
 
@@ -190,7 +190,7 @@ async def handle_suggest_meeting_time(arguments: dict) -> list[TextContent]:
     preference = arguments.get("time_preference", "any")  # morning, afternoon, any
 
     # Get upcoming events
-    response = api_get("/calendar/events", params={"days": days_ahead})
+    response = await api_get("/calendar/events", params={"days": days_ahead})
     response.raise_for_status()
     data = response.json()
 
@@ -256,7 +256,7 @@ async def handle_analyze_schedule(arguments: dict) -> list[TextContent]:
     """Analyze calendar for patterns, workload, and suggestions."""
     days = arguments.get("days", 7)
 
-    response = api_get("/calendar/events", params={"days": days})
+    response = await api_get("/calendar/events", params={"days": days})
     response.raise_for_status()
     data = response.json()
 
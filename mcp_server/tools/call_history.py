@@ -13,7 +13,7 @@ async def handle_get_property_calls(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Error: property_id is required")]
 
-    response = api_get(f"/properties/{property_id}/calls", params={"limit": limit})
+    response = await api_get(f"/properties/{property_id}/calls", params={"limit": limit})
     response.raise_for_status()
     data = response.json()
 
@@ -79,7 +79,7 @@ async def handle_get_call_recording(arguments: dict) -> list[TextContent]:
     if not call_id:
         return [TextContent(type="text", text="Error: call_id is required")]
 
-    response = api_get(f"/phone-calls/recording/{call_id}")
+    response = await api_get(f"/phone-calls/recording/{call_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -105,7 +105,7 @@ async def handle_call_summary(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Error: property_id is required")]
 
-    response = api_get(f"/properties/{property_id}/calls", params={"limit": 100})
+    response = await api_get(f"/properties/{property_id}/calls", params={"limit": 100})
     response.raise_for_status()
     data = response.json()
 
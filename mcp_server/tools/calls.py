@@ -2,7 +2,7 @@
 from mcp.types import Tool, TextContent
 
 from ..server import register_tool
-from ..utils.http_client import api_get, api_post
+from ..utils.http_client import api_gather, api_get, api_post
 
 
 async def handle_qa_call(arguments: dict) -> list[TextContent]:
@@ -17,7 +17,7 @@ async def handle_qa_call(arguments: dict) -> list[TextContent]:
     # If contact_id provided, get their phone
     if contact_id and not phone:
         try:
-            contact_response = api_get(f"/contacts/{contact_id}")
+            contact_response = await api_get(f"/contacts/{contact_id}")
             contact_response.raise_for_status()
             contact_data = contact_response.json()
             phone = contact_data.get("phone")
@@ -48,7 +48,7 @@ async def handle_qa_call(arguments: dict) -> list[TextContent]:
             "detect_machine": arguments.get("detect_machine", True),
             "record_call": arguments.get("record_call", True),
         }
-        response = api_post("/telnyx/calls", json=call_request)
+        response = await api_post("/telnyx/calls", json=call_request)
     else:
         # Use VAPI (default)
         call_request = {
@@ -60,7 +60,7 @@ async def handle_qa_call(arguments: dict) -> list[TextContent]:
         # Add property context if available
         if property_id and property_context:
             try:
-                prop_response = api_get(f"/properties/{property_id}")
+                prop_response = await api_get(f"/properties/{property_id}")
                 prop_response.raise_for_status()
                 prop_data = prop_response.json()
 
@@ -81,7 +81,7 @@ async def handle_qa_call(arguments: dict) -> list[TextContent]:
         # For Telnyx, property context is already in the script
         if property_id and property_context:
             try:
-                prop_response = api_get(f"/properties/{property_id}")
+                prop_response = await api_get(f"/properties/{property_id}")
                 prop_response.raise_for_status()
                 prop_data = prop_response.json()
 
@@ -99,9 +99,9 @@ async def handle_qa_call(arguments: dict) -> list[TextContent]:
 
     # Make the HTTP request
     if provider == "telnyx":
-        response = api_post("/telnyx/calls", json=call_request)
+        response = await api_post("/telnyx/calls", json=call_request)
     else:
-        response = api_post("/calls/voice", json=call_request)
+        response = await api_post("/calls/voice", json=call_request)
 
     response.raise_for_status()
     call_data = response.json()
@@ -137,9 +137,9 @@ async def handle_get_call_status(arguments: dict) -> list[TextContent]:
 
     # Route to appropriate provider endpoint
     if provider == "telnyx":
-        response = api_get(f"/telnyx/calls/{call_id}")
+        response = await api_get(f"/telnyx/calls/{call_id}")
     else:
-        response = api_get(f"/calls/{call_id}")
+        response = await api_get(f"/calls/{call_id}")
 
     response.raise_for_status()
     data = response.json()
@@ -210,7 +210,7 @@ async def handle_schedule_qa_call(arguments: dict) -> list[TextContent]:
         }
     }
 
-    response = api_post("/scheduled-tasks/", json=task_request)
+    response = await api_post("/scheduled-tasks/", json=task_request)
     response.raise_for_status()
     task_data = response.json()
 
@@ -237,17 +237,15 @@ async def handle_batch_qa_calls(arguments: dict) -> list[TextContent]:
     if not contacts:
         return [TextContent(type="text", text="Error: No contacts provided.")]
 
-    results = []
-    for contact in contacts:
+    async def _call(contact: dict) -> dict:
         phone = contact.get("phone")
         questions = contact.get("questions", [])
 
         if not phone or not questions:
-            results.append({"phone": phone, "error": "Missing phone or questions"})
-            continue
+            return {"phone": phone, "error": "Missing phone or questions"}
 
         # Make individual call
-        response = api_post("/calls/voice", json={
+        response = await api_post("/calls/voice", json={
             "phone": phone,
             "name": f"Q&A Call - {contact.get('name', 'Contact')}",
             "script": f"Hi, I have some questions: {'; '.join(questions)}",
@@ -257,13 +255,19 @@ async def handle_batch_qa_calls(arguments: dict) -> list[TextContent]:
         call_data = response.json()
 
         if call_data.get("error"):
-            results.append({"phone": phone, "error": call_data["error"]})
-        else:
-            results.append({
-                "phone": phone,
-                "call_id": call_data.get("call_id"),
-                "status": "initiated"
-            })
+            return {"phone": phone, "error": call_data["error"]}
+        return {
+            "phone": phone,
+            "call_id": call_data.get("call_id"),
+            "status": "initiated"
+        }
+
+    # Start the calls concurrently; one failed call doesn't abort the rest
+    outcomes = await api_gather(*(_call(contact) for contact in contacts), return_exceptions=True)
+    results = [
+        {"phone": contact.get("phone"), "error": str(outcome)} if isinstance(outcome, Exception) else outcome
+        for contact, outcome in zip(contacts, outcomes)
+    ]
 
     text = f"📞 **Batch Q&A Calls Initiated**\n\n"
     text += f"Total calls: {len(contacts)}\n\n"
@@ -18,7 +18,7 @@ async def handle_generate_cma_report(arguments: dict) -> list[TextContent]:
     if agent_brand_id:
         payload["agent_brand_id"] = agent_brand_id
 
-    response = api_post("/cma/generate", json=payload)
+    response = await api_post("/cma/generate", json=payload)
     response.raise_for_status()
 
     # The response is a PDF binary — we can't return it directly via MCP text,
@@ -59,7 +59,7 @@ async def handle_email_cma_report(arguments: dict) -> list[TextContent]:
     if agent_brand_id:
         payload["agent_brand_id"] = agent_brand_id
 
-    response = api_post("/cma/email", json=payload)
+    response = await api_post("/cma/email", json=payload)
     response.raise_for_status()
     result = response.json()
 
@@ -18,7 +18,7 @@ async def handle_run_compliance_check(arguments: dict) -> list[TextContent]:
     if agent_id:
         params["agent_id"] = agent_id
 
-    response = api_post(f"/compliance/properties/{property_id}/check", params=params)
+    response = await api_post(f"/compliance/properties/{property_id}/check", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -60,7 +60,7 @@ async def handle_get_compliance_history(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Error: property_id is required.")]
 
-    response = api_get(f"/compliance/properties/{property_id}/checks", params={"limit": limit})
+    response = await api_get(f"/compliance/properties/{property_id}/checks", params={"limit": limit})
     response.raise_for_status()
     checks = response.json()
 
@@ -90,7 +90,7 @@ async def handle_get_compliance_report(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Error: property_id is required.")]
 
-    response = api_get(f"/compliance/properties/{property_id}/report")
+    response = await api_get(f"/compliance/properties/{property_id}/report")
     response.raise_for_status()
     data = response.json()
 
@@ -149,7 +149,7 @@ async def handle_resolve_compliance_violation(arguments: dict) -> list[TextConte
     if not resolution_notes:
         return [TextContent(type="text", text="Error: resolution_notes is required. Describe how the violation was resolved.")]
 
-    response = api_post(
+    response = await api_post(
         f"/compliance/violations/{violation_id}/resolve",
         params={"resolution_notes": resolution_notes},
     )
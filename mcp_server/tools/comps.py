@@ -35,7 +35,7 @@ async def handle_get_comps_dashboard(arguments: dict) -> list[TextContent]:
     """Get full comp dashboard."""
     property_id = resolve_property_id(arguments)
 
-    response = api_get(f"/comps/{property_id}")
+    response = await api_get(f"/comps/{property_id}")
     if response.status_code == 404:
         return [TextContent(type="text", text=f"Property {property_id} not found.")]
     response.raise_for_status()
@@ -91,7 +91,7 @@ async def handle_get_comp_sales(arguments: dict) -> list[TextContent]:
     """Get sales comps only."""
     property_id = resolve_property_id(arguments)
 
-    response = api_get(f"/comps/{property_id}/sales")
+    response = await api_get(f"/comps/{property_id}/sales")
     if response.status_code == 404:
         return [TextContent(type="text", text=f"Property {property_id} not found.")]
     response.raise_for_status()
@@ -118,7 +118,7 @@ async def handle_get_comp_rentals(arguments: dict) -> list[TextContent]:
     """Get rental comps only."""
     property_id = resolve_property_id(arguments)
 
-    response = api_get(f"/comps/{property_id}/rentals")
+    response = await api_get(f"/comps/{property_id}/rentals")
     if response.status_code == 404:
         return [TextContent(type="text", text=f"Property {property_id} not found.")]
     response.raise_for_status()
@@ -2,27 +2,26 @@
 from mcp.types import Tool, TextContent
 
 from ..server import register_tool
-from ..utils.http_client import api_get, api_post, API_BASE_URL
+from ..utils.http_client import api_get, api_post
 from ..utils.property_resolver import resolve_property_id
-import requests
 
 
 # ── Helpers ──
 
 async def skip_trace_property(property_id: int) -> dict:
-    response = api_post("/context/skip-trace", json={"property_ref": str(property_id), "session_id": "mcp_session"})
+    response = await api_post("/context/skip-trace", json={"property_ref": str(property_id), "session_id": "mcp_session"})
     response.raise_for_status()
     return response.json()
 
 
 async def add_contact_to_property(property_id, name, email=None, phone=None, role="buyer") -> dict:
-    response = api_post("/contacts/", json={"name": name, "email": email, "phone": phone, "role": role, "property_id": property_id})
+    response = await api_post("/contacts/", json={"name": name, "email": email, "phone": phone, "role": role, "property_id": property_id})
     response.raise_for_status()
     return response.json()
 
 
 async def get_property(property_id: int) -> dict:
-    response = api_get(f"/properties/{property_id}")
+    response = await api_get(f"/properties/{property_id}")
     response.raise_for_status()
     return response.json()
 
@@ -90,7 +89,7 @@ async def handle_add_contact(arguments: dict) -> list[TextContent]:
         contact_id = result.get("id")
         if contact_id:
             try:
-                send_response = requests.post(f"{API_BASE_URL}/contacts/{contact_id}/send-pending-contracts")
+                send_response = await api_post(f"/contacts/{contact_id}/send-pending-contracts")
                 send_response.raise_for_status()
                 send_result = send_response.json()
 
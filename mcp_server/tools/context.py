@@ -11,7 +11,7 @@ async def handle_get_property_history(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Error: property_id is required.")]
 
-    response = api_get(f"/context/history/property/{property_id}")
+    response = await api_get(f"/context/history/property/{property_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -47,7 +47,7 @@ async def handle_get_property_history(arguments: dict) -> list[TextContent]:
 
 async def handle_clear_all_history(arguments: dict) -> list[TextContent]:
     """Clear all conversation history permanently."""
-    response = api_delete("/context/history")
+    response = await api_delete("/context/history")
     response.raise_for_status()
     data = response.json()
     return [TextContent(type="text", text=data.get("message", "All conversation history has been deleted."))]
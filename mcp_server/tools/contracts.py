@@ -10,10 +10,10 @@ from ..utils.voice import normalize_voice_query
 # ── Helpers ──
 
 async def send_contract(property_id, contact_id, contract_name="Purchase Agreement", docuseal_template_id=None):
-    response = api_post("/contracts/", json={"property_id": property_id, "contact_id": contact_id, "name": contract_name, "docuseal_template_id": docuseal_template_id or "1"})
+    response = await api_post("/contracts/", json={"property_id": property_id, "contact_id": contact_id, "name": contract_name, "docuseal_template_id": docuseal_template_id or "1"})
     response.raise_for_status()
     contract = response.json()
-    response = api_post(f"/contracts/{contract['id']}/send-to-contact", json={"contact_id": contact_id})
+    response = await api_post(f"/contracts/{contract['id']}/send-to-contact", json={"contact_id": contact_id})
     response.raise_for_status()
     return response.json()
 
@@ -26,7 +26,7 @@ async def check_contract_status(contract_id=None, address_query=None):
         return await check_contract_status(contract_id=contracts[0]['id'])
     if not contract_id:
         raise ValueError("Either contract_id or address_query must be provided")
-    response = api_get(f"/contracts/{contract_id}/status", params={"refresh": "true"})
+    response = await api_get(f"/contracts/{contract_id}/status", params={"refresh": "true"})
     response.raise_for_status()
     return response.json()
 
@@ -54,7 +54,7 @@ async def list_contracts(property_id=None, address_query=None):
         url = f"/contracts/property/{property_id}"
     else:
         url = "/contracts/"
-    response = api_get(url)
+    response = await api_get(url)
     response.raise_for_status()
     return response.json()
 
@@ -126,7 +126,7 @@ async def check_property_contract_readiness(property_id=None, address_query=None
             db.close()
     if not property_id:
         raise ValueError("Either property_id or address_query must be provided")
-    response = api_get(f"/contracts/property/{property_id}/required-status")
+    response = await api_get(f"/contracts/property/{property_id}/required-status")
     response.raise_for_status()
     return response.json()
 
@@ -163,7 +163,7 @@ async def check_property_contract_readiness_voice(address_query):
 
 
 async def get_signing_status(property_id):
-    response = api_get(f"/contracts/property/{property_id}/signing-status")
+    response = await api_get(f"/contracts/property/{property_id}/signing-status")
     response.raise_for_status()
     return response.json()
 
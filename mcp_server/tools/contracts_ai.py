@@ -13,7 +13,7 @@ async def attach_required_contracts(property_id=None, address_query=None):
         property_id = find_property_by_address(address_query)
     if not property_id:
         raise ValueError("Either property_id or address_query must be provided")
-    response = api_post(f"/contracts/property/{property_id}/auto-attach")
+    response = await api_post(f"/contracts/property/{property_id}/auto-attach")
     response.raise_for_status()
     return response.json()
 
@@ -23,7 +23,7 @@ async def ai_suggest_contracts_for_property(property_id=None, address_query=None
         property_id = find_property_by_address(address_query)
     if not property_id:
         raise ValueError("Either property_id or address_query must be provided")
-    response = api_post(f"/contracts/property/{property_id}/ai-suggest")
+    response = await api_post(f"/contracts/property/{property_id}/ai-suggest")
     response.raise_for_status()
     return response.json()
 
@@ -33,19 +33,19 @@ async def apply_ai_contract_suggestions(property_id=None, address_query=None, on
         property_id = find_property_by_address(address_query)
     if not property_id:
         raise ValueError("Either property_id or address_query must be provided")
-    response = api_post(f"/contracts/property/{property_id}/ai-apply-suggestions", params={"only_required": only_required})
+    response = await api_post(f"/contracts/property/{property_id}/ai-apply-suggestions", params={"only_required": only_required})
     response.raise_for_status()
     return response.json()
 
 
 async def mark_contract_required(contract_id, is_required=True, reason=None, required_by_date=None):
-    response = api_patch(f"/contracts/{contract_id}/mark-required", params={"is_required": is_required, "reason": reason, "required_by_date": required_by_date})
+    response = await api_patch(f"/contracts/{contract_id}/mark-required", params={"is_required": is_required, "reason": reason, "required_by_date": required_by_date})
     response.raise_for_status()
     return response.json()
 
 
 async def smart_send_contract(address_query, contract_name, order="preserved", message=None, create_if_missing=True):
-    response = api_post("/contracts/voice/smart-send", json={"address_query": address_query, "contract_name": contract_name, "order": order, "message": message, "create_if_missing": create_if_missing})
+    response = await api_post("/contracts/voice/smart-send", json={"address_query": address_query, "contract_name": contract_name, "order": order, "message": message, "create_if_missing": create_if_missing})
     response.raise_for_status()
     return response.json()
 
@@ -18,7 +18,7 @@ async def handle_get_conversation_history(arguments: dict) -> list[TextContent]:
     if hours_ago:
         params["hours_ago"] = hours_ago
 
-    response = api_get("/context/history", params=params)
+    response = await api_get("/context/history", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -27,7 +27,7 @@ async def handle_get_conversation_history(arguments: dict) -> list[TextContent]:
 
 async def handle_what_did_we_discuss(arguments: dict) -> list[TextContent]:
     """Natural language version - what did we talk about."""
-    response = api_get("/context/history", params={"session_id": SESSION_ID, "limit": 5})
+    response = await api_get("/context/history", params={"session_id": SESSION_ID, "limit": 5})
     response.raise_for_status()
     data = response.json()
 
@@ -39,14 +39,14 @@ async def handle_what_did_we_discuss(arguments: dict) -> list[TextContent]:
 
 async def handle_clear_conversation_history(arguments: dict) -> list[TextContent]:
     """Clear conversation history."""
-    response = api_delete("/context/history", params={"session_id": SESSION_ID})
+    response = await api_delete("/context/history", params={"session_id": SESSION_ID})
     response.raise_for_status()
     data = response.json()
 
     return [TextContent(type="text", text=f"Cleared {data['deleted']} conversation entries.")]
 
 
-def log_tool_call(tool_name: str, input_summary: str, output_summary: str, success: bool = True, duration_ms: int = None, property_id: int = None):
+async def log_tool_call(tool_name: str, input_summary: str, output_summary: str, success: bool = True, duration_ms: int = None, property_id: int = None):
     """Helper to log a tool call to conversation history."""
     try:
         payload = {
@@ -59,7 +59,7 @@ def log_tool_call(tool_name: str, input_summary: str, output_summary: str, succe
         }
         if property_id is not None:
             payload["property_id"] = property_id
-        api_post("/context/history/log", json=payload)
+        await api_post("/context/history/log", json=payload)
     except Exception:
         pass  # Don't fail the main operation if logging fails
 
@@ -70,7 +70,7 @@ async def handle_get_property_history(arguments: dict) -> list[TextContent]:
 
     limit = arguments.get("limit", 50)
 
-    response = api_get(f"/context/history/property/{property_id}", params={"limit": limit})
+    response = await api_get(f"/context/history/property/{property_id}", params={"limit": limit})
     response.raise_for_status()
     data = response.json()
 
@@ -7,7 +7,7 @@ from ..utils.http_client import api_get, api_post
 
 async def handle_get_daily_digest(arguments: dict) -> list[TextContent]:
     """Get the latest daily digest."""
-    resp = api_get("/digest/latest")
+    resp = await api_get("/digest/latest")
     resp.raise_for_status()
     data = resp.json()
 
@@ -40,7 +40,7 @@ async def handle_get_daily_digest(arguments: dict) -> list[TextContent]:
 
 async def handle_trigger_daily_digest(arguments: dict) -> list[TextContent]:
     """Generate a fresh daily digest."""
-    resp = api_post("/digest/generate")
+    resp = await api_post("/digest/generate")
     resp.raise_for_status()
     data = resp.json()
 
@@ -22,7 +22,7 @@ async def handle_calculate_deal(arguments: dict) -> list[TextContent]:
     if arguments.get("monthly_rent_override"):
         params["monthly_rent"] = arguments["monthly_rent_override"]
 
-    response = api_post("/deal-calculator/voice", params=params)
+    response = await api_post("/deal-calculator/voice", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -67,7 +67,7 @@ async def handle_compare_strategies(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Please provide a property_id or address.")]
 
-    response = api_get(f"/deal-calculator/property/{property_id}")
+    response = await api_get(f"/deal-calculator/property/{property_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -118,7 +118,7 @@ async def handle_what_if_deal(arguments: dict) -> list[TextContent]:
     if arguments.get("rehab_tier"):
         payload["rehab"] = {"tier": arguments["rehab_tier"]}
 
-    response = api_post("/deal-calculator/calculate", json=payload)
+    response = await api_post("/deal-calculator/calculate", json=payload)
     response.raise_for_status()
     data = response.json()
 
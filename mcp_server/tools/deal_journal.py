@@ -20,7 +20,7 @@ async def handle_log_journal(arguments: dict) -> list[TextContent]:
         if arguments.get(key):
             payload[key] = arguments[key]
 
-    response = api_post("/journal/log", json=payload)
+    response = await api_post("/journal/log", json=payload)
     response.raise_for_status()
     data = response.json()
     return [TextContent(type="text", text=f"Logged to deal journal (ID: {data['id']}). Auto-ingested to knowledge base for future RAG search.")]
@@ -35,7 +35,7 @@ async def handle_search_journal(arguments: dict) -> list[TextContent]:
     if arguments.get("property_id"):
         payload["property_id"] = arguments["property_id"]
 
-    response = api_post("/journal/search", json=payload)
+    response = await api_post("/journal/search", json=payload)
     response.raise_for_status()
     data = response.json()
 
@@ -64,7 +64,7 @@ async def handle_property_journal(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Please provide a property_id.")]
 
-    response = api_get(f"/journal/property/{property_id}")
+    response = await api_get(f"/journal/property/{property_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -91,7 +91,7 @@ async def handle_recent_journal(arguments: dict) -> list[TextContent]:
     if arguments.get("entry_type"):
         params["entry_type"] = arguments["entry_type"]
 
-    response = api_get("/journal/recent", params=params)
+    response = await api_get("/journal/recent", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -9,43 +9,43 @@ from ..utils.property_resolver import resolve_property_id
 # ── Helpers ──
 
 async def set_deal_type(property_id: int, deal_type_name: str, clear_previous: bool = False) -> dict:
-    response = api_post(f"/properties/{property_id}/set-deal-type", params={"deal_type_name": deal_type_name, "clear_previous": clear_previous})
+    response = await api_post(f"/properties/{property_id}/set-deal-type", params={"deal_type_name": deal_type_name, "clear_previous": clear_previous})
     response.raise_for_status()
     return response.json()
 
 
 async def get_deal_status(property_id: int) -> dict:
-    response = api_get(f"/properties/{property_id}/deal-status")
+    response = await api_get(f"/properties/{property_id}/deal-status")
     response.raise_for_status()
     return response.json()
 
 
 async def list_deal_types_api() -> list:
-    response = api_get("/deal-types/")
+    response = await api_get("/deal-types/")
     response.raise_for_status()
     return response.json()
 
 
 async def get_deal_type_config(name: str) -> dict:
-    response = api_get(f"/deal-types/{name}")
+    response = await api_get(f"/deal-types/{name}")
     response.raise_for_status()
     return response.json()
 
 
 async def create_deal_type_config(data: dict) -> dict:
-    response = api_post("/deal-types/", json=data)
+    response = await api_post("/deal-types/", json=data)
     response.raise_for_status()
     return response.json()
 
 
 async def update_deal_type_config(name: str, data: dict) -> dict:
-    response = api_put(f"/deal-types/{name}", json=data)
+    response = await api_put(f"/deal-types/{name}", json=data)
     response.raise_for_status()
     return response.json()
 
 
 async def delete_deal_type_config(name: str) -> dict:
-    response = api_delete(f"/deal-types/{name}")
+    response = await api_delete(f"/deal-types/{name}")
     if response.status_code == 204:
         return {"success": True, "name": name}
     response.raise_for_status()
@@ -53,13 +53,13 @@ async def delete_deal_type_config(name: str) -> dict:
 
 
 async def preview_deal_type_api(name: str, property_id: int) -> dict:
-    response = api_post(f"/deal-types/{name}/preview", params={"property_id": property_id})
+    response = await api_post(f"/deal-types/{name}/preview", params={"property_id": property_id})
     response.raise_for_status()
     return response.json()
 
 
 async def test_webhook_configuration() -> dict:
-    response = api_get("/webhooks/docuseal/test")
+    response = await api_get("/webhooks/docuseal/test")
     response.raise_for_status()
     return response.json()
 
@@ -13,7 +13,7 @@ async def handle_analyze_document(arguments: dict) -> list[TextContent]:
     if not file_path:
         return [TextContent(type="text", text="Error: file_path is required.")]
 
-    response = api_post("/documents/analyze", json={
+    response = await api_post("/documents/analyze", json={
         "file_path": file_path,
         "analysis_type": analysis_type,
     })
@@ -56,7 +56,7 @@ async def handle_extract_issues(arguments: dict) -> list[TextContent]:
     if not file_path:
         return [TextContent(type="text", text="Error: file_path is required.")]
 
-    response = api_post("/documents/extract-issues", json={
+    response = await api_post("/documents/extract-issues", json={
         "file_path": file_path,
     })
     response.raise_for_status()
@@ -117,7 +117,7 @@ async def handle_extract_terms(arguments: dict) -> list[TextContent]:
     if not file_path:
         return [TextContent(type="text", text="Error: file_path is required.")]
 
-    response = api_post("/documents/extract-terms", json={
+    response = await api_post("/documents/extract-terms", json={
         "file_path": file_path,
     })
     response.raise_for_status()
@@ -168,7 +168,7 @@ async def handle_compare_documents(arguments: dict) -> list[TextContent]:
     if not file_path_1 or not file_path_2:
         return [TextContent(type="text", text="Error: Both file_path_1 and file_path_2 are required.")]
 
-    response = api_post("/documents/compare", json={
+    response = await api_post("/documents/compare", json={
         "file_path_1": file_path_1,
         "file_path_2": file_path_2,
     })
@@ -205,7 +205,7 @@ async def handle_compare_documents(arguments: dict) -> list[TextContent]:
 
 async def handle_document_types(arguments: dict) -> list[TextContent]:
     """List supported document types for analysis."""
-    response = api_get("/documents/types")
+    response = await api_get("/documents/types")
     response.raise_for_status()
     data = response.json()
 
@@ -8,7 +8,7 @@ from ..utils.http_client import api_get, api_post
 # ── Handlers ──
 
 async def handle_elevenlabs_setup(arguments: dict) -> list[TextContent]:
-    response = api_post("/elevenlabs/setup")
+    response = await api_post("/elevenlabs/setup")
     response.raise_for_status()
     result = response.json()
 
@@ -25,7 +25,7 @@ async def handle_elevenlabs_call(arguments: dict) -> list[TextContent]:
     if arguments.get("custom_first_message"):
         payload["custom_first_message"] = arguments["custom_first_message"]
 
-    response = api_post("/elevenlabs/call", json=payload)
+    response = await api_post("/elevenlabs/call", json=payload)
     response.raise_for_status()
     result = response.json()
 
@@ -34,7 +34,7 @@ async def handle_elevenlabs_call(arguments: dict) -> list[TextContent]:
 
 
 async def handle_elevenlabs_status(arguments: dict) -> list[TextContent]:
-    response = api_get("/elevenlabs/agent")
+    response = await api_get("/elevenlabs/agent")
     response.raise_for_status()
     result = response.json()
 
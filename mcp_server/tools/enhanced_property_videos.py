@@ -21,14 +21,14 @@ async def handle_generate_enhanced_video(arguments: dict) -> list[TextContent]:
 
     # Resolve property by address if needed
     if address and not property_id:
-        resp = api_get("/properties/", params={"search": address, "limit": 1})
+        resp = await api_get("/properties/", params={"search": address, "limit": 1})
         resp.raise_for_status()
         props = resp.json()
         if not props:
             return [TextContent(type="text", text=f"No property found matching '{address}'.")]
         property_id = props[0]["id"]
 
-    response = api_post(
+    response = await api_post(
         f"/enhanced-videos/generate/{property_id}",
         params={
             "agent_id": agent_id,
@@ -61,7 +61,7 @@ async def handle_list_enhanced_videos(arguments: dict) -> list[TextContent]:
     if arguments.get("status"):
         params["status"] = arguments["status"]
 
-    response = api_get("/enhanced-videos/", params=params if params else None)
+    response = await api_get("/enhanced-videos/", params=params if params else None)
     response.raise_for_status()
     videos = response.json()
 
@@ -92,7 +92,7 @@ async def handle_get_enhanced_video_status(arguments: dict) -> list[TextContent]
     if not video_id:
         return [TextContent(type="text", text="Please provide video_id.")]
 
-    response = api_get(f"/enhanced-videos/{video_id}/status")
+    response = await api_get(f"/enhanced-videos/{video_id}/status")
     response.raise_for_status()
     video = response.json()
 
@@ -134,7 +134,7 @@ async def handle_create_agent_video_profile(arguments: dict) -> list[TextContent
         "voice_style": arguments.get("voice_style", "professional")
     }
 
-    response = api_post("/enhanced-videos/agent/profile", json=payload)
+    response = await api_post("/enhanced-videos/agent/profile", json=payload)
     response.raise_for_status()
 
     return [TextContent(
@@ -156,7 +156,7 @@ async def handle_create_agent_avatar(arguments: dict) -> list[TextContent]:
     agent_id = arguments.get("agent_id", 1)
     gender = arguments.get("gender", "female")
 
-    response = api_post(
+    response = await api_post(
         f"/enhanced-videos/agent/{agent_id}/avatar",
         params={"photo_url": photo_url, "gender": gender}
     )
@@ -178,7 +178,7 @@ async def handle_estimate_video_cost(arguments: dict) -> list[TextContent]:
     num_clips = arguments.get("num_clips", 5)
     duration = arguments.get("duration", 60)
 
-    response = api_post(
+    response = await api_post(
         "/enhanced-videos/estimate-cost",
         params={"num_clips": num_clips, "duration": duration}
     )
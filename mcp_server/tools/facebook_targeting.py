@@ -14,7 +14,7 @@ async def handle_get_facebook_targeting(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Error: property_id is required")]
 
-    response = api_post("/facebook-targeting/analyze", json={"property_id": property_id})
+    response = await api_post("/facebook-targeting/analyze", json={"property_id": property_id})
     response.raise_for_status()
     result = response.json()
 
@@ -27,7 +27,7 @@ async def handle_get_facebook_targeting(arguments: dict) -> list[TextContent]:
 
 async def handle_list_targeting_personas(arguments: dict) -> list[TextContent]:
     """List all available Facebook targeting personas."""
-    response = api_get("/facebook-targeting/personas")
+    response = await api_get("/facebook-targeting/personas")
     response.raise_for_status()
     result = response.json()
 
@@ -44,7 +44,7 @@ async def handle_suggest_facebook_audiences(arguments: dict) -> list[TextContent
     if not property_id:
         return [TextContent(type="text", text="Error: property_id is required")]
 
-    response = api_post("/facebook-targeting/analyze", json={"property_id": property_id})
+    response = await api_post("/facebook-targeting/analyze", json={"property_id": property_id})
     response.raise_for_status()
     result = response.json()
 
@@ -26,7 +26,7 @@ async def handle_create_sequence(arguments: dict) -> list[TextContent]:
     if arguments.get("context"):
         payload["custom_context"] = arguments["context"]
 
-    response = api_post("/sequences/create", json=payload)
+    response = await api_post("/sequences/create", json=payload)
     response.raise_for_status()
     data = response.json()
     return [TextContent(type="text", text=f"Created follow-up sequence for {lead_name} — {data['steps']} touches. ID: {data['id']}")]
@@ -37,7 +37,7 @@ async def handle_list_sequences(arguments: dict) -> list[TextContent]:
     if arguments.get("status"):
         params["status"] = arguments["status"]
 
-    response = api_get("/sequences/list", params=params)
+    response = await api_get("/sequences/list", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -65,7 +65,7 @@ async def handle_get_sequence(arguments: dict) -> list[TextContent]:
     if not seq_id:
         return [TextContent(type="text", text="Please provide a sequence_id.")]
 
-    response = api_get(f"/sequences/{seq_id}")
+    response = await api_get(f"/sequences/{seq_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -90,7 +90,7 @@ async def handle_get_sequence(arguments: dict) -> list[TextContent]:
 
 
 async def handle_process_sequences(arguments: dict) -> list[TextContent]:
-    response = api_post("/sequences/process", json={})
+    response = await api_post("/sequences/process", json={})
     response.raise_for_status()
     data = response.json()
     return [TextContent(type="text", text=data.get("message", "Processed."))]
@@ -100,7 +100,7 @@ async def handle_pause_sequence(arguments: dict) -> list[TextContent]:
     seq_id = arguments.get("sequence_id")
     if not seq_id:
         return [TextContent(type="text", text="Please provide a sequence_id.")]
-    response = api_post(f"/sequences/{seq_id}/pause", json={})
+    response = await api_post(f"/sequences/{seq_id}/pause", json={})
     response.raise_for_status()
     return [TextContent(type="text", text=response.json().get("message", "Paused."))]
 
@@ -109,7 +109,7 @@ async def handle_resume_sequence(arguments: dict) -> list[TextContent]:
     seq_id = arguments.get("sequence_id")
     if not seq_id:
         return [TextContent(type="text", text="Please provide a sequence_id.")]
-    response = api_post(f"/sequences/{seq_id}/resume", json={})
+    response = await api_post(f"/sequences/{seq_id}/resume", json={})
     response.raise_for_status()
     return [TextContent(type="text", text=response.json().get("message", "Resumed."))]
 
@@ -118,13 +118,13 @@ async def handle_cancel_sequence(arguments: dict) -> list[TextContent]:
     seq_id = arguments.get("sequence_id")
     if not seq_id:
         return [TextContent(type="text", text="Please provide a sequence_id.")]
-    response = api_post(f"/sequences/{seq_id}/cancel", json={})
+    response = await api_post(f"/sequences/{seq_id}/cancel", json={})
     response.raise_for_status()
     return [TextContent(type="text", text=response.json().get("message", "Cancelled."))]
 
 
 async def handle_sequence_templates(arguments: dict) -> list[TextContent]:
-    response = api_get("/sequences/templates/list")
+    response = await api_get("/sequences/templates/list")
     response.raise_for_status()
     data = response.json()
 
@@ -144,7 +144,7 @@ async def handle_record_engagement(arguments: dict) -> list[TextContent]:
     event = arguments.get("event")
     if not seq_id or not event:
         return [TextContent(type="text", text="Please provide sequence_id and event.")]
-    response = api_post(f"/sequences/{seq_id}/engagement", json={"event": event})
+    response = await api_post(f"/sequences/{seq_id}/engagement", json={"event": event})
     response.raise_for_status()
     data = response.json()
     return [TextContent(type="text", text=f"Recorded {event} for sequence {seq_id}. Temperature: {data.get('temperature')}, Engagement: {data.get('engagement_score', 0):.0f}/100")]
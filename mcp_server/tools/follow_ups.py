@@ -16,7 +16,7 @@ async def handle_get_follow_up_queue(arguments: dict) -> list[TextContent]:
     if priority:
         params["priority"] = priority
 
-    response = api_get("/follow-ups/queue", params=params)
+    response = await api_get("/follow-ups/queue", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -56,7 +56,7 @@ async def handle_complete_follow_up(arguments: dict) -> list[TextContent]:
     if note:
         body["note"] = note
 
-    response = api_post(f"/follow-ups/{property_id}/complete", json=body)
+    response = await api_post(f"/follow-ups/{property_id}/complete", json=body)
     response.raise_for_status()
     data = response.json()
 
@@ -75,7 +75,7 @@ async def handle_snooze_follow_up(arguments: dict) -> list[TextContent]:
     property_id = resolve_property_id(arguments)
 
     hours = arguments.get("hours", 72)
-    response = api_post(f"/follow-ups/{property_id}/snooze", json={"hours": hours})
+    response = await api_post(f"/follow-ups/{property_id}/snooze", json={"hours": hours})
     response.raise_for_status()
     data = response.json()
 
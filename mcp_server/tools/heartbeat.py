@@ -9,7 +9,7 @@ from ..utils.property_resolver import resolve_property_id
 async def handle_get_property_heartbeat(arguments: dict) -> list[TextContent]:
     property_id = resolve_property_id(arguments)
 
-    response = api_get(f"/properties/{property_id}/heartbeat")
+    response = await api_get(f"/properties/{property_id}/heartbeat")
     response.raise_for_status()
     data = response.json()
 
@@ -13,7 +13,7 @@ async def handle_get_insights(arguments: dict) -> list[TextContent]:
     if priority:
         params["priority"] = priority
 
-    response = api_get("/insights/", params=params)
+    response = await api_get("/insights/", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -42,7 +42,7 @@ async def handle_get_property_insights(arguments: dict) -> list[TextContent]:
     """Get alerts for a specific property."""
     property_id = resolve_property_id(arguments)
 
-    response = api_get(f"/insights/property/{property_id}")
+    response = await api_get(f"/insights/property/{property_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -16,7 +16,7 @@ async def handle_search_knowledge(arguments: dict) -> list[TextContent]:
     if arguments.get("doc_type"):
         payload["doc_type"] = arguments["doc_type"]
 
-    response = api_post("/knowledge/search", json=payload)
+    response = await api_post("/knowledge/search", json=payload)
     response.raise_for_status()
     data = response.json()
 
@@ -53,7 +53,7 @@ async def handle_ingest_knowledge(arguments: dict) -> list[TextContent]:
     if arguments.get("source"):
         payload["source"] = arguments["source"]
 
-    response = api_post("/knowledge/ingest/text", json=payload)
+    response = await api_post("/knowledge/ingest/text", json=payload)
     response.raise_for_status()
     data = response.json()
     return [TextContent(type="text", text=data.get("message", "Document ingested."))]
@@ -70,7 +70,7 @@ async def handle_ingest_url(arguments: dict) -> list[TextContent]:
     if arguments.get("title"):
         payload["title"] = arguments["title"]
 
-    response = api_post("/knowledge/ingest/url", json=payload)
+    response = await api_post("/knowledge/ingest/url", json=payload)
     response.raise_for_status()
     data = response.json()
     return [TextContent(type="text", text=data.get("message", "Webpage ingested."))]
@@ -83,7 +83,7 @@ async def handle_list_knowledge_docs(arguments: dict) -> list[TextContent]:
     if arguments.get("doc_type"):
         params["doc_type"] = arguments["doc_type"]
 
-    response = api_get("/knowledge/documents", params=params)
+    response = await api_get("/knowledge/documents", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -105,7 +105,7 @@ async def handle_get_knowledge_doc(arguments: dict) -> list[TextContent]:
     if not doc_id:
         return [TextContent(type="text", text="Please provide a document_id.")]
 
-    response = api_get(f"/knowledge/documents/{doc_id}")
+    response = await api_get(f"/knowledge/documents/{doc_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -130,7 +130,7 @@ async def handle_delete_knowledge_doc(arguments: dict) -> list[TextContent]:
     if not doc_id:
         return [TextContent(type="text", text="Please provide a document_id.")]
 
-    response = api_delete(f"/knowledge/documents/{doc_id}")
+    response = await api_delete(f"/knowledge/documents/{doc_id}")
     response.raise_for_status()
     data = response.json()
     return [TextContent(type="text", text=data.get("message", f"Document {doc_id} deleted."))]
@@ -23,7 +23,7 @@ async def handle_create_watchlist(arguments: dict) -> list[TextContent]:
     if arguments.get("description"):
         body["description"] = arguments["description"]
 
-    response = api_post("/watchlists/", json=body)
+    response = await api_post("/watchlists/", json=body)
     response.raise_for_status()
     data = response.json()
 
@@ -64,7 +64,7 @@ async def handle_list_watchlists(arguments: dict) -> list[TextContent]:
     if arguments.get("is_active") is not None:
         params["is_active"] = arguments["is_active"]
 
-    response = api_get("/watchlists/", params=params)
+    response = await api_get("/watchlists/", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -103,7 +103,7 @@ async def handle_toggle_watchlist(arguments: dict) -> list[TextContent]:
     if not watchlist_id:
         return [TextContent(type="text", text="Please provide a watchlist_id.")]
 
-    response = api_post(f"/watchlists/{watchlist_id}/toggle")
+    response = await api_post(f"/watchlists/{watchlist_id}/toggle")
     response.raise_for_status()
     data = response.json()
 
@@ -117,7 +117,7 @@ async def handle_delete_watchlist(arguments: dict) -> list[TextContent]:
     if not watchlist_id:
         return [TextContent(type="text", text="Please provide a watchlist_id.")]
 
-    response = api_delete(f"/watchlists/{watchlist_id}")
+    response = await api_delete(f"/watchlists/{watchlist_id}")
     response.raise_for_status()
 
     return [TextContent(type="text", text=f"Watchlist #{watchlist_id} has been deleted.")]
@@ -129,7 +129,7 @@ async def handle_check_watchlist_matches(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Please provide a property_id.")]
 
-    response = api_post(f"/watchlists/check/{property_id}")
+    response = await api_post(f"/watchlists/check/{property_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -7,7 +7,7 @@ from ..utils.http_client import api_post
 
 async def handle_trigger_daily_brief(arguments: dict) -> list[TextContent]:
     """Send the daily morning brief via Telegram."""
-    resp = api_post("/morning-brief/send")
+    resp = await api_post("/morning-brief/send")
     resp.raise_for_status()
     data = resp.json()
 
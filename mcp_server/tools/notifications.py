@@ -8,7 +8,7 @@ from ..utils.http_client import api_get, api_post
 # ── Helpers ──
 
 async def send_notification(title, message, notification_type="general", priority="medium", icon="\U0001f514", property_id=None, auto_dismiss_seconds=10) -> dict:
-    response = api_post("/notifications/", json={
+    response = await api_post("/notifications/", json={
         "type": notification_type, "priority": priority, "title": title,
         "message": message, "icon": icon, "property_id": property_id,
         "auto_dismiss_seconds": auto_dismiss_seconds
@@ -21,7 +21,7 @@ async def list_notifications(limit=10, unread_only=False) -> dict:
     params = {"limit": limit}
     if unread_only:
         params["unread_only"] = "true"
-    response = api_get("/notifications/", params=params)
+    response = await api_get("/notifications/", params=params)
     response.raise_for_status()
     return response.json()
 
@@ -142,7 +142,7 @@ async def handle_acknowledge_notification(arguments: dict) -> list[TextContent]:
     notification_id = arguments["notification_id"]
     action = arguments.get("action", "read")
 
-    response = api_post(f"/notifications/{notification_id}/{action}")
+    response = await api_post(f"/notifications/{notification_id}/{action}")
     response.raise_for_status()
     return [TextContent(type="text", text=f"Notification #{notification_id} marked as {action}.")]
 
@@ -21,7 +21,7 @@ async def handle_create_offer(arguments: dict) -> list[TextContent]:
         if arguments.get(key) is not None:
             payload[key] = arguments[key]
 
-    response = api_post("/offers/", json=payload)
+    response = await api_post("/offers/", json=payload)
     response.raise_for_status()
     offer = response.json()
 
@@ -49,12 +49,12 @@ async def handle_counter_offer(arguments: dict) -> list[TextContent]:
         if not property_id and address:
             property_id = find_property_by_address(address)
         if property_id:
-            resp = api_get("/offers/", params={"property_id": property_id, "status": "submitted"})
-            if resp.ok:
+            resp = await api_get("/offers/", params={"property_id": property_id, "status": "submitted"})
+            if resp.is_success:
                 offers = resp.json()
                 if not offers:
-                    resp2 = api_get("/offers/", params={"property_id": property_id, "status": "countered"})
-                    if resp2.ok:
+                    resp2 = await api_get("/offers/", params={"property_id": property_id, "status": "countered"})
+                    if resp2.is_success:
                         offers = resp2.json()
                 if offers:
                     offer_id = offers[0]["id"]
@@ -66,7 +66,7 @@ async def handle_counter_offer(arguments: dict) -> list[TextContent]:
         if arguments.get(key) is not None:
             payload[key] = arguments[key]
 
-    response = api_post(f"/offers/{offer_id}/counter", json=payload)
+    response = await api_post(f"/offers/{offer_id}/counter", json=payload)
     response.raise_for_status()
     offer = response.json()
 
@@ -86,8 +86,8 @@ async def handle_accept_offer(arguments: dict) -> list[TextContent]:
         if not property_id and address:
             property_id = find_property_by_address(address)
         if property_id:
-            resp = api_get("/offers/", params={"property_id": property_id})
-            if resp.ok:
+            resp = await api_get("/offers/", params={"property_id": property_id})
+            if resp.is_success:
                 offers = [o for o in resp.json() if o["status"] in ("submitted", "countered")]
                 if offers:
                     offers.sort(key=lambda o: o["offer_price"], reverse=True)
@@ -95,7 +95,7 @@ async def handle_accept_offer(arguments: dict) -> list[TextContent]:
         if not offer_id:
             return [TextContent(type="text", text="No active offer found to accept.")]
 
-    response = api_post(f"/offers/{offer_id}/accept")
+    response = await api_post(f"/offers/{offer_id}/accept")
     response.raise_for_status()
     offer = response.json()
 
@@ -111,15 +111,15 @@ async def handle_reject_offer(arguments: dict) -> list[TextContent]:
         if not property_id and address:
             property_id = find_property_by_address(address)
         if property_id:
-            resp = api_get("/offers/", params={"property_id": property_id})
-            if resp.ok:
+            resp = await api_get("/offers/", params={"property_id": property_id})
+            if resp.is_success:
                 offers = [o for o in resp.json() if o["status"] in ("submitted", "countered")]
                 if offers:
                     offer_id = offers[0]["id"]
         if not offer_id:
             return [TextContent(type="text", text="No active offer found to reject.")]
 
-    response = api_post(f"/offers/{offer_id}/reject")
+    response = await api_post(f"/offers/{offer_id}/reject")
     response.raise_for_status()
     offer = response.json()
 
@@ -135,15 +135,15 @@ async def handle_withdraw_offer(arguments: dict) -> list[TextContent]:
         if not property_id and address:
             property_id = find_property_by_address(address)
         if property_id:
-            resp = api_get("/offers/", params={"property_id": property_id})
-            if resp.ok:
+            resp = await api_get("/offers/", params={"property_id": property_id})
+            if resp.is_success:
                 offers = [o for o in resp.json() if o["status"] in ("submitted", "countered", "draft") and o.get("is_our_offer")]
                 if offers:
                     offer_id = offers[0]["id"]
         if not offer_id:
             return [TextContent(type="text", text="No active offer found to withdraw.")]
 
-    response = api_post(f"/offers/{offer_id}/withdraw")
+    response = await api_post(f"/offers/{offer_id}/withdraw")
     response.raise_for_status()
     offer = response.json()
 
@@ -162,7 +162,7 @@ async def handle_list_offers(arguments: dict) -> list[TextContent]:
     if arguments.get("status"):
         params["status"] = arguments["status"]
 
-    response = api_get("/offers/", params=params)
+    response = await api_get("/offers/", params=params)
     response.raise_for_status()
     offers = response.json()
 
@@ -184,7 +184,7 @@ async def handle_get_offer_details(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Please provide a property_id or address.")]
 
-    response = api_get(f"/offers/property/{property_id}/summary")
+    response = await api_get(f"/offers/property/{property_id}/summary")
     response.raise_for_status()
     summary = response.json()
 
@@ -207,7 +207,7 @@ async def handle_calculate_mao(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Please provide a property_id or address.")]
 
-    response = api_post(f"/offers/property/{property_id}/mao")
+    response = await api_post(f"/offers/property/{property_id}/mao")
     response.raise_for_status()
     mao = response.json()
 
@@ -254,7 +254,7 @@ async def handle_draft_offer_letter(arguments: dict) -> list[TextContent]:
 
     # If we have an offer_id, draft from the existing offer
     if offer_id:
-        response = api_post(f"/offers/{int(offer_id)}/draft-letter")
+        response = await api_post(f"/offers/{int(offer_id)}/draft-letter")
         response.raise_for_status()
         data = response.json()
     else:
@@ -275,7 +275,7 @@ async def handle_draft_offer_letter(arguments: dict) -> list[TextContent]:
             if arguments.get(key) is not None:
                 payload[key] = arguments[key]
 
-        response = api_post(f"/offers/property/{int(property_id)}/draft-letter", json=payload)
+        response = await api_post(f"/offers/property/{int(property_id)}/draft-letter", json=payload)
         response.raise_for_status()
         data = response.json()
 
@@ -7,7 +7,7 @@ from ..utils.http_client import api_get, api_post
 
 async def handle_get_onboarding_questions(arguments: dict) -> list[TextContent]:
     """Get the list of onboarding questions for new agents."""
-    response = api_get("/onboarding/questions")
+    response = await api_get("/onboarding/questions")
     response.raise_for_status()
     data = response.json()
 
@@ -37,7 +37,7 @@ async def handle_get_onboarding_questions(arguments: dict) -> list[TextContent]:
 
 async def handle_get_onboarding_categories(arguments: dict) -> list[TextContent]:
     """Get the available onboarding question categories."""
-    response = api_get("/onboarding/categories")
+    response = await api_get("/onboarding/categories")
     response.raise_for_status()
     data = response.json()
 
@@ -73,7 +73,7 @@ async def handle_submit_onboarding(arguments: dict) -> list[TextContent]:
     if agent_id:
         payload["agent_id"] = agent_id
 
-    response = api_post("/onboarding/submit", json=payload)
+    response = await api_post("/onboarding/submit", json=payload)
     response.raise_for_status()
     result = response.json()
 
@@ -100,7 +100,7 @@ async def handle_get_onboarding_status(arguments: dict) -> list[TextContent]:
     if not agent_id:
         return [TextContent(type="text", text="Error: agent_id is required.")]
 
-    response = api_get(f"/onboarding/status/{agent_id}")
+    response = await api_get(f"/onboarding/status/{agent_id}")
     response.raise_for_status()
     status = response.json()
 
@@ -133,7 +133,7 @@ async def handle_complete_onboarding(arguments: dict) -> list[TextContent]:
     if agent_id:
         payload["agent_id"] = agent_id
 
-    response = api_post("/onboarding/complete", json=payload)
+    response = await api_post("/onboarding/complete", json=payload)
     response.raise_for_status()
     result = response.json()
 
@@ -71,7 +71,7 @@ async def handle_order_photos(arguments: dict) -> list[TextContent]:
     if arguments.get("contact_phone"):
         payload["contact_phone"] = arguments["contact_phone"]
 
-    response = api_post("/photo-orders/", json=payload)
+    response = await api_post("/photo-orders/", json=payload)
     response.raise_for_status()
     order = response.json()
 
@@ -98,8 +98,8 @@ async def handle_submit_photo_order(arguments: dict) -> list[TextContent]:
             property_id = find_property_by_address(address)
         if property_id:
             # Find draft order for this property
-            resp = api_get("/photo-orders/", params={"property_id": property_id, "status": "draft", "limit": 1})
-            if resp.ok:
+            resp = await api_get("/photo-orders/", params={"property_id": property_id, "status": "draft", "limit": 1})
+            if resp.is_success:
                 orders = resp.json()
                 if orders:
                     order_id = orders[0]["id"]
@@ -107,7 +107,7 @@ async def handle_submit_photo_order(arguments: dict) -> list[TextContent]:
         if not order_id:
             return [TextContent(type="text", text="No draft order found. Create an order first with 'order_photos'.")]
 
-    response = api_post(f"/photo-orders/{order_id}/submit", json={"confirm_submit": True})
+    response = await api_post(f"/photo-orders/{order_id}/submit", json={"confirm_submit": True})
     response.raise_for_status()
     order = response.json()
 
@@ -134,8 +134,8 @@ async def handle_get_photo_order_status(arguments: dict) -> list[TextContent]:
             property_id = find_property_by_address(address)
         if property_id:
             # Get most recent order for property
-            resp = api_get("/photo-orders/", params={"property_id": property_id, "limit": 1})
-            if resp.ok:
+            resp = await api_get("/photo-orders/", params={"property_id": property_id, "limit": 1})
+            if resp.is_success:
                 orders = resp.json()
                 if orders:
                     order_id = orders[0]["id"]
@@ -143,7 +143,7 @@ async def handle_get_photo_order_status(arguments: dict) -> list[TextContent]:
     if not order_id:
         return [TextContent(type="text", text="Please provide an order_id or property address.")]
 
-    response = api_get(f"/photo-orders/{order_id}/voice-summary")
+    response = await api_get(f"/photo-orders/{order_id}/voice-summary")
     response.raise_for_status()
     summary = response.json()
 
@@ -164,7 +164,7 @@ async def handle_list_photo_orders(arguments: dict) -> list[TextContent]:
     if arguments.get("limit"):
         params["limit"] = arguments["limit"]
 
-    response = api_get("/photo-orders/", params=params)
+    response = await api_get("/photo-orders/", params=params)
     response.raise_for_status()
     orders = response.json()
 
@@ -208,8 +208,8 @@ async def handle_sync_photo_order(arguments: dict) -> list[TextContent]:
         if not property_id and address:
             property_id = find_property_by_address(address)
         if property_id:
-            resp = api_get("/photo-orders/", params={"property_id": property_id, "limit": 1})
-            if resp.ok:
+            resp = await api_get("/photo-orders/", params={"property_id": property_id, "limit": 1})
+            if resp.is_success:
                 orders = resp.json()
                 if orders:
                     order_id = orders[0]["id"]
@@ -217,7 +217,7 @@ async def handle_sync_photo_order(arguments: dict) -> list[TextContent]:
     if not order_id:
         return [TextContent(type="text", text="Please provide an order_id or property address.")]
 
-    response = api_post(f"/photo-orders/{order_id}/sync")
+    response = await api_post(f"/photo-orders/{order_id}/sync")
     response.raise_for_status()
     order = response.json()
 
@@ -241,12 +241,12 @@ async def handle_cancel_photo_order(arguments: dict) -> list[TextContent]:
         if not property_id and address:
             property_id = find_property_by_address(address)
         if property_id:
-            resp = api_get("/photo-orders/", params={"property_id": property_id, "status": "draft", "limit": 1})
-            if resp.ok:
+            resp = await api_get("/photo-orders/", params={"property_id": property_id, "status": "draft", "limit": 1})
+            if resp.is_success:
                 orders = resp.json()
                 if not orders:
-                    resp = api_get("/photo-orders/", params={"property_id": property_id, "status": "pending", "limit": 1})
-                    if resp.ok:
+                    resp = await api_get("/photo-orders/", params={"property_id": property_id, "status": "pending", "limit": 1})
+                    if resp.is_success:
                         orders = resp.json()
                 if orders:
                     order_id = orders[0]["id"]
@@ -255,7 +255,7 @@ async def handle_cancel_photo_order(arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text="No cancellable order found.")]
 
     params = {"reason": arguments.get("reason")} if arguments.get("reason") else {}
-    response = api_post(f"/photo-orders/{order_id}/cancel", params=params)
+    response = await api_post(f"/photo-orders/{order_id}/cancel", params=params)
     response.raise_for_status()
     order = response.json()
 
@@ -271,7 +271,7 @@ async def handle_check_photo_availability(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Please provide a property_id or address.")]
 
-    response = api_get(f"/photo-orders/services/availability", params={"property_id": property_id})
+    response = await api_get(f"/photo-orders/services/availability", params={"property_id": property_id})
     response.raise_for_status()
     availability = response.json()
 
@@ -306,7 +306,7 @@ async def handle_get_property_photo_summary(arguments: dict) -> list[TextContent
     if not property_id:
         return [TextContent(type="text", text="Please provide a property_id or address.")]
 
-    response = api_get(f"/photo-orders/property/{property_id}/summary")
+    response = await api_get(f"/photo-orders/property/{property_id}/summary")
     response.raise_for_status()
     summary = response.json()
 
@@ -343,7 +343,7 @@ async def handle_create_photo_template(arguments: dict) -> list[TextContent]:
         "is_active": arguments.get("is_active", True)
     }
 
-    response = api_post("/photo-orders/templates/", json=payload, params={"agent_id": agent_id})
+    response = await api_post("/photo-orders/templates/", json=payload, params={"agent_id": agent_id})
     response.raise_for_status()
     template = response.json()
 
@@ -353,7 +353,7 @@ async def handle_create_photo_template(arguments: dict) -> list[TextContent]:
 async def handle_list_photo_templates(arguments: dict) -> list[TextContent]:
     """List photo order templates."""
     agent_id = arguments.get("agent_id", 1)
-    response = api_get("/photo-orders/templates/", params={"agent_id": agent_id})
+    response = await api_get("/photo-orders/templates/", params={"agent_id": agent_id})
     response.raise_for_status()
     templates = response.json()
 
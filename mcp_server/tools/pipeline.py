@@ -7,7 +7,7 @@ from ..utils.http_client import api_get, api_post
 
 async def handle_get_pipeline_status(arguments: dict) -> list[TextContent]:
     """Get recent pipeline auto-transitions."""
-    resp = api_get("/pipeline/status")
+    resp = await api_get("/pipeline/status")
     resp.raise_for_status()
     data = resp.json()
 
@@ -26,7 +26,7 @@ async def handle_get_pipeline_status(arguments: dict) -> list[TextContent]:
 
 async def handle_trigger_pipeline_check(arguments: dict) -> list[TextContent]:
     """Manually trigger pipeline automation check."""
-    resp = api_post("/pipeline/check")
+    resp = await api_post("/pipeline/check")
     resp.raise_for_status()
     data = resp.json()
 
@@ -22,25 +22,25 @@ async def list_properties(limit: int = 10, status=None, property_type=None, city
         params["max_price"] = max_price
     if bedrooms is not None:
         params["bedrooms"] = bedrooms
-    response = api_get("/properties/", params=params)
+    response = await api_get("/properties/", params=params)
     response.raise_for_status()
     return response.json()
 
 
 async def get_property(property_id: int) -> dict:
-    response = api_get(f"/properties/{property_id}")
+    response = await api_get(f"/properties/{property_id}")
     response.raise_for_status()
     return response.json()
 
 
 async def create_property_with_address(address, price, bedrooms=None, bathrooms=None, agent_id=1) -> dict:
-    autocomplete_resp = api_post("/address/autocomplete", json={"input": address, "country": "us"})
+    autocomplete_resp = await api_post("/address/autocomplete", json={"input": address, "country": "us"})
     autocomplete_resp.raise_for_status()
     suggestions = autocomplete_resp.json()['suggestions']
     if not suggestions:
         raise ValueError(f"No address found for: {address}")
     place_id = suggestions[0]['place_id']
-    create_resp = api_post("/context/property/create", json={
+    create_resp = await api_post("/context/property/create", json={
         "place_id": place_id, "price": price, "bedrooms": bedrooms,
         "bathrooms": bathrooms, "agent_id": agent_id, "session_id": "mcp_session"
     })
@@ -56,7 +56,7 @@ async def update_property(property_id=None, address_query=None, **fields) -> dic
     update_data = {k: v for k, v in fields.items() if v is not None}
     if not update_data:
         raise ValueError("No fields to update")
-    response = api_patch(f"/properties/{property_id}", json=update_data)
+    response = await api_patch(f"/properties/{property_id}", json=update_data)
     response.raise_for_status()
     return response.json()
 
@@ -90,7 +90,7 @@ async def delete_property(property_id: int) -> dict:
 
 
 async def enrich_property(property_id: int) -> dict:
-    response = api_post("/context/enrich", json={"property_ref": str(property_id), "session_id": "mcp_session"})
+    response = await api_post("/context/enrich", json={"property_ref": str(property_id), "session_id": "mcp_session"})
     response.raise_for_status()
     return response.json()
 
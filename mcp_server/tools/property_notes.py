@@ -13,7 +13,7 @@ async def handle_add_property_note(arguments: dict) -> list[TextContent]:
         "source": arguments.get("source", "voice"),
         "created_by": arguments.get("created_by", "voice assistant"),
     }
-    response = api_post("/property-notes/", json=payload)
+    response = await api_post("/property-notes/", json=payload)
     response.raise_for_status()
     note = response.json()
 
@@ -28,7 +28,7 @@ async def handle_list_property_notes(arguments: dict) -> list[TextContent]:
     property_id = arguments["property_id"]
     limit = arguments.get("limit", 10)
 
-    response = api_get(f"/property-notes/property/{property_id}", params={"limit": limit})
+    response = await api_get(f"/property-notes/property/{property_id}", params={"limit": limit})
     response.raise_for_status()
     result = response.json()
 
@@ -10,7 +10,7 @@ async def handle_score_property(arguments: dict) -> list[TextContent]:
     """Score a single property."""
     property_id = resolve_property_id(arguments)
 
-    response = api_post(f"/scoring/property/{property_id}")
+    response = await api_post(f"/scoring/property/{property_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -34,7 +34,7 @@ async def handle_get_score_breakdown(arguments: dict) -> list[TextContent]:
     """Get stored score breakdown for a property."""
     property_id = resolve_property_id(arguments)
 
-    response = api_get(f"/scoring/property/{property_id}")
+    response = await api_get(f"/scoring/property/{property_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -62,7 +62,7 @@ async def handle_bulk_score(arguments: dict) -> list[TextContent]:
     if arguments.get("filters"):
         body["filters"] = arguments["filters"]
 
-    response = api_post("/scoring/bulk", json=body)
+    response = await api_post("/scoring/bulk", json=body)
     response.raise_for_status()
     data = response.json()
 
@@ -93,7 +93,7 @@ async def handle_get_top_properties(arguments: dict) -> list[TextContent]:
     if arguments.get("min_score"):
         params["min_score"] = arguments["min_score"]
 
-    response = api_get("/scoring/top", params=params)
+    response = await api_get("/scoring/top", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -9,19 +9,19 @@ from ..utils.property_resolver import resolve_property_id
 # ── Helpers ──
 
 async def generate_property_recap(property_id: int, trigger: str = "manual") -> dict:
-    response = api_post(f"/property-recap/property/{property_id}/generate", params={"trigger": trigger})
+    response = await api_post(f"/property-recap/property/{property_id}/generate", params={"trigger": trigger})
     response.raise_for_status()
     return response.json()
 
 
 async def get_property_recap(property_id: int) -> dict:
-    response = api_get(f"/property-recap/property/{property_id}")
+    response = await api_get(f"/property-recap/property/{property_id}")
     response.raise_for_status()
     return response.json()
 
 
 async def make_property_phone_call(property_id: int, phone_number: str, call_purpose: str = "property_update") -> dict:
-    response = api_post(f"/property-recap/property/{property_id}/call", json={"phone_number": phone_number, "call_purpose": call_purpose})
+    response = await api_post(f"/property-recap/property/{property_id}/call", json={"phone_number": phone_number, "call_purpose": call_purpose})
     response.raise_for_status()
     return response.json()
 
@@ -39,7 +39,7 @@ async def call_contact_about_contract(property_id: int, contact_id: int, contrac
         contract = db.query(Contract).filter(Contract.id == contract_id).first()
         if not contract:
             raise ValueError(f"Contract {contract_id} not found")
-        response = api_post(f"/property-recap/property/{property_id}/call", json={
+        response = await api_post(f"/property-recap/property/{property_id}/call", json={
             "phone_number": contact.phone,
             "call_purpose": "specific_contract_reminder",
             "custom_context": {
@@ -78,7 +78,7 @@ async def call_property_owner_skip_trace(property_id: int, custom_message=None)
         if not phone_number:
             raise ValueError("No phone number found in skip trace data")
         property_obj = db.query(Property).filter(Property.id == property_id).first()
-        response = api_post(f"/property-recap/property/{property_id}/call", json={
+        response = await api_post(f"/property-recap/property/{property_id}/call", json={
             "phone_number": phone_number,
             "call_purpose": "skip_trace_outreach",
             "custom_context": {
@@ -20,7 +20,7 @@ async def handle_render_video(arguments: dict) -> list[TextContent]:
     if arguments.get("webhook_url"):
         payload["webhook_url"] = arguments["webhook_url"]
 
-    response = api_post("/v1/renders", json=payload)
+    response = await api_post("/v1/renders", json=payload)
     response.raise_for_status()
     job = response.json()
 
@@ -70,7 +70,7 @@ async def handle_render_property_video(arguments: dict) -> list[TextContent]:
     if arguments.get("webhook_url"):
         payload["webhook_url"] = arguments["webhook_url"]
 
-    response = api_post("/v1/renders", json=payload)
+    response = await api_post("/v1/renders", json=payload)
     response.raise_for_status()
     job = response.json()
 
@@ -88,7 +88,7 @@ async def handle_check_render_status(arguments: dict) -> list[TextContent]:
     if not render_id:
         return [TextContent(type="text", text="Please provide a render_id.")]
 
-    response = api_get(f"/v1/renders/{render_id}/progress")
+    response = await api_get(f"/v1/renders/{render_id}/progress")
     response.raise_for_status()
     p = response.json()
 
@@ -105,7 +105,7 @@ async def handle_check_render_status(arguments: dict) -> list[TextContent]:
 
     # If completed, get the full job for output_url
     if p["status"] == "completed":
-        full = api_get(f"/v1/renders/{render_id}")
+        full = await api_get(f"/v1/renders/{render_id}")
         if full.status_code == 200:
             job = full.json()
             if job.get("output_url"):
@@ -115,7 +115,7 @@ async def handle_check_render_status(arguments: dict) -> list[TextContent]:
 
 
 async def handle_list_renders(arguments: dict) -> list[TextContent]:
-    response = api_get("/v1/renders")
+    response = await api_get("/v1/renders")
     response.raise_for_status()
     data = response.json()
 
@@ -140,7 +140,7 @@ async def handle_cancel_render(arguments: dict) -> list[TextContent]:
     if not render_id:
         return [TextContent(type="text", text="Please provide a render_id.")]
 
-    response = api_post(f"/v1/renders/{render_id}/cancel")
+    response = await api_post(f"/v1/renders/{render_id}/cancel")
     response.raise_for_status()
     job = response.json()
     return [TextContent(type="text", text=f"Render {job['id']} canceled. Status: {job['status']}")]
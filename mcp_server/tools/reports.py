@@ -7,7 +7,7 @@ from ..utils.property_resolver import resolve_property_id
 
 
 async def send_property_report(property_id: int, report_type: str = "property_overview") -> dict:
-    response = api_post(
+    response = await api_post(
         f"/property-recap/property/{property_id}/send-report",
         params={"report_type": report_type},
     )
@@ -27,7 +27,7 @@ async def handle_research_property(arguments: dict) -> list[TextContent]:
         payload["assumptions"] = assumptions
 
     timeout = 180 if arguments.get("extensive") else 120
-    response = api_post("/agentic/research", json=payload, timeout=timeout)
+    response = await api_post("/agentic/research", json=payload, timeout=timeout)
     response.raise_for_status()
     result = response.json()
 
@@ -156,7 +156,7 @@ async def handle_research_property_async(arguments: dict) -> list[TextContent]:
         payload["zip"] = arguments["zip"]
     payload["strategy"] = arguments.get("strategy", "wholesale")
 
-    response = api_post("/agentic/jobs", json=payload, timeout=15)
+    response = await api_post("/agentic/jobs", json=payload, timeout=15)
     response.raise_for_status()
     result = response.json()
 
@@ -166,7 +166,7 @@ async def handle_research_property_async(arguments: dict) -> list[TextContent]:
 
 async def handle_get_research_status(arguments: dict) -> list[TextContent]:
     job_id = int(arguments["job_id"])
-    response = api_get(f"/agentic/jobs/{job_id}", timeout=10)
+    response = await api_get(f"/agentic/jobs/{job_id}", timeout=10)
     response.raise_for_status()
     result = response.json()
 
@@ -186,7 +186,7 @@ async def handle_get_research_status(arguments: dict) -> list[TextContent]:
 
 async def handle_get_research_dossier(arguments: dict) -> list[TextContent]:
     property_id = int(arguments["property_id"])
-    response = api_get(f"/agentic/properties/{property_id}/dossier", timeout=10)
+    response = await api_get(f"/agentic/properties/{property_id}/dossier", timeout=10)
     response.raise_for_status()
     result = response.json()
 
@@ -38,7 +38,7 @@ async def handle_create_scheduled_task(arguments: dict) -> list[TextContent]:
     # Remove None values
     payload = {k: v for k, v in payload.items() if v is not None}
 
-    response = api_post("/scheduled-tasks/", json=payload)
+    response = await api_post("/scheduled-tasks/", json=payload)
     response.raise_for_status()
     data = response.json()
 
@@ -67,7 +67,7 @@ async def handle_list_scheduled_tasks(arguments: dict) -> list[TextContent]:
     if property_id:
         params["property_id"] = property_id
 
-    response = api_get("/scheduled-tasks/", params=params)
+    response = await api_get("/scheduled-tasks/", params=params)
     response.raise_for_status()
     tasks = response.json()
 
@@ -92,7 +92,7 @@ async def handle_cancel_scheduled_task(arguments: dict) -> list[TextContent]:
     if not task_id:
         return [TextContent(type="text", text="Please provide a task_id to cancel.")]
 
-    response = api_delete(f"/scheduled-tasks/{task_id}")
+    response = await api_delete(f"/scheduled-tasks/{task_id}")
     response.raise_for_status()
     data = response.json()
 
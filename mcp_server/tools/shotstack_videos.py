@@ -84,11 +84,11 @@ def _fmt_status(data: dict) -> str:
     return "\n".join(parts)
 
 
-def _get_agent_id() -> int:
+async def _get_agent_id() -> int:
     """Get agent_id from the API (uses the API key to resolve)."""
     # The middleware resolves the agent from the API key, so we call a
     # lightweight endpoint and extract agent_id from the response.
-    resp = api_get("/properties/", params={"limit": 1})
+    resp = await api_get("/properties/", params={"limit": 1})
     data = resp.json()
     if isinstance(data, list) and data:
         return data[0].get("agent_id", 1)
@@ -103,7 +103,7 @@ async def handle_render_property_video(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Error: property_id is required")]
 
-    agent_id = _get_agent_id()
+    agent_id = await _get_agent_id()
     style = arguments.get("style", "luxury")
 
     body = {"style": style}
@@ -111,7 +111,7 @@ async def handle_render_property_video(arguments: dict) -> list[TextContent]:
     if queries:
         body["video_search_queries"] = queries
 
-    resp = api_post(
+    resp = await api_post(
         f"/agent-brand/{agent_id}/property-video/{property_id}",
         json=body,
     )
@@ -138,7 +138,7 @@ async def handle_render_brand_video(arguments: dict) -> list[TextContent]:
     if not script:
         return [TextContent(type="text", text="Error: script is required (the text for the talking head to speak)")]
 
-    agent_id = _get_agent_id()
+    agent_id = await _get_agent_id()
 
     body = {
         "script": script,
@@ -149,7 +149,7 @@ async def handle_render_brand_video(arguments: dict) -> list[TextContent]:
     if music_url:
         body["background_music_url"] = music_url
 
-    resp = api_post(f"/agent-brand/{agent_id}/brand-video", json=body)
+    resp = await api_post(f"/agent-brand/{agent_id}/brand-video", json=body)
 
     if resp.status_code >= 400:
         return [TextContent(type="text", text=f"Error ({resp.status_code}): {resp.text}")]
@@ -172,8 +172,8 @@ async def handle_check_video_render_status(arguments: dict) -> list[TextContent]
     if not job_id:
         return [TextContent(type="text", text="Error: job_id is required")]
 
-    agent_id = _get_agent_id()
-    resp = api_get(f"/agent-brand/{agent_id}/property-video/{job_id}/status")
+    agent_id = await _get_agent_id()
+    resp = await api_get(f"/agent-brand/{agent_id}/property-video/{job_id}/status")
 
     if resp.status_code >= 400:
         return [TextContent(type="text", text=f"Error ({resp.status_code}): {resp.text}")]
@@ -187,8 +187,8 @@ async def handle_get_video_timeline(arguments: dict) -> list[TextContent]:
     if not job_id:
         return [TextContent(type="text", text="Error: job_id is required")]
 
-    agent_id = _get_agent_id()
-    resp = api_get(f"/agent-brand/{agent_id}/property-video/{job_id}/timeline")
+    agent_id = await _get_agent_id()
+    resp = await api_get(f"/agent-brand/{agent_id}/property-video/{job_id}/timeline")
 
     if resp.status_code >= 400:
         return [TextContent(type="text", text=f"Error ({resp.status_code}): {resp.text}")]
@@ -198,12 +198,12 @@ async def handle_get_video_timeline(arguments: dict) -> list[TextContent]:
 
 async def handle_list_video_jobs(arguments: dict) -> list[TextContent]:
     """List all property/brand video jobs for the agent."""
-    agent_id = _get_agent_id()
+    agent_id = await _get_agent_id()
 
     # The agent-brand router doesn't have a list endpoint for jobs,
     # so we query the properties and check for video jobs via a direct DB query.
     # For now, use the enhanced-videos list endpoint as fallback.
-    resp = api_get("/enhanced-videos/", params={
+    resp = await api_get("/enhanced-videos/", params={
         "limit": arguments.get("limit", 20),
     })
 
@@ -237,7 +237,7 @@ async def handle_preview_video_script(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Error: property_id is required")]
 
-    resp = api_post(f"/v1/property-videos/script-preview?property_id={property_id}")
+    resp = await api_post(f"/v1/property-videos/script-preview?property_id={property_id}")
 
     if resp.status_code >= 400:
         return [TextContent(type="text", text=f"Error ({resp.status_code}): {resp.text}")]
@@ -23,7 +23,7 @@ async def handle_create_todo(arguments: dict) -> list[TextContent]:
     if arguments.get("status"):
         payload["status"] = arguments["status"]
 
-    response = api_post("/todos/", json=payload)
+    response = await api_post("/todos/", json=payload)
     response.raise_for_status()
     todo = response.json()
 
@@ -44,7 +44,7 @@ async def handle_list_property_todos(arguments: dict) -> list[TextContent]:
     if arguments.get("contact_id"):
         params["contact_id"] = arguments["contact_id"]
 
-    response = api_get(f"/todos/property/{property_id}", params=params)
+    response = await api_get(f"/todos/property/{property_id}", params=params)
     response.raise_for_status()
     result = response.json()
 
@@ -69,7 +69,7 @@ async def handle_list_property_todos(arguments: dict) -> list[TextContent]:
 async def handle_get_todo(arguments: dict) -> list[TextContent]:
     """Get details of a specific todo by ID."""
     todo_id = arguments["todo_id"]
-    response = api_get(f"/todos/{todo_id}")
+    response = await api_get(f"/todos/{todo_id}")
     response.raise_for_status()
     todo = response.json()
 
@@ -87,7 +87,7 @@ async def handle_update_todo(arguments: dict) -> list[TextContent]:
     if not payload:
         return [TextContent(type="text", text="No fields to update. Provide at least one field to change.")]
 
-    response = api_patch(f"/todos/{todo_id}", json=payload)
+    response = await api_patch(f"/todos/{todo_id}", json=payload)
     response.raise_for_status()
     todo = response.json()
 
@@ -100,7 +100,7 @@ async def handle_update_todo(arguments: dict) -> list[TextContent]:
 async def handle_delete_todo(arguments: dict) -> list[TextContent]:
     """Delete a todo by ID."""
     todo_id = arguments["todo_id"]
-    response = api_delete(f"/todos/{todo_id}")
+    response = await api_delete(f"/todos/{todo_id}")
     response.raise_for_status()
 
     return [TextContent(type="text", text=f"Deleted todo #{todo_id}.")]
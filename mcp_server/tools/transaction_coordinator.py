@@ -21,7 +21,7 @@ async def handle_create_transaction(arguments: dict) -> list[TextContent]:
     if arguments.get("parties"):
         payload["parties"] = arguments["parties"]
 
-    response = api_post("/transactions/", json=payload)
+    response = await api_post("/transactions/", json=payload)
     response.raise_for_status()
     txn = response.json()
 
@@ -42,7 +42,7 @@ async def handle_get_transaction(arguments: dict) -> list[TextContent]:
     if not txn_id:
         return [TextContent(type="text", text="Please provide a transaction_id.")]
 
-    response = api_get(f"/transactions/{txn_id}")
+    response = await api_get(f"/transactions/{txn_id}")
     response.raise_for_status()
     txn = response.json()
 
@@ -90,7 +90,7 @@ async def handle_list_transactions(arguments: dict) -> list[TextContent]:
     if arguments.get("property_id"):
         params["property_id"] = arguments["property_id"]
 
-    response = api_get("/transactions/", params=params)
+    response = await api_get("/transactions/", params=params)
     response.raise_for_status()
     txns = response.json()
 
@@ -119,7 +119,7 @@ async def handle_update_milestone(arguments: dict) -> list[TextContent]:
         if arguments.get(key) is not None:
             payload[key] = arguments[key]
 
-    response = api_put(f"/transactions/milestones/{milestone_id}", json=payload)
+    response = await api_put(f"/transactions/milestones/{milestone_id}", json=payload)
     response.raise_for_status()
     m = response.json()
 
@@ -133,7 +133,7 @@ async def handle_update_milestone(arguments: dict) -> list[TextContent]:
 
 
 async def handle_check_deadlines(arguments: dict) -> list[TextContent]:
-    response = api_get("/transactions/check-deadlines")
+    response = await api_get("/transactions/check-deadlines")
     response.raise_for_status()
     data = response.json()
 
@@ -151,7 +151,7 @@ async def handle_check_deadlines(arguments: dict) -> list[TextContent]:
 
 
 async def handle_transaction_pipeline(arguments: dict) -> list[TextContent]:
-    response = api_get("/transactions/pipeline")
+    response = await api_get("/transactions/pipeline")
     response.raise_for_status()
     data = response.json()
 
@@ -176,7 +176,7 @@ async def handle_transaction_summary(arguments: dict) -> list[TextContent]:
     if not txn_id:
         return [TextContent(type="text", text="Please provide a transaction_id.")]
 
-    response = api_get(f"/transactions/{txn_id}/summary")
+    response = await api_get(f"/transactions/{txn_id}/summary")
     response.raise_for_status()
     s = response.json()
 
@@ -208,7 +208,7 @@ async def handle_add_party(arguments: dict) -> list[TextContent]:
     if arguments.get("phone"):
         params["phone"] = arguments["phone"]
 
-    response = api_post(f"/transactions/{txn_id}/party", params=params)
+    response = await api_post(f"/transactions/{txn_id}/party", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -220,7 +220,7 @@ async def handle_add_party(arguments: dict) -> list[TextContent]:
 
 
 async def handle_check_deadlines_notify(arguments: dict) -> list[TextContent]:
-    response = api_post("/transactions/check-deadlines/notify")
+    response = await api_post("/transactions/check-deadlines/notify")
     response.raise_for_status()
     data = response.json()
 
@@ -248,7 +248,7 @@ async def handle_add_risk_flag(arguments: dict) -> list[TextContent]:
     if not txn_id or not flag:
         return [TextContent(type="text", text="Please provide transaction_id and flag.")]
 
-    response = api_post(f"/transactions/{txn_id}/risk-flag", params={"flag": flag})
+    response = await api_post(f"/transactions/{txn_id}/risk-flag", params={"flag": flag})
     response.raise_for_status()
     data = response.json()
     return [TextContent(type="text", text=f"Risk flags: {', '.join(data.get('risk_flags', []))}")]
@@ -23,7 +23,7 @@ async def handle_semantic_search(arguments: dict) -> list[TextContent]:
     if arguments.get("max_price"):
         payload["max_price"] = arguments["max_price"]
 
-    response = api_post("/search/properties", json=payload)
+    response = await api_post("/search/properties", json=payload)
     response.raise_for_status()
     data = response.json()
 
@@ -53,7 +53,7 @@ async def handle_find_similar_properties(arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text="Please provide a property_id or address.")]
 
     limit = arguments.get("limit", 5)
-    response = api_get(f"/search/similar/{property_id}", params={"limit": limit})
+    response = await api_get(f"/search/similar/{property_id}", params={"limit": limit})
     response.raise_for_status()
     data = response.json()
 
@@ -82,7 +82,7 @@ async def handle_search_research(arguments: dict) -> list[TextContent]:
         "dossier_limit": arguments.get("dossier_limit", 5),
         "evidence_limit": arguments.get("evidence_limit", 10),
     }
-    response = api_post("/search/research", json=payload)
+    response = await api_post("/search/research", json=payload)
     response.raise_for_status()
     data = response.json()
 
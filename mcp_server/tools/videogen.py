@@ -15,7 +15,7 @@ async def handle_generate_avatar_video(arguments: dict) -> list[TextContent]:
     if not property_id:
         return [TextContent(type="text", text="Error: property_id is required")]
 
-    resp = api_post("/videogen/post", json={
+    resp = await api_post("/videogen/post", json={
         "property_id": property_id,
         "avatar_id": arguments.get("avatar_id", "Anna-public-1_20230714"),
         "script_type": arguments.get("script_type", "promotion"),
@@ -28,12 +28,12 @@ async def handle_check_video_status(arguments: dict) -> list[TextContent]:
     video_id = arguments.get("video_id")
     if not video_id:
         return [TextContent(type="text", text="Error: video_id is required")]
-    resp = api_get(f"/videogen/status/{video_id}")
+    resp = await api_get(f"/videogen/status/{video_id}")
     return [TextContent(type="text", text=json.dumps(resp.json(), indent=2))]
 
 
 async def handle_list_avatars(arguments: dict) -> list[TextContent]:
-    resp = api_get("/videogen/avatars/cached")
+    resp = await api_get("/videogen/avatars/cached")
     return [TextContent(type="text", text=json.dumps(resp.json(), indent=2))]
 
 
@@ -41,7 +41,7 @@ async def handle_create_video_and_post(arguments: dict) -> list[TextContent]:
     property_id = arguments.get("property_id")
     if not property_id:
         return [TextContent(type="text", text="Error: property_id is required")]
-    resp = api_post("/videogen/post", json={
+    resp = await api_post("/videogen/post", json={
         "property_id": property_id,
         "caption": arguments.get("caption"),
         "platforms": arguments.get("platforms", ["instagram", "tiktok", "youtube"]),
@@ -52,7 +52,7 @@ async def handle_create_video_and_post(arguments: dict) -> list[TextContent]:
 
 async def handle_generate_test_video(arguments: dict) -> list[TextContent]:
     script = arguments.get("script", "This is a test of the AI avatar video system.")
-    resp = api_post("/videogen/generate", json={"script": script, "test": True})
+    resp = await api_post("/videogen/generate", json={"script": script, "test": True})
     return [TextContent(type="text", text=json.dumps(resp.json(), indent=2))]
 
 
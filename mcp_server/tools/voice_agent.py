@@ -9,7 +9,7 @@ from ..utils.http_client import api_get, api_post
 
 async def handle_start_voice_call(arguments: dict) -> list[TextContent]:
     payload = {"phone_number": arguments["phone_number"]}
-    response = api_post("/voice/agent/call", json=payload)
+    response = await api_post("/voice/agent/call", json=payload)
     response.raise_for_status()
     result = response.json()
 
@@ -24,7 +24,7 @@ async def handle_list_voice_calls(arguments: dict) -> list[TextContent]:
     params = {}
     if arguments.get("limit"):
         params["limit"] = arguments["limit"]
-    response = api_get("/voice/agent/calls", params=params)
+    response = await api_get("/voice/agent/calls", params=params)
     response.raise_for_status()
     calls = response.json()
 
@@ -44,7 +44,7 @@ async def handle_list_voice_calls(arguments: dict) -> list[TextContent]:
 
 async def handle_get_voice_call(arguments: dict) -> list[TextContent]:
     call_id = arguments["call_id"]
-    response = api_get(f"/voice/agent/calls/{call_id}")
+    response = await api_get(f"/voice/agent/calls/{call_id}")
     response.raise_for_status()
     result = response.json()
 
@@ -8,7 +8,7 @@ from ..utils.http_client import api_get, api_post, api_put, api_delete
 
 async def handle_create_phone_number(arguments: dict) -> list[TextContent]:
     """Create a new phone number for inbound calling."""
-    response = api_post("/voice-assistant/phone-numbers", arguments)
+    response = await api_post("/voice-assistant/phone-numbers", arguments)
     response.raise_for_status()
     data = response.json()
 
@@ -30,7 +30,7 @@ async def handle_create_phone_number(arguments: dict) -> list[TextContent]:
 
 async def handle_list_phone_numbers(arguments: dict) -> list[TextContent]:
     """List all phone numbers."""
-    response = api_get("/voice-assistant/phone-numbers")
+    response = await api_get("/voice-assistant/phone-numbers")
     response.raise_for_status()
     numbers = response.json()
 
@@ -53,7 +53,7 @@ async def handle_list_phone_numbers(arguments: dict) -> list[TextContent]:
 async def handle_set_primary_number(arguments: dict) -> list[TextContent]:
     """Set a phone number as primary."""
     phone_id = arguments.get("phone_id")
-    response = api_post(f"/voice-assistant/phone-numbers/{phone_id}/set-primary")
+    response = await api_post(f"/voice-assistant/phone-numbers/{phone_id}/set-primary")
     response.raise_for_status()
 
     return [TextContent(type="text", text=f"✅ Phone number {phone_id} set as primary")]
@@ -69,7 +69,7 @@ async def handle_list_calls(arguments: dict) -> list[TextContent]:
     if arguments.get("property_id"):
         params["property_id"] = arguments["property_id"]
 
-    response = api_get("/voice-assistant/phone-calls", params=params)
+    response = await api_get("/voice-assistant/phone-calls", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -105,12 +105,12 @@ async def handle_get_call_transcript(arguments: dict) -> list[TextContent]:
     call_id = arguments.get("call_id")
 
     # Get call details
-    response = api_get(f"/voice-assistant/phone-calls/{call_id}")
+    response = await api_get(f"/voice-assistant/phone-calls/{call_id}")
     response.raise_for_status()
     call = response.json()
 
     # Get transcript
-    response = api_get(f"/voice-assistant/phone-calls/transcription/{call_id}")
+    response = await api_get(f"/voice-assistant/phone-calls/transcription/{call_id}")
     response.raise_for_status()
     data = response.json()
 
@@ -135,7 +135,7 @@ async def handle_get_call_transcript(arguments: dict) -> list[TextContent]:
 
 async def handle_get_call_analytics(arguments: dict) -> list[TextContent]:
     """Get call analytics overview."""
-    response = api_get("/voice-assistant/phone-calls/analytics/overview")
+    response = await api_get("/voice-assistant/phone-calls/analytics/overview")
     response.raise_for_status()
     data = response.json()
 
@@ -166,7 +166,7 @@ async def handle_get_call_analytics(arguments: dict) -> list[TextContent]:
 
 async def handle_get_property_call_stats(arguments: dict) -> list[TextContent]:
     """Get call statistics grouped by property."""
-    response = api_get("/voice-assistant/phone-calls/analytics/by-property")
+    response = await api_get("/voice-assistant/phone-calls/analytics/by-property")
     response.raise_for_status()
     data = response.json()
 
@@ -19,7 +19,7 @@ async def handle_create_voice_campaign(arguments: dict) -> list[TextContent]:
         "rate_limit_per_minute": 5,
         "auto_enroll_from_filters": arguments.get("auto_enroll", False),
     }
-    response = api_post("/voice-campaigns/", json=payload)
+    response = await api_post("/voice-campaigns/", json=payload)
     response.raise_for_status()
     campaign = response.json()
 
@@ -40,14 +40,14 @@ async def handle_add_campaign_targets(arguments: dict) -> list[TextContent]:
             "phone_numbers": arguments.get("phone_numbers", []),
             "property_id": arguments.get("property_id"),
         }
-        response = api_post(f"/voice-campaigns/{campaign_id}/targets", json=payload)
+        response = await api_post(f"/voice-campaigns/{campaign_id}/targets", json=payload)
     else:
         payload = {
             "property_id": arguments.get("property_id"),
             "contact_roles": arguments.get("contact_roles", []),
             "limit": arguments.get("limit", 100),
         }
-        response = api_post(f"/voice-campaigns/{campaign_id}/targets/from-filters", json=payload)
+        response = await api_post(f"/voice-campaigns/{campaign_id}/targets/from-filters", json=payload)
 
     response.raise_for_status()
     result = response.json()
@@ -62,7 +62,7 @@ async def handle_add_campaign_targets(arguments: dict) -> list[TextContent]:
 
 async def handle_start_voice_campaign(arguments: dict) -> list[TextContent]:
     campaign_id = arguments["campaign_id"]
-    response = api_post(f"/voice-campaigns/{campaign_id}/start")
+    response = await api_post(f"/voice-campaigns/{campaign_id}/start")
     response.raise_for_status()
     campaign = response.json()
     return [TextContent(type="text", text=f"Campaign '{campaign['name']}' started. Status: {campaign['status']}")]
@@ -70,7 +70,7 @@ async def handle_start_voice_campaign(arguments: dict) -> list[TextContent]:
 
 async def handle_pause_voice_campaign(arguments: dict) -> list[TextContent]:
     campaign_id = arguments["campaign_id"]
-    response = api_post(f"/voice-campaigns/{campaign_id}/pause")
+    response = await api_post(f"/voice-campaigns/{campaign_id}/pause")
     response.raise_for_status()
     campaign = response.json()
     return [TextContent(type="text", text=f"Campaign '{campaign['name']}' paused.")]
@@ -78,7 +78,7 @@ async def handle_pause_voice_campaign(arguments: dict) -> list[TextContent]:
 
 async def handle_get_campaign_status(arguments: dict) -> list[TextContent]:
     campaign_id = arguments["campaign_id"]
-    response = api_get(f"/voice-campaigns/{campaign_id}/analytics")
+    response = await api_get(f"/voice-campaigns/{campaign_id}/analytics")
     response.raise_for_status()
     stats = response.json()
 
@@ -101,7 +101,7 @@ async def handle_list_voice_campaigns(arguments: dict) -> list[TextContent]:
     if arguments.get("status"):
         params["status"] = arguments["status"]
 
-    response = api_get("/voice-campaigns/", params=params)
+    response = await api_get("/voice-campaigns/", params=params)
     response.raise_for_status()
     campaigns = response.json()
 
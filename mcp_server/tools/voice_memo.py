@@ -20,7 +20,7 @@ async def handle_transcribe_voice_memo(arguments: dict) -> list[TextContent]:
     try:
         with open(file_path, "rb") as f:
             files = {"file": (os.path.basename(file_path), f)}
-            response = api_post("/voice-memo/transcribe", files=files)
+            response = await api_post("/voice-memo/transcribe", files=files)
 
         response.raise_for_status()
         data = response.json()
@@ -54,7 +54,7 @@ async def handle_process_voice_memo(arguments: dict) -> list[TextContent]:
             if arguments.get("contact_id"):
                 form_data["contact_id"] = str(arguments["contact_id"])
 
-            response = api_post("/voice-memo/process", files=files, data=form_data)
+            response = await api_post("/voice-memo/process", files=files, data=form_data)
 
         response.raise_for_status()
         data = response.json()
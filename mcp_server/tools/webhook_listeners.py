@@ -22,7 +22,7 @@ async def handle_register_webhook(arguments: dict) -> list[TextContent]:
     if arguments.get("secret"):
         body["secret"] = arguments["secret"]
 
-    response = api_post("/webhooks/listeners/register", json=body)
+    response = await api_post("/webhooks/listeners/register", json=body)
     response.raise_for_status()
     data = response.json()
 
@@ -41,7 +41,7 @@ async def handle_list_webhooks(arguments: dict) -> list[TextContent]:
     if arguments.get("event_type"):
         params["event_type"] = arguments["event_type"]
 
-    response = api_get("/webhooks/listeners/registered", params=params)
+    response = await api_get("/webhooks/listeners/registered", params=params)
     response.raise_for_status()
     data = response.json()
 
@@ -71,7 +71,7 @@ async def handle_test_webhook(arguments: dict) -> list[TextContent]:
     if arguments.get("payload"):
         body["payload"] = arguments["payload"]
 
-    response = api_post(f"/webhooks/listeners/test/{event_type}", json=body)
+    response = await api_post(f"/webhooks/listeners/test/{event_type}", json=body)
     response.raise_for_status()
     data = response.json()
 
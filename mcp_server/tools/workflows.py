@@ -14,7 +14,7 @@ async def handle_execute_workflow(arguments: dict) -> list[TextContent]:
         "execution_mode": arguments.get("execution_mode"),
         "confirm_high_risk": arguments.get("confirm_high_risk", False),
     }
-    response = api_post("/workflows/execute", json=payload)
+    response = await api_post("/workflows/execute", json=payload)
     response.raise_for_status()
     result = response.json()
 
@@ -46,7 +46,7 @@ async def handle_execute_workflow(arguments: dict) -> list[TextContent]:
 
 
 async def handle_list_workflows(arguments: dict) -> list[TextContent]:
-    response = api_get("/workflows/templates")
+    response = await api_get("/workflows/templates")
     response.raise_for_status()
     templates = response.json()
 
@@ -6,10 +6,10 @@ from .http_client import api_post, api_patch
 logger = logging.getLogger(__name__)
 
 
-def log_activity_event(tool_name: str, metadata: dict = None) -> Optional[int]:
+async def log_activity_event(tool_name: str, metadata: dict = None) -> Optional[int]:
     """Log an activity event for MCP tool call."""
     try:
-        response = api_post(
+        response = await api_post(
             "/activities/log",
             json={
                 "tool_name": tool_name,
@@ -27,12 +27,12 @@ def log_activity_event(tool_name: str, metadata: dict = None) -> Optional[int]:
     return None
 
 
-def update_activity_event(event_id: int, status: str, duration_ms: int, error_message: str = None):
+async def update_activity_event(event_id: int, status: str, duration_ms: int, error_message: str = None):
     """Update activity event with result."""
     if not event_id:
         return
     try:
-        api_patch(
+        await api_patch(
             f"/activities/{event_id}",
             json={
                 "status": status,
@@ -64,10 +64,10 @@ def _extract_property_id(tool_name: str, arguments: dict[str, Any]) -> int | Non
     return None
 
 
-def _get_session_state(session_id: str) -> dict[str, Any]:
+async def _get_session_state(session_id: str) -> dict[str, Any]:
     """Fetch current session state from memory graph. Returns {} on failure."""
     try:
-        resp = api_get("/context/history/", params={"session_id": session_id, "limit": 3})
+        resp = await api_get("/context/history/", params={"session_id": session_id, "limit": 3})
         resp.raise_for_status()
         history = resp.json()
         return {"recent_history": history}
@@ -75,10 +75,10 @@ def _get_session_state(session_id: str) -> dict[str, Any]:
         return {}
 
 
-def _get_related_notifications(property_id: int, limit: int = 3) -> str:
+async def _get_related_notifications(property_id: int, limit: int = 3) -> str:
     """Fetch recent notifications for a property. Returns formatted text or ''."""
     try:
-        resp = api_get("/notifications/", params={"limit": 30})
+        resp = await api_get("/notifications/", params={"limit": 30})
         resp.raise_for_status()
         all_notifs = resp.json()
         if not isinstance(all_notifs, list):
@@ -97,7 +97,7 @@ def _get_related_notifications(property_id: int, limit: int = 3) -> str:
         return ""
 
 
-def enrich_response(
+async def enrich_response(
     tool_name: str,
     arguments: dict[str, Any],
     result: list[TextContent],
@@ -119,7 +119,7 @@ def enrich_response(
     if tool_name in _PROPERTY_CONTEXT_TOOLS:
         property_id = _extract_property_id(tool_name, arguments)
         if property_id:
-            notif_text = _get_related_notifications(property_id, limit=2)
+            notif_text = await _get_related_notifications(property_id, limit=2)
             if notif_text:
                 hints.append(f"Recent activity for this property:\n{notif_text}")
 
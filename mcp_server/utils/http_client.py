@@ -1,9 +1,40 @@
-"""Shared HTTP client configuration."""
+"""Shared async HTTP client for calling the FastAPI backend.
+
+One keep-alive ``httpx.AsyncClient`` per event loop is reused by every tool
+call, so requests share pooled connections instead of opening a new TCP
+connection each time, and never block the MCP server's event loop.
+
+Set ``MCP_API_TRANSPORT=asgi`` when the MCP server runs alongside the app:
+requests are then dispatched straight into ``app.main:app`` in-process,
+skipping the network entirely.
+
+Tools that need several independent backend calls can issue them together:
+
+    props, notifs = await api_gather(
+        api_get("/properties/", params={"limit": 5}),
+        api_get("/notifications/", params={"limit": 10}),
+    )
+"""
+import asyncio
+import logging
 import os
-import requests
+from typing import Any, Awaitable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
 
 API_BASE_URL = os.getenv("MCP_API_BASE_URL", "http://localhost:8000")
 API_KEY = os.getenv("MCP_API_KEY", "")
+API_TRANSPORT = os.getenv("MCP_API_TRANSPORT", "http")  # "http" or "asgi"
+
+DEFAULT_TIMEOUT = 30  # seconds
+MAX_CONNECTIONS = int(os.getenv("MCP_API_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("MCP_API_MAX_KEEPALIVE", "10"))
+FANOUT_LIMIT = int(os.getenv("MCP_API_FANOUT_LIMIT", "8"))
+
+# (loop, client) — a client is bound to the loop it was created on
+_client: Optional[tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = None
 
 
 def _default_headers() -> dict:
@@ -14,39 +45,95 @@ def _default_headers() -> dict:
     return headers
 
 
-DEFAULT_TIMEOUT = 30  # seconds
+def _build_client() -> httpx.AsyncClient:
+    if API_TRANSPORT == "asgi":
+        from app.main import app as backend_app
+
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=backend_app),
+            base_url="http://backend",
+            headers=_default_headers(),
+            timeout=DEFAULT_TIMEOUT,
+        )
+    return httpx.AsyncClient(
+        base_url=API_BASE_URL,
+        headers=_default_headers(),
+        timeout=DEFAULT_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+
 
+def get_client() -> httpx.AsyncClient:
+    """The pooled client for the running event loop."""
+    global _client
+    loop = asyncio.get_running_loop()
+    if _client is None or _client[0] is not loop or _client[1].is_closed:
+        _client = (loop, _build_client())
+    return _client[1]
 
-def api_get(path: str, **kwargs):
+
+async def aclose() -> None:
+    """Close the pooled client (call when the MCP server shuts down)."""
+    global _client
+    entry, _client = _client, None
+    if entry is not None and not entry[1].is_closed:
+        await entry[1].aclose()
+
+
+async def api_request(method: str, path: str, **kwargs) -> httpx.Response:
+    """Send a request to the backend API on the pooled client."""
+    return await get_client().request(method, path, **kwargs)
+
+
+async def api_get(path: str, **kwargs) -> httpx.Response:
     """GET request to the backend API."""
-    headers = {**_default_headers(), **kwargs.pop("headers", {})}
-    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-    return requests.get(f"{API_BASE_URL}{path}", headers=headers, **kwargs)
+    return await api_request("GET", path, **kwargs)
 
 
-def api_post(path: str, **kwargs):
+async def api_post(path: str, **kwargs) -> httpx.Response:
     """POST request to the backend API."""
-    headers = {**_default_headers(), **kwargs.pop("headers", {})}
-    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-    return requests.post(f"{API_BASE_URL}{path}", headers=headers, **kwargs)
+    return await api_request("POST", path, **kwargs)
 
 
-def api_patch(path: str, **kwargs):
+async def api_patch(path: str, **kwargs) -> httpx.Response:
     """PATCH request to the backend API."""
-    headers = {**_default_headers(), **kwargs.pop("headers", {})}
-    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-    return requests.patch(f"{API_BASE_URL}{path}", headers=headers, **kwargs)
+    return await api_request("PATCH", path, **kwargs)
 
 
-def api_put(path: str, **kwargs):
+async def api_put(path: str, **kwargs) -> httpx.Response:
     """PUT request to the backend API."""
-    headers = {**_default_headers(), **kwargs.pop("headers", {})}
-    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-    return requests.put(f"{API_BASE_URL}{path}", headers=headers, **kwargs)
+    return await api_request("PUT", path, **kwargs)
 
 
-def api_delete(path: str, **kwargs):
+async def api_delete(path: str, **kwargs) -> httpx.Response:
     """DELETE request to the backend API."""
-    headers = {**_default_headers(), **kwargs.pop("headers", {})}
-    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-    return requests.delete(f"{API_BASE_URL}{path}", headers=headers, **kwargs)
+    return await api_request("DELETE", path, **kwargs)
+
+
+async def api_gather(*calls: Awaitable[Any], return_exceptions: bool = False) -> list[Any]:
+    """Run backend calls concurrently, at most ``FANOUT_LIMIT`` at a time.
+
+    Results come back in argument order. With ``return_exceptions`` a failed
+    call yields its exception instead of failing the whole batch.
+    """
+    slots = asyncio.Semaphore(FANOUT_LIMIT)
+
+    async def _bounded(call: Awaitable[Any]) -> Any:
+        async with slots:
+            return await call
+
+    return await asyncio.gather(*(_bounded(call) for call in calls), return_exceptions=return_exceptions)
+
+
+async def api_get_json(path: str, default: Any = None, **kwargs) -> Any:
+    """GET and decode JSON; returns ``default`` on any error (for optional context lookups)."""
+    try:
+        response = await api_get(path, **kwargs)
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        logger.debug("GET %s failed: %s", path, e)
+        return default
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Benchmark the analytics dashboard and portfolio summary at scale: the legacy
+per-metric COUNT queries over raw ``analytics_events`` vs the daily rollups
+and grouped queries, on a temporary SQLite database (1M events by default).
+
+Usage:
+    python scripts/benchmarks/bench_analytics_dashboard.py
+    python scripts/benchmarks/bench_analytics_dashboard.py --events 1000000 --agents 50 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="bench_analytics_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import and_, func, insert  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.agent import Agent  # noqa: E402
+from app.models.analytics_event import AnalyticsEvent  # noqa: E402
+from app.models.contract import Contract, ContractStatus  # noqa: E402
+from app.models.property import Property, PropertyStatus  # noqa: E402
+from app.services.analytics_rollup_service import analytics_rollup_service  # noqa: E402
+from app.services.analytics_service import analytics_service  # noqa: E402
+
+EVENT_TYPES = ["property_view"] * 6 + ["page_view"] * 3 + ["lead_created", "conversion", "contract_sent", "contract_signed"]
+PROPERTIES_PER_AGENT = 40
+
+
+def seed(events: int, agents: int, days: int) -> list[int]:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    rng = random.Random(7)
+    try:
+        agent_rows = [Agent(name=f"Agent {i}", email=f"agent{i}@example.com") for i in range(agents)]
+        db.add_all(agent_rows)
+        db.commit()
+        agent_ids = [a.id for a in agent_rows]
+
+        statuses = list(PropertyStatus)
+        props = []
+        for agent_id in agent_ids:
+            for i in range(PROPERTIES_PER_AGENT):
+                props.append({
+                    "title": f"{i} Bench St", "address": f"{i} Bench Street", "city": f"City {i % 20}",
+                    "state": "NJ", "zip_code": "07001", "price": 150000.0 + rng.randint(0, 500000),
+                    "property_type": "HOUSE", "status": rng.choice(statuses).value, "agent_id": agent_id,
+                    "deal_score": rng.uniform(10, 99) if i % 2 else None,
+                    "score_grade": rng.choice("ABCDF") if i % 2 else None,
+                })
+        db.execute(insert(Property.__table__), props)
+        property_ids = [pid for (pid,) in db.query(Property.id)]
+        contract_statuses = [s.name for s in ContractStatus]
+        db.execute(insert(Contract.__table__), [
+            {"property_id": pid, "name": "Agreement", "status": rng.choice(contract_statuses),
+             "is_required": bool(pid % 3)}
+            for pid in property_ids for _ in range(3)
+        ])
+        db.commit()
+
+        now = datetime.now(timezone.utc)
+        span = days * 86400
+        batch = []
+        for i in range(events):
+            batch.append({
+                "agent_id": rng.choice(agent_ids),
+                "event_type": rng.choice(EVENT_TYPES),
+                "event_name": "bench",
+                "property_id": rng.choice(property_ids),
+                "value": rng.randint(100, 100000) if i % 10 == 0 else None,
+                "created_at": now - timedelta(seconds=rng.randint(0, span)),
+            })
+            if len(batch) == 20000:
+                db.execute(insert(AnalyticsEvent.__table__), batch)
+                batch = []
+        if batch:
+            db.execute(insert(AnalyticsEvent.__table__), batch)
+        db.commit()
+        return agent_ids
+    finally:
+        db.close()
+
+
+def legacy_overview(db, agent_id: int, days: int) -> dict:
+    """Pre-change overview: one COUNT/SUM per metric over raw events."""
+    start_date = datetime.now(timezone.utc) - timedelta(days=days)
+
+    def count_events(event_type):
+        return db.query(func.count(AnalyticsEvent.id)).filter(and_(
+            AnalyticsEvent.agent_id == agent_id,
+            AnalyticsEvent.event_type == event_type,
+            AnalyticsEvent.created_at >= start_date,
+        )).scalar() or 0
+
+    result = {t: count_events(t) for t in ("property_view", "lead_created", "conversion")}
+    result["total_value"] = db.query(func.sum(AnalyticsEvent.value)).filter(and_(
+        AnalyticsEvent.agent_id == agent_id, AnalyticsEvent.created_at >= start_date,
+    )).scalar() or 0
+    result["active"] = db.query(func.count(Property.id)).filter(and_(
+        Property.agent_id == agent_id, Property.status != PropertyStatus.COMPLETE,
+    )).scalar() or 0
+    result["new"] = db.query(func.count(Property.id)).filter(and_(
+        Property.agent_id == agent_id, Property.created_at >= start_date,
+    )).scalar() or 0
+    result["signed"] = db.query(func.count(Contract.id)).join(
+        Property, Contract.property_id == Property.id
+    ).filter(and_(
+        Property.agent_id == agent_id,
+        Contract.status == ContractStatus.COMPLETED,
+        Contract.updated_at >= start_date,
+    )).scalar() or 0
+    return result
+
+
+def legacy_portfolio(db) -> None:
+    """Pre-change portfolio hot spots: per-status contract COUNTs and a full scored-property load."""
+    db.query(func.count(Contract.id)).scalar()
+    for status in ContractStatus:
+        db.query(func.count(Contract.id)).filter(Contract.status == status).scalar()
+    scored = db.query(Property).filter(Property.deal_score.isnot(None)).all()
+    sorted(scored, key=lambda p: p.deal_score or 0, reverse=True)[:5]
+    db.query(func.count(Property.id)).scalar()
+    db.query(Property.status, func.count(Property.id)).group_by(Property.status).all()
+    db.query(Property.property_type, func.count(Property.id)).group_by(Property.property_type).all()
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analytics dashboard benchmark")
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Seeding {args.events} events for {args.agents} agents over {args.days} days...")
+    start = time.perf_counter()
+    agent_ids = seed(args.events, args.agents, args.days)
+    print(f"  seeded in {time.perf_counter() - start:.1f}s")
+
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        rows = analytics_rollup_service.rebuild(db)
+        print(f"  full rollup rebuild: {rows} rows in {time.perf_counter() - start:.2f}s")
+        start = time.perf_counter()
+        analytics_rollup_service.rebuild(db, since=datetime.now(timezone.utc).date() - timedelta(days=2))
+        print(f"  nightly rebuild (2 days): {(time.perf_counter() - start) * 1000:.0f}ms")
+
+        agent_id = agent_ids[len(agent_ids) // 2]
+        print(f"\nDashboard overview for one agent (best of {args.repeat}, ms)")
+        print(f"  {'days':>6s} {'legacy':>10s} {'rollups':>10s}")
+        for days in (7, 30, 365):
+            legacy = timed(lambda: legacy_overview(db, agent_id, days), args.repeat)
+            new = timed(lambda: analytics_service.get_dashboard_overview(db, agent_id, days), args.repeat)
+            print(f"  {days:6d} {legacy:10.1f} {new:10.1f}")
+
+        funnel = timed(lambda: analytics_service.get_conversion_funnel(db, agent_id, 365), args.repeat)
+        print(f"  funnel (365d):        {funnel:10.1f}")
+
+        print(f"\nPortfolio summary hot spots (best of {args.repeat}, ms)")
+        legacy = timed(lambda: legacy_portfolio(db), args.repeat)
+        new = timed(lambda: (
+            analytics_service._pipeline_stats(db),
+            analytics_service._contract_stats(db),
+            analytics_service._deal_score_stats(db),
+        ), args.repeat)
+        print(f"  legacy: {legacy:8.1f}   grouped: {new:8.1f}")
+        full = timed(lambda: analytics_service.get_portfolio_summary(db), args.repeat)
+        print(f"  full get_portfolio_summary: {full:8.1f}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
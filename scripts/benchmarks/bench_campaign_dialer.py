@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Benchmark voice campaign dialing against a local fake Vapi server.
+
+Starts a fake Vapi API (uvicorn, fixed per-call latency) on localhost, points
+VAPI_BASE_URL at it and dials every target of several active campaigns with:
+  legacy — the previous loop: campaigns one by one, one call start at a time,
+           commit after each target
+  dialer — CampaignDialer: token-bucket pacing per campaign, concurrent call
+           starts under a global cap, batched target writes
+
+Reports achieved calls/minute for each. Campaign rate limits are set high
+enough that the Vapi round-trip, not pacing, is the bottleneck; pass
+--rate to see the token buckets hold the per-campaign limit instead.
+
+Usage:
+    python scripts/benchmarks/bench_campaign_dialer.py
+    python scripts/benchmarks/bench_campaign_dialer.py --campaigns 8 --targets 100 --latency-ms 250 --concurrency 40
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from itertools import count
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="bench_dialer_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+_PORT = _free_port()
+os.environ["VAPI_BASE_URL"] = f"http://127.0.0.1:{_PORT}"
+os.environ["VAPI_API_KEY"] = "bench-key"
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import uvicorn  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.agent import Agent  # noqa: E402
+from app.models.property import Property, PropertyStatus, PropertyType  # noqa: E402
+from app.models.property_recap import PropertyRecap  # noqa: E402
+from app.models.voice_campaign import VoiceCampaign, VoiceCampaignTarget  # noqa: E402
+from app.services.campaign_dialer import CampaignDialer  # noqa: E402
+from app.services.voice_campaign_service import (  # noqa: E402
+    CampaignStatus,
+    CampaignTargetStatus,
+    voice_campaign_service,
+)
+
+
+def fake_vapi(latency: float) -> FastAPI:
+    api = FastAPI()
+    ids = count(1)
+
+    @api.post("/call/phone", status_code=201)
+    async def start_call():
+        await asyncio.sleep(latency)
+        return {"id": f"call-{next(ids)}", "status": "queued"}
+
+    return api
+
+
+def serve(api: FastAPI) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(api, host="127.0.0.1", port=_PORT, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def seed(campaigns: int, targets: int, rate: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.query(VoiceCampaignTarget).delete()
+        db.query(VoiceCampaign).delete()
+        if not db.query(Property).count():
+            agent = Agent(name="Bench Agent", email="bench@example.com")
+            db.add(agent)
+            db.flush()
+            prop = Property(
+                title="1 Bench St",
+                address="1 Bench Street",
+                city="Benchville",
+                state="NJ",
+                zip_code="07001",
+                price=250000.0,
+                property_type=PropertyType.HOUSE,
+                status=PropertyStatus.NEW_PROPERTY,
+                agent_id=agent.id,
+            )
+            db.add(prop)
+            db.flush()
+            db.add(PropertyRecap(property_id=prop.id, recap_text="Bench recap", recap_context={}))
+        prop = db.query(Property).first()
+        for c in range(campaigns):
+            campaign = VoiceCampaign(
+                name=f"Bench {c}",
+                status=CampaignStatus.ACTIVE,
+                call_purpose="property_update",
+                property_id=prop.id,
+                rate_limit_per_minute=rate,
+                assistant_overrides={"name": "Bench assistant"},
+            )
+            db.add(campaign)
+            db.flush()
+            db.add_all(
+                VoiceCampaignTarget(
+                    campaign_id=campaign.id,
+                    phone_number=f"+1555{c:03d}{i:04d}",
+                    status=CampaignTargetStatus.QUEUED,
+                    attempts_made=0,
+                )
+                for i in range(targets)
+            )
+        db.commit()
+    finally:
+        db.close()
+
+
+def active_campaigns(db):
+    return (
+        db.query(VoiceCampaign)
+        .filter(VoiceCampaign.status == CampaignStatus.ACTIVE)
+        .order_by(VoiceCampaign.id.asc())
+        .all()
+    )
+
+
+async def legacy(max_calls: int) -> int:
+    """Reproduces the old tick: campaigns in turn, targets serially, commit per target."""
+    db = SessionLocal()
+    started = 0
+    try:
+        while True:
+            dialed = 0
+            for campaign in active_campaigns(db):
+                now = voice_campaign_service._utcnow()
+                budget = max(1, min(max_calls, campaign.rate_limit_per_minute))
+                for target in voice_campaign_service._due_targets(db, campaign.id, now=now, limit=budget):
+                    result = await voice_campaign_service._process_target_attempt(
+                        db, campaign=campaign, target=target, now=now
+                    )
+                    started += result == "started"
+                    dialed += 1
+                    db.commit()
+                voice_campaign_service._refresh_campaign_completion(db, campaign)
+                db.commit()
+            if not dialed:
+                return started
+    finally:
+        db.close()
+
+
+async def dialer_run(max_calls: int, concurrency: int) -> int:
+    dialer = CampaignDialer(voice_campaign_service, max_concurrency=concurrency)
+    db = SessionLocal()
+    started = 0
+    try:
+        while True:
+            campaigns = active_campaigns(db)
+            if not campaigns:
+                return started
+            summaries = await dialer.run(db, campaigns, max_calls_per_campaign=max_calls)
+            started += sum(s["calls_started"] for s in summaries.values())
+            if not any(s["targets_processed"] for s in summaries.values()):
+                # Every bucket is empty; wait for the next token like the worker loop would.
+                await asyncio.sleep(0.25)
+    finally:
+        db.close()
+
+
+def report(label: str, calls: int, elapsed: float) -> None:
+    print(f"  {label:<8} {calls:>6} calls in {elapsed:7.2f}s  ->  {calls / elapsed * 60:10.0f} calls/min")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--campaigns", type=int, default=5)
+    parser.add_argument("--targets", type=int, default=60, help="targets per campaign")
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="fake Vapi call-start latency")
+    parser.add_argument("--concurrency", type=int, default=20, help="global dialer concurrency cap")
+    parser.add_argument("--rate", type=int, default=10_000, help="rate_limit_per_minute per campaign")
+    parser.add_argument("--max-calls", type=int, default=50, help="max calls per campaign per tick")
+    args = parser.parse_args()
+
+    server = serve(fake_vapi(args.latency_ms / 1000))
+    print(
+        f"{args.campaigns} campaigns x {args.targets} targets, Vapi latency {args.latency_ms:.0f}ms, "
+        f"rate {args.rate}/min per campaign, concurrency {args.concurrency}"
+    )
+    try:
+        for label, runner in (
+            ("legacy", lambda: legacy(args.max_calls)),
+            ("dialer", lambda: dialer_run(args.max_calls, args.concurrency)),
+        ):
+            seed(args.campaigns, args.targets, args.rate)
+            t0 = time.perf_counter()
+            calls = asyncio.run(runner())
+            report(label, calls, time.perf_counter() - t0)
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Benchmark direct mail campaign sends against a local fake Lob server.
+
+Starts a fake Lob API (uvicorn, fixed per-request latency, optional 429s once
+a per-second budget is spent, Idempotency-Key replay) on localhost and sends a
+postcard campaign to every seeded contact with:
+  legacy — the previous loop: recipient lookups per contact, then verify,
+           create and commit one piece at a time
+  runner — DirectMailCampaignRunner: bulk recipient loading, bulk piece
+           insert, cached verification shared by owners at one mailing
+           address, a bounded worker pool and batched write-back
+
+Reports pieces/minute and Lob requests made for each. Several contacts share
+each mailing address (--per-address), which is where the verification cache
+pays off.
+
+Usage:
+    python scripts/benchmarks/bench_direct_mail_campaign.py
+    python scripts/benchmarks/bench_direct_mail_campaign.py --contacts 2000 --latency-ms 150 --concurrency 20 --stub-rps 200
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from itertools import count
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="bench_direct_mail_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+_PORT = _free_port()
+_LOB_URL = f"http://127.0.0.1:{_PORT}"
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from jinja2 import Template  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.agent import Agent  # noqa: E402
+from app.models.contact import Contact, ContactRole  # noqa: E402
+from app.models.direct_mail import DirectMail, DirectMailCampaign, MailStatus, MailType  # noqa: E402
+from app.models.property import Property, PropertyStatus, PropertyType  # noqa: E402
+from app.models.skip_trace import SkipTrace  # noqa: E402
+from app.services.direct_mail_campaign_runner import DirectMailCampaignRunner, load_content  # noqa: E402
+from app.services.lob_service import LobClient, lob_verification_cache  # noqa: E402
+
+requests_seen: Counter = Counter()
+
+
+def fake_lob(latency: float, rps: int) -> FastAPI:
+    api = FastAPI()
+    ids = count(1)
+    pieces: dict[str, dict] = {}
+    window = {"second": 0, "used": 0}
+
+    def throttled() -> JSONResponse | None:
+        if not rps:
+            return None
+        now = int(time.monotonic())
+        if now != window["second"]:
+            window.update(second=now, used=0)
+        window["used"] += 1
+        if window["used"] > rps:
+            requests_seen["429"] += 1
+            return JSONResponse({"error": {"message": "rate limited"}}, status_code=429, headers={"Retry-After": "1"})
+        return None
+
+    @api.post("/us_verifications")
+    async def verify(request: Request):
+        requests_seen["verify"] += 1
+        if (limited := throttled()) is not None:
+            return limited
+        body = await request.json()
+        await asyncio.sleep(latency)
+        return {
+            "recipient": body.get("recipient"),
+            "primary_line": (body.get("primary_line") or "").upper(),
+            "secondary_line": "",
+            "deliverability": "deliverable",
+            "components": {
+                "city": (body.get("city") or "").upper(),
+                "state": body.get("state"),
+                "zip_code": body.get("zip_code"),
+            },
+        }
+
+    @api.post("/postcards")
+    async def postcard(request: Request):
+        requests_seen["create"] += 1
+        if (limited := throttled()) is not None:
+            return limited
+        await request.body()
+        await asyncio.sleep(latency)
+        key = request.headers.get("Idempotency-Key") or f"anon-{next(ids)}"
+        if key not in pieces:
+            pieces[key] = {"id": f"psc_{next(ids)}", "status": "processing", "expected_cost": 63}
+        return pieces[key]
+
+    return api
+
+
+def serve(api: FastAPI) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(api, host="127.0.0.1", port=_PORT, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def seed(contacts: int, per_address: int) -> int:
+    """Fresh agent, properties and contacts; returns the new campaign's id."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        agent = Agent(name="Bench Agent", email="bench@example.com", phone="555-0100")
+        db.add(agent)
+        db.flush()
+        contact_ids = []
+        for p in range((contacts + per_address - 1) // per_address):
+            prop = Property(
+                title=f"{p} Bench St",
+                address=f"{p} Bench Street",
+                city="Benchville",
+                state="NJ",
+                zip_code="07001",
+                price=250000.0,
+                property_type=PropertyType.HOUSE,
+                status=PropertyStatus.NEW_PROPERTY,
+                agent_id=agent.id,
+            )
+            db.add(prop)
+            db.flush()
+            db.add(SkipTrace(
+                property_id=prop.id,
+                owner_name=f"Owner {p}",
+                mailing_address=f"{p} Mailing Road",
+                mailing_city="Elsewhere",
+                mailing_state="NJ",
+                mailing_zip="07002",
+            ))
+            people = [
+                Contact(property_id=prop.id, name=f"Contact {p}-{i}", role=ContactRole.BUYER)
+                for i in range(min(per_address, contacts - len(contact_ids)))
+            ]
+            db.add_all(people)
+            db.flush()
+            contact_ids.extend(c.id for c in people)
+        campaign = DirectMailCampaign(
+            agent_id=agent.id,
+            name="Bench farm",
+            campaign_type="just_sold",
+            mail_type=MailType.POSTCARD,
+            target_contact_ids=contact_ids,
+        )
+        db.add(campaign)
+        db.commit()
+        return campaign.id
+    finally:
+        db.close()
+
+
+def _client() -> LobClient:
+    return LobClient(api_key="test_bench", base_url=_LOB_URL)
+
+
+async def legacy(campaign_id: int) -> int:
+    """Reproduces the old loop: per-contact queries, one verify + create + commit per piece."""
+    db = SessionLocal()
+    client = _client()
+    sent = 0
+    try:
+        campaign = db.get(DirectMailCampaign, campaign_id)
+        content = load_content(db, campaign)
+        for contact_id in campaign.target_contact_ids:
+            contact = db.query(Contact).filter(Contact.id == contact_id).first()
+            prop = db.query(Property).filter(Property.id == contact.property_id).first()
+            trace = db.query(SkipTrace).filter(SkipTrace.property_id == prop.id).first()
+            to_address = {
+                "name": contact.name,
+                "address_line1": trace.mailing_address,
+                "address_city": trace.mailing_city,
+                "address_state": trace.mailing_state,
+                "address_zip": trace.mailing_zip,
+            }
+            variables = {**content.merge_variables, "name": contact.name, "property_address": prop.address}
+            try:
+                await client.verify_address(to_address)
+                result = await client.create_postcard(
+                    to_address=to_address,
+                    from_address=content.from_address,
+                    front_html=Template(content.front_html).render(**variables),
+                    back_html=Template(content.back_html or "").render(**variables),
+                )
+                status = MailStatus.PROCESSING
+                sent += 1
+            except Exception:
+                result, status = {}, MailStatus.FAILED
+            db.add(DirectMail(
+                agent_id=campaign.agent_id,
+                campaign_id=campaign.id,
+                contact_id=contact.id,
+                property_id=prop.id,
+                mail_type=MailType.POSTCARD,
+                mail_status=status,
+                to_address=to_address,
+                from_address=content.from_address,
+                lob_mailpiece_id=result.get("id"),
+            ))
+            db.commit()
+        return sent
+    finally:
+        await client.close()
+        db.close()
+
+
+async def runner_run(campaign_id: int, concurrency: int) -> int:
+    runner = DirectMailCampaignRunner(client_factory=_client, max_concurrency=concurrency)
+    summary = await runner.run(campaign_id)
+    return summary.get("sent", 0)
+
+
+def report(label: str, sent: int, elapsed: float) -> None:
+    calls = ", ".join(f"{k} {v}" for k, v in sorted(requests_seen.items()))
+    print(f"  {label:<7} {sent:>6} pieces in {elapsed:7.2f}s  ->  {sent / elapsed * 60:9.0f} pieces/min  ({calls})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contacts", type=int, default=300)
+    parser.add_argument("--per-address", type=int, default=3, help="contacts sharing one mailing address")
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="fake Lob per-request latency")
+    parser.add_argument("--concurrency", type=int, default=10, help="runner worker pool size")
+    parser.add_argument("--stub-rps", type=int, default=0, help="fake Lob requests/second before 429s (0 = unlimited)")
+    args = parser.parse_args()
+
+    # No Redis here: keep verification caching in-process.
+    lob_verification_cache.use_l2 = False
+    server = serve(fake_lob(args.latency_ms / 1000, args.stub_rps))
+    print(
+        f"{args.contacts} contacts, {args.per_address} per mailing address, Lob latency {args.latency_ms:.0f}ms, "
+        f"concurrency {args.concurrency}, stub limit {args.stub_rps or 'none'} rps"
+    )
+    try:
+        for label, run in (
+            ("legacy", legacy),
+            ("runner", lambda campaign_id: runner_run(campaign_id, args.concurrency)),
+        ):
+            campaign_id = seed(args.contacts, args.per_address)
+            lob_verification_cache.l1.clear()
+            requests_seen.clear()
+            t0 = time.perf_counter()
+            sent = asyncio.run(run(campaign_id))
+            report(label, sent, time.perf_counter() - t0)
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark the batched embedding pipeline against the legacy one-record-per-call
+backfill, fully offline (stub embedding backend with simulated API latency).
+
+Runs three passes over a temporary SQLite database:
+  legacy   — one embeddings request and one UPDATE/commit per property
+  pipeline — keyset chunks, packed batches, concurrent requests, bulk UPDATEs
+  refresh  — pipeline again with nothing changed (content-hash dedupe)
+
+Usage:
+    python scripts/benchmarks/bench_embedding_pipeline.py
+    python scripts/benchmarks/bench_embedding_pipeline.py --rows 20000 --latency-ms 150 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="bench_embeddings_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.agent import Agent  # noqa: E402
+from app.models.property import Property, PropertyStatus, PropertyType  # noqa: E402
+from app.services.embedding_pipeline import EmbeddingPipeline, StubEmbeddingBackend  # noqa: E402
+from app.services.embedding_service import embedding_service  # noqa: E402
+
+
+def seed(rows: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE properties ADD COLUMN embedding TEXT"))
+    db = SessionLocal()
+    try:
+        agent = Agent(name="Bench Agent", email="bench@example.com")
+        db.add(agent)
+        db.flush()
+        db.add_all(
+            Property(
+                title=f"{i} Bench St",
+                address=f"{i} Bench Street",
+                city="Benchville",
+                state="NJ",
+                zip_code="07001",
+                price=250000.0 + i,
+                bedrooms=3,
+                bathrooms=2.0,
+                square_feet=1500 + i % 900,
+                description="Updated colonial with a finished basement and fenced yard. " * 4,
+                property_type=PropertyType.HOUSE,
+                status=PropertyStatus.NEW_PROPERTY,
+                agent_id=agent.id,
+            )
+            for i in range(rows)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def reset_embeddings() -> None:
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE properties SET embedding = NULL, embedding_hash = NULL"))
+
+
+async def legacy(backend: StubEmbeddingBackend) -> int:
+    """Reproduces the old backfill: embed_property() for each row, serially."""
+    db = SessionLocal()
+    try:
+        ids = [r.id for r in db.execute(text("SELECT id FROM properties WHERE embedding IS NULL"))]
+        for pid in ids:
+            prop = db.query(Property).get(pid)
+            vec = (await backend.embed([embedding_service._property_text(prop)]))[0]
+            db.execute(text("UPDATE properties SET embedding = :vec WHERE id = :pid"), {"vec": str(vec), "pid": pid})
+            db.commit()
+        return len(ids)
+    finally:
+        db.close()
+
+
+def report(label: str, rows: int, seconds: float, requests: int) -> None:
+    rate = rows / seconds if seconds else float("inf")
+    print(f"  {label:9s} {seconds:8.2f}s  {rate:9.0f} rows/s  {requests:6d} API requests")
+
+
+async def main_async(args) -> None:
+    seed(args.rows)
+    print(f"{args.rows} properties, {args.latency_ms:.0f}ms per request + {args.per_item_ms}ms per input")
+
+    backend = StubEmbeddingBackend(latency_ms=args.latency_ms, per_item_ms=args.per_item_ms)
+    start = time.perf_counter()
+    done = await legacy(backend)
+    report("legacy", done, time.perf_counter() - start, backend.requests)
+
+    reset_embeddings()
+    backend = StubEmbeddingBackend(latency_ms=args.latency_ms, per_item_ms=args.per_item_ms)
+    pipeline = EmbeddingPipeline(
+        backend=backend,
+        chunk_size=args.chunk_size,
+        max_batch_items=args.batch_items,
+        max_concurrency=args.concurrency,
+    )
+    start = time.perf_counter()
+    result = await pipeline.run("properties", only_missing=True)
+    report("pipeline", result["tables"]["properties"]["embedded"], time.perf_counter() - start, backend.requests)
+
+    requests_before = backend.requests
+    start = time.perf_counter()
+    result = await pipeline.run("properties", only_missing=False)
+    stats = result["tables"]["properties"]
+    report("refresh", stats["unchanged"], time.perf_counter() - start, backend.requests - requests_before)
+    print(f"  refresh re-embedded {stats['embedded']} rows, skipped {stats['unchanged']} unchanged")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Embedding pipeline benchmark")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--per-item-ms", type=float, default=0.2)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--batch-items", type=int, default=256)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark MCP tool-call latency against a local fake backend.
+
+Starts a fake FastAPI backend (uvicorn, fixed per-request latency) on
+localhost and runs the same tool call — log the activity event, fetch a
+property, update the event and log the conversation — with:
+  legacy — the previous client: blocking ``requests`` calls, a new TCP
+           connection per request, bookkeeping calls one after another
+  async  — ``mcp_server.server.call_tool`` on the pooled keep-alive httpx
+           client, with the bookkeeping calls overlapped
+
+Reports per-call latency (sequential calls) and the wall time of a burst of
+concurrent tool calls, which the legacy client serializes on the event loop.
+
+Usage:
+    python scripts/benchmarks/bench_mcp_backend_client.py
+    python scripts/benchmarks/bench_mcp_backend_client.py --calls 200 --concurrency 20 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from itertools import count
+from pathlib import Path
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+_PORT = _free_port()
+os.environ["MCP_API_BASE_URL"] = f"http://127.0.0.1:{_PORT}"
+os.environ.setdefault("MCP_API_KEY", "bench-key")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import requests  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from mcp.types import TextContent, Tool  # noqa: E402
+
+from mcp_server.server import call_tool, register_tool  # noqa: E402
+from mcp_server.utils import http_client  # noqa: E402
+
+BASE = os.environ["MCP_API_BASE_URL"]
+HEADERS = {"X-API-Key": os.environ["MCP_API_KEY"]}
+
+
+def fake_backend(latency: float) -> FastAPI:
+    api = FastAPI()
+    ids = count(1)
+
+    @api.post("/activities/log")
+    async def log_activity():
+        await asyncio.sleep(latency)
+        return {"id": next(ids)}
+
+    @api.patch("/activities/{event_id}")
+    async def update_activity(event_id: int):
+        await asyncio.sleep(latency)
+        return {"id": event_id}
+
+    @api.get("/properties/{property_id}")
+    async def get_property(property_id: int):
+        await asyncio.sleep(latency)
+        return {"id": property_id, "address": "1 Bench St", "city": "Benchville", "price": 250000}
+
+    @api.post("/context/history/log")
+    async def log_history():
+        await asyncio.sleep(latency)
+        return {"ok": True}
+
+    return api
+
+
+def serve(api: FastAPI) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(api, host="127.0.0.1", port=_PORT, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def _bench_tool(arguments: dict) -> list[TextContent]:
+    response = await http_client.api_get(f"/properties/{arguments['property_id']}")
+    response.raise_for_status()
+    return [TextContent(type="text", text=response.json()["address"])]
+
+
+register_tool(
+    Tool(name="bench_get_property", description="Benchmark tool", inputSchema={"type": "object"}),
+    _bench_tool,
+)
+
+
+async def legacy_call(property_id: int) -> None:
+    """Reproduces the old call_tool flow on blocking ``requests`` calls."""
+    event = requests.post(
+        f"{BASE}/activities/log",
+        json={"tool_name": "bench_get_property", "status": "pending"},
+        headers=HEADERS,
+        timeout=1,
+    ).json()["id"]
+    response = requests.get(f"{BASE}/properties/{property_id}", headers=HEADERS, timeout=30)
+    response.raise_for_status()
+    requests.post(f"{BASE}/context/history/log", json={"tool_name": "bench_get_property"}, headers=HEADERS, timeout=30)
+    requests.patch(f"{BASE}/activities/{event}", json={"status": "success"}, headers=HEADERS, timeout=1)
+
+
+async def async_call(property_id: int) -> None:
+    await call_tool("bench_get_property", {"property_id": property_id})
+
+
+async def measure(call, calls: int, concurrency: int) -> tuple[list[float], float]:
+    latencies = []
+    for i in range(calls):
+        t0 = time.perf_counter()
+        await call(i)
+        latencies.append((time.perf_counter() - t0) * 1000)
+
+    t0 = time.perf_counter()
+    for start in range(0, calls, concurrency):
+        await asyncio.gather(*(call(i) for i in range(start, min(calls, start + concurrency))))
+    return latencies, time.perf_counter() - t0
+
+
+def report(label: str, latencies: list[float], burst: float, calls: int) -> None:
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(
+        f"  {label:<7} p50 {statistics.median(latencies):7.2f}ms  p95 {p95:7.2f}ms  "
+        f"burst {burst:6.2f}s ({calls / burst:7.1f} calls/s)"
+    )
+
+
+async def run(args) -> None:
+    for label, call in (("legacy", legacy_call), ("async", async_call)):
+        latencies, burst = await measure(call, args.calls, args.concurrency)
+        report(label, latencies, burst, args.calls)
+    await http_client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10, help="tool calls in flight during the burst")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="fake backend latency per request")
+    args = parser.parse_args()
+
+    server = serve(fake_backend(args.latency_ms / 1000))
+    print(f"{args.calls} tool calls, backend latency {args.latency_ms:.0f}ms, burst concurrency {args.concurrency}")
+    try:
+        asyncio.run(run(args))
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark SQL statements and latency per voice turn for the memory graph on a
+temporary SQLite database.
+
+A simulated turn remembers a property, a contact and a contract (with their
+edges), persists the six session state keys, commits, and then hydrates the
+conversation context from the session summary — what the contract and voice
+flows do on every request. Compared:
+  legacy   — the previous service: SELECT-then-INSERT/UPDATE with a flush for
+             every node and edge (endpoints included), and a summary built
+             from separate node and edge queries plus six state lookups
+  buffered — MemoryGraphService: writes merged per session and written with
+             one multi-row upsert per table at commit, summary loaded with a
+             single UNION ALL query
+
+Usage:
+    python scripts/benchmarks/bench_memory_graph.py
+    python scripts/benchmarks/bench_memory_graph.py --turns 500 --sessions 20
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="bench_memory_graph_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import delete, event  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.voice_memory import VoiceMemoryEdge, VoiceMemoryNode  # noqa: E402
+from app.services.memory_graph import SESSION_STATE_KEYS, MemoryRef, memory_graph_service  # noqa: E402
+
+_statements = 0
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count(*args):
+    global _statements
+    _statements += 1
+
+
+class LegacyMemoryGraph:
+    """The previous per-row implementation, reproduced for comparison."""
+
+    def upsert_node(self, db, session_id, node_type, node_key, summary=None, payload=None, importance=0.5):
+        node = db.query(VoiceMemoryNode).filter(
+            VoiceMemoryNode.session_id == session_id,
+            VoiceMemoryNode.node_type == node_type,
+            VoiceMemoryNode.node_key == node_key,
+        ).first()
+        now = datetime.utcnow()
+        if node is None:
+            node = VoiceMemoryNode(
+                session_id=session_id, node_type=node_type, node_key=node_key, summary=summary,
+                payload=payload, importance=importance, last_seen_at=now,
+            )
+            db.add(node)
+        else:
+            node.summary = summary or node.summary
+            node.payload = payload if payload is not None else node.payload
+            node.importance = max(node.importance, importance)
+            node.last_seen_at = now
+        db.flush()
+        return node
+
+    def upsert_edge(self, db, session_id, source, target, relation, weight=1.0):
+        source_node = self.upsert_node(db, session_id, source.node_type, source.node_key)
+        target_node = self.upsert_node(db, session_id, target.node_type, target.node_key)
+        edge = db.query(VoiceMemoryEdge).filter(
+            VoiceMemoryEdge.session_id == session_id,
+            VoiceMemoryEdge.source_node_id == source_node.id,
+            VoiceMemoryEdge.target_node_id == target_node.id,
+            VoiceMemoryEdge.relation == relation,
+        ).first()
+        now = datetime.utcnow()
+        if edge is None:
+            db.add(VoiceMemoryEdge(
+                session_id=session_id, source_node_id=source_node.id, target_node_id=target_node.id,
+                relation=relation, weight=weight, last_seen_at=now,
+            ))
+        else:
+            edge.weight = max(edge.weight, weight)
+            edge.last_seen_at = now
+        db.flush()
+
+    def remember_session_state(self, db, session_id, key, value):
+        self.upsert_node(db, session_id, "session_state", key, str(value), {"value": value}, 0.9)
+
+    def get_session_summary(self, db, session_id, max_nodes=25):
+        nodes = db.query(VoiceMemoryNode).filter(VoiceMemoryNode.session_id == session_id).order_by(
+            VoiceMemoryNode.last_seen_at.desc()).limit(max_nodes).all()
+        edges = db.query(VoiceMemoryEdge).filter(VoiceMemoryEdge.session_id == session_id).order_by(
+            VoiceMemoryEdge.last_seen_at.desc()).limit(max_nodes).all()
+        state = {}
+        for key in SESSION_STATE_KEYS:
+            node = db.query(VoiceMemoryNode).filter(
+                VoiceMemoryNode.session_id == session_id,
+                VoiceMemoryNode.node_type == "session_state",
+                VoiceMemoryNode.node_key == key,
+            ).first()
+            state[key] = node.payload.get("value") if node and node.payload else None
+        return {"session_state": state, "node_count": len(nodes), "edge_count": len(edges)}
+
+
+def turn(graph, db, session_id: str, i: int) -> dict:
+    prop_id, contact_id, contract_id = 1000 + i % 50, 2000 + i % 80, 3000 + i
+    address, name, contract = f"{prop_id} Main St", f"Contact {contact_id}", f"Contract {contract_id}"
+
+    graph.upsert_node(db, session_id, "property", str(prop_id), address, {"property_id": prop_id}, 0.95)
+    graph.upsert_node(db, session_id, "contact", str(contact_id), name, {"contact_id": contact_id}, 0.9)
+    graph.upsert_node(db, session_id, "contract", str(contract_id), contract, {"contract_id": contract_id}, 0.9)
+    graph.upsert_edge(db, session_id, MemoryRef("contact", str(contact_id)), MemoryRef("property", str(prop_id)), "associated_with", 0.9)
+    graph.upsert_edge(db, session_id, MemoryRef("contract", str(contract_id)), MemoryRef("property", str(prop_id)), "for_property", 0.95)
+    graph.upsert_edge(db, session_id, MemoryRef("contract", str(contract_id)), MemoryRef("contact", str(contact_id)), "for_contact", 0.85)
+    for key, value in zip(SESSION_STATE_KEYS, (prop_id, address, contact_id, name, contract_id, contract)):
+        graph.remember_session_state(db, session_id, key, value)
+    db.commit()
+    return graph.get_session_summary(db, session_id)
+
+
+def run(label: str, graph, turns: int, sessions: int) -> None:
+    global _statements
+    with SessionLocal() as db:
+        db.execute(delete(VoiceMemoryEdge))
+        db.execute(delete(VoiceMemoryNode))
+        db.commit()
+
+    _statements = 0
+    started = time.perf_counter()
+    for i in range(turns):
+        # A fresh database session per turn, like a request
+        with SessionLocal() as db:
+            summary = turn(graph, db, f"bench-{i % sessions}", i)
+    elapsed = time.perf_counter() - started
+    assert summary["session_state"]["last_contract_id"] == 3000 + turns - 1
+    print(
+        f"  {label:<8} {_statements / turns:6.1f} statements/turn  "
+        f"{elapsed / turns * 1000:7.2f} ms/turn  ({turns} turns)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=10, help="distinct voice sessions the turns rotate through")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    print(f"Memory graph: {args.turns} voice turns over {args.sessions} sessions")
+    run("legacy", LegacyMemoryGraph(), args.turns, args.sessions)
+    run("buffered", memory_graph_service, args.turns, args.sessions)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Benchmark request throughput through the API middleware stack.
+
+Compares the previous BaseHTTPMiddleware implementations of
+RateLimitToggle / ApiKey / RequestId / Metrics (reproduced below) with the
+plain ASGI middlewares the app now uses, on a trivial endpoint and on
+GET /properties/. Requests go through httpx's in-process ASGI transport so
+only application + middleware cost is measured.
+
+Usage:
+    python scripts/benchmarks/bench_middleware.py
+    python scripts/benchmarks/bench_middleware.py --requests 5000 --concurrency 50 --properties 200
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="bench_middleware_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+os.environ.pop("TESTING", None)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import httpx  # noqa: E402
+import structlog  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.api_key_cache import cache_agent_id, get_cached_agent_id  # noqa: E402
+from app.auth import hash_api_key, verify_api_key  # noqa: E402
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.middleware import metrics  # noqa: E402
+from app.middleware.api_key import ApiKeyMiddleware, is_public_path  # noqa: E402
+from app.middleware.metrics import MetricsMiddleware  # noqa: E402
+from app.middleware.request_id import RequestIdMiddleware  # noqa: E402
+from app.models.agent import Agent  # noqa: E402
+from app.models.property import Property, PropertyStatus, PropertyType  # noqa: E402
+from app import rate_limit  # noqa: E402
+from app.rate_limit import RateLimitToggleMiddleware, get_agent_tier  # noqa: E402
+from app.routers.core.properties import router as properties_router  # noqa: E402
+
+API_KEY = "sk_live_bench_middleware_key"
+
+
+# ---------------------------------------------------------------------------
+# Previous BaseHTTPMiddleware stack
+# ---------------------------------------------------------------------------
+
+class LegacyRateLimitToggleMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        request.state.rate_limit_enabled = rate_limit.RATE_LIMIT_ENABLED
+        request.state.rate_limit_tier = get_agent_tier(request)
+        request.state.rate_limit_config = {
+            "enabled": rate_limit.RATE_LIMIT_ENABLED,
+            "default": rate_limit.RATE_LIMIT_DEFAULT,
+            "burst": rate_limit.RATE_LIMIT_BURST,
+            "tiers": rate_limit.RATE_LIMIT_TIERS,
+        }
+        return await call_next(request)
+
+
+class LegacyApiKeyMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        if is_public_path(request.url.path):
+            return await call_next(request)
+        api_key = request.headers.get("x-api-key")
+        if not api_key:
+            return JSONResponse(status_code=401, content={"error": "unauthorized", "message": "Missing API key"})
+        key_hash = hash_api_key(api_key)
+        cached_agent_id = await get_cached_agent_id(key_hash)
+        if cached_agent_id:
+            request.state.agent_id = cached_agent_id
+            return await call_next(request)
+        db = SessionLocal()
+        try:
+            agent = verify_api_key(db, api_key)
+            if not agent:
+                return JSONResponse(status_code=401, content={"error": "unauthorized", "message": "Invalid API key"})
+            await cache_agent_id(key_hash, agent.id)
+            request.state.agent_id = agent.id
+        finally:
+            db.close()
+        return await call_next(request)
+
+
+class LegacyRequestIdMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
+        request.state.request_id = request_id
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(request_id=request_id)
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+class LegacyMetricsMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        if not metrics.PROMETHEUS_AVAILABLE or request.url.path == "/metrics":
+            return await call_next(request)
+        method = request.method
+        path = MetricsMiddleware._normalize_path(request.url.path)
+        metrics.ACTIVE_REQUESTS.inc()
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+            metrics.REQUEST_COUNT.labels(method=method, endpoint=path, status_code=response.status_code).inc()
+            return response
+        finally:
+            metrics.REQUEST_LATENCY.labels(method=method, endpoint=path).observe(time.perf_counter() - start)
+            metrics.ACTIVE_REQUESTS.dec()
+
+
+STACKS = {
+    "legacy": (LegacyRateLimitToggleMiddleware, LegacyApiKeyMiddleware, LegacyRequestIdMiddleware, LegacyMetricsMiddleware),
+    "asgi": (RateLimitToggleMiddleware, ApiKeyMiddleware, RequestIdMiddleware, MetricsMiddleware),
+}
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    app.include_router(properties_router)
+    # Same order as app/main.py
+    for middleware in STACKS[stack]:
+        app.add_middleware(middleware)
+    return app
+
+
+def seed(n_properties: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        agent = Agent(name="Bench Agent", email="bench@example.com", api_key_hash=hash_api_key(API_KEY))
+        db.add(agent)
+        db.flush()
+        db.add_all(
+            Property(
+                title=f"{i} Bench St",
+                address=f"{i} Bench Street",
+                city="Benchville",
+                state="NJ",
+                zip_code="07001",
+                price=300000.0 + i,
+                bedrooms=3,
+                bathrooms=2.0,
+                property_type=PropertyType.HOUSE,
+                status=PropertyStatus.NEW_PROPERTY,
+                agent_id=agent.id,
+            )
+            for i in range(n_properties)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run(app: FastAPI, path: str, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    headers = {"x-api-key": API_KEY}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up (fills the API key cache)
+        for _ in range(10):
+            (await client.get(path, headers=headers)).raise_for_status()
+
+        remaining = total
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.get(path, headers=headers)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total / (time.perf_counter() - start)
+
+
+async def main_async(args) -> None:
+    seed(args.properties)
+    apps = {name: build_app(name) for name in STACKS}
+    targets = [("/ping", "trivial endpoint"), (f"/properties/?limit={args.limit}&include_heartbeat=false", "/properties/")]
+
+    print(f"{args.requests} requests per run, concurrency {args.concurrency}, {args.properties} properties")
+    for path, label in targets:
+        results = {name: await run(app, path, args.requests, args.concurrency) for name, app in apps.items()}
+        print(f"\n{label}")
+        for name, rps in results.items():
+            print(f"  {name:8s} {rps:10.0f} req/s")
+        print(f"  speedup  {results['asgi'] / results['legacy']:10.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Middleware stack throughput benchmark")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--properties", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
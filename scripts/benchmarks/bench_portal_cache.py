@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark the blob-backed portal page cache against the legacy inline table.
+
+Caches the same set of synthetic listing pages (some fetched under several
+URLs) into a temporary SQLite database two ways:
+  legacy — raw HTML inline in ``portal_cache.raw_html``; ``extract_text``
+           re-parses the page on every call
+  blob   — ``PortalCacheService`` on a local compressed, content-addressed
+           blob store; extracted text is cached alongside the page
+
+Reports database and blob store size, and per-lookup latency for HTML and
+text fetches.
+
+Usage:
+    python scripts/benchmarks/bench_portal_cache.py
+    python scripts/benchmarks/bench_portal_cache.py --pages 500 --page-kb 400 --lookups 2000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="bench_portal_cache_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.portal_cache import PortalCache  # noqa: E402
+from app.services.agentic.page_store import ZSTD_AVAILABLE, LocalPageBlobStore  # noqa: E402
+from app.services.agentic.providers import PortalCacheService  # noqa: E402
+from app.services.agentic.utils import utcnow  # noqa: E402
+
+_WORDS = "colonial ranch bedroom bath kitchen granite renovated basement garage fenced yard school tax sold listed price".split()
+
+
+def make_page(i: int, kb: int, rng: random.Random) -> str:
+    rows = []
+    while sum(len(r) for r in rows) < kb * 1024:
+        words = " ".join(rng.choice(_WORDS) for _ in range(12))
+        rows.append(
+            f'<div class="listing-card" data-id="{rng.randint(1, 10**6)}"><span class="price">${rng.randint(150, 900)},000'
+            f'</span><p class="desc">{words}</p><a href="/homedetails/{rng.randint(1, 10**8)}_zpid/">details</a></div>\n'
+        )
+    return f"<html><head><title>Listing {i}</title><script>{'var x=1;' * 200}</script></head><body>{''.join(rows)}</body></html>"
+
+
+def url_set(pages: int, duplicate_ratio: float, rng: random.Random) -> list[tuple[str, int]]:
+    """(url, page index) pairs; a share of URLs are variants of an earlier page."""
+    urls = [(f"https://portal.example.com/listing/{i}", i) for i in range(pages)]
+    for n in range(int(pages * duplicate_ratio)):
+        i = rng.randrange(pages)
+        urls.append((f"https://portal.example.com/listing/{i}?utm_source=feed{n}", i))
+    return urls
+
+
+def db_bytes() -> int:
+    with engine.begin() as conn:
+        conn.execute(text("VACUUM"))
+    return os.path.getsize(f"{_DB_DIR}/bench.db")
+
+
+def dir_bytes(root: Path) -> int:
+    return sum(p.stat().st_size for p in root.rglob("*") if p.is_file())
+
+
+def reset() -> None:
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM portal_cache"))
+
+
+def legacy_set(db, cache: PortalCacheService, url: str, html: str) -> None:
+    """Reproduces the old PortalCacheService.set: HTML inline in the row."""
+    db.add(PortalCache(
+        url_hash=cache._url_hash(url),
+        source_url=url,
+        raw_html=html,
+        captured_at=utcnow(),
+        expires_at=utcnow() + timedelta(hours=24),
+    ))
+    db.commit()
+
+
+def legacy_text(db, cache: PortalCacheService, url: str) -> str:
+    html = cache.get(db, url)
+    return BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
+
+
+def timed(fn, urls: list[str]) -> list[float]:
+    out = []
+    for url in urls:
+        t0 = time.perf_counter()
+        fn(url)
+        out.append((time.perf_counter() - t0) * 1000)
+    return out
+
+
+def summary(samples: list[float]) -> str:
+    return f"p50 {statistics.median(samples):7.2f}ms  p95 {statistics.quantiles(samples, n=20)[-1]:7.2f}ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--page-kb", type=int, default=300)
+    parser.add_argument("--duplicates", type=float, default=0.25, help="extra URLs serving an already cached page")
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument("--text-lookups", type=int, default=50, help="text lookups (legacy re-parses each one)")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    pages = [make_page(i, args.page_kb, rng) for i in range(args.pages)]
+    urls = url_set(args.pages, args.duplicates, rng)
+    lookups = [rng.choice(urls)[0] for _ in range(args.lookups)]
+    text_lookups = lookups[: args.text_lookups]
+
+    Base.metadata.create_all(bind=engine)
+    empty = db_bytes()
+    codec = "zstd" if ZSTD_AVAILABLE else "zlib (zstandard not installed)"
+    print(f"{len(urls)} cached URLs over {args.pages} distinct pages of ~{args.page_kb}KB, blobs: {codec}")
+
+    db = SessionLocal()
+    try:
+        legacy_cache = PortalCacheService()
+        for url, i in urls:
+            legacy_set(db, legacy_cache, url, pages[i])
+        legacy_db = db_bytes() - empty
+        legacy_html = timed(lambda u: legacy_cache.get(db, u), lookups)
+        legacy_txt = timed(lambda u: legacy_text(db, legacy_cache, u), text_lookups)
+
+        reset()
+        store_dir = Path(_DB_DIR) / "pages"
+        cache = PortalCacheService(store=LocalPageBlobStore(store_dir))
+        t0 = time.perf_counter()
+        for url, i in urls:
+            cache.set(db, url, pages[i])
+        write_s = time.perf_counter() - t0
+        for url in set(text_lookups):  # first extract_text call caches the text
+            cache.set_text(db, url, legacy_text(db, cache, url))
+        blob_db = db_bytes() - empty
+        blob_store = dir_bytes(store_dir)
+        blob_html = timed(lambda u: cache.get(db, u), lookups)
+        blob_txt = timed(lambda u: cache.get_text(db, u), text_lookups)
+    finally:
+        db.close()
+
+    mb = 1024 * 1024
+    print(f"  legacy  db {legacy_db / mb:8.2f}MB                         "
+          f"html {summary(legacy_html)}  text {summary(legacy_txt)}")
+    print(f"  blob    db {blob_db / mb:8.2f}MB  store {blob_store / mb:8.2f}MB  "
+          f"html {summary(blob_html)}  text {summary(blob_txt)}")
+    print(f"  blob writes: {write_s:.2f}s for {len(urls)} pages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark GET /properties/ pagination at scale: legacy OFFSET paging with
+full ORM rows vs keyset cursors, sparse ``fields=`` projection, and the
+NDJSON export, on a temporary SQLite database (100k rows by default).
+
+The endpoint function is called directly (no HTTP) so the numbers reflect
+query + serialization cost.
+
+Usage:
+    python scripts/benchmarks/bench_property_listing.py
+    python scripts/benchmarks/bench_property_listing.py --rows 100000 --limit 100 --repeat 5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="bench_listing_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from fastapi import Response  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.agent import Agent  # noqa: E402
+from app.models.property import Property  # noqa: E402
+from app.routers.core.properties import list_properties  # noqa: E402
+from app.schemas.property import PropertyResponse  # noqa: E402
+
+
+def seed(rows: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        agent = Agent(name="Bench Agent", email="bench@example.com")
+        db.add(agent)
+        db.commit()
+        start = datetime(2024, 1, 1)
+        batch = []
+        for i in range(rows):
+            batch.append({
+                "title": f"{i} Bench St",
+                "address": f"{i} Bench Street",
+                "city": f"City {i % 200}",
+                "state": "NJ",
+                "zip_code": "07001",
+                "price": 200000.0 + (i % 5000) * 100,
+                "bedrooms": 1 + i % 5,
+                "bathrooms": 1.0 + i % 3,
+                "square_feet": 900 + i % 3000,
+                "property_type": "HOUSE",
+                "status": "new_property",
+                "agent_id": agent.id,
+                "score_breakdown": {"components": {f"factor_{k}": k * 1.5 for k in range(20)}, "notes": "x" * 200},
+                "created_at": start + timedelta(seconds=i * 37),
+            })
+            if len(batch) == 5000:
+                db.execute(insert(Property.__table__), batch)
+                batch = []
+        if batch:
+            db.execute(insert(Property.__table__), batch)
+        db.commit()
+    finally:
+        db.close()
+
+
+def call(db, **overrides):
+    params = dict(
+        response=Response(), skip=0, limit=100, status=None, property_type=None, min_price=None,
+        max_price=None, city=None, bedrooms=None, agent_id=None, include_heartbeat=False,
+        cursor=None, fields=None, output="json", db=db,
+    )
+    params.update(overrides)
+    return list_properties(**params)
+
+
+def legacy_page(db, skip: int, limit: int):
+    """Pre-change query: unordered OFFSET with eager-loaded relationships."""
+    rows = (
+        db.query(Property)
+        .options(joinedload(Property.zillow_enrichment), joinedload(Property.skip_traces))
+        .offset(skip).limit(limit).all()
+    )
+    return [PropertyResponse.model_validate(r) for r in rows]
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def cursor_at(db, depth: int, limit: int):
+    """Walk projection pages to reach the cursor for ``depth`` (setup, not timed)."""
+    cursor = None
+    for _ in range(depth // 1000):
+        response = call(db, limit=1000, cursor=cursor, fields="id")
+        cursor = response.headers.get("X-Next-Cursor")
+    return cursor
+
+
+def drain(response) -> int:
+    async def count():
+        return sum([chunk.count("\n") async for chunk in response.body_iterator])
+    return asyncio.run(count())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Property listing pagination benchmark")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Seeding {args.rows} properties...")
+    seed(args.rows)
+    db = SessionLocal()
+    try:
+        depths = [d for d in (0, 10_000, 50_000, args.rows - args.limit) if d < args.rows]
+        print(f"\nPage of {args.limit} at depth (best of {args.repeat}, ms)")
+        print(f"  {'depth':>8s} {'offset+ORM':>12s} {'keyset+ORM':>12s} {'keyset+fields':>14s}")
+        for depth in depths:
+            cursor = cursor_at(db, depth, args.limit)
+            legacy = timed(lambda: legacy_page(db, depth, args.limit), args.repeat)
+            keyset = timed(lambda: call(db, limit=args.limit, cursor=cursor), args.repeat)
+            sparse = timed(
+                lambda: call(db, limit=args.limit, cursor=cursor, fields="address,city,price"), args.repeat
+            )
+            print(f"  {depth:8d} {legacy:12.1f} {keyset:12.1f} {sparse:14.1f}")
+
+        print("\nFull export")
+        start = time.perf_counter()
+        total, skip = 0, 0
+        while True:
+            page = legacy_page(db, skip, 1000)
+            total += len(page)
+            skip += 1000
+            if len(page) < 1000:
+                break
+        print(f"  offset pages of 1000 (ORM):   {time.perf_counter() - start:7.2f}s  {total} rows")
+
+        start = time.perf_counter()
+        response = call(db, output="ndjson", fields="address,city,price")
+        lines = drain(response)
+        print(f"  ndjson stream (3 fields):     {time.perf_counter() - start:7.2f}s  {lines} rows")
+
+        start = time.perf_counter()
+        response = call(db, output="ndjson")
+        lines = drain(response)
+        print(f"  ndjson stream (all columns):  {time.perf_counter() - start:7.2f}s  {lines} rows")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
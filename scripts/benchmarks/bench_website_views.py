@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Load-test the public property website view (pages/sec) on a temporary SQLite
+database, served by uvicorn on localhost and hit by concurrent keep-alive
+clients for a fixed duration per mode:
+  legacy     — the previous handler: render the page from the website row and
+               insert + commit a WebsiteAnalytics row on every hit
+  cached     — the render cache: one render per content version, pre-compressed
+               body picked by Accept-Encoding, views written in batches
+  revalidate — cached, with clients sending If-None-Match (304s)
+
+Usage:
+    python scripts/benchmarks/bench_website_views.py
+    python scripts/benchmarks/bench_website_views.py --seconds 10 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="bench_website_views_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+_PORT = _free_port()
+_BASE_URL = f"http://127.0.0.1:{_PORT}"
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from fastapi.responses import HTMLResponse  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.database import Base, SessionLocal, engine, get_db  # noqa: E402
+from app.models.agent import Agent  # noqa: E402
+from app.models.property import Property, PropertyStatus, PropertyType  # noqa: E402
+from app.models.property_website import PropertyWebsite, WebsiteAnalytics  # noqa: E402
+from app.routers.properties import property_websites  # noqa: E402
+from app.services.website_render_cache import website_render_cache, website_view_writer  # noqa: E402
+from app.services.website_renderer import WebsiteRenderer  # noqa: E402
+
+SLUG = "42-bench-lane"
+
+CONTENT = {
+    "sections": {
+        "hero": {
+            "headline": "42 Bench Lane",
+            "subheadline": "Sunlit 4 bed colonial on a quiet cul-de-sac",
+            "price_display": "$749,000",
+            "background_image": "https://images.example.com/hero.jpg",
+        },
+        "features": {"title": "Highlights", "features": [
+            {"title": f"Feature {i}", "description": "Renovated in 2023 with premium finishes " * 3, "icon": "star"}
+            for i in range(8)
+        ]},
+        "gallery": {"title": "Gallery", "images": [
+            {"url": f"https://images.example.com/{i}.jpg", "caption": f"Room {i}"} for i in range(12)
+        ]},
+        "about": {"title": "About the home", "content": "A thoughtfully updated home close to parks and trains. " * 20},
+        "contact": {"title": "Schedule a showing", "form_fields": [
+            {"name": "name", "label": "Name", "type": "text", "required": True},
+            {"name": "email", "label": "Email", "type": "email", "required": True},
+            {"name": "phone", "label": "Phone", "type": "tel"},
+            {"name": "message", "label": "Message", "type": "textarea"},
+        ]},
+        "cta": {"headline": "Don't miss it", "button_text": "Book a tour"},
+    },
+    "seo": {"description": "4 bed colonial for sale at 42 Bench Lane"},
+}
+
+
+def seed() -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        agent = Agent(name="Bench Agent", email="bench@example.com")
+        db.add(agent)
+        db.flush()
+        prop = Property(
+            title="42 Bench Lane", address="42 Bench Lane", city="Benchville", state="NJ", zip_code="07001",
+            price=749000, property_type=PropertyType.HOUSE, status=PropertyStatus.NEW_PROPERTY, agent_id=agent.id,
+        )
+        db.add(prop)
+        db.flush()
+        now = datetime.utcnow()
+        db.add(PropertyWebsite(
+            property_id=prop.id, agent_id=agent.id, website_name="42 Bench Lane", website_slug=SLUG,
+            theme={"primary_color": "#1f6feb", "font": "Inter"}, content=CONTENT, is_published=True,
+            published_at=now, created_at=now, updated_at=now,
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def build_app() -> FastAPI:
+    api = FastAPI()
+    api.include_router(property_websites.router)
+
+    @api.get("/legacy/{website_slug}")
+    async def legacy_view(website_slug: str, db: Session = Depends(get_db)):
+        """The previous handler: per-hit analytics commit and full render."""
+        website = db.query(PropertyWebsite).filter(PropertyWebsite.website_slug == website_slug).first()
+        db.add(WebsiteAnalytics(website_id=website.id, event_type="view", event_data={}, created_at=datetime.utcnow()))
+        db.commit()
+        return HTMLResponse(content=await WebsiteRenderer(db).render_website(website))
+
+    @api.on_event("startup")
+    async def start_writer():
+        website_view_writer.start()
+
+    @api.on_event("shutdown")
+    async def stop_writer():
+        await website_view_writer.stop()
+
+    return api
+
+
+def serve(api: FastAPI) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(api, host="127.0.0.1", port=_PORT, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def load(path: str, seconds: float, concurrency: int, revalidate: bool = False) -> tuple[int, int]:
+    """(pages served, bytes received) in ``seconds`` from ``concurrency`` clients."""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=_BASE_URL, limits=limits, timeout=30) as client:
+        headers = {"Accept-Encoding": "br, gzip"}
+        if revalidate:
+            first = await client.get(path, headers=headers)
+            headers["If-None-Match"] = first.headers["etag"]
+        deadline = time.perf_counter() + seconds
+        pages = wire_bytes = 0
+
+        async def worker():
+            nonlocal pages, wire_bytes
+            while time.perf_counter() < deadline:
+                async with client.stream("GET", path, headers=headers) as response:
+                    async for chunk in response.aiter_raw():
+                        wire_bytes += len(chunk)
+                    if response.status_code not in (200, 304):
+                        raise RuntimeError(f"{path}: HTTP {response.status_code}")
+                pages += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return pages, wire_bytes
+
+
+def report(label: str, pages: int, wire_bytes: int, seconds: float) -> None:
+    print(f"  {label:<10} {pages / seconds:9.0f} pages/s   {wire_bytes / max(pages, 1) / 1024:7.1f} KiB/page on the wire")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0, help="duration of each mode")
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    seed()
+    server = serve(build_app())
+    view_path = f"/properties/0/websites/view/{SLUG}"
+    try:
+        print(f"Public website view, {args.concurrency} concurrent clients, {args.seconds:.0f}s per mode")
+        report("legacy", *asyncio.run(load(f"/legacy/{SLUG}", args.seconds, args.concurrency)), args.seconds)
+        report("cached", *asyncio.run(load(view_path, args.seconds, args.concurrency)), args.seconds)
+        report("revalidate", *asyncio.run(load(view_path, args.seconds, args.concurrency, revalidate=True)), args.seconds)
+        print(f"  render cache: {website_render_cache.stats()}")
+    finally:
+        server.should_exit = True
+        time.sleep(0.5)
+    print(f"  view writer:  {website_view_writer.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Tests for the write-behind activity event writer."""
+
+import asyncio
+
+from app.middleware.activity_logger import ActivityEventWriter, _event_row, log_mcp_tool_call
+from app.models.activity_event import ActivityEvent, ActivityEventStatus
+from tests.conftest import TestingSessionLocal
+
+
+def _row(i: int, status=ActivityEventStatus.SUCCESS) -> dict:
+    return _event_row(f"GET /items/{i}", "pytest", status, duration_ms=i)
+
+
+def test_events_are_batched_and_flushed_on_stop(db):
+    writer = ActivityEventWriter(batch_size=10, flush_interval_ms=10_000, session_factory=TestingSessionLocal)
+
+    async def scenario():
+        writer.start()
+        for i in range(25):
+            writer.enqueue(_row(i))
+        await asyncio.sleep(0.05)  # full batches are flushed without waiting for the interval
+        flushed_early = writer.written
+        await writer.stop()
+        return flushed_early
+
+    flushed_early = asyncio.run(scenario())
+    assert flushed_early >= 10
+    assert writer.written == 25
+    assert writer.depth == 0
+    assert db.query(ActivityEvent).count() == 25
+
+
+def test_backpressure_drops_when_full_and_samples_successes(db):
+    writer = ActivityEventWriter(
+        max_queue=10, batch_size=1000, sample_high_water=0.5, sample_rate=0.0,
+        session_factory=TestingSessionLocal,
+    )
+
+    async def scenario():
+        writer.start()
+        for i in range(5):
+            assert writer.enqueue(_row(i)) is True
+        # Above the high-water mark successes are sampled out, errors kept.
+        assert writer.enqueue(_row(5)) is False
+        for i in range(5):
+            assert writer.enqueue(_row(i, ActivityEventStatus.ERROR)) is True
+        assert writer.enqueue(_row(99, ActivityEventStatus.ERROR)) is False
+        await writer.stop()
+
+    asyncio.run(scenario())
+    assert writer.sampled_out == 1
+    assert writer.dropped == 1
+    assert db.query(ActivityEvent).count() == 10
+
+
+def test_writes_through_when_writer_not_running(db):
+    writer = ActivityEventWriter(session_factory=TestingSessionLocal)
+    assert writer.enqueue(_row(1)) is True
+    assert db.query(ActivityEvent).count() == 1
+
+
+def test_log_mcp_tool_call_with_session_returns_persisted_event(db):
+    event = log_mcp_tool_call("search_properties", metadata={"q": "x"}, db=db)
+    assert event.id is not None
+    assert event.status == ActivityEventStatus.PENDING
@@ -0,0 +1,94 @@
+"""Tests for the SQL-merged activity timeline and its keyset pagination."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.contract import Contract, ContractStatus
+from app.models.conversation_history import ConversationHistory
+from app.models.notification import Notification, NotificationType
+from app.models.property_note import PropertyNote
+from app.models.zillow_enrichment import ZillowEnrichment
+from app.services.activity_timeline_service import activity_timeline_service
+
+T0 = datetime(2026, 10, 1, 12, 0, 0)
+
+
+def _seed(db, sample_property):
+    pid = sample_property.id
+    db.add_all([
+        ConversationHistory(session_id="s", property_id=pid, tool_name="search", output_summary="Found 3 comps",
+                            created_at=T0),
+        PropertyNote(property_id=pid, content="Seller wants 100% cash", created_at=T0 + timedelta(minutes=1)),
+        Notification(type=NotificationType.GENERAL, title="Price drop", message="Down 5%", property_id=pid,
+                     created_at=T0 + timedelta(minutes=2)),
+        ZillowEnrichment(property_id=pid, zestimate=350000, created_at=T0 + timedelta(minutes=3)),
+        Contract(property_id=pid, name="Purchase Agreement", status=ContractStatus.COMPLETED,
+                 created_at=T0 + timedelta(minutes=4), sent_at=T0 + timedelta(minutes=5),
+                 completed_at=T0 + timedelta(minutes=6)),
+    ])
+    # Several notes sharing a timestamp exercise the (ts, source, id) tie-break
+    db.add_all([PropertyNote(property_id=pid, content=f"Same time {i}", created_at=T0 + timedelta(minutes=7))
+                for i in range(3)])
+    db.commit()
+
+
+def test_sources_are_merged_newest_first(db, sample_property):
+    _seed(db, sample_property)
+
+    timeline = activity_timeline_service.get_timeline(db, property_id=sample_property.id, limit=20)
+
+    assert timeline["total_events"] == 10
+    assert timeline["next_cursor"] is None
+    titles = [e["title"] for e in timeline["events"]]
+    assert titles[3:] == [
+        "Contract completed: Purchase Agreement",
+        "Contract sent: Purchase Agreement",
+        "Contract created: Purchase Agreement",
+        "Zillow enrichment",
+        "Price drop",
+        "Note (manual)",
+        "Tool: search",
+    ]
+    assert timeline["events"][3]["metadata"]["action"] == "completed"
+    assert timeline["voice_summary"].startswith(f"10 events for property {sample_property.id}.")
+
+
+def test_keyset_pages_cover_every_event_once(db, sample_property):
+    _seed(db, sample_property)
+    full = activity_timeline_service.get_timeline(db, property_id=sample_property.id, limit=20)["events"]
+
+    seen, cursor = [], None
+    while True:
+        page = activity_timeline_service.get_timeline(db, property_id=sample_property.id, limit=3, cursor=cursor)
+        assert len(page["events"]) <= 3
+        seen.extend(page["events"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == full
+
+    offset_page = activity_timeline_service.get_timeline(db, property_id=sample_property.id, limit=3, offset=3)
+    assert offset_page["events"] == full[3:6]
+
+
+def test_search_and_type_filters_run_in_sql(db, sample_property):
+    _seed(db, sample_property)
+
+    # LIKE wildcards in the search text are matched literally
+    found = activity_timeline_service.get_timeline(db, search="100%")
+    assert [e["description"] for e in found["events"]] == ["Seller wants 100% cash"]
+
+    contracts = activity_timeline_service.get_timeline(db, event_types=["contract"], search="purchase")
+    assert contracts["total_events"] == 3
+
+    enrichments = activity_timeline_service.get_timeline(db, event_types=["enrichment"])
+    assert [e["metadata"]["zestimate"] for e in enrichments["events"]] == [350000]
+
+    since = activity_timeline_service.get_timeline(db, start_date=T0 + timedelta(minutes=5))
+    assert since["total_events"] == 5
+
+
+def test_malformed_cursor_is_rejected(db):
+    with pytest.raises(ValueError):
+        activity_timeline_service.get_timeline(db, cursor="not-a-cursor")
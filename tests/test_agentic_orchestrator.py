@@ -67,6 +67,46 @@ def test_multi_agent_orchestrator_raises_on_unresolvable_plan():
         raise AssertionError("Expected RuntimeError for cyclic dependencies")
 
 
+def test_multi_agent_orchestrator_starts_dependents_without_waiting_for_batch():
+    specs = [
+        AgentSpec(name="slow", dependencies=set()),
+        AgentSpec(name="fast", dependencies=set()),
+        AgentSpec(name="after_fast", dependencies={"fast"}),
+    ]
+    orchestrator = MultiAgentOrchestrator(max_parallel_agents=2)
+    started: list[str] = []
+
+    async def run_agent(name: str):
+        started.append(name)
+        await asyncio.sleep(0.05 if name == "slow" else 0.005)
+        return name
+
+    executions = asyncio.run(orchestrator.run(specs=specs, run_agent=run_agent))
+
+    # after_fast must start (and finish) while slow is still running.
+    assert [name for name, _ in executions] == ["fast", "after_fast", "slow"]
+    assert started == ["fast", "slow", "after_fast"]
+
+
+def test_multi_agent_orchestrator_prioritizes_longest_critical_path():
+    specs = [
+        AgentSpec(name="short", dependencies=set()),
+        AgentSpec(name="head", dependencies=set()),
+        AgentSpec(name="tail", dependencies={"head"}),
+    ]
+    orchestrator = MultiAgentOrchestrator(
+        max_parallel_agents=1,
+        estimated_costs={"short": 100, "head": 80, "tail": 500},
+    )
+    assert orchestrator.critical_path_lengths(specs) == {"short": 100, "head": 580, "tail": 500}
+
+    async def run_agent(name: str):
+        return name
+
+    executions = asyncio.run(orchestrator.run(specs=specs, run_agent=run_agent))
+    assert [name for name, _ in executions] == ["head", "tail", "short"]
+
+
 def test_build_agent_specs_adds_subdivision_when_enabled():
     service = AgenticResearchService()
 
@@ -0,0 +1,161 @@
+"""Tests for analytics daily rollups and the grouped dashboard queries."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func
+
+from app.models.analytics_event import AnalyticsDailyRollup, AnalyticsEvent
+from app.models.contract import Contract, ContractStatus
+from app.models.property import Property, PropertyStatus, PropertyType
+from app.services.analytics_rollup_service import analytics_rollup_service
+from app.services.analytics_service import AnalyticsService, analytics_service
+
+
+def _event(db, agent, event_type, at, value=None):
+    db.add(AnalyticsEvent(
+        agent_id=agent.id, event_type=event_type, event_name=event_type, created_at=at, value=value,
+    ))
+
+
+def _raw_counts(db, agent, since):
+    rows = (
+        db.query(AnalyticsEvent.event_type, func.count(AnalyticsEvent.id), func.coalesce(func.sum(AnalyticsEvent.value), 0))
+        .filter(AnalyticsEvent.agent_id == agent.id, AnalyticsEvent.created_at >= since)
+        .group_by(AnalyticsEvent.event_type)
+        .all()
+    )
+    return {event_type: (count, value) for event_type, count, value in rows}
+
+
+class TestRollups:
+    def test_track_event_upserts_daily_rollup(self, db, agent):
+        for value in (100, 250):
+            AnalyticsService.track_event(db, agent.id, "conversion", "Offer", {}, value=value)
+        AnalyticsService.track_event(db, agent.id, "property_view", "View", {})
+
+        rows = {r.event_type: r for r in db.query(AnalyticsDailyRollup).filter_by(agent_id=agent.id)}
+        assert rows["conversion"].event_count == 2
+        assert rows["conversion"].value_sum == 350
+        assert rows["conversion"].day == datetime.now(timezone.utc).date()
+        assert rows["property_view"].event_count == 1
+
+    def test_totals_match_raw_scan_across_partial_first_day(self, db, agent):
+        now = datetime.now(timezone.utc)
+        for hours in range(0, 24 * 10, 5):
+            _event(db, agent, "property_view", now - timedelta(hours=hours))
+            if hours % 3 == 0:
+                _event(db, agent, "lead_created", now - timedelta(hours=hours), value=1000)
+        db.commit()
+        analytics_rollup_service.rebuild(db)
+
+        since = now - timedelta(days=7)
+        assert analytics_rollup_service.totals(db, agent.id, since) == _raw_counts(db, agent, since)
+        assert analytics_rollup_service.totals(db, agent.id, since, ["lead_created"]) == {
+            "lead_created": _raw_counts(db, agent, since)["lead_created"]
+        }
+
+    def test_rebuild_since_only_replaces_recent_days(self, db, agent):
+        now = datetime.now(timezone.utc)
+        _event(db, agent, "page_view", now - timedelta(days=5))
+        _event(db, agent, "page_view", now)
+        db.commit()
+        assert analytics_rollup_service.rebuild(db) == 2
+
+        old_day = (now - timedelta(days=5)).date()
+        db.query(AnalyticsDailyRollup).filter_by(day=old_day).update({"event_count": 42})
+        db.commit()
+        analytics_rollup_service.rebuild(db, since=now.date())
+
+        counts = {r.day: r.event_count for r in db.query(AnalyticsDailyRollup)}
+        assert counts == {old_day: 42, now.date(): 1}
+
+    def test_rebuild_upserts_in_place_and_drops_stale_rows(self, db, agent):
+        now = datetime.now(timezone.utc)
+        AnalyticsService.track_event(db, agent.id, "page_view", "View", {}, value=10)
+        live = db.query(AnalyticsDailyRollup).filter_by(agent_id=agent.id).one()
+        live.event_count = 99
+        db.add(AnalyticsDailyRollup(
+            agent_id=agent.id, day=now.date(), event_type="orphaned", event_count=3, value_sum=0,
+        ))
+        db.commit()
+        live_id = live.id
+
+        assert analytics_rollup_service.rebuild(db, since=now.date()) == 1
+
+        rows = db.query(AnalyticsDailyRollup).filter_by(agent_id=agent.id).all()
+        assert [(r.id, r.event_type, r.event_count, r.value_sum) for r in rows] == [
+            (live_id, "page_view", 1, 10)
+        ]
+
+
+class TestDashboardOverview:
+    def test_overview_reads_rollups_and_properties(self, db, agent, sample_property):
+        for _ in range(3):
+            AnalyticsService.track_event(db, agent.id, "property_view", "View", {})
+        for _ in range(4):
+            AnalyticsService.track_event(db, agent.id, "lead_created", "Lead", {})
+        AnalyticsService.track_event(db, agent.id, "conversion", "Offer", {}, value=5000)
+        _event(db, agent, "property_view", datetime.now(timezone.utc) - timedelta(days=40))
+        db.commit()
+
+        stats = analytics_service.get_dashboard_overview(db, agent.id, days=30)
+        assert stats["property_views"] == 3
+        assert stats["leads_created"] == 4
+        assert stats["conversions"] == 1
+        assert stats["conversion_rate"] == 25.0
+        assert stats["total_value_cents"] == 5000
+        assert stats["active_properties"] == 1
+
+    def test_funnel(self, db, agent):
+        AnalyticsService.track_event(db, agent.id, "property_view", "View", {})
+        AnalyticsService.track_event(db, agent.id, "contract_signed", "Closed", {})
+
+        funnel = {s["stage"]: s["count"] for s in analytics_service.get_conversion_funnel(db, agent.id)}
+        assert funnel == {
+            "Property Views": 1, "Leads Captured": 0, "Contacts Added": 0,
+            "Contracts Sent": 0, "Deals Closed": 1,
+        }
+
+
+class TestPortfolioSummary:
+    def _property(self, db, agent, i, **kwargs):
+        prop = Property(
+            title=f"{i} Oak St", address=f"{i} Oak Street", city="Testville", state="NJ",
+            zip_code="07001", price=100000.0 * (i + 1), property_type=PropertyType.HOUSE,
+            status=PropertyStatus.NEW_PROPERTY, agent_id=agent.id, **kwargs,
+        )
+        db.add(prop)
+        db.flush()
+        return prop
+
+    def test_grouped_portfolio_stats(self, db, agent):
+        props = [
+            self._property(db, agent, 0, deal_score=91.0, score_grade="A"),
+            self._property(db, agent, 1, deal_score=62.0, score_grade="C"),
+            self._property(db, agent, 2, deal_score=40.0, score_grade=None),
+            self._property(db, agent, 3),
+        ]
+        props[3].status = PropertyStatus.COMPLETE
+        for status, required in [
+            (ContractStatus.DRAFT, True), (ContractStatus.SENT, True), (ContractStatus.SENT, False),
+            (ContractStatus.COMPLETED, True),
+        ]:
+            db.add(Contract(property_id=props[0].id, name="Agreement", status=status, is_required=required))
+        db.commit()
+
+        summary = analytics_service.get_portfolio_summary(db)
+
+        assert summary["pipeline"]["total"] == 4
+        assert summary["pipeline"]["by_status"] == {"new_property": 3, "complete": 1}
+        assert summary["portfolio_value"]["total_price"] == 1000000.0
+        assert summary["portfolio_value"]["avg_price"] == 250000.0
+        assert summary["contracts"] == {
+            "total": 4,
+            "by_status": {"draft": 1, "sent": 2, "completed": 1},
+            "unsigned_required": 2,
+        }
+        scores = summary["deal_scores"]
+        assert scores["avg_score"] == 64.3
+        assert scores["distribution"] == {"A": 1, "B": 0, "C": 1, "D": 0, "F": 1}
+        assert [p["property_id"] for p in scores["top_5"]] == [props[0].id, props[1].id, props[2].id]
+        assert summary["enrichment_coverage"]["total"] == 4
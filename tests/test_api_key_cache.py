@@ -0,0 +1,147 @@
+"""Tests for the API key verification cache."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app import api_key_cache
+from app.api_key_cache import (
+    api_key_cache_stats,
+    cache_agent_id,
+    get_cached_agent_id,
+    invalidate_api_key_cache,
+    resolve_agent_id,
+)
+from app.auth import hash_api_key
+from tests.conftest import TEST_API_KEY
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    invalidate_api_key_cache()
+    yield
+    invalidate_api_key_cache()
+
+
+class TestResolveAgentId:
+    def test_caches_verified_key(self):
+        calls = []
+
+        def lookup():
+            calls.append(1)
+            return 7
+
+        async def run():
+            return [await resolve_agent_id("h1", lookup) for _ in range(3)]
+
+        assert asyncio.run(run()) == [7, 7, 7]
+        assert len(calls) == 1
+        assert asyncio.run(get_cached_agent_id("h1")) == 7
+
+    def test_caches_rejected_key(self):
+        calls = []
+
+        def lookup():
+            calls.append(1)
+            return None
+
+        async def run():
+            return [await resolve_agent_id("bad", lookup) for _ in range(5)]
+
+        assert asyncio.run(run()) == [None] * 5
+        assert len(calls) == 1
+        assert asyncio.run(get_cached_agent_id("bad")) is None
+        assert api_key_cache_stats()["rejected_entries"] == 1
+
+    def test_lookup_runs_off_loop_and_coalesces(self):
+        threads = []
+        release = threading.Event()
+
+        def lookup():
+            threads.append(threading.get_ident())
+            release.wait(2)
+            return 3
+
+        async def run():
+            tasks = [asyncio.create_task(resolve_agent_id("h2", lookup)) for _ in range(10)]
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        assert asyncio.run(run()) == [3] * 10
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+
+    def test_rejected_entry_expires(self, monkeypatch):
+        monkeypatch.setattr(api_key_cache, "NEGATIVE_CACHE_TTL_SECONDS", -1)
+        results = iter([None, 5])
+
+        async def run():
+            first = await resolve_agent_id("h3", lambda: next(results))
+            second = await resolve_agent_id("h3", lambda: next(results))
+            return first, second
+
+        assert asyncio.run(run()) == (None, 5)
+
+
+class TestBoundsAndInvalidation:
+    def test_lru_bound(self, monkeypatch):
+        monkeypatch.setattr(api_key_cache, "CACHE_MAX_ENTRIES", 3)
+
+        async def run():
+            for i in range(1, 5):
+                await cache_agent_id(f"k{i}", i)
+            return [await get_cached_agent_id(f"k{i}") for i in range(1, 5)]
+
+        assert asyncio.run(run()) == [None, 2, 3, 4]
+
+    def test_invalidate_single_hash(self):
+        async def run():
+            await cache_agent_id("a", 1)
+            await cache_agent_id("b", 2)
+            invalidate_api_key_cache("a")
+            return await get_cached_agent_id("a"), await get_cached_agent_id("b")
+
+        assert asyncio.run(run()) == (None, 2)
+
+    def test_invalidation_during_lookup_is_not_undone(self):
+        started, release = threading.Event(), threading.Event()
+
+        def lookup():
+            started.set()
+            release.wait(2)
+            return 9
+
+        async def run():
+            task = asyncio.create_task(resolve_agent_id("h4", lookup))
+            await asyncio.to_thread(started.wait, 2)
+            # As the agent delete route does, from a threadpool thread
+            await asyncio.to_thread(invalidate_api_key_cache, "h4")
+            release.set()
+            return await task, await get_cached_agent_id("h4")
+
+        assert asyncio.run(run()) == (9, None)
+
+
+class TestMiddlewareNegativeCache:
+    def test_bad_key_hits_database_once(self, client, monkeypatch):
+        from app.middleware import api_key
+
+        calls = []
+        original = api_key._lookup_agent_id
+
+        def counting(key):
+            calls.append(key)
+            return original(key)
+
+        monkeypatch.setattr(api_key, "_lookup_agent_id", counting)
+        for _ in range(5):
+            assert client.get("/agents/", headers={"x-api-key": "sk_live_bogus"}).status_code == 401
+        assert calls == ["sk_live_bogus"]
+
+    def test_deleting_agent_invalidates_key(self, client, agent, agent_headers):
+        assert client.get("/agents/", headers=agent_headers).status_code == 200
+        assert asyncio.run(get_cached_agent_id(hash_api_key(TEST_API_KEY))) == agent.id
+        assert client.delete(f"/agents/{agent.id}", headers=agent_headers).status_code == 204
+        assert asyncio.run(get_cached_agent_id(hash_api_key(TEST_API_KEY))) is None
@@ -0,0 +1,199 @@
+"""Tests for the bulk operations engine and resumable bulk jobs."""
+
+import asyncio
+
+import pytest
+
+from app.models.bulk_job import BulkJob, BulkJobStatus
+from app.models.property import Property, PropertyStatus, PropertyType
+from app.models.zillow_enrichment import ZillowEnrichment
+from app.routers.operations import bulk as bulk_router
+from app.services import bulk_operations_service as bulk_module
+from app.services.bulk_operations_service import BulkOperationsService
+from app.utils.circuit_breaker import CircuitBreakerRegistry
+from tests.conftest import TestingSessionLocal
+
+
+class FakeZillow:
+    def __init__(self, latency=0.02, fail=()):
+        self.latency = latency
+        self.fail = set(fail)
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def enrich_by_address(self, address):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        self.calls.append(address)
+        if any(address.startswith(f) for f in self.fail):
+            raise RuntimeError("upstream error")
+        return {"zestimate": 400000, "zpid": 123}
+
+
+@pytest.fixture()
+def breakers(monkeypatch):
+    registry = CircuitBreakerRegistry()
+    monkeypatch.setattr(bulk_module, "circuit_breakers", registry)
+    return registry
+
+
+@pytest.fixture()
+def zillow(monkeypatch, breakers):
+    fake = FakeZillow()
+    monkeypatch.setattr(bulk_module, "_get_zillow_service", lambda: fake)
+    return fake
+
+
+def _properties(db, agent, n):
+    props = [
+        Property(
+            title=f"{i} Bulk St",
+            address=f"{i} Bulk Street",
+            city="Testville",
+            state="NJ",
+            zip_code="07001",
+            price=200000.0 + i,
+            property_type=PropertyType.HOUSE,
+            status=PropertyStatus.NEW_PROPERTY,
+            agent_id=agent.id,
+        )
+        for i in range(n)
+    ]
+    db.add_all(props)
+    db.commit()
+    return props
+
+
+def _service():
+    return BulkOperationsService(session_factory=TestingSessionLocal)
+
+
+async def test_enrich_runs_concurrently_and_keeps_order(db, agent, zillow):
+    props = _properties(db, agent, 12)
+
+    result = await _service().execute(db, "enrich", property_ids=[p.id for p in props], params={"concurrency": 4})
+
+    assert result["succeeded"] == 12
+    assert 1 < zillow.max_active <= 4
+    assert [r["property_id"] for r in result["results"]] == [p.id for p in props]
+    assert db.query(ZillowEnrichment).count() == 12
+
+
+async def test_open_circuit_stops_new_calls(db, agent, zillow, breakers):
+    props = _properties(db, agent, 5)
+    breaker = breakers.get("zillow", fail_threshold=1)
+    breaker.record_failure()
+
+    result = await _service().execute(db, "enrich", property_ids=[p.id for p in props])
+
+    assert zillow.calls == []
+    assert result["failed"] == 5
+    assert "circuit open" in result["results"][0]["detail"]
+
+
+def test_throttle_shrinks_with_breaker_failures(breakers):
+    breaker = breakers.get("zillow", fail_threshold=5)
+    assert BulkOperationsService._throttled(8, breaker) == 8
+    breaker.record_failure()
+    breaker.record_failure()
+    assert BulkOperationsService._throttled(8, breaker) == 2
+    assert BulkOperationsService._throttled(8, None) == 8
+
+
+async def test_failures_are_reported_per_property(db, agent, zillow):
+    props = _properties(db, agent, 3)
+    zillow.fail = {"1 Bulk"}
+
+    result = await _service().execute(db, "enrich", property_ids=[p.id for p in props])
+
+    statuses = {r["property_id"]: r["status"] for r in result["results"]}
+    assert statuses == {props[0].id: "success", props[1].id: "error", props[2].id: "success"}
+
+
+async def test_invalid_status_fails_every_property(db, agent):
+    props = _properties(db, agent, 2)
+
+    result = await _service().execute(db, "update_status", property_ids=[p.id for p in props], params={"status": "bogus"})
+
+    assert result["failed"] == 2
+    assert result["results"][0]["detail"] == "Invalid status: bogus"
+
+
+async def test_job_resumes_with_unprocessed_properties(db, agent, zillow):
+    props = _properties(db, agent, 4)
+    service = _service()
+    job = service.create_job(db, "enrich", property_ids=[p.id for p in props])
+
+    # Simulate a worker that died after recording the first property.
+    job.status = BulkJobStatus.RUNNING
+    job.results = [{"property_id": props[0].id, "address": props[0].address, "status": "success", "detail": "done"}]
+    db.commit()
+
+    summary = await service.run_job(job.id)
+
+    assert summary["status"] == BulkJobStatus.COMPLETED
+    assert summary["processed"] == 4
+    assert summary["succeeded"] == 4
+    assert len(zillow.calls) == 3
+    assert not any(c.startswith("0 Bulk") for c in zillow.calls)
+    assert service.unfinished_job_ids(db) == []
+
+
+async def test_completed_job_is_not_rerun(db, agent, zillow):
+    props = _properties(db, agent, 2)
+    service = _service()
+    job = service.create_job(db, "enrich", property_ids=[p.id for p in props])
+
+    await service.run_job(job.id)
+    assert await service.run_job(job.id) is None
+    assert len(zillow.calls) == 2
+    db.expire_all()
+    assert db.query(BulkJob).one().voice_summary == "Enriched 2 of 2 properties."
+
+
+@pytest.fixture()
+def no_redis(monkeypatch):
+    async def get_pool():
+        return None
+
+    runs = []
+
+    async def run_job(job_id):
+        runs.append(job_id)
+
+    monkeypatch.setattr(bulk_router, "get_pool", get_pool)
+    monkeypatch.setattr(bulk_router.bulk_operations_service, "run_job", run_job)
+    return runs
+
+
+@pytest.mark.parametrize("status", [BulkJobStatus.PENDING, BulkJobStatus.RUNNING])
+def test_resume_without_redis_rejects_job_that_is_not_failed(client, db, agent, agent_headers, no_redis, status):
+    props = _properties(db, agent, 1)
+    job = _service().create_job(db, "enrich", property_ids=[props[0].id])
+    job.status = status
+    db.commit()
+
+    response = client.post(f"/bulk/jobs/{job.id}/resume", headers=agent_headers)
+
+    assert response.status_code == 409
+    assert no_redis == []
+
+
+def test_resume_without_redis_reruns_failed_job_once(client, db, agent, agent_headers, no_redis):
+    props = _properties(db, agent, 1)
+    job = _service().create_job(db, "enrich", property_ids=[props[0].id])
+    job.status = BulkJobStatus.FAILED
+    db.commit()
+
+    first = client.post(f"/bulk/jobs/{job.id}/resume", headers=agent_headers)
+    second = client.post(f"/bulk/jobs/{job.id}/resume", headers=agent_headers)
+
+    assert first.status_code == 202
+    assert first.json()["status"] == BulkJobStatus.PENDING
+    assert second.status_code == 409
+    assert no_redis == [job.id]
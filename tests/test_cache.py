@@ -0,0 +1,78 @@
+"""Tests for the bounded in-process TTL cache."""
+
+from unittest.mock import patch
+
+from app.services.cache import TTLCache, all_caches
+
+
+class TestTTLCache:
+    def test_get_set_and_counters(self):
+        cache = TTLCache()
+        assert cache.get("missing") is None
+        cache.set("a", {"v": 1}, ttl_seconds=60)
+        assert cache.get("a") == {"v": 1}
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["total_entries"] == 1
+
+    def test_entries_expire_on_access(self):
+        cache = TTLCache()
+        with patch("app.services.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1, ttl_seconds=10)
+        with patch("app.services.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+        assert cache.stats()["expirations"] == 1
+
+    def test_lru_eviction_by_entry_count(self):
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1, ttl_seconds=60)
+        cache.set("b", 2, ttl_seconds=60)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3, ttl_seconds=60)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_byte_budget(self):
+        cache = TTLCache(max_bytes=20)
+        cache.set("a", "x" * 10, ttl_seconds=60)
+        cache.set("b", "y" * 10, ttl_seconds=60)
+        assert cache.get("a") is None
+        assert cache.get("b") == "y" * 10
+        cache.set("huge", "z" * 100, ttl_seconds=60)
+        assert cache.get("huge") is None
+        assert cache.stats()["bytes"] <= 20
+
+    def test_named_caches_are_registered(self):
+        assert {"google_places", "zillow", "docuseal"} <= set(all_caches())
+
+    def test_expired_entries_are_only_counted_on_request(self):
+        cache = TTLCache()
+        with patch("app.services.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1, ttl_seconds=10)
+            cache.set("b", 2, ttl_seconds=60)
+        with patch("app.services.cache.time.monotonic", return_value=120.0):
+            assert "valid_entries" not in cache.stats()
+            stats = cache.stats(count_expired=True)
+        assert (stats["total_entries"], stats["valid_entries"], stats["expired_entries"]) == (2, 1, 1)
+
+    def test_metrics_export_cache_events_as_counters(self):
+        from prometheus_client import REGISTRY
+
+        from app.middleware.metrics import metrics_endpoint
+
+        cache = TTLCache("metrics_counter_test")
+        labels = {"cache": "metrics_counter_test", "event": "hits"}
+        cache.set("a", 1, ttl_seconds=60)
+        cache.get("a")
+        metrics_endpoint(None)
+        assert REGISTRY.get_sample_value("cache_events_total", labels) == 1
+
+        cache.get("a")
+        cache.get("a")
+        metrics_endpoint(None)
+        metrics_endpoint(None)
+        assert REGISTRY.get_sample_value("cache_events_total", labels) == 3
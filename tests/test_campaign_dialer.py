@@ -0,0 +1,231 @@
+"""Tests for the concurrent, paced voice campaign dialer."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+from app.models.property_recap import PropertyRecap
+from app.models.voice_campaign import VoiceCampaign, VoiceCampaignTarget
+from app.services.campaign_dialer import CampaignDialer
+from app.utils.rate_limit import TokenBucket
+from app.services.vapi_service import vapi_service
+from app.services.voice_campaign_service import CampaignTargetStatus, voice_campaign_service
+from app.utils.http_clients import http_clients
+from tests.conftest import TestingSessionLocal
+
+
+class FakeVapi:
+    """Stands in for the Vapi API on the pooled ``vapi`` client."""
+
+    def __init__(self, latency: float = 0.02, fail_numbers: set[str] | None = None):
+        self.latency = latency
+        self.fail_numbers = fail_numbers or set()
+        self.calls: list[dict] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        self.calls.append(payload)
+        if payload["customer"]["number"] in self.fail_numbers:
+            return httpx.Response(500, json={"error": "upstream"})
+        return httpx.Response(201, json={"id": f"call-{len(self.calls)}", "status": "queued"})
+
+    def install(self) -> None:
+        http_clients.get("vapi")
+        http_clients._transports["vapi"].inner = httpx.MockTransport(self)
+
+
+@pytest.fixture(autouse=True)
+def vapi_key(monkeypatch):
+    monkeypatch.setattr(vapi_service, "api_key", "test-key")
+
+
+def _campaign(db, prop, name, n_targets, rate=60, max_attempts=3):
+    campaign = VoiceCampaign(
+        name=name,
+        status="active",
+        call_purpose="property_update",
+        property_id=prop.id,
+        max_attempts=max_attempts,
+        retry_delay_minutes=30,
+        rate_limit_per_minute=rate,
+        assistant_overrides={"name": "Test assistant"},
+    )
+    db.add(campaign)
+    db.flush()
+    db.add_all(
+        VoiceCampaignTarget(
+            campaign_id=campaign.id,
+            phone_number=f"+1555{campaign.id:03d}{i:04d}",
+            status=CampaignTargetStatus.QUEUED,
+            attempts_made=0,
+        )
+        for i in range(n_targets)
+    )
+    db.commit()
+    return campaign
+
+
+@pytest.fixture()
+def recap(db, sample_property):
+    row = PropertyRecap(property_id=sample_property.id, recap_text="Recap", recap_context={})
+    db.add(row)
+    db.commit()
+    return row
+
+
+def _dialer(**kwargs):
+    return CampaignDialer(voice_campaign_service, session_factory=TestingSessionLocal, **kwargs)
+
+
+def _statuses(db, campaign):
+    db.expire_all()
+    return [t.status for t in db.query(VoiceCampaignTarget).filter_by(campaign_id=campaign.id)]
+
+
+async def test_dials_campaigns_concurrently_under_global_cap(db, sample_property, recap):
+    fake = FakeVapi(latency=0.05)
+    fake.install()
+    campaigns = [_campaign(db, sample_property, f"C{i}", 4) for i in range(3)]
+
+    summaries = await _dialer(max_concurrency=5).run(db, campaigns, max_calls_per_campaign=10)
+
+    assert all(s["calls_started"] == 4 for s in summaries.values())
+    assert 1 < fake.max_active <= 5
+    for campaign in campaigns:
+        assert _statuses(db, campaign) == [CampaignTargetStatus.IN_PROGRESS] * 4
+    call_ids = {t.last_call_id for t in db.query(VoiceCampaignTarget)}
+    assert len(call_ids) == 12 and None not in call_ids
+
+
+async def test_token_bucket_paces_each_campaign(db, sample_property, recap):
+    FakeVapi(latency=0).install()
+    campaign = _campaign(db, sample_property, "Paced", 5, rate=3)
+    dialer = _dialer()
+
+    first = await dialer.run(db, [campaign], max_calls_per_campaign=10)
+    second = await dialer.run(db, [campaign], max_calls_per_campaign=10)
+
+    assert first[campaign.id]["calls_started"] == 3
+    assert second[campaign.id]["targets_processed"] == 0
+    assert _statuses(db, campaign).count(CampaignTargetStatus.QUEUED) == 2
+
+
+async def test_launch_order_is_round_robin_across_campaigns(db, sample_property, recap):
+    fake = FakeVapi(latency=0)
+    fake.install()
+    big = _campaign(db, sample_property, "Big", 4)
+    small = _campaign(db, sample_property, "Small", 2)
+
+    await _dialer(max_concurrency=1).run(db, [big, small], max_calls_per_campaign=10)
+
+    order = [c["assistant"]["metadata"]["campaign_id"] for c in fake.calls]
+    assert order == [big.id, small.id, big.id, small.id, big.id, big.id]
+
+
+async def test_failed_call_start_schedules_retry(db, sample_property, recap):
+    campaign = _campaign(db, sample_property, "Flaky", 2)
+    failing = db.query(VoiceCampaignTarget).filter_by(campaign_id=campaign.id).first().phone_number
+    FakeVapi(latency=0, fail_numbers={failing}).install()
+
+    summary = (await _dialer().run(db, [campaign], max_calls_per_campaign=10))[campaign.id]
+
+    assert summary == {"targets_processed": 2, "calls_started": 1, "retries_scheduled": 1, "exhausted": 0}
+    db.expire_all()
+    target = db.query(VoiceCampaignTarget).filter_by(phone_number=failing).one()
+    assert target.status == CampaignTargetStatus.QUEUED
+    assert target.attempts_made == 1
+    assert target.last_disposition == "retry_scheduled"
+
+
+async def test_outcomes_written_in_batches(db, sample_property, recap):
+    FakeVapi(latency=0).install()
+    campaign = _campaign(db, sample_property, "Bulk", 5)
+    statements = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE voice_campaign_targets"):
+            statements.append(executemany)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        await _dialer(write_batch_size=2).run(db, [campaign], max_calls_per_campaign=10)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    # One claim, then 5 outcomes in batches of 2 -> 3 UPDATE round trips
+    assert len(statements) == 4
+    assert _statuses(db, campaign) == [CampaignTargetStatus.IN_PROGRESS] * 5
+
+
+def test_token_bucket_refills_at_rate():
+    now = [0.0]
+    bucket = TokenBucket(6, clock=lambda: now[0])
+
+    assert bucket.take(10) == 6
+    assert bucket.take(1) == 0
+    assert bucket.seconds_until_available() == pytest.approx(10.0)
+    now[0] = 25.0
+    assert bucket.take(10) == 2
+    bucket.refund(1)
+    assert bucket.take(10) == 1
+
+
+
+async def test_webhook_outcome_is_not_overwritten_by_batched_write(db, sample_property, recap):
+    campaign = _campaign(db, sample_property, "Fast", 2)
+    fast = db.query(VoiceCampaignTarget).filter_by(campaign_id=campaign.id).first()
+    fake = FakeVapi(latency=0)
+
+    async def hang_up_immediately(request: httpx.Request) -> httpx.Response:
+        response = await fake(request)
+        payload = json.loads(request.content)
+        if payload["customer"]["number"] == fast.phone_number:
+            # The call ends and its webhook is handled before the tick writes back
+            with TestingSessionLocal() as webhook_db:
+                voice_campaign_service.handle_vapi_webhook(webhook_db, {
+                    "type": "end-of-call-report",
+                    "status": "ended",
+                    "endedReason": "customer-ended-call",
+                    "assistant": {"metadata": payload["assistant"]["metadata"]},
+                })
+        return response
+
+    http_clients.get("vapi")
+    http_clients._transports["vapi"].inner = httpx.MockTransport(hang_up_immediately)
+
+    await _dialer(write_batch_size=10).run(db, [campaign], max_calls_per_campaign=10)
+
+    db.expire_all()
+    by_id = {t.id: t for t in db.query(VoiceCampaignTarget).filter_by(campaign_id=campaign.id)}
+    assert by_id[fast.id].status == CampaignTargetStatus.COMPLETED
+    assert by_id[fast.id].last_disposition == "completed"
+    assert [t.status for i, t in by_id.items() if i != fast.id] == [CampaignTargetStatus.IN_PROGRESS]
+
+
+async def test_overlapping_ticks_never_dial_a_target_twice(db, sample_property, recap):
+    fake = FakeVapi(latency=0.05)
+    fake.install()
+    campaign = _campaign(db, sample_property, "Shared", 3)
+
+    with TestingSessionLocal() as other_db:
+        other = other_db.get(VoiceCampaign, campaign.id)
+        results = await asyncio.gather(
+            _dialer().run(db, [campaign], max_calls_per_campaign=10),
+            _dialer().run(other_db, [other], max_calls_per_campaign=10),
+        )
+
+    assert sorted(r[campaign.id]["calls_started"] for r in results) == [0, 3]
+    assert len(fake.calls) == 3
+    assert _statuses(db, campaign) == [CampaignTargetStatus.IN_PROGRESS] * 3
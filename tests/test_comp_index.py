@@ -0,0 +1,209 @@
+"""Tests for the geohash comp candidate index."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.models.property import Property, PropertyStatus, PropertyType
+from app.models.zillow_enrichment import ZillowEnrichment
+from app.services.agentic.comps import recency_cutoff, recency_months, similarity_score, similarity_scores
+from app.services.comp_index import find_comp_candidates, rank_comp_candidates
+from app.utils.geo import covering_cells, encode_geohash, haversine_mi, prefix_range
+
+# Newark, NJ
+SUBJECT = (40.7357, -74.1724)
+
+
+def _offset(miles_north: float = 0.0, miles_east: float = 0.0) -> tuple[float, float]:
+    lat, lng = SUBJECT
+    return lat + miles_north / 69.09, lng + miles_east / (69.09 * np.cos(np.radians(lat)))
+
+
+def _property(db, agent, name, coords, **overrides):
+    fields = dict(
+        title=name,
+        address=f"{name} Street",
+        city="Newark",
+        state="NJ",
+        zip_code="07102",
+        price=300000.0,
+        bedrooms=3,
+        bathrooms=2.0,
+        square_feet=1500,
+        property_type=PropertyType.HOUSE,
+        status=PropertyStatus.NEW_PROPERTY,
+        agent_id=agent.id,
+    )
+    fields.update(overrides)
+    if coords is not None:
+        fields["geo_lat"], fields["geo_lng"] = coords
+    prop = Property(**fields)
+    db.add(prop)
+    db.commit()
+    return prop
+
+
+def test_geohash_matches_reference_value():
+    assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+
+def test_covering_cells_contain_every_point_on_the_circle():
+    lat, lng = SUBJECT
+    for radius in (0.25, 1.0, 10.0):
+        cells = covering_cells(lat, lng, radius)
+        for bearing in np.linspace(0, 2 * np.pi, 16, endpoint=False):
+            north, east = radius * np.cos(bearing) * 0.999, radius * np.sin(bearing) * 0.999
+            point = encode_geohash(*_offset(north, east))
+            assert any(point.startswith(cell) for cell in cells)
+
+
+def test_prefix_range_bounds_stored_hashes():
+    low, high = prefix_range("dr5r")
+    assert low <= encode_geohash(*SUBJECT) <= high
+
+
+def test_haversine_is_vectorized():
+    distances = haversine_mi(SUBJECT[0], SUBJECT[1], np.array([SUBJECT[0], 40.7128]), np.array([SUBJECT[1], -74.0060]))
+    assert distances[0] == pytest.approx(0.0)
+    assert distances[1] == pytest.approx(8.8, abs=0.3)  # Newark -> Manhattan
+
+
+def test_recency_cutoff_matches_recency_months():
+    today = date(2026, 3, 15)
+    cutoff = recency_cutoff(12, today)
+    assert cutoff == date(2025, 3, 1)
+    assert recency_months(cutoff, today) == 12
+    assert recency_months(cutoff - timedelta(days=1), today) == 13
+
+
+def test_vectorized_scores_match_scalar_score():
+    today = date.today()
+    rows = [
+        (0.1, 1500, 3, 2.0, today),
+        (0.9, 1200, 4, 1.0, today.replace(day=1) - timedelta(days=200)),
+        (0.5, None, None, None, None),
+        (0.3, 0, 2, 3.5, today),
+    ]
+    expected = [
+        similarity_score(
+            distance_mi=d,
+            radius_mi=1.0,
+            target_sqft=1500,
+            candidate_sqft=sqft,
+            target_beds=3,
+            candidate_beds=beds,
+            target_baths=2.0,
+            candidate_baths=baths,
+            sale_or_list_date=when,
+        )
+        for d, sqft, beds, baths, when in rows
+    ]
+
+    def col(i):
+        return np.array([np.nan if r[i] is None else r[i] for r in rows], dtype=float)
+
+    scores = similarity_scores(
+        distance_mi=col(0),
+        radius_mi=1.0,
+        target_sqft=1500,
+        candidate_sqft=col(1),
+        target_beds=3,
+        candidate_beds=col(2),
+        target_baths=2.0,
+        candidate_baths=col(3),
+        months=np.array([recency_months(r[4]) for r in rows], dtype=float),
+    )
+    assert scores.tolist() == pytest.approx(expected)
+
+
+def test_candidates_fetched_by_true_radius(db, agent):
+    near = _property(db, agent, "Near", _offset(0.4))
+    _property(db, agent, "Far", _offset(1.6))
+    _property(db, agent, "Unplaced", None)
+
+    candidates = find_comp_candidates(db, lat=SUBJECT[0], lng=SUBJECT[1], radius_mi=1.0)
+
+    assert [p.id for p in candidates.properties] == [near.id]
+    assert candidates.distance_mi[0] == pytest.approx(0.4, abs=0.01)
+    assert candidates.exact_distance
+
+
+def test_hard_filters_run_in_sql(db, agent):
+    keep = _property(db, agent, "Keep", _offset(0.2), square_feet=1600, bedrooms=4, bathrooms=2.5)
+    _property(db, agent, "Huge", _offset(0.2), square_feet=4000)
+    _property(db, agent, "Studio", _offset(0.2), bedrooms=1)
+    _property(db, agent, "Spa", _offset(0.2), bathrooms=4.0)
+    stale = _property(db, agent, "Stale", _offset(0.2))
+    stale.created_at = stale.updated_at = datetime.now(timezone.utc) - timedelta(days=500)
+    db.commit()
+
+    candidates = find_comp_candidates(
+        db,
+        lat=SUBJECT[0],
+        lng=SUBJECT[1],
+        radius_mi=1.0,
+        target_sqft=1500,
+        target_beds=3,
+        target_baths=2.0,
+        max_recency_months=12,
+    )
+
+    assert [p.id for p in candidates.properties] == [keep.id]
+
+
+def test_rank_orders_closer_candidates_higher(db, agent):
+    close = _property(db, agent, "Close", _offset(0.1))
+    farther = _property(db, agent, "Farther", _offset(0, 0.8))
+
+    candidates = find_comp_candidates(db, lat=SUBJECT[0], lng=SUBJECT[1], radius_mi=1.0)
+    scores = dict(zip((p.id for p in candidates.properties), rank_comp_candidates(candidates, radius_mi=1.0)))
+
+    assert scores[close.id] > scores[farther.id]
+
+
+def test_rent_candidates_join_enrichment(db, agent):
+    rented = _property(db, agent, "Rented", _offset(0.3))
+    _property(db, agent, "NoRent", _offset(0.3))
+    db.add(ZillowEnrichment(property_id=rented.id, rent_zestimate=2400.0))
+    db.commit()
+
+    candidates = find_comp_candidates(db, lat=SUBJECT[0], lng=SUBJECT[1], radius_mi=1.0, with_rent=True)
+
+    assert [p.id for p in candidates.properties] == [rented.id]
+    assert candidates.rents == [2400.0]
+
+
+def test_subject_without_coordinates_falls_back_to_city(db, agent):
+    same_zip = _property(db, agent, "SameZip", None)
+    _property(db, agent, "Elsewhere", None, city="Trenton", zip_code="08601")
+
+    candidates = find_comp_candidates(
+        db, lat=None, lng=None, radius_mi=1.0, city="newark", state="NJ", zip_code="07102"
+    )
+
+    assert [p.id for p in candidates.properties] == [same_zip.id]
+    assert not candidates.exact_distance
+
+
+def test_candidates_without_coordinates_match_by_city(db, agent):
+    near = _property(db, agent, "Near", _offset(0.4))
+    legacy = _property(db, agent, "Legacy", None)
+    _property(db, agent, "OtherTown", None, city="Trenton", zip_code="08601")
+
+    candidates = find_comp_candidates(
+        db, lat=SUBJECT[0], lng=SUBJECT[1], radius_mi=1.0, city="Newark", state="NJ", zip_code="07102"
+    )
+
+    assert [p.id for p in candidates.properties] == [near.id, legacy.id]
+    assert candidates.proxy_distance.tolist() == [False, True]
+    assert candidates.distance_mi[1] == 0.5
+
+
+def test_geohash_follows_coordinates(db, agent):
+    prop = _property(db, agent, "Moves", SUBJECT)
+    assert prop.geohash == encode_geohash(*SUBJECT)
+
+    prop.geo_lat = prop.geo_lng = None
+    db.commit()
+    assert prop.geohash is None
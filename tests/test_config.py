@@ -16,6 +16,8 @@ class TestSettings:
         assert s.campaign_worker_enabled is True
         assert s.campaign_worker_interval_seconds == 15
         assert s.campaign_worker_max_calls_per_tick == 5
+        assert s.campaign_dialer_max_concurrency == 20
+        assert s.vapi_base_url == "https://api.vapi.ai"
         assert s.daily_digest_enabled is True
         assert s.daily_digest_hour == 8
         assert s.redis_host == "localhost"
@@ -0,0 +1,119 @@
+"""Tests for materialized contact list membership."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.contact import Contact, ContactRole
+from app.models.contact_lists import ContactList, ListType, SmartListRule
+from app.models.direct_mail import DirectMail, MailType
+from app.services import contact_list_membership as membership
+
+
+def _smart_list(db, agent, rule, **kwargs):
+    contact_list = ContactList(agent_id=agent.id, name=rule, list_type=ListType.SMART, smart_rule=rule, **kwargs)
+    db.add(contact_list)
+    db.commit()
+    membership.rebuild(db, contact_list)
+    return contact_list
+
+
+def _member_ids(db, contact_list):
+    return [c.id for c in contact_list.get_contacts_query(db)]
+
+
+def _contact(db, sample_property, name, **kwargs):
+    contact = Contact(property_id=sample_property.id, name=name, role=ContactRole.BUYER, **kwargs)
+    db.add(contact)
+    db.commit()
+    return contact
+
+
+def test_rebuild_applies_rule_and_location_filters(db, agent, sample_property):
+    with_email = _contact(db, sample_property, "Has Email", email="a@example.com")
+    _contact(db, sample_property, "No Email")
+
+    has_email = _smart_list(db, agent, SmartListRule.HAS_EMAIL)
+    elsewhere = _smart_list(db, agent, SmartListRule.HAS_EMAIL, filters={"city": "Elsewhere"})
+
+    assert _member_ids(db, has_email) == [with_email.id]
+    assert has_email.total_contacts == 1
+    assert elsewhere.total_contacts == 0
+
+
+def test_contact_changes_update_smart_lists_incrementally(db, agent, sample_property):
+    has_email = _smart_list(db, agent, SmartListRule.HAS_EMAIL)
+    no_phone = _smart_list(db, agent, SmartListRule.NO_PHONE)
+
+    contact = _contact(db, sample_property, "New Lead", email="lead@example.com")
+    db.refresh(has_email)
+    db.refresh(no_phone)
+    assert (has_email.total_contacts, no_phone.total_contacts) == (1, 1)
+    assert has_email.last_contact_added_at is not None
+
+    contact.email = None
+    contact.phone = "555-0101"
+    db.commit()
+    db.refresh(has_email)
+    db.refresh(no_phone)
+    assert (has_email.total_contacts, no_phone.total_contacts) == (0, 0)
+    assert _member_ids(db, has_email) == []
+
+    contact.phone = None
+    db.commit()
+    db.delete(contact)
+    db.commit()
+    db.refresh(no_phone)
+    assert no_phone.total_contacts == 0
+
+
+def test_first_mail_removes_contact_from_uncontacted(db, agent, sample_property):
+    contact = _contact(db, sample_property, "Fresh Lead")
+    uncontacted = _smart_list(db, agent, SmartListRule.UNSCONTACTED)
+    assert uncontacted.total_contacts == 1
+
+    db.add(DirectMail(agent_id=agent.id, contact_id=contact.id, mail_type=MailType.POSTCARD, to_address={}, from_address={}))
+    db.commit()
+
+    db.refresh(uncontacted)
+    assert uncontacted.total_contacts == 0
+
+
+def test_time_window_members_expire(db, agent, sample_property):
+    _contact(db, sample_property, "Recent")
+    last_week = _smart_list(db, agent, SmartListRule.LAST_7_DAYS)
+    assert last_week.total_contacts == 1
+
+    assert membership.expire_members(db, last_week, now=datetime.utcnow() + timedelta(days=8)) == 1
+    assert last_week.total_contacts == 0
+    assert _member_ids(db, last_week) == []
+
+
+def test_manual_members_page_by_keyset(db, agent, sample_property):
+    contacts = [_contact(db, sample_property, f"Contact {i}") for i in range(5)]
+    manual = ContactList(agent_id=agent.id, name="Manual", list_type=ListType.MANUAL)
+    db.add(manual)
+    db.commit()
+
+    assert membership.add_members(db, manual, [c.id for c in contacts] + [contacts[0].id]) == 5
+    assert membership.remove_members(db, manual, [contacts[2].id]) == 1
+    assert manual.total_contacts == 4
+
+    pages = list(membership.iter_member_ids(db, manual.id, page_size=3))
+    expected = [c.id for c in contacts if c is not contacts[2]]
+    assert pages == [expected[:3], expected[3:]]
+
+
+def test_no_property_rule_is_rejected(db, agent, sample_property):
+    _contact(db, sample_property, "Linked")
+    with pytest.raises(ValueError):
+        membership.rule_conditions(agent.id, SmartListRule.NO_PROPERTY, None, datetime.utcnow())
+
+    legacy = ContactList(agent_id=agent.id, name="Legacy", list_type=ListType.SMART, smart_rule=SmartListRule.NO_PROPERTY)
+    db.add(legacy)
+    db.commit()
+    assert membership.refresh_due_lists(db) == {"expired": 0, "rebuilt": 0}
+
+    _contact(db, sample_property, "Another")
+    db.refresh(legacy)
+    assert legacy.total_contacts in (None, 0)
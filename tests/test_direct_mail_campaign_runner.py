@@ -0,0 +1,252 @@
+"""Tests for the bulk direct mail campaign pipeline."""
+
+import asyncio
+
+import httpx
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.models.contact import Contact, ContactRole
+from app.models.direct_mail import DirectMail, DirectMailCampaign, MailStatus, MailType
+from app.models.skip_trace import SkipTrace
+from app.services.direct_mail_campaign_runner import (
+    DirectMailCampaignRunner,
+    claim_campaign,
+    load_recipients,
+    unfinished_campaign_ids,
+)
+from app.services.lob_service import LobClient, lob_verification_cache, normalize_address_key
+from tests.conftest import TestingSessionLocal
+
+
+class FakeLob:
+    """In-memory stand-in for LobClient; honours idempotency keys like Lob does.
+
+    ``transient`` and ``rejected`` hold recipient names whose submission fails.
+    """
+
+    def __init__(self):
+        self.verified = []
+        self.submitted = {}
+        self.calls = 0
+        self.transient = set()
+        self.rejected = set()
+
+    async def verify_address_cached(self, address):
+        self.verified.append(address["address_line1"])
+        await asyncio.sleep(0)
+        return {"primary_line": address["address_line1"].upper(), "deliverability": "deliverable", "components": {}}
+
+    async def create_postcard(self, *, idempotency_key, to_address, **kwargs):
+        self.calls += 1
+        if to_address["name"] in self.transient:
+            request = httpx.Request("POST", "http://lob/postcards")
+            raise httpx.HTTPStatusError("busy", request=request, response=httpx.Response(503, request=request))
+        if to_address["name"] in self.rejected:
+            request = httpx.Request("POST", "http://lob/postcards")
+            raise httpx.HTTPStatusError("bad", request=request, response=httpx.Response(422, request=request))
+        piece = self.submitted.setdefault(idempotency_key, {
+            "id": f"psc_{len(self.submitted)}", "status": "processing", "expected_cost": 75,
+        })
+        return piece
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def campaign_factory(db, agent, sample_property):
+    def make(contact_count=3, **kwargs):
+        contacts = [
+            Contact(property_id=sample_property.id, name=f"Owner {i}", role=ContactRole.BUYER)
+            for i in range(contact_count)
+        ]
+        db.add_all(contacts)
+        db.add(SkipTrace(
+            property_id=sample_property.id,
+            owner_name="Pat Owner",
+            mailing_address="9 Mailing Rd",
+            mailing_city="Elsewhere",
+            mailing_state="NJ",
+            mailing_zip="07002",
+        ))
+        db.flush()
+        campaign = DirectMailCampaign(
+            agent_id=agent.id,
+            name="Spring farm",
+            campaign_type="just_sold",
+            mail_type=MailType.POSTCARD,
+            target_contact_ids=[c.id for c in contacts],
+            **kwargs,
+        )
+        db.add(campaign)
+        db.commit()
+        return campaign
+    return make
+
+
+def _runner(lob):
+    return DirectMailCampaignRunner(
+        session_factory=TestingSessionLocal,
+        client_factory=lambda: lob,
+        max_concurrency=4,
+        write_batch_size=2,
+    )
+
+
+def test_recipients_use_skip_trace_mailing_address(db, campaign_factory, sample_property):
+    campaign = campaign_factory(contact_count=2, target_property_ids=[sample_property.id])
+
+    recipients = load_recipients(db, campaign)
+
+    # No seller contacts: the property contributes its skip-traced owner.
+    assert [r.name for r in recipients] == ["Pat Owner", "Owner 0", "Owner 1"]
+    assert all(r.to_address["address_line1"] == "9 Mailing Rd" for r in recipients)
+
+
+async def test_run_sends_every_piece_and_updates_counts(db, campaign_factory):
+    campaign = campaign_factory(contact_count=5)
+    lob = FakeLob()
+
+    summary = await _runner(lob).run(campaign.id)
+
+    db.expire_all()
+    pieces = db.query(DirectMail).filter(DirectMail.campaign_id == campaign.id).all()
+    assert summary["created"] == 5 and summary["sent"] == 5
+    assert {p.mail_status for p in pieces} == {MailStatus.PROCESSING}
+    assert all(p.to_address["address_line1"] == "9 MAILING RD" for p in pieces)
+    assert len({p.lob_mailpiece_id for p in pieces}) == 5
+    campaign = db.get(DirectMailCampaign, campaign.id)
+    assert campaign.status == "completed"
+    assert (campaign.sent_count, campaign.failed_count) == (5, 0)
+    assert campaign.total_cost == pytest.approx(3.75)
+
+
+async def test_transient_errors_leave_pieces_for_resume(db, campaign_factory):
+    campaign = campaign_factory(contact_count=4)
+    lob = FakeLob()
+    lob.transient = {"Owner 0", "Owner 1"}
+    lob.rejected = {"Owner 2"}
+    summary = await _runner(lob).run(campaign.id)
+
+    db.expire_all()
+    assert summary == {"sent": 1, "failed": 1, "pending": 2, "created": 4}
+    campaign = db.get(DirectMailCampaign, campaign.id)
+    assert campaign.status == "sending"
+    assert "2 pending" in campaign.description
+
+    # Resume: only the pending pieces are retried, and nothing is re-materialized.
+    lob.transient = set()
+    calls_before = lob.calls
+    summary = await _runner(lob).run(campaign.id)
+
+    db.expire_all()
+    assert summary == {"sent": 2, "failed": 0, "pending": 0, "created": 0}
+    assert lob.calls - calls_before == 2
+    campaign = db.get(DirectMailCampaign, campaign.id)
+    assert campaign.status == "completed"
+    assert (campaign.sent_count, campaign.failed_count) == (3, 1)
+
+
+async def test_lost_write_back_is_resubmitted_idempotently(db, campaign_factory):
+    campaign = campaign_factory(contact_count=2)
+    lob = FakeLob()
+    await _runner(lob).run(campaign.id)
+    # Simulate a crash after Lob accepted the pieces but before the write-back.
+    db.query(DirectMail).update({DirectMail.mail_status: MailStatus.DRAFT, DirectMail.lob_mailpiece_id: None})
+    db.commit()
+
+    await _runner(lob).run(campaign.id)
+
+    assert len(lob.submitted) == 2
+
+
+async def test_concurrent_runs_send_each_piece_once(db, campaign_factory):
+    campaign = campaign_factory(contact_count=3)
+    lob = FakeLob()
+
+    results = await asyncio.gather(_runner(lob).run(campaign.id), _runner(lob).run(campaign.id))
+
+    assert sorted(r.get("sent", 0) for r in results) == [0, 3]
+    assert lob.calls == 3
+    db.expire_all()
+    assert db.query(DirectMail).filter(DirectMail.campaign_id == campaign.id).count() == 3
+
+
+def test_claimed_campaign_is_not_resumed_or_claimed_again(db, campaign_factory):
+    campaign = campaign_factory(contact_count=1)
+
+    assert claim_campaign(db, campaign.id)
+    assert not claim_campaign(db, campaign.id)
+    assert campaign.id not in unfinished_campaign_ids(db)
+
+    # A crashed run's lease lapses and the campaign becomes resumable
+    db.expire_all()
+    db.get(DirectMailCampaign, campaign.id).run_lease_expires_at = None
+    db.commit()
+    assert campaign.id in unfinished_campaign_ids(db)
+    assert claim_campaign(db, campaign.id)
+
+
+async def test_recipient_is_materialized_once_per_campaign(db, campaign_factory):
+    campaign = campaign_factory(contact_count=1)
+    await _runner(FakeLob()).run(campaign.id)
+    piece = db.query(DirectMail).filter(DirectMail.campaign_id == campaign.id).one()
+
+    db.add(DirectMail(
+        agent_id=piece.agent_id,
+        campaign_id=campaign.id,
+        recipient_key=piece.recipient_key,
+        mail_type=MailType.POSTCARD,
+        to_address={},
+        from_address={},
+    ))
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.rollback()
+
+
+async def test_batch_verification_is_concurrent_cached_and_ordered(monkeypatch):
+    monkeypatch.setattr(lob_verification_cache, "use_l2", False)
+    lob_verification_cache.l1.clear()
+    client = LobClient(api_key="test_key", rate_limit_per_minute=60_000, max_concurrency=5)
+    in_flight = {"now": 0, "peak": 0, "calls": 0}
+
+    async def verify(address, secondary_line=""):
+        in_flight["now"] += 1
+        in_flight["calls"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return {"primary_line": address["address_line1"], "deliverability": "deliverable"}
+
+    monkeypatch.setattr(client, "verify_address", verify)
+    addresses = [
+        {"name": f"R{i}", "address_line1": f"{i % 8} Main Street", "address_city": "Town", "address_zip": "07001"}
+        for i in range(24)
+    ]
+    addresses.append({"name": "Dup", "address_line1": "0 main st.", "address_city": "TOWN", "address_zip": "07001-1234"})
+
+    results = await client.verify_address_batch(addresses)
+    await client.close()
+
+    assert [r["recipient"] for r in results] == [a["name"] for a in addresses]
+    assert in_flight["calls"] == 8
+    assert 1 < in_flight["peak"] <= 5
+
+
+def test_normalized_address_key_ignores_formatting():
+    assert normalize_address_key(
+        {"address_line1": "12 North Oak Street.", "address_city": "Newark", "address_state": "nj", "address_zip": "07102-1234"}
+    ) == normalize_address_key(
+        {"address_line1": "12 N oak st", "address_city": "NEWARK", "address_state": "NJ", "address_zip": "07102"}
+    )
+
+
+def test_execute_endpoint_rejects_a_campaign_being_sent(client, db, agent_headers, campaign_factory):
+    campaign = campaign_factory(contact_count=1)
+    assert claim_campaign(db, campaign.id)
+
+    response = client.post(f"/direct-mail/campaigns/{campaign.id}/execute", headers=agent_headers)
+
+    assert response.status_code == 409
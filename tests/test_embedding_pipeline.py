@@ -0,0 +1,144 @@
+"""Tests for the batched embedding pipeline."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import inspect, text
+
+from app.models.property import Property, PropertyStatus, PropertyType
+from app.services.embedding_pipeline import EmbeddingPipeline, StubEmbeddingBackend
+from app.services.embedding_service import content_hash, embedding_service
+from tests.conftest import TestingSessionLocal, engine
+
+
+@pytest.fixture()
+def embedding_column():
+    """SQLite has no pgvector; give properties a plain embedding column."""
+    columns = {c["name"] for c in inspect(engine).get_columns("properties")}
+    if "embedding" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE properties ADD COLUMN embedding TEXT"))
+
+
+def _seed(db, agent, n):
+    db.add_all(
+        Property(
+            title=f"{i} Main St",
+            address=f"{i} Main Street",
+            city="Testville",
+            state="NJ",
+            zip_code="07001",
+            price=100000.0 + i,
+            property_type=PropertyType.HOUSE,
+            status=PropertyStatus.NEW_PROPERTY,
+            agent_id=agent.id,
+        )
+        for i in range(n)
+    )
+    db.commit()
+
+
+class _CountingBackend(StubEmbeddingBackend):
+    def __init__(self, **kwargs):
+        super().__init__(dims=8, **kwargs)
+        self.sizes = []
+        self.active = 0
+        self.max_active = 0
+
+    async def embed(self, texts):
+        self.sizes.append(len(texts))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            return await super().embed(texts)
+        finally:
+            self.active -= 1
+
+
+def _pipeline(backend, **kwargs):
+    return EmbeddingPipeline(backend=backend, session_factory=TestingSessionLocal, **kwargs)
+
+
+class TestEmbeddingPipeline:
+    def test_backfill_then_refresh_skips_unchanged(self, db, agent, embedding_column):
+        _seed(db, agent, 25)
+        backend = _CountingBackend()
+        pipeline = _pipeline(backend, chunk_size=10, max_batch_items=8)
+
+        first = asyncio.run(pipeline.run("properties", only_missing=True))["tables"]["properties"]
+        assert first["embedded"] == 25
+        assert sum(backend.sizes) == 25
+        assert max(backend.sizes) <= 8
+        assert db.execute(text("SELECT COUNT(*) FROM properties WHERE embedding IS NULL")).scalar() == 0
+
+        refresh = asyncio.run(pipeline.run("properties", only_missing=False))["tables"]["properties"]
+        assert refresh["embedded"] == 0
+        assert refresh["unchanged"] == 25
+
+        prop = db.query(Property).order_by(Property.id).first()
+        prop.description = "Newly renovated kitchen"
+        db.commit()
+        refresh = asyncio.run(pipeline.run("properties", only_missing=False))["tables"]["properties"]
+        assert refresh["embedded"] == 1
+        assert refresh["unchanged"] == 24
+        db.refresh(prop)
+        assert prop.embedding_hash == content_hash(embedding_service._property_text(prop))
+
+    def test_batches_respect_token_budget_and_concurrency(self, db, agent, embedding_column):
+        _seed(db, agent, 40)
+        backend = _CountingBackend(latency_ms=5)
+        pipeline = _pipeline(backend, max_batch_tokens=60, max_concurrency=2)
+
+        result = asyncio.run(pipeline.run("properties", only_missing=True))["tables"]["properties"]
+        assert result["embedded"] == 40
+        assert len(backend.sizes) > 1
+        assert backend.max_active <= 2
+
+    def test_failed_batches_are_counted(self, db, agent, embedding_column):
+        _seed(db, agent, 3)
+
+        class FailingBackend:
+            async def embed(self, texts):
+                raise RuntimeError("upstream down")
+
+        pipeline = _pipeline(FailingBackend(), max_retries=0)
+        result = asyncio.run(pipeline.run("properties", only_missing=True))["tables"]["properties"]
+        assert result["embedded"] == 0
+        assert result["errors"] == 3
+
+    def test_tables_without_embedding_column_are_skipped(self):
+        pipeline = _pipeline(_CountingBackend())
+        result = asyncio.run(pipeline.run("dossiers"))["tables"]["dossiers"]
+        assert result["unsupported"] is True
+
+    def test_unknown_table(self):
+        with pytest.raises(ValueError):
+            asyncio.run(_pipeline(_CountingBackend()).run("nope"))
+
+
+class TestEmbedRecord:
+    def test_embed_property_skips_unchanged_text(self, db, sample_property, embedding_column, monkeypatch):
+        calls = []
+        monkeypatch.setattr(embedding_service, "generate_embedding", lambda t: calls.append(t) or [0.0] * 8)
+
+        assert embedding_service.embed_property(db, sample_property.id) is True
+        db.refresh(sample_property)
+        assert embedding_service.embed_property(db, sample_property.id) is True
+        assert len(calls) == 1
+
+    def test_matching_hash_without_vector_is_reembedded(self, db, sample_property, embedding_column, monkeypatch):
+        calls = []
+        monkeypatch.setattr(embedding_service, "generate_embedding", lambda t: calls.append(t) or [0.0] * 8)
+
+        assert embedding_service.embed_property(db, sample_property.id) is True
+        db.execute(text("UPDATE properties SET embedding = NULL WHERE id = :id"), {"id": sample_property.id})
+        db.commit()
+        db.refresh(sample_property)
+        assert embedding_service.embed_property(db, sample_property.id) is True
+        assert len(calls) == 2
+
+        db.execute(text("UPDATE properties SET embedding = NULL WHERE id = :id"), {"id": sample_property.id})
+        db.commit()
+        pipeline = _pipeline(_CountingBackend())
+        refresh = asyncio.run(pipeline.run("properties", only_missing=False))["tables"]["properties"]
+        assert (refresh["embedded"], refresh["unchanged"]) == (1, 0)
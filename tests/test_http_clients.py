@@ -0,0 +1,81 @@
+"""Tests for the shared outbound HTTP client registry."""
+
+import asyncio
+
+import httpx
+
+from app.utils.http_clients import HttpClientRegistry, PROFILES
+
+
+def _mock_transport(registry: HttpClientRegistry, name: str, handler) -> None:
+    """Swap the pooled transport's inner transport for a MockTransport."""
+    registry.get(name)
+    registry._transports[name].inner = httpx.MockTransport(handler)
+
+
+def test_same_client_reused_within_a_loop():
+    registry = HttpClientRegistry()
+
+    async def scenario():
+        first = registry.get("rapidapi")
+        async with registry.session("rapidapi") as second:
+            return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first is second
+    assert first.timeout.read == PROFILES["rapidapi"].timeout
+
+
+def test_client_rebuilt_for_new_event_loop():
+    registry = HttpClientRegistry()
+
+    async def grab():
+        return registry.get("exa")
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+
+    async def grab_and_settle():
+        client = registry.get("exa")
+        await asyncio.sleep(0)
+        return client
+
+    asyncio.run(grab_and_settle())
+    assert second.is_closed
+
+
+def test_unknown_name_uses_default_profile_and_counts_requests():
+    registry = HttpClientRegistry()
+
+    async def scenario():
+        _mock_transport(
+            registry,
+            "somewhere",
+            lambda request: httpx.Response(503 if request.url.path == "/down" else 200),
+        )
+        async with registry.session("somewhere") as client:
+            await client.get("https://example.test/ok")
+            await client.get("https://example.test/down")
+        return client.timeout.read
+
+    assert asyncio.run(scenario()) == PROFILES["default"].timeout
+    status = registry.status()["somewhere"]
+    assert status["requests"] == 2
+    assert status["errors"] == 1
+    assert status["in_flight"] == 0
+
+
+def test_borrowed_transport_survives_owner_close():
+    registry = HttpClientRegistry()
+
+    async def scenario():
+        _mock_transport(registry, "lob", lambda request: httpx.Response(200, json={"ok": True}))
+        owned = httpx.AsyncClient(base_url="https://lob.test", transport=registry.transport("lob"))
+        await owned.aclose()
+        shared = registry.get("lob")
+        response = await shared.get("https://lob.test/v1/ping")
+        await registry.aclose_all()
+        return response.json(), shared.is_closed
+
+    assert asyncio.run(scenario()) == ({"ok": True}, True)
@@ -0,0 +1,61 @@
+"""Tests for the MCP server's pooled backend client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from mcp_server.utils import http_client
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    """Route the pooled client through a MockTransport; yields in-flight counters."""
+    in_flight = {"now": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if request.url.path == "/missing":
+            return httpx.Response(404, json={"detail": "Not found"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    monkeypatch.setattr(
+        http_client,
+        "_build_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://backend"),
+    )
+    monkeypatch.setattr(http_client, "_client", None)
+    yield in_flight
+
+
+async def test_client_reused_across_calls(monkeypatch):
+    built = []
+    monkeypatch.setattr(http_client, "_client", None)
+    monkeypatch.setattr(http_client, "_build_client", lambda: built.append(1) or httpx.AsyncClient())
+
+    first = http_client.get_client()
+    second = http_client.get_client()
+    await http_client.aclose()
+
+    assert first is second
+    assert len(built) == 1
+    assert first.is_closed
+
+
+async def test_gather_keeps_order_and_respects_limit(monkeypatch, backend):
+    monkeypatch.setattr(http_client, "FANOUT_LIMIT", 2)
+
+    responses = await http_client.api_gather(*(http_client.api_get(f"/p/{i}") for i in range(6)))
+    await http_client.aclose()
+
+    assert [r.json()["path"] for r in responses] == [f"/p/{i}" for i in range(6)]
+    assert backend["peak"] == 2
+
+
+async def test_get_json_returns_default_on_error(backend):
+    assert await http_client.api_get_json("/missing", default={}) == {}
+    assert await http_client.api_get_json("/ok") == {"path": "/ok"}
+    await http_client.aclose()
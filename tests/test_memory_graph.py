@@ -0,0 +1,92 @@
+"""Tests for buffered memory graph writes and the single-query session summary."""
+
+from sqlalchemy import event
+
+from app.models.voice_memory import VoiceMemoryEdge, VoiceMemoryNode
+from app.services.memory_graph import MemoryRef, memory_graph_service
+
+
+class _StatementCounter:
+    def __init__(self, db):
+        self.engine = db.get_bind()
+        self.count = 0
+
+    def _count(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+
+
+def _remember_turn(db, session_id):
+    memory_graph_service.remember_property(db, session_id, 5, address="1 Main St", city="Testville", state="NJ")
+    memory_graph_service.remember_contact(db, session_id, 9, "Jane Buyer", role="buyer", property_id=5)
+    memory_graph_service.remember_contract(db, session_id, 3, "Purchase Agreement", property_id=5, contact_id=9)
+
+
+def test_turn_is_written_with_one_statement_per_table(db):
+    with _StatementCounter(db) as counter:
+        _remember_turn(db, "s1")
+        db.commit()
+    assert counter.count == 2
+
+    nodes = db.query(VoiceMemoryNode).filter_by(session_id="s1").all()
+    assert {(n.node_type, n.node_key) for n in nodes if n.node_type != "session_state"} == {
+        ("property", "5"), ("contact", "9"), ("contract", "3"),
+    }
+    # The edge endpoint upsert did not wipe the property's summary or payload
+    prop = next(n for n in nodes if n.node_type == "property")
+    assert prop.summary == "1 Main St" and prop.payload["city"] == "Testville"
+    assert db.query(VoiceMemoryEdge).filter_by(session_id="s1").count() == 3
+
+
+def test_repeat_upserts_merge_into_existing_rows(db):
+    memory_graph_service.upsert_node(db, "s2", "fact", "k", summary="first", payload={"v": 1}, importance=0.9)
+    db.commit()
+
+    memory_graph_service.upsert_node(db, "s2", "fact", "k", importance=0.2)
+    memory_graph_service.upsert_edge(db, "s2", MemoryRef("fact", "k"), MemoryRef("fact", "other"), "related", weight=0.4)
+    db.commit()
+    memory_graph_service.upsert_edge(db, "s2", MemoryRef("fact", "k"), MemoryRef("fact", "other"), "related", weight=0.7)
+    db.commit()
+
+    node = db.query(VoiceMemoryNode).filter_by(session_id="s2", node_key="k").one()
+    db.refresh(node)
+    assert (node.summary, node.payload, node.importance) == ("first", {"v": 1}, 0.9)
+    edge = db.query(VoiceMemoryEdge).filter_by(session_id="s2").one()
+    assert edge.weight == 0.7
+
+
+def test_session_summary_loads_in_one_query(db):
+    _remember_turn(db, "s3")
+    db.commit()
+    db.expire_all()
+    db.info.pop("memory_graph_buffer", None)
+
+    with _StatementCounter(db) as counter:
+        summary = memory_graph_service.get_session_summary(db, "s3")
+        assert memory_graph_service.get_session_state(db, "s3", "last_contract_name") == "Purchase Agreement"
+    assert counter.count == 1
+
+    assert summary["session_state"] == {
+        "last_property_id": 5,
+        "last_property_address": "1 Main St",
+        "last_contact_id": 9,
+        "last_contact_name": "Jane Buyer",
+        "last_contract_id": 3,
+        "last_contract_name": "Purchase Agreement",
+    }
+    assert summary["node_count"] == 9 and summary["edge_count"] == 3
+    assert {e["relation"] for e in summary["recent_edges"]} == {"associated_with", "for_property", "for_contact"}
+
+
+def test_rollback_discards_buffered_writes(db):
+    memory_graph_service.remember_session_state(db, "s4", "last_property_id", 1)
+    db.rollback()
+    db.commit()
+    assert db.query(VoiceMemoryNode).filter_by(session_id="s4").count() == 0
+    assert memory_graph_service.get_session_state(db, "s4", "last_property_id") is None
@@ -0,0 +1,87 @@
+"""Tests for the plain ASGI request middlewares."""
+
+import pytest
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware import metrics
+from app.middleware.api_key import ApiKeyMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.request_id import RequestIdMiddleware
+from app.rate_limit import RateLimitToggleMiddleware
+from tests.conftest import TEST_API_KEY
+
+
+@pytest.fixture()
+def stack_app():
+    app = FastAPI()
+
+    @app.get("/state")
+    def state(request: Request):
+        return {
+            "agent_id": request.state.agent_id,
+            "request_id": request.state.request_id,
+            "rate_limit_tier": request.state.rate_limit_tier,
+        }
+
+    @app.get("/health")
+    def health():
+        return {"ok": True}
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
+    @app.websocket("/ws")
+    async def ws(websocket: WebSocket):
+        await websocket.accept()
+        await websocket.send_text("hello")
+        await websocket.close()
+
+    app.add_middleware(RateLimitToggleMiddleware)
+    app.add_middleware(ApiKeyMiddleware)
+    app.add_middleware(RequestIdMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+class TestAsgiMiddlewareStack:
+    def test_sets_request_state(self, stack_app, agent):
+        client = TestClient(stack_app)
+        response = client.get("/state", headers={"x-api-key": TEST_API_KEY, "x-request-id": "req-123"})
+        assert response.status_code == 200
+        assert response.json() == {"agent_id": agent.id, "request_id": "req-123", "rate_limit_tier": "free"}
+        assert response.headers["X-Request-ID"] == "req-123"
+
+    def test_generates_request_id(self, stack_app):
+        response = TestClient(stack_app).get("/health")
+        assert response.status_code == 200
+        assert len(response.headers["X-Request-ID"]) == 36
+
+    def test_rejects_missing_and_invalid_keys(self, stack_app, agent):
+        client = TestClient(stack_app)
+        missing = client.get("/state")
+        assert missing.status_code == 401
+        assert missing.json()["message"] == "Missing API key"
+        assert "X-Request-ID" in missing.headers
+        invalid = client.get("/state", headers={"x-api-key": "nope"})
+        assert invalid.status_code == 401
+        assert invalid.json()["message"] == "Invalid API key"
+
+    def test_streaming_response_passes_through(self, stack_app, agent):
+        response = TestClient(stack_app).get("/stream", headers={"x-api-key": TEST_API_KEY})
+        assert response.status_code == 200
+        assert response.content == b"abc"
+        assert "X-Request-ID" in response.headers
+
+    def test_websocket_passes_through(self, stack_app):
+        with TestClient(stack_app).websocket_connect("/ws") as ws:
+            assert ws.receive_text() == "hello"
+
+    @pytest.mark.skipif(not metrics.PROMETHEUS_AVAILABLE, reason="prometheus_client not installed")
+    def test_metrics_record_status_code(self, stack_app):
+        labels = {"method": "GET", "endpoint": "/state", "status_code": "401"}
+        before = metrics.REQUEST_COUNT.labels(**labels)._value.get()
+        TestClient(stack_app).get("/state")
+        assert metrics.REQUEST_COUNT.labels(**labels)._value.get() == before + 1
@@ -0,0 +1,126 @@
+"""Tests for queued EventBus dispatch, history and the durable outbox."""
+
+import asyncio
+from datetime import datetime
+
+from app.services import event_subscribers
+from app.services.event_outbox import RedisStreamOutbox, decode_event, encode_event
+from app.services.observer import EventBus, EventType, PropertyEvent
+
+
+async def test_publish_returns_before_slow_subscribers_finish():
+    bus = EventBus()
+    release = asyncio.Event()
+    handled = []
+
+    async def slow(event):
+        await release.wait()
+        handled.append(event.property_id)
+
+    bus.subscribe(EventType.PROPERTY_CREATED, slow)
+    bus.subscribe(EventType.PROPERTY_CREATED, lambda event: handled.append("sync"))
+
+    await asyncio.wait_for(bus.publish(EventType.PROPERTY_CREATED, PropertyEvent(property_id=1, agent_id=1)), 0.5)
+    await asyncio.sleep(0)
+    assert handled == ["sync"]
+
+    release.set()
+    await bus.drain()
+    assert handled == ["sync", 1]
+    await bus.stop()
+
+
+async def test_subscriber_metrics_and_full_queue_drops():
+    bus = EventBus()
+
+    async def failing(event):
+        raise RuntimeError("boom")
+
+    subscriber = bus.subscribe(EventType.PROPERTY_UPDATED, failing, queue_size=2)
+    for i in range(3):
+        await bus.publish(EventType.PROPERTY_UPDATED, PropertyEvent(property_id=i, agent_id=1))
+    await bus.drain()
+
+    stats = subscriber.stats()
+    assert stats["dropped_count"] == 1
+    assert stats["error_count"] == 2 and stats["call_count"] == 0
+    assert stats["last_error"] == "boom"
+    assert stats["avg_latency_ms"] is not None
+    await bus.stop()
+
+
+async def test_history_is_a_ring_buffer_newest_first():
+    bus = EventBus(max_history_size=3)
+    for i in range(5):
+        event_type = EventType.PROPERTY_CREATED if i % 2 == 0 else EventType.PROPERTY_DELETED
+        await bus.publish(event_type, PropertyEvent(property_id=i, agent_id=1))
+
+    assert [e["data"]["property_id"] for e in bus.get_history()] == [4, 3, 2]
+    assert [e["data"]["property_id"] for e in bus.get_history(EventType.PROPERTY_CREATED, limit=1)] == [4]
+
+
+class FakeOutbox:
+    def __init__(self, available=True):
+        self.available = available
+        self.entries = []
+        self.appended = 0
+
+    async def append(self, event_type, event):
+        if self.available:
+            self.entries.append((event_type, encode_event(event)))
+        return self.available
+
+
+async def test_durable_subscribers_are_served_from_the_outbox():
+    outbox = FakeOutbox()
+    bus = EventBus(outbox=outbox)
+    local, durable = [], []
+    bus.subscribe(EventType.CONTRACT_CREATED, lambda e: local.append(e))
+    bus.subscribe(EventType.CONTRACT_CREATED, lambda e: durable.append(e), durable=True)
+
+    await bus.publish(EventType.CONTRACT_CREATED, PropertyEvent(property_id=7, agent_id=2, metadata={"a": 1}))
+    await bus.drain()
+    assert len(local) == 1 and durable == []
+
+    # What the worker does with the stream entry
+    event_type, payload = outbox.entries[0]
+    await bus.dispatch_durable(event_type, decode_event(payload))
+    assert durable[0].property_id == 7
+    assert isinstance(durable[0].timestamp, datetime)
+    assert durable[0].metadata == {"a": 1}
+
+    # Without the outbox, durable subscribers are dispatched in-process
+    outbox.available = False
+    await bus.publish(EventType.CONTRACT_CREATED, PropertyEvent(property_id=8, agent_id=2))
+    await bus.drain()
+    assert [e.property_id for e in durable] == [7, 8]
+    await bus.stop()
+
+
+class FakeStreamRedis:
+    def __init__(self):
+        self.acked = []
+
+    async def xack(self, stream, group, entry_id):
+        self.acked.append(entry_id)
+
+
+async def test_outbox_acks_only_events_a_durable_subscriber_handled(monkeypatch):
+    bus = EventBus()
+    handled = []
+    monkeypatch.setattr(event_subscribers, "DURABLE_SUBSCRIBERS", [
+        (EventType.CONTRACT_CREATED, lambda e: handled.append(e.property_id), "contract_recorder"),
+    ])
+    assert event_subscribers.register_durable_subscribers(bus) == 1
+    assert event_subscribers.register_durable_subscribers(bus) == 0
+
+    redis, outbox = FakeStreamRedis(), RedisStreamOutbox(stream="s", maxlen=10)
+    event = encode_event(PropertyEvent(property_id=3, agent_id=1))
+    await outbox._deliver(redis, bus, [
+        ("1-0", {"event_type": EventType.CONTRACT_CREATED.value, "payload": event}),
+        ("2-0", {"event_type": EventType.PROPERTY_CREATED.value, "payload": event}),
+    ])
+
+    assert handled == [3]
+    assert redis.acked == ["1-0"]
+    assert (outbox.delivered, outbox.unhandled) == (1, 1)
@@ -0,0 +1,104 @@
+"""Tests for the blob-backed portal page cache."""
+
+from datetime import timedelta
+
+from app.models.portal_cache import PortalCache
+from app.services.agentic.page_store import LocalPageBlobStore, compress, decompress
+from app.services.agentic.providers import PortalCacheService
+from app.services.agentic.utils import utcnow
+
+PAGE = "<html><body>" + "<p>3 bed colonial, 1,850 sqft, sold 2025</p>" * 200 + "</body></html>"
+
+
+def _cache(tmp_path, ttl_hours=24):
+    store = LocalPageBlobStore(tmp_path / "pages")
+    return PortalCacheService(ttl_hours=ttl_hours, store=store), store
+
+
+def test_round_trip_keeps_only_metadata_in_db(db, tmp_path):
+    cache, store = _cache(tmp_path)
+
+    cache.set(db, "https://example.com/a", PAGE)
+
+    record = db.query(PortalCache).one()
+    assert record.raw_html is None
+    assert record.html_bytes == len(PAGE)
+    assert record.stored_bytes < record.html_bytes
+    assert store.exists(record.content_hash)
+    assert cache.get(db, "https://example.com/a") == PAGE
+    assert cache.get(db, "https://example.com/missing") is None
+
+
+def test_identical_pages_share_one_blob(db, tmp_path):
+    cache, store = _cache(tmp_path)
+
+    cache.set(db, "https://example.com/a", PAGE)
+    cache.set(db, "https://example.com/b?ref=x", PAGE)
+
+    hashes = {r.content_hash for r in db.query(PortalCache).all()}
+    assert len(hashes) == 1
+    assert len(list((tmp_path / "pages").rglob("*"))) == 3  # two fan-out dirs + one blob
+
+
+def test_text_cached_alongside_html(db, tmp_path):
+    cache, store = _cache(tmp_path)
+    cache.set(db, "https://example.com/a", PAGE)
+    assert cache.get_text(db, "https://example.com/a") is None
+
+    cache.set_text(db, "https://example.com/a", "3 bed colonial")
+
+    assert cache.get_text(db, "https://example.com/a") == "3 bed colonial"
+    # Re-caching the same page keeps its text; new content drops it.
+    cache.set(db, "https://example.com/a", PAGE)
+    assert cache.get_text(db, "https://example.com/a") == "3 bed colonial"
+    cache.set(db, "https://example.com/a", PAGE + "<p>price cut</p>")
+    assert cache.get_text(db, "https://example.com/a") is None
+
+
+def test_replaced_page_blob_is_released(db, tmp_path):
+    cache, store = _cache(tmp_path)
+    cache.set(db, "https://example.com/a", PAGE)
+    old_hash = db.query(PortalCache).one().content_hash
+
+    cache.set(db, "https://example.com/a", PAGE + "<p>updated</p>")
+
+    assert not store.exists(old_hash)
+
+
+def test_garbage_collection_keeps_shared_blobs(db, tmp_path):
+    cache, store = _cache(tmp_path)
+    cache.set(db, "https://example.com/old", PAGE)
+    cache.set(db, "https://example.com/shared", PAGE)
+    cache.set(db, "https://example.com/gone", "<html>only here</html>")
+    gone_hash = db.query(PortalCache).filter(PortalCache.source_url.endswith("/gone")).one().content_hash
+    for url in ("https://example.com/old", "https://example.com/gone"):
+        record = db.query(PortalCache).filter(PortalCache.source_url == url).one()
+        record.expires_at = utcnow() - timedelta(minutes=1)
+    db.commit()
+
+    result = cache.collect_garbage(db)
+
+    assert result == {"entries_removed": 2, "blobs_removed": 1}
+    assert not store.exists(gone_hash)
+    assert cache.get(db, "https://example.com/shared") == PAGE
+
+
+def test_expired_and_legacy_rows(db, tmp_path):
+    cache, _ = _cache(tmp_path)
+    db.add(PortalCache(
+        url_hash=cache._url_hash("https://example.com/legacy"),
+        source_url="https://example.com/legacy",
+        raw_html="<html>inline</html>",
+        expires_at=utcnow() + timedelta(hours=1),
+    ))
+    db.commit()
+    cache.ttl_hours = -1
+    cache.set(db, "https://example.com/stale", PAGE)
+
+    assert cache.get(db, "https://example.com/legacy") == "<html>inline</html>"
+    assert cache.get(db, "https://example.com/stale") is None
+
+
+def test_compression_round_trip():
+    data = PAGE.encode()
+    assert decompress(compress(data)) == data
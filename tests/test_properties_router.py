@@ -1,8 +1,12 @@
 """Tests for the properties router (CRUD + filtering)."""
 
+import json
 from unittest.mock import patch, AsyncMock
 
-from app.models.property import PropertyStatus, PropertyType
+import pytest
+
+from app.models.property import Property, PropertyStatus, PropertyType
+from app.utils.pagination import apply_keyset, encode_cursor
 
 
 class TestCreateProperty:
@@ -104,6 +108,117 @@ class TestListProperties:
         assert len(response.json()) <= 1
 
 
+class TestListPropertiesKeyset:
+    @pytest.fixture()
+    def many_properties(self, db, agent):
+        props = [
+            Property(
+                title=f"{i} Keyset Rd", address=f"{i} Keyset Road", city="Cursorville",
+                state="NJ", zip_code="07001", price=100000.0 + i, agent_id=agent.id,
+                score_breakdown={"total": i},
+            )
+            for i in range(7)
+        ]
+        db.add_all(props)
+        db.commit()
+        return props
+
+    def test_cursor_walks_every_row_once(self, client, many_properties, agent_headers):
+        seen, cursor = [], None
+        while True:
+            url = "/properties/?limit=3&include_heartbeat=false"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = client.get(url, headers=agent_headers)
+            assert response.status_code == 200
+            seen.extend(p["id"] for p in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        assert sorted(seen) == sorted(p.id for p in many_properties)
+        assert len(seen) == len(set(seen))
+        assert seen == sorted(seen, reverse=True)
+
+    def test_cursor_walks_rows_with_null_created_at(self, client, db, many_properties, agent_headers):
+        null_ids = [p.id for p in many_properties[2:5]]
+        db.query(Property).filter(Property.id.in_(null_ids)).update(
+            {"created_at": None}, synchronize_session=False
+        )
+        db.commit()
+
+        seen, cursor = [], None
+        while True:
+            url = "/properties/?limit=2&include_heartbeat=false"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = client.get(url, headers=agent_headers)
+            assert response.status_code == 200
+            seen.extend(p["id"] for p in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        assert seen[:3] == sorted(null_ids, reverse=True)
+        assert sorted(seen) == sorted(p.id for p in many_properties)
+
+    def test_ascending_keyset_puts_null_created_at_last(self, db, many_properties):
+        null_ids = [p.id for p in many_properties[:2]]
+        db.query(Property).filter(Property.id.in_(null_ids)).update(
+            {"created_at": None}, synchronize_session=False
+        )
+        db.commit()
+
+        seen, cursor = [], None
+        while True:
+            rows = apply_keyset(db.query(Property), Property.created_at, Property.id, cursor,
+                                descending=False).limit(2).all()
+            seen.extend(p.id for p in rows)
+            if len(rows) < 2:
+                break
+            cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+        assert seen[-2:] == null_ids
+        assert sorted(seen) == sorted(p.id for p in many_properties)
+
+    def test_invalid_cursor(self, client, agent, agent_headers):
+        response = client.get("/properties/?cursor=not-a-cursor", headers=agent_headers)
+        assert response.status_code == 400
+
+    def test_fields_projection(self, client, many_properties, agent_headers):
+        response = client.get("/properties/?fields=address,price&limit=2", headers=agent_headers)
+        assert response.status_code == 200
+        rows = response.json()
+        assert len(rows) == 2
+        assert set(rows[0]) == {"id", "address", "price"}
+        assert response.headers.get("X-Next-Cursor")
+
+    def test_unknown_field(self, client, agent, agent_headers):
+        response = client.get("/properties/?fields=address,secret", headers=agent_headers)
+        assert response.status_code == 400
+        assert "secret" in response.json()["message"]
+
+    def test_ndjson_export(self, client, many_properties, agent_headers, monkeypatch):
+        from app.routers.core import properties as properties_router
+        monkeypatch.setattr(properties_router, "NDJSON_CHUNK_SIZE", 2)
+        real_factory, opened, closed = properties_router.SessionLocal, [], []
+
+        def _session(**kwargs):
+            session = real_factory(**kwargs)
+            opened.append(session)
+            real_close = session.close
+            session.close = lambda: (closed.append(session), real_close())
+            return session
+
+        monkeypatch.setattr(properties_router, "SessionLocal", _session)
+
+        response = client.get("/properties/?format=ndjson&fields=city,status", headers=agent_headers)
+        assert response.status_code == 200
+        # The stream reads through its own session and closes it
+        assert len(opened) == 1 and closed == opened
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == len(many_properties)
+        assert lines[0] == {"id": lines[0]["id"], "city": "Cursorville", "status": "new_property"}
+
+
 class TestGetProperty:
     def test_get_existing(self, client, sample_property, agent_headers):
         response = client.get(
@@ -0,0 +1,43 @@
+"""Tests for skip trace result caching."""
+
+import asyncio
+from unittest.mock import patch
+
+import app.services.skip_trace as skip_trace_module
+from app.services.skip_trace import RapidAPISkipTraceService
+from app.services.tiered_cache import TieredCache
+
+
+def _result(people):
+    if not people:
+        return {"owner_name": "Unknown Owner", "raw_response": {"PeopleDetails": []}}
+    return {"owner_name": people[0], "raw_response": {"person_count": len(people)}}
+
+
+def _trace_twice(responses):
+    service = RapidAPISkipTraceService()
+    calls = []
+
+    async def fetch(*args):
+        calls.append(args)
+        return _result(responses[len(calls) - 1])
+
+    async def scenario():
+        return [await service.skip_trace("1 Oak St", "Newark", "NJ", "07102") for _ in range(2)]
+
+    cache = TieredCache("skip_trace_test", ttl=60, use_l2=False)
+    with patch.object(skip_trace_module, "skip_trace_cache", cache), \
+            patch.object(service, "_fetch_skip_trace", fetch):
+        return asyncio.run(scenario()), calls
+
+
+def test_owner_hits_are_cached():
+    results, calls = _trace_twice([["Jane Doe"], ["Someone Else"]])
+    assert len(calls) == 1
+    assert [r["owner_name"] for r in results] == ["Jane Doe", "Jane Doe"]
+
+
+def test_no_people_found_is_not_cached():
+    results, calls = _trace_twice([[], ["Jane Doe"]])
+    assert len(calls) == 2
+    assert [r["owner_name"] for r in results] == ["Unknown Owner", "Jane Doe"]
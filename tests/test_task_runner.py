@@ -0,0 +1,145 @@
+"""Tests for the lease-based scheduled task runner."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import app.services.task_runner as task_runner_module
+from app.models.notification import Notification
+from app.models.scheduled_task import ScheduledTask, TaskStatus
+from app.services.scheduled_task_service import scheduled_task_service
+from app.services.task_runner import MAX_TASK_ATTEMPTS, TaskRunner
+from tests.conftest import TestingSessionLocal
+
+
+def _task(db, title="Call seller", minutes=-1, **kwargs):
+    return scheduled_task_service.create_task(
+        db, title=title, scheduled_at=datetime.now(timezone.utc) + timedelta(minutes=minutes), **kwargs
+    )
+
+
+def _runner(**kwargs):
+    return TaskRunner(session_factory=TestingSessionLocal, **kwargs)
+
+
+def _status(task_id):
+    db = TestingSessionLocal()
+    try:
+        return db.get(ScheduledTask, task_id).status
+    finally:
+        db.close()
+
+
+class TestClaims:
+    def test_each_due_task_is_claimed_once(self, db):
+        due = [_task(db).id for _ in range(3)]
+        _task(db, minutes=30)
+
+        first = scheduled_task_service.claim_due_tasks(db, "a", limit=2, lease_seconds=60)
+        second = scheduled_task_service.claim_due_tasks(db, "b", limit=10, lease_seconds=60)
+
+        assert len(first) == 2
+        assert sorted(first + second) == due
+        assert scheduled_task_service.claim_due_tasks(db, "c", limit=10, lease_seconds=60) == []
+
+    def test_stale_version_loses_the_race(self, db):
+        task = _task(db)
+        scheduled_task_service.claim_due_tasks(db, "a", limit=1, lease_seconds=-1)
+        # Lease already expired: reclaimable, but only by one runner per version
+        assert scheduled_task_service.claim_due_tasks(db, "b", limit=1, lease_seconds=60) == [task.id]
+        db.refresh(task)
+        assert task.lease_owner == "b"
+        assert task.lease_version == 2
+        assert task.attempts == 2
+
+    def test_extend_lease_requires_ownership(self, db):
+        task = _task(db)
+        scheduled_task_service.claim_due_tasks(db, "a", limit=1, lease_seconds=60)
+        assert scheduled_task_service.extend_lease(db, task.id, "a", 60) is True
+        assert scheduled_task_service.extend_lease(db, task.id, "b", 60) is False
+
+    def test_next_wakeup_at(self, db):
+        assert scheduled_task_service.next_wakeup_at(db) is None
+        _task(db, minutes=10)
+        sooner = _task(db, minutes=5)
+        wakeup = scheduled_task_service.next_wakeup_at(db)
+        assert abs((wakeup - sooner.scheduled_at.replace(tzinfo=timezone.utc)).total_seconds()) < 1
+
+
+class TestTaskRunner:
+    def test_reminder_creates_notification_and_recurring_reschedules(self, db):
+        reminder = _task(db)
+        recurring = _task(db, title="Weekly check", task_type="recurring", repeat_interval_hours=24)
+
+        assert asyncio.run(_runner().run_once()) == 2
+
+        db.expire_all()
+        assert _status(reminder.id) == TaskStatus.COMPLETED
+        assert _status(recurring.id) == TaskStatus.COMPLETED
+        assert db.query(Notification).count() == 2
+        pending = db.query(ScheduledTask).filter(ScheduledTask.status == TaskStatus.PENDING).all()
+        assert [t.title for t in pending] == ["Weekly check"]
+
+    def test_tasks_run_concurrently_within_bound(self, db, monkeypatch):
+        ids = [_task(db).id for _ in range(6)]
+        active = {"now": 0, "max": 0}
+
+        async def slow_execute(task_db, task, service):
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            await asyncio.sleep(0.2)
+            active["now"] -= 1
+            service.mark_completed(task_db, task)
+
+        monkeypatch.setattr(task_runner_module, "_execute_task", slow_execute)
+
+        start = time.perf_counter()
+        assert asyncio.run(_runner(max_concurrency=3).run_once()) == 6
+        elapsed = time.perf_counter() - start
+
+        assert active["max"] == 3
+        assert elapsed < 0.9  # two waves of 0.2s, not six
+        assert all(_status(i) == TaskStatus.COMPLETED for i in ids)
+
+    def test_failing_task_is_marked_failed(self, db, monkeypatch):
+        task = _task(db)
+
+        async def boom(task_db, task, service):
+            raise RuntimeError("handler crashed")
+
+        monkeypatch.setattr(task_runner_module, "_execute_task", boom)
+        asyncio.run(_runner().run_once())
+        assert _status(task.id) == TaskStatus.FAILED
+
+    def test_task_abandoned_after_max_attempts(self, db):
+        task = _task(db)
+        for _ in range(MAX_TASK_ATTEMPTS):
+            scheduled_task_service.claim_due_tasks(db, "crashed", limit=1, lease_seconds=-1)
+
+        asyncio.run(_runner().run_once())
+        assert _status(task.id) == TaskStatus.FAILED
+        assert db.query(Notification).count() == 0
+
+    def test_run_forever_wakes_for_new_task(self, db):
+        runner = _runner(max_sleep_seconds=30)
+
+        async def scenario():
+            loop_task = asyncio.create_task(runner.run_forever())
+            await asyncio.sleep(0.1)
+            task = _task(db)
+            runner.wake()
+            for _ in range(50):
+                if _status(task.id) == TaskStatus.COMPLETED:
+                    break
+                await asyncio.sleep(0.02)
+            runner.stop()
+            await asyncio.wait_for(loop_task, timeout=2)
+            return task.id
+
+        task_id = asyncio.run(scenario())
+        assert _status(task_id) == TaskStatus.COMPLETED
+
+    def test_sleep_is_bounded_by_next_due_time(self, db):
+        _task(db, minutes=5)
+        assert 295 < _runner(max_sleep_seconds=3600)._seconds_until_next(scheduled_task_service) <= 300
+        assert _runner(max_sleep_seconds=60)._seconds_until_next(scheduled_task_service) == 60
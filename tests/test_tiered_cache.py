@@ -0,0 +1,127 @@
+"""Tests for the two-tier read-through cache (L1 only — no Redis needed)."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+from app.services.tiered_cache import TieredCache
+
+
+def _cache(**kwargs):
+    return TieredCache("test", use_l2=False, **kwargs)
+
+
+def test_concurrent_loads_are_coalesced():
+    cache = _cache(ttl=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(10)))
+
+    results = asyncio.run(scenario())
+    assert calls == 1
+    assert all(r == {"value": 1} for r in results)
+    assert cache.stats()["coalesced"] == 9
+
+
+def test_cached_value_is_reused_and_none_is_not_cached():
+    cache = _cache(ttl=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return None if len(calls) == 1 else "ok"
+
+    async def scenario():
+        first = await cache.get_or_load("k", loader)
+        second = await cache.get_or_load("k", loader)
+        third = await cache.get_or_load("k", loader)
+        return first, second, third
+
+    assert asyncio.run(scenario()) == (None, "ok", "ok")
+    assert len(calls) == 2
+
+
+def test_errors_propagate_to_all_waiters_and_are_not_cached():
+    cache = _cache(ttl=60)
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def scenario():
+        return await asyncio.gather(
+            *(cache.get_or_load("k", failing) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert asyncio.run(cache.get("k")) is None
+
+
+def test_stale_value_served_while_revalidating():
+    cache = _cache(ttl=10, stale_ttl=100)
+    versions = iter(["v1", "v2"])
+
+    async def loader():
+        return next(versions)
+
+    async def scenario():
+        with patch("app.services.tiered_cache.time.time", return_value=1000.0):
+            assert await cache.get_or_load("k", loader) == "v1"
+        with patch("app.services.tiered_cache.time.time", return_value=1020.0):
+            stale = await cache.get_or_load("k", loader)
+            await asyncio.sleep(0)  # let the background refresh run
+            await asyncio.sleep(0)
+            fresh = await cache.get_or_load("k", loader)
+        return stale, fresh
+
+    assert asyncio.run(scenario()) == ("v1", "v2")
+
+
+def test_cache_if_vetoes_storage():
+    cache = _cache(ttl=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return {"status": "running"}
+
+    async def scenario():
+        for _ in range(2):
+            await cache.get_or_load("k", loader, cache_if=lambda p: p["status"] == "completed")
+
+    asyncio.run(scenario())
+    assert len(calls) == 2
+
+
+def test_invalidate_namespace_clears_l1():
+    cache = _cache(ttl=60)
+
+    async def scenario():
+        await cache.set("k", 1)
+        assert await cache.get("k") == 1
+        await cache.invalidate_namespace()
+        return await cache.get("k")
+
+    assert asyncio.run(scenario()) is None
+
+
+
+def test_l1_keeps_full_ttl_without_l2():
+    cache = _cache(ttl=6 * 3600, stale_ttl=600, l1_max_ttl=300)
+
+    async def loader():
+        return "ok"
+
+    asyncio.run(cache.get_or_load("k", loader))
+
+    # L1 is the only copy, so it is not capped at l1_max_ttl
+    remaining = cache.l1._cache["k"].expires_at - time.monotonic()
+    assert 6 * 3600 < remaining <= 6 * 3600 + 600
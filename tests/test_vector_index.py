@@ -0,0 +1,64 @@
+"""Tests for the resident property vector index."""
+
+import numpy as np
+
+from app.services.vector_index import PropertyVectorIndex
+
+
+def _index_with(rows):
+    index = PropertyVectorIndex()
+    for prop_id, vector, workspace_id, agent_id in rows:
+        index.upsert(prop_id, vector, workspace_id=workspace_id, agent_id=agent_id)
+    return index
+
+
+class TestPropertyVectorIndex:
+    def test_search_ranks_by_cosine_similarity(self):
+        index = _index_with([
+            (1, [1.0, 0.0, 0.0], None, None),
+            (2, [0.7, 0.7, 0.0], None, None),
+            (3, [0.0, 0.0, 5.0], None, None),
+        ])
+        results = index.search([2.0, 0.0, 0.0], limit=2)
+        assert [pid for pid, _ in results] == [1, 2]
+        assert abs(results[0][1] - 1.0) < 1e-6
+
+    def test_upsert_replaces_existing_vector(self):
+        index = _index_with([(1, [1.0, 0.0], None, None), (2, [0.0, 1.0], None, None)])
+        index.upsert(1, [0.0, 1.0])
+        assert len(index) == 2
+        assert {pid for pid, _ in index.search([0.0, 1.0], limit=2)} == {1, 2}
+        assert index.search([1.0, 0.0], limit=1)[0][1] < 1e-6
+
+    def test_filters_and_exclusions(self):
+        index = _index_with([
+            (1, [1.0, 0.0], 10, 100),
+            (2, [1.0, 0.1], 10, 200),
+            (3, [1.0, 0.2], 20, 100),
+        ])
+        assert [pid for pid, _ in index.search([1.0, 0.0], workspace_id=10)] == [1, 2]
+        assert [pid for pid, _ in index.search([1.0, 0.0], agent_id=100)] == [1, 3]
+        assert [pid for pid, _ in index.search([1.0, 0.0], workspace_id=20, agent_id=200)] == []
+        assert [pid for pid, _ in index.search([1.0, 0.0], exclude_ids=[1])] == [2, 3]
+
+    def test_remove_keeps_positions_consistent(self):
+        index = _index_with([(i, [float(i), 1.0], None, None) for i in range(1, 6)])
+        assert index.remove(2) is True
+        assert index.remove(2) is False
+        assert 2 not in index
+        assert len(index) == 4
+        np.testing.assert_allclose(
+            index.get_vector(5), np.array([5.0, 1.0]) / np.linalg.norm([5.0, 1.0]), rtol=1e-6
+        )
+
+    def test_ivf_search_matches_exact_on_clustered_data(self):
+        rng = np.random.default_rng(0)
+        centers = rng.standard_normal((4, 16))
+        index = PropertyVectorIndex(initial_capacity=2)
+        for i in range(200):
+            index.upsert(i, centers[i % 4] + 0.05 * rng.standard_normal(16))
+        query = centers[1]
+        exact = {pid for pid, _ in index.search(query, limit=5)}
+        assert index.build_ivf(n_lists=4) == 4
+        approx = {pid for pid, _ in index.search(query, limit=5, n_probe=2)}
+        assert approx == exact
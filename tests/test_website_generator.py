@@ -0,0 +1,122 @@
+"""Tests for concurrent, memoized landing page section generation."""
+
+import asyncio
+from collections import Counter
+
+import pytest
+
+from app.models.zillow_enrichment import ZillowEnrichment
+from app.services import website_generator
+from app.services.cache import TTLCache
+from app.services.website_generator import SECTION_GRAPH, WebsiteGeneratorService
+
+
+@pytest.fixture(autouse=True)
+def section_cache(monkeypatch):
+    cache = TTLCache()
+    monkeypatch.setattr(website_generator, "website_section_cache", cache)
+    return cache
+
+
+@pytest.fixture()
+def enrichment(db, sample_property):
+    row = ZillowEnrichment(
+        property_id=sample_property.id,
+        description="Sunny colonial near the park",
+        photos=["https://img.example.com/1.jpg", "https://img.example.com/2.jpg"],
+        zestimate=365000,
+    )
+    db.add(row)
+    db.commit()
+    return row
+
+
+def _counting_generator(db, calls: Counter, delay: float = 0.0, running: list = None) -> WebsiteGeneratorService:
+    """A generator whose section methods count their calls (and optionally take ``delay`` seconds)."""
+    generator = WebsiteGeneratorService(db)
+    for spec in SECTION_GRAPH:
+        method = getattr(generator, spec.method)
+
+        async def counted(*args, _name=spec.name, _method=method, **kwargs):
+            calls[_name] += 1
+            if running is not None:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            await asyncio.sleep(delay)
+            if running is not None:
+                running[0] -= 1
+            return await _method(*args, **kwargs)
+
+        setattr(generator, spec.method, counted)
+    return generator
+
+
+async def test_unchanged_listing_reuses_memoized_sections(db, sample_property, enrichment):
+    calls = Counter()
+    first = await _counting_generator(db, calls).generate_website_content(sample_property)
+    assert set(calls) == {spec.name for spec in SECTION_GRAPH}
+
+    calls.clear()
+    again = await _counting_generator(db, calls).generate_website_content(sample_property)
+    assert again == first
+    assert calls == Counter(gallery=1)
+
+    luxury = await _counting_generator(db, calls).generate_website_content(sample_property, "luxury")
+    assert luxury["theme"] != first["theme"]
+    assert calls["hero"] == 1
+
+
+async def test_photo_change_does_not_regenerate_text_sections(db, sample_property, enrichment):
+    calls = Counter()
+    await _counting_generator(db, calls).generate_website_content(sample_property)
+
+    enrichment.photos = ["https://img.example.com/new.jpg"]
+    db.commit()
+    calls.clear()
+    content = await _counting_generator(db, calls).generate_website_content(sample_property)
+
+    assert calls == Counter(gallery=1)
+    assert content["sections"]["hero"]["background_image"] == "https://img.example.com/new.jpg"
+    assert content["seo"]["og_image"] == "https://img.example.com/new.jpg"
+    assert [image["url"] for image in content["sections"]["gallery"]["images"]] == ["https://img.example.com/new.jpg"]
+
+
+async def test_changed_fields_regenerate_only_dependent_sections(db, sample_property, enrichment):
+    calls = Counter()
+    await _counting_generator(db, calls).generate_website_content(sample_property)
+
+    sample_property.price = 340000.0
+    db.commit()
+    calls.clear()
+    content = await _counting_generator(db, calls).generate_website_content(sample_property)
+
+    assert set(calls) == {"hero", "about", "seo", "gallery"}
+    assert content["sections"]["hero"]["price_display"] == "$340,000.0"
+
+    sample_property.square_feet = 2000
+    db.commit()
+    calls.clear()
+    await _counting_generator(db, calls).generate_website_content(sample_property)
+
+    # about and features build on the shared feature list, so both are regenerated with it
+    assert set(calls) == {"key_features", "features", "about", "seo", "gallery"}
+
+
+async def test_independent_sections_run_concurrently(db, sample_property):
+    calls, running = Counter(), [0, 0]
+    content = await _counting_generator(db, calls, delay=0.01, running=running).generate_website_content(sample_property)
+
+    assert running[1] > 1
+    assert list(content["sections"]) == ["hero", "about", "features", "gallery", "contact", "cta"]
+    assert content["sections"]["hero"]["background_image"] is None
+    assert content["sections"]["about"]["features"] == content["sections"]["features"]["features"]
+
+
+async def test_about_keeps_every_feature_while_features_section_is_capped(db, sample_property, monkeypatch):
+    many = [f"Feature {i}" for i in range(15)]
+    monkeypatch.setattr(WebsiteGeneratorService, "_extract_key_features", lambda self, data: list(many))
+
+    content = await WebsiteGeneratorService(db).generate_website_content(sample_property)
+
+    assert content["sections"]["about"]["features"] == many
+    assert content["sections"]["features"]["features"] == many[:12]
@@ -0,0 +1,92 @@
+"""Tests for cached, compressed public website pages and batched view tracking."""
+
+import gzip
+from datetime import datetime
+
+import pytest
+
+from app.middleware.activity_logger import ActivityEventWriter
+from app.models.property_website import PropertyWebsite, WebsiteAnalytics
+from app.services import website_render_cache as render_cache
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture()
+def website(db, agent, sample_property):
+    now = datetime.utcnow()
+    site = PropertyWebsite(
+        property_id=sample_property.id,
+        agent_id=agent.id,
+        website_name="123 Test St",
+        website_slug="123-test-st",
+        theme={"primary_color": "#112233"},
+        content={"sections": {"hero": {"headline": "Welcome home", "subheadline": "3 bed"}}},
+        is_published=True,
+        published_at=now,
+        created_at=now,
+        updated_at=now,
+    )
+    db.add(site)
+    db.commit()
+    return site
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(render_cache, "website_render_cache", render_cache.WebsiteRenderCache())
+    monkeypatch.setattr("app.routers.properties.property_websites.website_render_cache", render_cache.website_render_cache)
+    # Started by the app's startup hook when a test uses the client
+    writer = ActivityEventWriter(session_factory=TestingSessionLocal, table=WebsiteAnalytics.__table__)
+    monkeypatch.setattr(render_cache, "website_view_writer", writer)
+    return render_cache.website_render_cache
+
+
+def _url(site):
+    return f"/properties/{site.property_id}/websites/view/{site.website_slug}"
+
+
+def test_page_is_rendered_once_and_revalidated_with_etag(client, agent_headers, website, fresh_cache):
+    first = client.get(_url(website), headers={**agent_headers, "Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert "Welcome home" in first.text
+    etag = first.headers["etag"]
+
+    again = client.get(_url(website), headers={**agent_headers, "If-None-Match": etag})
+    assert again.status_code == 304
+    assert fresh_cache.renders == 1 and fresh_cache.hits == 1
+
+
+def test_content_change_invalidates_page(client, agent_headers, db, website, fresh_cache):
+    etag = client.get(_url(website), headers=agent_headers).headers["etag"]
+
+    website.content = {"sections": {"hero": {"headline": "Price reduced"}}}
+    website.updated_at = datetime.utcnow()
+    db.commit()
+
+    changed = client.get(_url(website), headers={**agent_headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert "Price reduced" in changed.text
+    assert fresh_cache.renders == 2
+
+
+def test_views_are_recorded(client, agent_headers, db, website):
+    writer = render_cache.website_view_writer
+    for _ in range(3):
+        client.get(_url(website), headers=agent_headers)
+    client.get(_url(website) + "?track_view=false", headers=agent_headers)
+
+    # Views are queued for the background flusher; flush on its loop instead of waiting for it
+    assert writer.running and writer.enqueued == 3
+    client.portal.call(writer.flush)
+    assert db.query(WebsiteAnalytics).filter_by(website_id=website.id, event_type="view").count() == 3
+
+
+def test_compressed_bodies_decode_to_the_page():
+    page = render_cache.build_page("v1", "<html>" + "listing " * 500 + "</html>")
+    body, encoding = page.body("gzip, deflate")
+    assert encoding == "gzip" and len(body) < len(page.html)
+    assert gzip.decompress(body) == page.html
+    assert page.body("identity") == (page.html, None)
+    assert render_cache.etag_matches('W/"other", W/"v1"', page)
@@ -0,0 +1,210 @@
+"""Tests for the topic-based WebSocket hub."""
+
+import asyncio
+import json
+
+import pytest
+
+from app import websocket as ws_module
+from app.websocket import ConnectionManager, agent_topic, property_topic
+
+
+class FakeSocket:
+    def __init__(self, fail: bool = False, hang: bool = False):
+        self.fail = fail
+        self.hang = hang
+        self.sent: list[dict] = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        if self.hang:
+            await asyncio.Event().wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    async def _none():
+        return None
+
+    monkeypatch.setattr("app.services.redis_cache.get_async_redis", _none)
+
+
+@pytest.fixture()
+async def hub_factory():
+    """Build hubs that are closed (writer tasks stopped) when the test ends."""
+    hubs = []
+
+    def _make(**kwargs):
+        hub = ConnectionManager(**kwargs)
+        hubs.append(hub)
+        return hub
+
+    yield _make
+    for hub in hubs:
+        await hub.close()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_publish_reaches_only_topic_subscribers(hub_factory):
+    hub = hub_factory()
+    watcher, other = FakeSocket(), FakeSocket()
+    await hub.connect(watcher, agent_id=1, topics=[property_topic(7)])
+    await hub.connect(other, agent_id=2, topics=[property_topic(8)])
+
+    delivered = await hub.publish([property_topic(7), agent_topic(1)], {"action": "enrichment_start"})
+    await _settle()
+
+    assert delivered == 1
+    assert watcher.sent == [{"action": "enrichment_start"}]
+    assert other.sent == []
+
+
+async def test_default_subscriptions_include_own_agent_and_broadcast(hub_factory):
+    hub = hub_factory()
+    sock = FakeSocket()
+    await hub.connect(sock, agent_id=3)
+
+    await hub.broadcast({"n": 1})
+    await hub.publish(agent_topic(3), {"n": 2})
+    await hub.publish(agent_topic(4), {"n": 3})
+    await _settle()
+
+    assert [m["n"] for m in sock.sent] == [1, 2]
+
+
+async def test_message_serialized_once_for_all_recipients(monkeypatch, hub_factory):
+    hub = hub_factory()
+    calls = []
+    real_dumps = ws_module._dumps
+    monkeypatch.setattr(ws_module, "_dumps", lambda m: calls.append(m) or real_dumps(m))
+    sockets = [FakeSocket() for _ in range(5)]
+    for sock in sockets:
+        await hub.connect(sock, agent_id=1)
+
+    await hub.broadcast({"hello": "world"})
+    await _settle()
+
+    assert len(calls) == 1
+    assert all(s.sent == [{"hello": "world"}] for s in sockets)
+
+
+async def test_slow_consumer_is_dropped_without_stalling_others(hub_factory):
+    hub = hub_factory(queue_size=2)
+    slow, fast = FakeSocket(hang=True), FakeSocket()
+    await hub.connect(slow, agent_id=1)
+    await hub.connect(fast, agent_id=2)
+
+    for n in range(5):
+        await hub.broadcast({"n": n})
+        await _settle()
+
+    assert [m["n"] for m in fast.sent] == list(range(5))
+    assert slow not in hub.active_connections
+    assert slow.closed_with == 1013
+    assert hub.stats()["dropped_slow"] == 1
+
+
+async def test_dead_socket_is_removed_after_send_failure(hub_factory):
+    hub = hub_factory()
+    dead = FakeSocket(fail=True)
+    await hub.connect(dead, agent_id=1)
+
+    await hub.broadcast({"n": 1})
+    await _settle()
+
+    assert hub.active_connections == []
+    assert hub.stats()["topics"] == 0
+
+
+async def test_client_can_subscribe_but_not_to_other_agents(hub_factory):
+    hub = hub_factory()
+    sock = FakeSocket()
+    await hub.connect(sock, agent_id=1, topics=[])
+
+    handled = hub.handle_client_message(
+        sock, json.dumps({"action": "subscribe", "topics": ["job:bulk:4", agent_topic(2)]})
+    )
+    await hub.publish("job:bulk:4", {"type": "bulk_job_progress"})
+    await hub.publish(agent_topic(2), {"type": "secret"})
+    await _settle()
+
+    assert handled is True
+    assert hub.handle_client_message(sock, "ping") is False
+    assert sock.sent[0]["subscribed"] == ["job:bulk:4"]
+    assert [m.get("type") for m in sock.sent[1:]] == ["bulk_job_progress"]
+
+
+async def test_close_stops_writer_tasks():
+    hub = ConnectionManager()
+    sockets = [FakeSocket(), FakeSocket(hang=True)]
+    for sock in sockets:
+        await hub.connect(sock, agent_id=1)
+    await hub.broadcast({"n": 1})
+    await _settle()
+    writers = [hub._connections[sock].writer for sock in sockets]
+
+    await hub.close()
+
+    assert all(w.done() for w in writers)
+    assert hub.active_connections == []
+    assert hub.stats()["dropped_dead"] == 0
+
+
+async def test_listener_resubscribes_after_redis_error(monkeypatch, hub_factory):
+    hub = hub_factory()
+    sock = FakeSocket()
+    await hub.connect(sock, agent_id=1)
+    remote = json.dumps({"origin": "other", "topics": ["broadcast"], "text": json.dumps({"n": 1})})
+
+    class FakePubSub:
+        def __init__(self, fail):
+            self.fail = fail
+            self.messages = [] if fail else [{"data": remote}]
+
+        async def subscribe(self, channel):
+            if self.fail:
+                raise ConnectionError("redis went away")
+
+        async def get_message(self, **kwargs):
+            if self.messages:
+                return self.messages.pop()
+            await asyncio.sleep(0.01)
+            return None
+
+        async def aclose(self):
+            pass
+
+    class FakeRedis:
+        connections = 0
+
+        def pubsub(self):
+            FakeRedis.connections += 1
+            return FakePubSub(fail=FakeRedis.connections == 1)
+
+    async def _redis():
+        return FakeRedis()
+
+    monkeypatch.setattr("app.services.redis_cache.get_async_redis", _redis)
+    hub.start_listener()
+    # The listener waits a second before resubscribing
+    for _ in range(40):
+        await asyncio.sleep(0.05)
+        if sock.sent:
+            break
+
+    assert FakeRedis.connections == 2
+    assert sock.sent == [{"n": 1}]
+